@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Browser backend benchmark: Selenium vs async Playwright
+Runs the same page lookups through a ScraperPool on each backend and
+prints lookups/sec, latency and peak memory of this process tree
+(Python, chromedriver/Playwright driver and every Chrome process).
+
+Usage: python benchmarks/bench_backends.py --url http://localhost:8765/ [--concurrency 4] [--lookups 40]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ecourts_pool import ScraperPool, process_tree_rss, psutil  # noqa: E402
+
+class PeakMemory:
+    """Samples the RSS of this process and its children in the background"""
+
+    def __init__(self, interval=0.2):
+        self.interval = interval
+        self.peak = 0
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop_event.set()
+        self.thread.join()
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            self.peak = max(self.peak, process_tree_rss(os.getpid()) or 0)
+            self.stop_event.wait(self.interval)
+
+def run_backend(backend, url, concurrency, lookups, tabs=1):
+    pool = ScraperPool(size=concurrency, headless=True, warm=concurrency, backend=backend,
+                       tabs_per_browser=tabs, max_pages=0, max_rss_mb=0)
+    latencies = []
+    lock = threading.Lock()
+
+    def lookup(_):
+        started = time.perf_counter()
+        with pool.scraper() as scraper:
+            scraper.open_page(url)
+            scraper.parse_case_details()
+        with lock:
+            latencies.append(time.perf_counter() - started)
+
+    try:
+        with PeakMemory() as memory:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(lookup, range(lookups)))
+            elapsed = time.perf_counter() - started
+    finally:
+        pool.close()
+
+    latencies.sort()
+    return {
+        'backend': backend if tabs == 1 else f"{backend} ({tabs} tabs/browser)",
+        'lookups': lookups,
+        'lookups_per_second': round(lookups / elapsed, 2),
+        'p50_ms': round(statistics.median(latencies) * 1000, 1),
+        'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+        'peak_rss_mb': round(memory.peak / 1024 / 1024, 1) if psutil else None
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Selenium vs Playwright backend benchmark')
+    parser.add_argument('--url', required=True, help='Page to look up (use the fixture server for repeatable runs)')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--lookups', type=int, default=40)
+    parser.add_argument('--tabs', type=int, default=1, help='Also run Selenium with this many tabs per Chrome')
+    parser.add_argument('--json', help='Write results to this file')
+    args = parser.parse_args()
+
+    runs = [('selenium', 1)]
+    if args.tabs > 1:
+        runs.append(('selenium', args.tabs))
+    runs.append(('playwright', 1))
+
+    results = []
+    for backend, tabs in runs:
+        try:
+            results.append(run_backend(backend, args.url, args.concurrency, args.lookups, tabs))
+        except Exception as e:
+            print(f"⚠️ {backend} skipped: {e}")
+
+    print(f"{'backend':32} {'lookups/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'peak MB':>9}")
+    for r in results:
+        print(f"{r['backend']:32} {r['lookups_per_second']:>10} {r['p50_ms']:>9} {r['p95_ms']:>9} {str(r['peak_rss_mb']):>9}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
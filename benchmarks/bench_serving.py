@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Serving benchmark: Werkzeug dev server vs gunicorn
+Starts each server on a free port, drives it with concurrent clients and
+prints requests/sec and latency for the index page and a cause list call.
+
+Usage: python benchmarks/bench_serving.py [--clients 16] [--duration 10]
+"""
+
+import argparse
+import configparser
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def benchmark_config():
+    """Copy config.ini with rate limiting off so load is not rejected"""
+    config = configparser.ConfigParser(interpolation=None)
+    config.read(os.path.join(ROOT, 'config.ini'), encoding='utf-8')
+    config.set('security', 'rate_limit', '0')
+    config.set('security', 'ip_rate_limit', '0')
+
+    handle, path = tempfile.mkstemp(suffix='.ini')
+    with os.fdopen(handle, 'w', encoding='utf-8') as f:
+        config.write(f)
+    os.environ['ECOURTS_CONFIG'] = path
+    return path
+
+def start_dev_server(port):
+    code = (
+        "from ecourts_web_interface import app; "
+        f"app.run(host='127.0.0.1', port={port}, debug=False, threaded=True)"
+    )
+    return subprocess.Popen([sys.executable, '-c', code], cwd=ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def start_gunicorn(port, workers=None, threads=None):
+    cmd = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+           '-b', f'127.0.0.1:{port}', '--access-logfile', '/dev/null',
+           '--pid', f'/tmp/bench-gunicorn-{port}.pid']
+    if workers:
+        cmd += ['--workers', str(workers)]
+    if threads:
+        cmd += ['--threads', str(threads)]
+    cmd.append('ecourts_web_interface:app')
+    return subprocess.Popen(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def wait_ready(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/', timeout=1).read()
+            return True
+        except Exception:
+            time.sleep(0.2)
+    return False
+
+def make_request(url, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    start = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=60) as response:
+        response.read()
+    return time.perf_counter() - start
+
+def run_load(url, clients, duration, body=None):
+    latencies = []
+    errors = 0
+    deadline = time.time() + duration
+
+    def client():
+        nonlocal errors
+        while time.time() < deadline:
+            try:
+                latencies.append(make_request(url, body))
+            except Exception:
+                errors += 1
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        for _ in range(clients):
+            pool.submit(client)
+
+    latencies.sort()
+    count = len(latencies)
+    return {
+        'requests': count,
+        'errors': errors,
+        'rps': round(count / duration, 1),
+        'p50_ms': round(latencies[count // 2] * 1000, 1) if count else None,
+        'p99_ms': round(latencies[min(count - 1, int(count * 0.99))] * 1000, 1) if count else None
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Dev server vs gunicorn serving benchmark')
+    parser.add_argument('--clients', type=int, default=16, help='Concurrent clients')
+    parser.add_argument('--duration', type=float, default=10, help='Seconds per scenario')
+    parser.add_argument('--workers', type=int, help='Override gunicorn workers from config.ini')
+    parser.add_argument('--threads', type=int, help='Override gunicorn threads from config.ini')
+    args = parser.parse_args()
+
+    scenarios = [
+        ('GET /', '/', None),
+        ('POST /api/cause-list', '/api/cause-list', {'state': 'Delhi', 'district': 'New Delhi',
+                                                     'complex': 'Patiala House Court Comp', 'date': '2025-10-17'})
+    ]
+    results = {}
+    config_path = benchmark_config()
+
+    servers = (
+        ('werkzeug-dev', start_dev_server),
+        ('gunicorn', lambda port: start_gunicorn(port, args.workers, args.threads))
+    )
+
+    for name, starter in servers:
+        port = free_port()
+        proc = starter(port)
+        try:
+            if not wait_ready(port):
+                print(f"❌ {name} did not start")
+                continue
+            for label, path, body in scenarios:
+                stats = run_load(f'http://127.0.0.1:{port}{path}', args.clients, args.duration, body)
+                results[(name, label)] = stats
+                print(f"{name:14} {label:22} {stats['rps']:>8} req/s  p50 {stats['p50_ms']} ms  "
+                      f"p99 {stats['p99_ms']} ms  errors {stats['errors']}")
+        finally:
+            proc.terminate()
+            proc.wait(timeout=30)
+
+    os.remove(config_path)
+    return results
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Hot path benchmark suite: parser, exports, API routes and end-to-end lookups
+Times each case over several rounds and stores the results as JSON so runs
+from different releases can be compared; --compare exits non-zero when a
+case got slower than --threshold.
+
+Usage: python benchmarks/bench_suite.py [--only parser,export,api,e2e] [--quick]
+       python benchmarks/bench_suite.py --compare benchmarks/results/<earlier>.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+GROUPS = ('parser', 'export', 'api', 'e2e')
+
+def measure(func, rounds=5, warmup=1):
+    """Run func warmup + rounds times and summarise the timed rounds (seconds)"""
+    for _ in range(warmup):
+        func()
+    times = []
+    for _ in range(rounds):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    times.sort()
+    return {
+        'rounds': rounds,
+        'min_ms': round(times[0] * 1000, 3),
+        'median_ms': round(statistics.median(times) * 1000, 3),
+        'mean_ms': round(statistics.mean(times) * 1000, 3),
+        'p95_ms': round(times[max(0, int(len(times) * 0.95) - 1)] * 1000, 3),
+        'ops_per_second': round(1 / statistics.median(times), 2)
+    }
+
+def case_rows(count):
+    return [{
+        'sr_no': str(i + 1),
+        'case_no': f'CS {1000 + i}/2025',
+        'party_names': f'Petitioner {i} vs Respondent {i}',
+        'advocate': f'Advocate {i % 97}',
+        'purpose': ('For Arguments', 'For Evidence', 'For Orders')[i % 3],
+        'court_name': f'Court No. {i % 12 + 1}',
+        'remarks': 'Matter taken up'
+    } for i in range(count)]
+
+def details_html(rows):
+    cells = ''.join(f'<tr><td>Field {i}</td><td>Value {i}</td></tr>' for i in range(rows))
+    return f'<html><body><table>{cells}</table></body></html>'
+
+def cause_list_html(rows):
+    header = '<tr><th>Sr No</th><th>Case Number</th><th>Party Name</th><th>Advocate</th><th>Purpose</th><th>Court</th></tr>'
+    body = ''.join(
+        f"<tr><td>{r['sr_no']}</td><td>{r['case_no']}</td><td>{r['party_names']}</td>"
+        f"<td>{r['advocate']}</td><td>{r['purpose']}</td><td>{r['court_name']}</td></tr>"
+        for r in case_rows(rows)
+    )
+    return f'<html><body><table>{header}{body}</table></body></html>'
+
+def offline_scraper():
+    """An ECourtsScraper without a browser, for parsing and export cases"""
+    from ecourts_backends import BrowserBackend
+    from ecourts_scraper import ECourtsScraper
+
+    class NoBrowser(BrowserBackend):
+        name = 'none'
+
+        def close(self):
+            pass
+
+    return ECourtsScraper(backend=NoBrowser())
+
+def bench_parser(quick):
+    scraper = offline_scraper()
+    results = {}
+    for rows in ((100, 1000) if quick else (100, 1000, 5000)):
+        page = details_html(rows)
+        results[f'parse_case_details[{rows} rows]'] = measure(lambda: scraper.parse_case_details(page))
+        page = cause_list_html(rows)
+        results[f'parse_cause_list[{rows} rows]'] = measure(lambda: scraper.parse_cause_list(page))
+    return results
+
+@contextmanager
+def scratch_directory():
+    """Run in a temporary directory; exports go to ./downloads"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            yield workdir
+        finally:
+            os.chdir(cwd)
+
+def bench_export(quick):
+    scraper = offline_scraper()
+    results = {}
+    with scratch_directory():
+        for rows in ((10000,) if quick else (10000, 100000)):
+            data = {'metadata': {'total_cases': rows}, 'cases': case_rows(rows)}
+            results[f'save_results[{rows} rows]'] = measure(
+                lambda: scraper.save_results(data, 'bench'), rounds=3 if rows > 10000 else 5
+            )
+    return results
+
+def bench_api(quick):
+    import ecourts_web_interface as web
+    from ecourts_cancel import CancellationToken
+
+    client = web.app.test_client()
+    body = {'state': 'Delhi', 'district': 'New Delhi', 'complex': 'Patiala House Court Comp', 'date': '2025-10-17'}
+    days = iter(range(10 ** 6))
+
+    def cause_list_uncached():
+        # A new (valid) date misses the cause list store and runs a task
+        day = date(2030, 1, 1) + timedelta(days=next(days))
+        response = client.post('/api/cause-list', json={**body, 'date': day.isoformat()})
+        assert response.status_code == 200
+
+    def cause_list_cached():
+        assert client.post('/api/cause-list', json=body).get_json()['success']
+
+    def search_cnr():
+        assert client.post('/api/search-cnr', json={'cnr': 'DLND010012342025'}).get_json()['success']
+
+    # Demo tasks sleep to mimic eCourts; the route, scheduler and JSON work is what we time.
+    # The per-IP limit is off (0) so the test client is never throttled.
+    rounds = 10 if quick else 30
+    with scratch_directory(), patch.object(CancellationToken, 'sleep', lambda self, seconds: None), \
+            patch.object(web, 'IP_RATE_LIMIT', 0):
+        results = {
+            'POST /api/cause-list (cached)': measure(cause_list_cached, rounds=rounds),
+            'POST /api/cause-list (uncached)': measure(cause_list_uncached, rounds=rounds),
+            'POST /api/search-cnr': measure(search_cnr, rounds=rounds)
+        }
+        web.result_writer.flush()
+    return results
+
+def bench_e2e(quick):
+    """CNR lookups through Chrome against the local fixture server"""
+    from ecourts_fixtures import FixtureServer
+    from ecourts_pool import ScraperPool
+
+    results = {}
+    with FixtureServer(latency=0.05, jitter=0.05, seed=7) as server, \
+            patch.dict(os.environ, {'ECOURTS_BASE_URL': server.base_url}), \
+            patch('ecourts_scraper.pause', lambda seconds, token=None: None):
+        pool = ScraperPool(size=1, headless=True, warm=1, max_pages=0, max_rss_mb=0)
+        try:
+            def lookup():
+                with pool.scraper() as scraper:
+                    details = scraper.search_case_by_cnr('DLND010012342025')['case_details']
+                assert details.get('CNR Number') == 'DLND010012342025', 'lookup fell back to demo data'
+
+            results['search_case_by_cnr (fixture server)'] = measure(lookup, rounds=5 if quick else 20)
+        finally:
+            pool.close()
+    return results
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+def compare(results, baseline, threshold):
+    """Cases whose median grew by more than threshold (fraction) over the baseline"""
+    regressions = []
+    for name, stats in results['benchmarks'].items():
+        before = baseline.get('benchmarks', {}).get(name)
+        if before and before['median_ms'] > 0:
+            change = stats['median_ms'] / before['median_ms'] - 1
+            if change > threshold:
+                regressions.append((name, before['median_ms'], stats['median_ms'], change))
+    return regressions
+
+def missing_cases(results, baseline):
+    """Baseline cases of the groups that ran which produced no result this time"""
+    if baseline.get('metadata', {}).get('quick') != results['metadata']['quick']:
+        # --quick runs other input sizes; only the shared cases can be compared
+        return []
+    groups = set(results['metadata']['groups'])
+    return [name for name, stats in baseline.get('benchmarks', {}).items()
+            if name not in results['benchmarks']
+            # Older results have no group per case; those are only required from a full run
+            and (stats['group'] in groups if 'group' in stats else groups == set(GROUPS))]
+
+def main():
+    parser = argparse.ArgumentParser(description='Hot path benchmark suite')
+    parser.add_argument('--only', help=f"Comma-separated groups ({', '.join(GROUPS)})")
+    parser.add_argument('--quick', action='store_true', help='Smaller inputs and fewer rounds')
+    parser.add_argument('--output', help='Results file (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--compare', help='Earlier results file to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed slowdown before failing (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    groups = args.only.split(',') if args.only else GROUPS
+    runners = {'parser': bench_parser, 'export': bench_export, 'api': bench_api, 'e2e': bench_e2e}
+
+    results = {
+        'metadata': {
+            'created_at': datetime.now().isoformat(),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': args.quick,
+            'groups': list(groups),
+            'failed_groups': []
+        },
+        'benchmarks': {}
+    }
+
+    for group in groups:
+        try:
+            for name, stats in runners[group](args.quick).items():
+                results['benchmarks'][name] = {'group': group, **stats}
+        except Exception as e:
+            # A crashing benchmark must not pass as "no regressions"
+            results['metadata']['failed_groups'].append(group)
+            print(f"❌ {group} failed: {e}")
+
+    print(f"{'benchmark':44} {'median ms':>11} {'p95 ms':>11} {'ops/s':>10}")
+    for name, stats in results['benchmarks'].items():
+        print(f"{name:44} {stats['median_ms']:>11} {stats['p95_ms']:>11} {stats['ops_per_second']:>10}")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"📁 Results saved to {output}")
+
+    failed = bool(results['metadata']['failed_groups'])
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, before, after, change in regressions:
+            print(f"❌ {name}: {before} ms -> {after} ms (+{change:.0%})")
+        missing = missing_cases(results, baseline)
+        for name in missing:
+            print(f"❌ {name}: in the baseline but not measured")
+        failed = failed or bool(regressions or missing)
+        if not failed:
+            print(f"✅ No regressions over {args.threshold:.0%}")
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
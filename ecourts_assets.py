@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Static Assets
+Pre-rendered, content-hashed and pre-compressed responses for the web UI
+"""
+
+import gzip
+import hashlib
+import os
+
+from flask import Response, request
+
+from ecourts_metrics import record_cache
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE = 'no-cache'
+
+# Smaller payloads are not worth compressing
+MIN_COMPRESS_SIZE = 512
+
+class Asset:
+    """One response body, built once, with its compressed variants"""
+
+    def __init__(self, body, content_type, immutable=False):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        self.content_type = content_type
+        self.digest = hashlib.sha256(body).hexdigest()[:16]
+        self.cache_control = IMMUTABLE_CACHE if immutable else REVALIDATE_CACHE
+
+        self.variants = {'identity': body}
+        if len(body) >= MIN_COMPRESS_SIZE:
+            self.variants['gzip'] = gzip.compress(body, compresslevel=9, mtime=0)
+            if brotli is not None:
+                self.variants['br'] = brotli.compress(body, quality=11)
+
+    def etag(self, encoding):
+        return self.digest if encoding == 'identity' else f"{self.digest}-{encoding}"
+
+    def choose_encoding(self, accept_encodings):
+        """Pick the smallest variant the client accepts"""
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and accept_encodings[encoding]:
+                return encoding
+        return 'identity'
+
+    def is_fresh(self, if_none_match):
+        """True if the client already holds any representation of this body"""
+        if if_none_match.star_tag:
+            return True
+        return any(tag.split('-')[0] == self.digest for tag in if_none_match)
+
+    def response(self):
+        """Build a Flask response for the current request"""
+        encoding = self.choose_encoding(request.accept_encodings)
+        headers = {
+            'ETag': f'"{self.etag(encoding)}"',
+            'Cache-Control': self.cache_control,
+            'Vary': 'Accept-Encoding'
+        }
+
+        if request.if_none_match:
+            fresh = self.is_fresh(request.if_none_match)
+            record_cache('http_etag', fresh)
+            if fresh:
+                return Response(status=304, headers=headers)
+
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+
+        return Response(self.variants[encoding], content_type=self.content_type, headers=headers)
+
+class AssetBundle:
+    """Static files addressed by content-hashed names"""
+
+    def __init__(self, static_dir, url_prefix='/assets'):
+        self.static_dir = static_dir
+        self.url_prefix = url_prefix
+        self.assets = {}
+
+    def add_file(self, relpath, content_type):
+        """Load a static file and return its hashed URL"""
+        with open(os.path.join(self.static_dir, relpath), 'rb') as f:
+            asset = Asset(f.read(), content_type, immutable=True)
+
+        stem, ext = os.path.splitext(os.path.basename(relpath))
+        name = f"{stem}.{asset.digest}{ext}"
+        self.assets[name] = asset
+        return f"{self.url_prefix}/{name}"
+
+    def get(self, name):
+        return self.assets.get(name)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Browser Backends
+Navigation, form filling, waits and page snapshots behind one interface
+"""
+
+import asyncio
+import logging
+import threading
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from ecourts_lean import is_blocked, is_captcha
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:  # playwright is optional; Selenium is always available
+    async_playwright = None
+
+logger = logging.getLogger(__name__)
+
+# Resource types a lean Playwright context never fetches
+BLOCKED_RESOURCE_TYPES = ('image', 'stylesheet', 'font', 'media')
+
+def should_block(url, resource_type):
+    """Lean Playwright routing: block by resource type or host, never the CAPTCHA"""
+    if is_captcha(url):
+        return False
+    # is_blocked covers the tracker hosts as well as asset extensions
+    return resource_type in BLOCKED_RESOURCE_TYPES or is_blocked(url)
+
+class BrowserBackend:
+    """
+    The browser steps ECourtsScraper needs. Selectors are XPath.
+
+    ``execute_script`` takes a WebDriver-style function body (``return ...``
+    with ``arguments``) so page measurements work on every backend.
+    """
+
+    name = 'base'
+
+    def navigate(self, url):
+        raise NotImplementedError
+
+    def fill(self, selector, text):
+        raise NotImplementedError
+
+    def click(self, selector):
+        raise NotImplementedError
+
+    def exists(self, selector):
+        raise NotImplementedError
+
+    def wait_for(self, selector, timeout=15):
+        raise NotImplementedError
+
+    def snapshot(self):
+        """Current page HTML"""
+        raise NotImplementedError
+
+    def element_png(self, selector):
+        """Screenshot of one element, e.g. the CAPTCHA image"""
+        raise NotImplementedError
+
+    def execute_script(self, script, *args):
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+class SeleniumBackend(BrowserBackend):
+    """WebDriver session (or a TabDriver from ecourts_tabs)"""
+
+    name = 'selenium'
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def navigate(self, url):
+        self.driver.get(url)
+
+    def fill(self, selector, text):
+        element = self.driver.find_element(By.XPATH, selector)
+        element.clear()
+        element.send_keys(text)
+
+    def click(self, selector):
+        self.driver.find_element(By.XPATH, selector).click()
+
+    def exists(self, selector):
+        return bool(self.driver.find_elements(By.XPATH, selector))
+
+    def wait_for(self, selector, timeout=15):
+        WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((By.XPATH, selector)))
+
+    def snapshot(self):
+        return self.driver.page_source
+
+    def element_png(self, selector):
+        return self.driver.find_element(By.XPATH, selector).screenshot_as_png
+
+    def execute_script(self, script, *args):
+        return self.driver.execute_script(script, *args)
+
+    def close(self):
+        self.driver.quit()
+
+class PlaywrightBrowser:
+    """
+    One Playwright connection to Chromium, driven by an asyncio loop on a
+    background thread. Every backend it hands out is a separate browser
+    context (own cookies) multiplexed over that single CDP connection, so
+    many lookups are in flight without one thread or process per browser.
+    Connects to ``cdp_url`` (an existing Chrome's remote debugging
+    endpoint) if given, otherwise launches Chromium.
+    """
+
+    def __init__(self, headless=True, cdp_url=None, timeout=60):
+        if async_playwright is None:
+            raise RuntimeError('Playwright backend requires: pip install playwright && playwright install chromium')
+
+        self.timeout = timeout
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='playwright', daemon=True)
+        self.thread.start()
+        self.lock = threading.Lock()
+        self.contexts = 0
+        self.blocked = 0
+
+        self.playwright, self.browser = self.run(self._start(headless, cdp_url))
+        logger.info(f"✅ Playwright connected ({'CDP ' + cdp_url if cdp_url else 'launched Chromium'})")
+
+    async def _start(self, headless, cdp_url):
+        playwright = await async_playwright().start()
+        if cdp_url:
+            browser = await playwright.chromium.connect_over_cdp(cdp_url)
+        else:
+            browser = await playwright.chromium.launch(headless=headless, args=['--no-sandbox', '--disable-dev-shm-usage'])
+        return playwright, browser
+
+    def run(self, coro, timeout=None):
+        """Run a coroutine on the browser's loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout or self.timeout)
+
+    def new_backend(self, lean=True):
+        return PlaywrightBackend(self, *self.run(self._new_page(lean)))
+
+    async def _new_page(self, lean):
+        context = await self.browser.new_context()
+        if lean:
+            await context.route('**/*', self._route)
+        page = await context.new_page()
+        with self.lock:
+            self.contexts += 1
+        return context, page
+
+    async def _route(self, route):
+        if should_block(route.request.url, route.request.resource_type):
+            with self.lock:
+                self.blocked += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def context_closed(self):
+        with self.lock:
+            self.contexts -= 1
+
+    def close(self):
+        try:
+            self.run(self._stop(), timeout=10)
+        except Exception as e:
+            logger.warning(f"⚠️ Playwright shutdown failed: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+
+    async def _stop(self):
+        await self.browser.close()
+        await self.playwright.stop()
+
+class PlaywrightBackend(BrowserBackend):
+    """One isolated Playwright context and page, called from any thread"""
+
+    name = 'playwright'
+
+    def __init__(self, browser, context, page):
+        self.browser = browser
+        self.context = context
+        self.page = page
+
+    def navigate(self, url):
+        self.browser.run(self.page.goto(url, wait_until='load'))
+
+    def fill(self, selector, text):
+        self.browser.run(self.page.fill(f"xpath={selector}", text))
+
+    def click(self, selector):
+        self.browser.run(self.page.click(f"xpath={selector}"))
+
+    def exists(self, selector):
+        return self.browser.run(self.page.locator(f"xpath={selector}").count()) > 0
+
+    def wait_for(self, selector, timeout=15):
+        self.browser.run(self.page.wait_for_selector(f"xpath={selector}", state='attached', timeout=timeout * 1000))
+
+    def snapshot(self):
+        return self.browser.run(self.page.content())
+
+    def element_png(self, selector):
+        return self.browser.run(self.page.locator(f"xpath={selector}").first.screenshot())
+
+    def execute_script(self, script, *args):
+        # Wrap the WebDriver-style body so `arguments` and `return` behave the same
+        wrapper = "args => (function() {" + script + "}).apply(null, args)"
+        return self.browser.run(self.page.evaluate(wrapper, list(args)))
+
+    def close(self):
+        try:
+            self.browser.run(self.context.close(), timeout=10)
+        finally:
+            self.browser.context_closed()
+
+class PlaywrightContexts:
+    """Scraper factory giving each ScraperPool slot its own context on one shared connection"""
+
+    def __init__(self, headless=True, cdp_url=None, lean=None):
+        self.headless = headless
+        self.cdp_url = cdp_url
+        self.lean = lean
+        self.lock = threading.Lock()
+        self.browser = None
+
+    def new_scraper(self):
+        import ecourts_config as config
+        from ecourts_scraper import ECourtsScraper
+
+        with self.lock:
+            if self.browser is None:
+                self.browser = PlaywrightBrowser(self.headless, self.cdp_url)
+        lean = config.get_bool('scraper', 'lean_mode', True) if self.lean is None else self.lean
+        return ECourtsScraper(headless=self.headless, lean=lean, backend=self.browser.new_backend(lean))
+
+    def close(self):
+        with self.lock:
+            if self.browser is not None:
+                self.browser.close()
+                self.browser = None
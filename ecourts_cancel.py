@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Cancellation
+Cooperative cancellation for scraping tasks nobody is waiting on
+"""
+
+import threading
+
+class TaskCancelled(Exception):
+    """Raised at a checkpoint once the task's token has been cancelled"""
+
+class CancellationToken:
+    """
+    Shared flag between a waiting caller and the worker doing the scrape.
+
+    The worker calls ``check()`` between navigation stages and uses
+    ``sleep()`` instead of ``time.sleep`` so a cancel interrupts page waits.
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.reason = None
+
+    def cancel(self, reason='cancelled'):
+        if not self.event.is_set():
+            self.reason = reason
+            self.event.set()
+
+    @property
+    def cancelled(self):
+        return self.event.is_set()
+
+    def check(self):
+        """Raise TaskCancelled if the token has been cancelled"""
+        if self.event.is_set():
+            raise TaskCancelled(self.reason)
+
+    def sleep(self, seconds):
+        """Sleep up to seconds, raising TaskCancelled as soon as cancelled"""
+        if self.event.wait(seconds):
+            raise TaskCancelled(self.reason)
+
+def checkpoint(token):
+    """check() that tolerates callers passing no token"""
+    if token is not None:
+        token.check()
+
+def pause(seconds, token=None):
+    """time.sleep that wakes early when the token is cancelled"""
+    (token or CancellationToken()).sleep(seconds)
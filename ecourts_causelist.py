@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Cause List Index
+Filterable, cursor-paginated views over fetched cause lists
+"""
+
+import base64
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+
+FILTER_FIELDS = ('court_name', 'purpose', 'advocate', 'case_type')
+
+CASE_NO_PATTERN = re.compile(r'^(.*?)\s*\d+\s*/\s*\d{2,4}\s*$')
+
+class InvalidCursor(Exception):
+    """Raised for malformed cursors or cursors whose list has expired"""
+
+def normalize(value):
+    """Case- and whitespace-insensitive form used for index keys"""
+    return ' '.join(str(value or '').split()).casefold()
+
+def case_type_of(case_no):
+    """Case type prefix of a case number, e.g. 'CRL.M.C.' for 'CRL.M.C. 1234/2025'"""
+    match = CASE_NO_PATTERN.match(case_no or '')
+    return match.group(1).strip() if match else ''
+
+def encode_cursor(list_id, offset, filters, selection=None):
+    """
+    Opaque page cursor. It carries the list's selection too, so a worker
+    that never indexed the list can fetch it again and serve the page.
+    """
+    payload = {'l': list_id, 'o': offset, 'f': filters}
+    if selection is not None:
+        payload['s'] = list(selection)
+    payload = json.dumps(payload, separators=(',', ':'), sort_keys=True)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """Return (list_id, offset, filters, selection or None)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        list_id, offset, filters = payload['l'], int(payload['o']), payload.get('f') or {}
+        selection = payload.get('s')
+        if selection is not None:
+            selection = CauseListStore.selection_key(*selection)
+    except Exception:
+        raise InvalidCursor('Malformed cursor')
+    if offset < 0:
+        raise InvalidCursor('Malformed cursor')
+    return list_id, offset, filters, selection
+
+class CauseListIndex:
+    """
+    Inverted index over one cause list.
+
+    Each filter field maps normalized values to the ascending row positions
+    holding them. A filter matches any distinct value containing the search
+    text, so lookups cost the number of distinct values plus matches rather
+    than a scan of every row.
+    """
+
+    def __init__(self, list_id, cause_list, downloads=None, selection=None):
+        self.list_id = list_id
+        self.selection = selection
+        self.downloads = downloads or {}
+        self.metadata = cause_list.get('metadata', {})
+        self.cases = cause_list.get('cases', [])
+        self.postings = {field: {} for field in FILTER_FIELDS}
+
+        for position, case in enumerate(self.cases):
+            values = dict(case)
+            values['case_type'] = case_type_of(case.get('case_no'))
+            for field in FILTER_FIELDS:
+                self.postings[field].setdefault(normalize(values.get(field)), []).append(position)
+
+        self.match_cache = OrderedDict()
+
+    def matches(self, filters):
+        """Ascending positions of rows matching every filter"""
+        active = {f: normalize(v) for f, v in filters.items() if f in FILTER_FIELDS and normalize(v)}
+        if not active:
+            return range(len(self.cases))
+
+        key = tuple(sorted(active.items()))
+        if key in self.match_cache:
+            self.match_cache.move_to_end(key)
+            return self.match_cache[key]
+
+        result = None
+        for field, needle in active.items():
+            positions = set()
+            for value, rows in self.postings[field].items():
+                if needle in value:
+                    positions.update(rows)
+            result = positions if result is None else result & positions
+            if not result:
+                break
+
+        result = sorted(result or ())
+        self.match_cache[key] = result
+        if len(self.match_cache) > 32:
+            self.match_cache.popitem(last=False)
+        return result
+
+    def page(self, filters=None, offset=0, limit=50):
+        """Return (rows, next_cursor, total_matches)"""
+        filters = {f: v for f, v in (filters or {}).items() if f in FILTER_FIELDS and normalize(v)}
+        positions = self.matches(filters)
+        rows = [self.cases[i] for i in positions[offset:offset + limit]]
+
+        next_offset = offset + len(rows)
+        next_cursor = encode_cursor(self.list_id, next_offset, filters, self.selection) if next_offset < len(positions) else None
+        return rows, next_cursor, len(positions)
+
+class CauseListStore:
+    """LRU of cause list indexes with a time-to-live, keyed by list id"""
+
+    def __init__(self, max_lists=256, ttl=600):
+        self.max_lists = max_lists
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.lists = OrderedDict()
+        self.latest = {}
+
+    @staticmethod
+    def selection_key(state, district, complex_name, date):
+        return (state, district, complex_name, date)
+
+    def put(self, selection, cause_list, downloads=None):
+        """Index a freshly fetched cause list and return the index"""
+        list_id = hashlib.sha1(repr((selection, time.time())).encode()).hexdigest()[:16]
+        index = CauseListIndex(list_id, cause_list, downloads, selection)
+
+        with self.lock:
+            self.lists[list_id] = (time.monotonic(), index)
+            self.latest[selection] = list_id
+            while len(self.lists) > self.max_lists:
+                expired_id, _ = self.lists.popitem(last=False)
+                self.latest = {k: v for k, v in self.latest.items() if v != expired_id}
+        return index
+
+    def get(self, list_id):
+        with self.lock:
+            entry = self.lists.get(list_id)
+            if entry is None:
+                return None
+            stored_at, index = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self.lists[list_id]
+                return None
+            self.lists.move_to_end(list_id)
+            return index
+
+    def lookup(self, selection):
+        """Most recent unexpired index for a state/district/complex/date"""
+        with self.lock:
+            list_id = self.latest.get(selection)
+        return self.get(list_id) if list_id else None
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Configuration
+Loads config.ini once and provides typed lookups with defaults
+"""
+
+import configparser
+import os
+
+CONFIG_PATH = os.environ.get(
+    'ECOURTS_CONFIG',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.ini')
+)
+
+_config = None
+
+def load_config(path=None, reload=False):
+    """Load config.ini (cached after the first call)"""
+    global _config
+
+    if _config is None or reload or path:
+        # Interpolation is disabled so logging format strings survive untouched
+        config = configparser.ConfigParser(interpolation=None)
+        config.read(path or CONFIG_PATH, encoding='utf-8')
+        _config = config
+
+    return _config
+
+def get(section, option, fallback=None):
+    """Read a string option"""
+    value = load_config().get(section, option, fallback=fallback)
+    if value == '' and fallback is not None:
+        return fallback
+    return value
+
+def get_int(section, option, fallback=0):
+    """Read an integer option"""
+    try:
+        return load_config().getint(section, option, fallback=fallback)
+    except ValueError:
+        return fallback
+
+def get_float(section, option, fallback=0.0):
+    """Read a float option"""
+    try:
+        return load_config().getfloat(section, option, fallback=fallback)
+    except ValueError:
+        return fallback
+
+def get_bool(section, option, fallback=False):
+    """Read a boolean option"""
+    try:
+        return load_config().getboolean(section, option, fallback=fallback)
+    except ValueError:
+        return fallback
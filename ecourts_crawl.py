@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Statewide Crawl
+Every complex's cause list for whole states, spread over work-stealing workers
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+from ecourts_directory import GEOGRAPHIC_DATA
+from ecourts_downloads import export_name
+
+logger = logging.getLogger(__name__)
+
+# metadata.source of a cause list parsed from eCourts; anything else is demo data
+LIVE_SOURCE = 'eCourts'
+
+def is_live(result):
+    return (result or {}).get('metadata', {}).get('source') == LIVE_SOURCE
+
+def fetch_live_cause_list(pool, state, district, complex_name, date, timeout=None):
+    """
+    One cause list through the scraper pool. fetch_cause_list falls back to
+    demo data when eCourts fails or shows no table; in a crawl or listing
+    check that must count as a failure, not as real hearings.
+    """
+    with pool.scraper(timeout=timeout) as scraper:
+        result = scraper.fetch_cause_list(state, district, complex_name, date)
+    if not is_live(result):
+        raise RuntimeError('No cause list from eCourts (demo data fallback)')
+    return result
+
+class WorkUnit:
+    """One cause list to fetch: a complex on a date"""
+
+    def __init__(self, state, district, complex_name, date):
+        self.state = state
+        self.district = district
+        self.complex_name = complex_name
+        self.date = date
+        self.attempts = 0
+
+    @property
+    def key(self):
+        return f"{self.state}|{self.district}|{self.complex_name}|{self.date}"
+
+    @property
+    def filename_base(self):
+        return export_name('cause_list', self.state, self.district, self.complex_name, self.date.replace('/', '_'))
+
+    def __repr__(self):
+        return f"WorkUnit({self.key})"
+
+def plan_units(states, dates, districts=None):
+    """Expand states (optionally limited to districts) into per-complex, per-date units"""
+    units = []
+    for state in states:
+        if state not in GEOGRAPHIC_DATA:
+            raise ValueError(f"Unknown state: {state}")
+        for district, complexes in GEOGRAPHIC_DATA[state].items():
+            if districts and district not in districts:
+                continue
+            for complex_name in complexes:
+                for date in dates:
+                    units.append(WorkUnit(state, district, complex_name, date))
+    return units
+
+class WorkStealingPool:
+    """
+    Fixed workers, each with its own deque of units.
+
+    A worker takes from the front of its own deque; when that runs dry it
+    steals from the back of the longest other deque. A slow complex only
+    delays the worker holding it, while the rest of that worker's backlog
+    is drained by idle peers, so the run ends when total work is done
+    rather than when the unluckiest worker's share is.
+    """
+
+    def __init__(self, workers, func, retries=1, on_result=None, shuffle=True):
+        self.workers = max(1, workers)
+        self.func = func
+        self.retries = retries
+        self.on_result = on_result
+        self.shuffle = shuffle
+
+        self.deques = [deque() for _ in range(self.workers)]
+        self.locks = [threading.Lock() for _ in range(self.workers)]
+        self.stats = {'completed': 0, 'failed': 0, 'retried': 0, 'steals': 0}
+        self.stats_lock = threading.Lock()
+        self.stop_event = threading.Event()
+
+    def run(self, units):
+        """Process every unit; returns {unit key: (status, result or error)}"""
+        units = list(units)
+        # Shuffled round-robin so one state's or district's units are not all on one worker
+        if self.shuffle:
+            random.shuffle(units)
+        for i, unit in enumerate(units):
+            self.deques[i % self.workers].append(unit)
+
+        results = {}
+        threads = [
+            threading.Thread(target=self._work, args=(i, results), name=f'crawl-{i}', daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def stop(self):
+        """Let running units finish and start no new ones"""
+        self.stop_event.set()
+
+    def _next(self, index):
+        with self.locks[index]:
+            if self.deques[index]:
+                return self.deques[index].popleft()
+
+        # Own deque empty: steal from the back of the fullest peer
+        victims = sorted(range(self.workers), key=lambda i: len(self.deques[i]), reverse=True)
+        for victim in victims:
+            if victim == index:
+                continue
+            with self.locks[victim]:
+                if self.deques[victim]:
+                    with self.stats_lock:
+                        self.stats['steals'] += 1
+                    return self.deques[victim].pop()
+        return None
+
+    def _work(self, index, results):
+        while not self.stop_event.is_set():
+            unit = self._next(index)
+            if unit is None:
+                return
+
+            unit.attempts += 1
+            try:
+                outcome = ('done', self.func(unit))
+            except Exception as e:
+                if unit.attempts <= self.retries:
+                    with self.stats_lock:
+                        self.stats['retried'] += 1
+                    # Retry later, at the back so other units go first
+                    with self.locks[index]:
+                        self.deques[index].append(unit)
+                    continue
+                logger.error(f"❌ {unit.complex_name} on {unit.date} failed: {e}")
+                outcome = ('failed', str(e))
+
+            with self.stats_lock:
+                self.stats['completed' if outcome[0] == 'done' else 'failed'] += 1
+                results[unit.key] = outcome
+            if self.on_result:
+                self.on_result(unit, *outcome)
+
+class CrawlJournal:
+    """
+    Append-only JSON-lines record of a crawl's plan and committed units.
+
+    A unit is journaled only after its export has been renamed into place,
+    and each line is fsynced, so after a crash every journaled unit has its
+    output on disk and every other unit is simply fetched again. A torn
+    last line from the crash is cut off when the journal is reopened.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.plan = None
+        self.completed = {}
+
+        if os.path.exists(path):
+            self._load()
+        self.file = open(path, 'a', encoding='utf-8')
+
+    def _load(self):
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        intact = data[:data.rfind(b'\n') + 1]
+        if len(intact) < len(data):
+            logger.warning(f"⚠️ Dropping torn last entry of {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(len(intact))
+
+        for line in intact.decode('utf-8').splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get('type') == 'plan':
+                self.plan = entry['plan']
+            elif entry.get('type') == 'done':
+                self.completed[entry['key']] = entry.get('cases', 0)
+
+    def start(self, plan):
+        """Record the plan of a new crawl, or check a resumed one matches it"""
+        if self.plan is None:
+            self.plan = plan
+            self._append({'type': 'plan', 'plan': plan})
+        elif self.plan != plan:
+            raise ValueError(f"{self.path} belongs to a different crawl")
+
+    def record(self, key, cases):
+        """Mark a unit done once its output is committed"""
+        self._append({'type': 'done', 'key': key, 'cases': cases})
+        with self.lock:
+            self.completed[key] = cases
+
+    def close(self):
+        self.file.close()
+
+    def _append(self, entry):
+        with self.lock:
+            self.file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+class StatewideCrawl:
+    """
+    Fetch, export and summarize the cause lists of whole states.
+
+    ``fetch(state, district, complex_name, date)`` returns a cause list;
+    each one is exported through ``writer`` as it arrives. Progress,
+    throughput and ETA are shown with tqdm. With a ``journal``, units it
+    already holds are skipped and new ones are recorded as their exports
+    are committed, so a crawl run again with the same journal resumes.
+    """
+
+    def __init__(self, fetch, writer, workers=4, retries=1, progress=True, journal=None):
+        self.fetch = fetch
+        self.writer = writer
+        self.workers = workers
+        self.retries = retries
+        self.progress = progress
+        self.journal = journal
+        self.pool = None
+
+    def run(self, units):
+        from tqdm import tqdm
+
+        units = list(units)
+        done = dict(self.journal.completed) if self.journal else {}
+        pending = [unit for unit in units if unit.key not in done]
+        if done:
+            logger.info(f"⏩ Resuming: {len(units) - len(pending)} of {len(units)} cause lists already done")
+
+        started = time.monotonic()
+        bar = tqdm(total=len(units), initial=len(units) - len(pending), unit='list',
+                   desc='Cause lists', disable=not self.progress)
+        summary = {'cases': sum(done.get(unit.key, 0) for unit in units)}
+        lock = threading.Lock()
+        uncommitted = {}
+
+        def fetch_unit(unit):
+            return self.fetch(unit.state, unit.district, unit.complex_name, unit.date)
+
+        def on_commit(filename_base):
+            with lock:
+                entry = uncommitted.pop(filename_base, None)
+            if entry:
+                self.journal.record(*entry)
+
+        def on_result(unit, status, result):
+            cases = len(result.get('cases', [])) if status == 'done' else 0
+            if status == 'done':
+                # Only real eCourts data is journaled: --resume must refetch anything synthetic
+                if self.journal and is_live(result):
+                    with lock:
+                        uncommitted[unit.filename_base] = (unit.key, cases)
+                self.writer.submit(unit.filename_base, result)
+            with lock:
+                summary['cases'] += cases
+                bar.update(1)
+                bar.set_postfix(cases=summary['cases'], failed=self.pool.stats['failed'], steals=self.pool.stats['steals'])
+
+        if self.journal:
+            self.writer.on_commit = on_commit
+        self.pool = WorkStealingPool(self.workers, fetch_unit, self.retries, on_result)
+        try:
+            results = self.pool.run(pending)
+        finally:
+            bar.close()
+            self.writer.flush()
+
+        elapsed = time.monotonic() - started
+        return {
+            'units': len(units),
+            'resumed': len(units) - len(pending),
+            'completed': self.pool.stats['completed'],
+            'failed': self.pool.stats['failed'],
+            'retried': self.pool.stats['retried'],
+            'steals': self.pool.stats['steals'],
+            'cases': summary['cases'],
+            'elapsed_seconds': round(elapsed, 2),
+            'lists_per_second': round(self.pool.stats['completed'] / elapsed, 3) if elapsed else 0,
+            'failures': {key: error for key, (status, error) in results.items() if status == 'failed'}
+        }
+
+def crawl_dates(start=None, days=1):
+    """DD/MM/YYYY dates from start (default today) for the given number of days"""
+    first = datetime.strptime(start, '%d/%m/%Y') if start else datetime.now()
+    return [(first + timedelta(days=i)).strftime('%d/%m/%Y') for i in range(days)]
+
+def main():
+    """Crawl every complex of the given states from the command line"""
+    import ecourts_config as config
+    from ecourts_logging import setup_logging
+    from ecourts_pool import ScraperPool
+    from ecourts_writer import ResultWriter
+
+    parser = argparse.ArgumentParser(description='eCourts statewide cause list crawl')
+    parser.add_argument('--state', action='append', help='State to crawl (repeatable)')
+    parser.add_argument('--district', action='append', help='Limit to these districts (repeatable)')
+    parser.add_argument('--date', help='First date (DD/MM/YYYY), default today')
+    parser.add_argument('--days', type=int, default=1, help='Number of consecutive dates')
+    parser.add_argument('--workers', type=int, default=config.get_int('api', 'max_concurrent_tasks', 5))
+    parser.add_argument('--retries', type=int, default=config.get_int('scraper', 'retry_attempts', 3))
+    parser.add_argument('--output', default=os.path.join(config.get('scraper', 'output_directory', 'downloads'), 'crawl'))
+    parser.add_argument('--resume', action='store_true', help='Continue the crawl journaled in --output')
+    args = parser.parse_args()
+
+    setup_logging(level='WARNING')
+
+    os.makedirs(args.output, exist_ok=True)
+    journal_path = os.path.join(args.output, 'crawl_journal.jsonl')
+    if not args.resume and os.path.exists(journal_path):
+        os.remove(journal_path)
+    journal = CrawlJournal(journal_path)
+
+    if args.resume and journal.plan:
+        plan = journal.plan
+    elif args.state:
+        plan = {'states': args.state, 'districts': args.district, 'dates': crawl_dates(args.date, args.days)}
+    else:
+        parser.error('--state is required unless resuming a journaled crawl')
+    journal.start(plan)
+
+    units = plan_units(plan['states'], plan['dates'], plan['districts'])
+    print(f"🗺️  {len(units)} cause lists across {', '.join(plan['states'])} with {args.workers} workers")
+
+    pool = ScraperPool(size=args.workers, headless=config.get_bool('scraper', 'headless', True))
+    writer = ResultWriter(output_dir=args.output, fsync_policy=config.get('export', 'fsync_policy', 'batch'))
+
+    def fetch(state, district, complex_name, date):
+        return fetch_live_cause_list(pool, state, district, complex_name, date)
+
+    try:
+        summary = StatewideCrawl(fetch, writer, args.workers, args.retries, journal=journal).run(units)
+    finally:
+        writer.close()
+        pool.close()
+        journal.close()
+
+    summary_path = os.path.join(args.output, 'crawl_summary.json')
+    with open(f"{summary_path}.tmp", 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    os.replace(f"{summary_path}.tmp", summary_path)
+
+    print(f"✅ {summary['resumed'] + summary['completed']}/{summary['units']} lists, {summary['cases']} cases in {summary['elapsed_seconds']}s "
+          f"({summary['lists_per_second']} lists/s, {summary['steals']} steals, {summary['failed']} failed)")
+
+if __name__ == '__main__':
+    main()
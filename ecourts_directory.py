@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Court Directory
+States, districts and court complexes with their CNR establishment codes
+"""
+
+import re
+
+# Same coverage as the web interface's geographic selectors
+GEOGRAPHIC_DATA = {
+    'Delhi': {
+        'New Delhi': ['Patiala House Court Comp', 'Saket Court Complex'],
+        'Central Delhi': ['Tis Hazari Court Complex', 'Karkardooma Court Complex'],
+        'South Delhi': ['Saket Court Complex', 'Dwarka Court Complex'],
+        'East Delhi': ['Karkardooma Court Complex', 'Mandoli Court Complex'],
+        'West Delhi': ['Rohini Court Complex', 'Dwarka Court Complex']
+    },
+    'Maharashtra': {
+        'Mumbai City': ['Mumbai City Civil Court', 'Bombay High Court'],
+        'Pune': ['Pune District Court', 'Pune City Civil Court'],
+        'Nagpur': ['Nagpur District Court', 'Nagpur Bench High Court'],
+        'Thane': ['Thane District Court', 'Kalyan Court Complex'],
+        'Nashik': ['Nashik District Court', 'Nashik Road Court']
+    },
+    'Uttar Pradesh': {
+        'Lucknow': ['Lucknow District Court', 'Lucknow Bench'],
+        'Kanpur': ['Kanpur District Court', 'Kanpur Nagar Court'],
+        'Allahabad': ['Allahabad High Court', 'Allahabad District Court'],
+        'Varanasi': ['Varanasi District Court', 'Varanasi Civil Court'],
+        'Noida': ['Gautam Buddha Nagar Court', 'Noida Additional Court']
+    },
+    'Karnataka': {
+        'Bangalore Urban': ['Bangalore City Civil Court', 'Karnataka High Court'],
+        'Mysore': ['Mysore District Court', 'Mysore City Court'],
+        'Hubli': ['Hubli-Dharwad Court', 'Hubli District Court'],
+        'Mangalore': ['Mangalore District Court', 'Mangalore City Court'],
+        'Belgaum': ['Belgaum District Court', 'Belgaum Bench High Court']
+    },
+    'Tamil Nadu': {
+        'Chennai': ['Chennai City Civil Court', 'Madras High Court'],
+        'Coimbatore': ['Coimbatore District Court', 'Coimbatore City Court'],
+        'Madurai': ['Madurai District Court', 'Madurai Bench High Court'],
+        'Salem': ['Salem District Court', 'Salem City Court'],
+        'Trichy': ['Trichy District Court', 'Trichy City Court']
+    }
+}
+
+# First four CNR characters: state code + district code
+DISTRICT_CODES = {
+    ('Delhi', 'New Delhi'): 'DLND', ('Delhi', 'Central Delhi'): 'DLCT', ('Delhi', 'South Delhi'): 'DLST',
+    ('Delhi', 'East Delhi'): 'DLET', ('Delhi', 'West Delhi'): 'DLWT',
+    ('Maharashtra', 'Mumbai City'): 'MHMC', ('Maharashtra', 'Pune'): 'MHPU', ('Maharashtra', 'Nagpur'): 'MHNG',
+    ('Maharashtra', 'Thane'): 'MHTH', ('Maharashtra', 'Nashik'): 'MHNS',
+    ('Uttar Pradesh', 'Lucknow'): 'UPLK', ('Uttar Pradesh', 'Kanpur'): 'UPKN', ('Uttar Pradesh', 'Allahabad'): 'UPAL',
+    ('Uttar Pradesh', 'Varanasi'): 'UPVN', ('Uttar Pradesh', 'Noida'): 'UPGB',
+    ('Karnataka', 'Bangalore Urban'): 'KABU', ('Karnataka', 'Mysore'): 'KAMY', ('Karnataka', 'Hubli'): 'KAHD',
+    ('Karnataka', 'Mangalore'): 'KADK', ('Karnataka', 'Belgaum'): 'KABG',
+    ('Tamil Nadu', 'Chennai'): 'TNCH', ('Tamil Nadu', 'Coimbatore'): 'TNCO', ('Tamil Nadu', 'Madurai'): 'TNMD',
+    ('Tamil Nadu', 'Salem'): 'TNSL', ('Tamil Nadu', 'Trichy'): 'TNTR'
+}
+
+CNR_PATTERN = re.compile(r'^[A-Z]{4}\d{12}$')
+CASE_NUMBER_PATTERN = re.compile(r'(\d+)\s*/\s*(\d{4})\s*$')
+
+def _build_establishments():
+    # Establishment code = district code + two-digit position of the complex
+    establishments = {}
+    for state, districts in GEOGRAPHIC_DATA.items():
+        for district, complexes in districts.items():
+            for number, complex_name in enumerate(complexes, start=1):
+                code = f"{DISTRICT_CODES[(state, district)]}{number:02d}"
+                establishments[code] = (state, district, complex_name)
+    return establishments
+
+ESTABLISHMENTS = _build_establishments()
+ESTABLISHMENT_CODES = {court: code for code, court in ESTABLISHMENTS.items()}
+
+def normalize_cnr(cnr):
+    return re.sub(r'[^A-Za-z0-9]', '', str(cnr or '')).upper()
+
+def complex_for_cnr(cnr):
+    """(state, district, complex) of the establishment a CNR was filed in, or None"""
+    cnr = normalize_cnr(cnr)
+    if not CNR_PATTERN.match(cnr):
+        return None
+    return ESTABLISHMENTS.get(cnr[:6])
+
+def cnr_for_case(state, district, complex_name, case_no):
+    """
+    Stand-in CNR for a demo case number like 'CS 5678/2024', or None. Real
+    CNRs do not follow from case numbers, so live rows keep only the CNR
+    eCourts shows.
+    """
+    code = ESTABLISHMENT_CODES.get((state, district, complex_name))
+    match = CASE_NUMBER_PATTERN.search(case_no or '')
+    if code is None or match is None or len(match.group(1)) > 6:
+        return None
+    return f"{code}{int(match.group(1)):06d}{match.group(2)}"
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Downloads
+Safe export naming plus streaming gzip and zip responses
+"""
+
+import os
+import re
+import zipfile
+import zlib
+
+CHUNK_SIZE = 64 * 1024
+
+DOWNLOAD_ID_PATTERN = re.compile(r'^[A-Za-z0-9_.-]+\.(json|csv)$')
+UNSAFE_CHARS = re.compile(r'[^A-Za-z0-9_.-]+')
+
+def export_name(*parts):
+    """Filesystem-safe export base name built from user-supplied parts"""
+    name = '_'.join(UNSAFE_CHARS.sub('_', str(part)).strip('._') for part in parts)
+    return name or 'export'
+
+def download_path(output_dir, download_id):
+    """Resolve a download id ('<base>.json' or '<base>.csv') inside output_dir"""
+    if not DOWNLOAD_ID_PATTERN.match(download_id) or download_id.startswith('.'):
+        return None
+    return os.path.join(output_dir, download_id)
+
+def download_urls(filename_base, has_cases=True):
+    """Download links for one export"""
+    urls = {'json': f"/api/downloads/{filename_base}.json"}
+    if has_cases:
+        urls['csv'] = f"/api/downloads/{filename_base}.csv"
+        urls['zip'] = f"/api/downloads/bundle?ids={filename_base}.json,{filename_base}.csv"
+    return urls
+
+def stream_file(path):
+    """Yield a file in fixed-size chunks"""
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            yield chunk
+
+def stream_gzip(path):
+    """Gzip a file chunk by chunk without holding it in memory"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in stream_file(path):
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+class _StreamSink:
+    """Write-only file object; zipfile writes into it, the generator drains it"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+def stream_zip(paths):
+    """Zip several files on the fly; memory use is bounded by one chunk"""
+    sink = _StreamSink()
+
+    # An unseekable sink makes zipfile emit data descriptors after each entry
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for path in paths:
+            info = zipfile.ZipInfo.from_file(path, os.path.basename(path))
+            info.compress_type = zipfile.ZIP_DEFLATED
+
+            with open(path, 'rb') as src, archive.open(info, 'w', force_zip64=True) as dst:
+                for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+                    dst.write(chunk)
+                    data = sink.drain()
+                    if data:
+                        yield data
+
+            data = sink.drain()
+            if data:
+                yield data
+
+    yield sink.drain()
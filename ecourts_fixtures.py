@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Fixture Server
+Local stand-in for the eCourts endpoints that replays recorded pages
+"""
+
+import argparse
+import base64
+import html
+import logging
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+CAPTCHA_PATH = 'vendor/securimage/securimage_show.php'
+
+# 1x1 PNG; the scraper only needs an image element to screenshot
+CAPTCHA_PNG = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=='
+)
+
+# Page assets lean mode blocks, sized like the real site's so savings show up
+ASSETS = {
+    'css/style.css': ('text/css', b'/* ecourts */ body { font-family: sans-serif; }\n' * 800),
+    'images/logo.png': ('image/png', CAPTCHA_PNG + b'\0' * 60000),
+    'js/main.js': ('application/javascript', b'window.ecourts = {};\n')
+}
+
+PAGE_HEAD = """<html><head><title>eCourts Services</title>
+<link rel="stylesheet" href="css/style.css"><script src="js/main.js"></script></head>
+<body><img src="images/logo.png" alt="eCourts">"""
+
+# Default pages, used for any endpoint without a recorded file. {name}
+# placeholders are filled from the submitted form.
+DEFAULT_PAGES = {
+    'home/index': PAGE_HEAD + """
+<form method="post" action="?p=home/viewcase">
+  <input type="text" id="cnr_number" name="cnr_number" placeholder="Enter 16 Digit CNR Number">
+  <img id="captcha_image" src="vendor/securimage/securimage_show.php">
+  <input type="text" name="captcha" placeholder="Enter Captcha">
+  <input type="submit" value="Search">
+</form></body></html>""",
+
+    'home/viewcase': PAGE_HEAD + """
+<table class="case_details_table">
+  <tr><td>CNR Number</td><td>{cnr_number}</td></tr>
+  <tr><td>Case Type</td><td>CS - Civil Suit</td></tr>
+  <tr><td>Filing Date</td><td>15-01-2025</td></tr>
+  <tr><td>Registration Number</td><td>1234/2025</td></tr>
+  <tr><td>Case Status</td><td>Pending</td></tr>
+  <tr><td>Next Hearing Date</td><td>20th October 2025</td></tr>
+  <tr><td>Court Number and Judge</td><td>1-District Judge</td></tr>
+</table></body></html>""",
+
+    'casestatus/index': PAGE_HEAD + """
+<form method="post" action="?p=casestatus/submit">
+  <input type="text" name="party_name" placeholder="Petitioner/Respondent">
+  <input type="text" name="case_year" placeholder="Year">
+  <img src="vendor/securimage/securimage_show.php?captcha">
+  <input type="text" name="captcha" placeholder="Enter Captcha">
+  <input type="submit" value="Go">
+</form></body></html>""",
+
+    'casestatus/submit': PAGE_HEAD + """
+<table>
+  <tr><td>Party Name</td><td>{party_name}</td></tr>
+  <tr><td>Case Year</td><td>{case_year}</td></tr>
+  <tr><td>Case Status</td><td>Pending</td></tr>
+</table></body></html>""",
+
+    'cause_list/index': PAGE_HEAD + """
+<table id="cause_list">
+  <tr><th>Sr No</th><th>Case Number</th><th>Party Name</th><th>Advocate</th><th>Purpose</th><th>Court</th></tr>
+  <tr><td>1</td><td>CS 1234/2025</td><td>Arun Kumar vs State</td><td>Sh. Rajesh Sharma</td><td>For Arguments</td><td>Court No. 1</td></tr>
+  <tr><td>2</td><td>CRL.M.C. 5678/2024</td><td>Delhi Metro Rail Corp vs ABC Construction</td><td>Ms. Priya Gupta</td><td>For Evidence</td><td>Court No. 2</td></tr>
+  <tr><td>3</td><td>CM 9012/2025</td><td>HDFC Bank vs Rakesh Gupta</td><td>Sh. Amit Jain</td><td>For Orders</td><td>Court No. 3</td></tr>
+</table></body></html>"""
+}
+
+# Pages fetched by record(); form results need a solved CAPTCHA, so add those by hand
+RECORDED_PAGES = ('home/index', 'casestatus/index', 'cause_list/index')
+
+def fixture_file(page):
+    return page.replace('/', '_') + '.html'
+
+def record(base_url, output_dir, session=None):
+    """Save the live eCourts pages (and one CAPTCHA image) for replay"""
+    import requests
+
+    session = session or requests.Session()
+    os.makedirs(output_dir, exist_ok=True)
+    saved = []
+    for page in RECORDED_PAGES:
+        response = session.get(f"{base_url}?p={page}", timeout=30)
+        response.raise_for_status()
+        with open(os.path.join(output_dir, fixture_file(page)), 'w', encoding='utf-8') as f:
+            f.write(response.text)
+        saved.append(page)
+
+    response = session.get(f"{base_url}{CAPTCHA_PATH}", timeout=30)
+    with open(os.path.join(output_dir, 'captcha.png'), 'wb') as f:
+        f.write(response.content)
+    logger.info(f"✅ Recorded {len(saved)} pages into {output_dir}")
+    return saved
+
+class FixtureServer:
+    """
+    Threaded HTTP server answering eCourts URLs (``?p=<page>``, the CAPTCHA
+    and page assets) from recorded files in ``fixtures_dir``, falling back
+    to built-in pages. Every response waits ``latency`` seconds plus up to
+    ``jitter``; ``error_rate`` of requests get a 500 and ``hang_rate`` hang
+    for ``hang_seconds`` before a 504, with a seeded random generator so
+    runs are reproducible.
+    """
+
+    def __init__(self, fixtures_dir=None, host='127.0.0.1', port=0, latency=0.0, jitter=0.0,
+                 error_rate=0.0, hang_rate=0.0, hang_seconds=30, seed=None):
+        self.fixtures_dir = fixtures_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'errors': 0, 'hangs': 0}
+
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/ecourtindia_v6/"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='fixture-server', daemon=True)
+        self.thread.start()
+        logger.info(f"🧪 Fixture server on {self.base_url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def page(self, name, form):
+        """HTML of a page with form values filled in, or None"""
+        body = None
+        if self.fixtures_dir:
+            path = os.path.join(self.fixtures_dir, fixture_file(name))
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as f:
+                    body = f.read()
+        if body is None:
+            body = DEFAULT_PAGES.get(name)
+        if body is None:
+            return None
+        for key, values in form.items():
+            body = body.replace('{' + key + '}', html.escape(values[0]))
+        return body
+
+    def captcha(self):
+        if self.fixtures_dir:
+            path = os.path.join(self.fixtures_dir, 'captcha.png')
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    return f.read()
+        return CAPTCHA_PNG
+
+    def _fault(self):
+        """'error', 'hang' or None for one request, after the simulated latency"""
+        with self.lock:
+            self.stats['requests'] += 1
+            delay = self.latency + self.random.uniform(0, self.jitter)
+            roll = self.random.random()
+            fault = 'error' if roll < self.error_rate else 'hang' if roll < self.error_rate + self.hang_rate else None
+            if fault:
+                self.stats['errors' if fault == 'error' else 'hangs'] += 1
+        time.sleep(delay + (self.hang_seconds if fault == 'hang' else 0))
+        return fault
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.respond({})
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                self.respond(parse_qs(self.rfile.read(length).decode('utf-8')))
+
+            def respond(self, form):
+                fault = server._fault()
+                if fault:
+                    return self.send(500 if fault == 'error' else 504, 'text/plain', b'Injected failure')
+
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                path = url.path.split('/ecourtindia_v6/', 1)[-1].lstrip('/')
+
+                if path == CAPTCHA_PATH:
+                    return self.send(200, 'image/png', server.captcha())
+                if path in ASSETS:
+                    return self.send(200, *ASSETS[path])
+
+                page = server.page(query.get('p', ['home/index'])[0], {**query, **form})
+                if page is None:
+                    return self.send(404, 'text/plain', b'Not found')
+                self.send(200, 'text/html; charset=utf-8', page.encode('utf-8'))
+
+            def send(self, status, content_type, body):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+def main():
+    """Serve recorded pages, or record them from the live site"""
+    import ecourts_config as config
+
+    parser = argparse.ArgumentParser(description='eCourts fixture server')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve = sub.add_parser('serve', help='Replay fixtures over HTTP')
+    serve.add_argument('--fixtures', help='Directory of recorded pages (default: built-in pages)')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    serve.add_argument('--jitter', type=float, default=0.0, help='Up to this many extra seconds')
+    serve.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 500')
+    serve.add_argument('--hang-rate', type=float, default=0.0, help='Fraction of requests that hang')
+    serve.add_argument('--hang-seconds', type=float, default=30)
+    serve.add_argument('--seed', type=int)
+
+    rec = sub.add_parser('record', help='Save live eCourts pages as fixtures')
+    rec.add_argument('--output', default='fixtures')
+    rec.add_argument('--base-url', default=config.get('urls', 'base_url', 'https://services.ecourts.gov.in/ecourtindia_v6/'))
+
+    args = parser.parse_args()
+    from ecourts_logging import setup_logging
+    setup_logging()
+
+    if args.command == 'record':
+        record(args.base_url, args.output)
+        return
+
+    server = FixtureServer(args.fixtures, args.host, args.port, args.latency, args.jitter,
+                           args.error_rate, args.hang_rate, args.hang_seconds, args.seed)
+    print(f"🧪 Serving eCourts fixtures on {server.base_url}")
+    print(f"   Point scrapers at it with ECOURTS_BASE_URL={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Lean Browsing
+Blocks images, stylesheets, fonts and trackers over CDP, letting the CAPTCHA through
+"""
+
+import fnmatch
+import logging
+import re
+import threading
+
+import ecourts_metrics as metrics
+
+logger = logging.getLogger(__name__)
+
+# Static assets the scraper never reads
+BLOCKED_EXTENSIONS = (
+    'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'ico', 'bmp',
+    'css', 'woff', 'woff2', 'ttf', 'otf', 'eot',
+    'mp4', 'webm', 'mp3'
+)
+
+# Third-party hosts eCourts pages pull in for analytics, fonts and widgets
+BLOCKED_HOSTS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'fonts.googleapis.com',
+    'fonts.gstatic.com', 'facebook.net', 'twitter.com', 'addthis.com', 'sharethis.com'
+)
+
+# The CAPTCHA is served by a PHP endpoint, never as a static image, and the
+# page requests it with a random cache-busting query (securimage_show.php?0.81...)
+CAPTCHA_URL = 'https://services.ecourts.gov.in/ecourtindia_v6/vendor/securimage/securimage_show.php'
+CAPTCHA_PATTERN = re.compile(r'/securimage/securimage_show\.php(?:[?#]|$)')
+
+def is_captcha(url):
+    return CAPTCHA_PATTERN.search(url) is not None
+
+def blocked_url_patterns(extra=()):
+    """Wildcard patterns for CDP Network.setBlockedURLs, minus any matching the CAPTCHA"""
+    patterns = [f"*.{ext}" for ext in BLOCKED_EXTENSIONS]
+    patterns += [f"*.{ext}?*" for ext in BLOCKED_EXTENSIONS]
+    patterns += [f"*://*.{host}/*" for host in BLOCKED_HOSTS]
+    patterns += [f"*://{host}/*" for host in BLOCKED_HOSTS]
+    patterns += list(extra)
+    captcha = (CAPTCHA_URL, f'{CAPTCHA_URL}?0.5')
+    return [p for p in patterns if not any(fnmatch.fnmatchcase(url, p) for url in captcha)]
+
+def compile_patterns(patterns):
+    """One regex matching any of the wildcard patterns"""
+    return re.compile('|'.join(fnmatch.translate(pattern) for pattern in patterns))
+
+# Compiled once; checked on every request of a lean Playwright context
+BLOCKED_URLS = compile_patterns(blocked_url_patterns())
+
+def is_blocked(url, patterns=None):
+    """Whether Chrome would block this URL with the given patterns; never the CAPTCHA"""
+    matcher = compile_patterns(patterns) if patterns else BLOCKED_URLS
+    return not is_captcha(url) and matcher.match(url) is not None
+
+# Runs after load: the navigation entry and every resource Chrome actually fetched
+PAGE_TIMING_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+return {
+    load_ms: nav ? nav.loadEventEnd - nav.startTime : 0,
+    bytes: (nav ? nav.transferSize : 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+    requests: resources.length + 1
+};
+"""
+
+class PageStats:
+    """
+    Page load time and transferred bytes per browsing mode ('lean' or 'full').
+
+    Blocked requests are never made, so their size is unknown; bytes saved
+    is estimated from the average full page whenever full pages have been
+    measured in the same process.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.modes = {}
+
+    def record(self, mode, load_ms, transferred, requests):
+        with self.lock:
+            entry = self.modes.setdefault(mode, {'pages': 0, 'load_ms': 0.0, 'bytes': 0, 'requests': 0})
+            entry['pages'] += 1
+            entry['load_ms'] += load_ms
+            entry['bytes'] += transferred
+            entry['requests'] += requests
+        metrics.PAGE_LOAD.labels(mode=mode).observe(load_ms / 1000)
+        metrics.PAGE_BYTES.labels(mode=mode).inc(transferred)
+
+    def summary(self):
+        with self.lock:
+            modes = {mode: dict(entry) for mode, entry in self.modes.items()}
+
+        result = {}
+        for mode, entry in modes.items():
+            pages = entry['pages']
+            result[mode] = {
+                'pages': pages,
+                'avg_load_ms': round(entry['load_ms'] / pages, 1),
+                'avg_bytes': entry['bytes'] // pages,
+                'avg_requests': round(entry['requests'] / pages, 1)
+            }
+
+        if 'lean' in result and 'full' in result:
+            lean, full = result['lean'], result['full']
+            result['lean']['bytes_saved'] = max(0, full['avg_bytes'] - lean['avg_bytes']) * lean['pages']
+            result['lean']['load_ms_saved'] = round(full['avg_load_ms'] - lean['avg_load_ms'], 1)
+        return result
+
+PAGE_STATS = PageStats()
+
+def enable_lean_mode(driver, patterns=None):
+    """Block non-essential requests for every later navigation of this driver"""
+    patterns = patterns or blocked_url_patterns()
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    logger.info(f"🪶 Lean browsing: {len(patterns)} URL patterns blocked")
+
+def measure_page(driver, mode):
+    """Record the current page's load time and transferred bytes"""
+    try:
+        timing = driver.execute_script(PAGE_TIMING_SCRIPT)
+        PAGE_STATS.record(mode, float(timing['load_ms']), int(timing['bytes']), int(timing['requests']))
+        return timing
+    except Exception as e:
+        logger.debug(f"Page timing unavailable: {e}")
+        return None
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Listing Resolver
+Listing checks answered by joining CNRs against cached cause lists
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+import ecourts_metrics as metrics
+from ecourts_crawl import is_live
+from ecourts_directory import CNR_PATTERN, complex_for_cnr, normalize_cnr
+
+logger = logging.getLogger(__name__)
+
+def listing_dates(check_today=False, check_tomorrow=False):
+    """DD/MM/YYYY dates a listing check covers"""
+    today = datetime.now().date()
+    dates = []
+    if check_today:
+        dates.append(today.strftime('%d/%m/%Y'))
+    if check_tomorrow:
+        dates.append((today + timedelta(days=1)).strftime('%d/%m/%Y'))
+    return dates
+
+def index_cause_list(cause_list):
+    """
+    Map normalized CNR to the cause list rows of that case. Only CNRs the
+    rows carry are indexed; a case number alone (e.g. 'CS 5678/2024') does
+    not identify the case's CNR.
+    """
+    index = {}
+    for row in cause_list.get('cases', []):
+        cnr = normalize_cnr(row.get('cnr'))
+        if CNR_PATTERN.match(cnr):
+            index.setdefault(cnr, []).append(row)
+    return index
+
+def listing_from_row(date, row):
+    return {
+        'date': date,
+        'serial_no': row.get('sr_no', ''),
+        'case_no': row.get('case_no', ''),
+        'court_name': row.get('court_name', ''),
+        'purpose': row.get('purpose', '')
+    }
+
+class ListingResolver:
+    """
+    Answers "is this CNR listed on these dates" for many CNRs at once.
+
+    Each CNR maps to its complex through the court directory; the cause
+    list of every (complex, date) involved is fetched once, indexed by CNR
+    and kept for ``ttl`` seconds, and the CNRs are hash-joined against it.
+    Cost grows with the number of complexes, not the number of cases.
+    ``fetch(state, district, complex_name, date)`` returns a cause list;
+    with ``live_only`` a list not sourced from eCourts (a demo fallback)
+    fails the load instead of being indexed.
+    """
+
+    def __init__(self, fetch, ttl=3600, max_lists=512, live_only=True):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.max_lists = max_lists
+        self.live_only = live_only
+
+        self.lock = threading.Lock()
+        self.indexes = OrderedDict()
+        # Keys being fetched, so concurrent callers wait instead of refetching
+        self.loading = {}
+        self.stats = {'fetches': 0, 'hits': 0, 'failures': 0}
+
+    def plan(self, cnrs, dates):
+        """Return (cause lists still to fetch, CNRs outside the directory)"""
+        needed, unresolved = set(), []
+        for cnr in cnrs:
+            court = complex_for_cnr(cnr)
+            if court is None:
+                unresolved.append(cnr)
+                continue
+            for date in dates:
+                if self._cached((court, date)) is None:
+                    needed.add((court, date))
+        return needed, unresolved
+
+    def load(self, court, date):
+        """Fetch and index one complex's cause list unless already cached"""
+        key = (court, date)
+        while True:
+            with self.lock:
+                cached = self._cached_locked(key)
+                if cached is not None:
+                    self.stats['hits'] += 1
+                    metrics.record_cache('listing_index', True)
+                    return cached
+                event = self.loading.get(key)
+                if event is None:
+                    event = self.loading[key] = threading.Event()
+                    break
+            event.wait()
+
+        metrics.record_cache('listing_index', False)
+        try:
+            cause_list = self.fetch(*court, date)
+            if self.live_only and not is_live(cause_list):
+                raise RuntimeError('No cause list from eCourts (demo data fallback)')
+            index = index_cause_list(cause_list)
+            with self.lock:
+                self.stats['fetches'] += 1
+                self.indexes[key] = (time.monotonic(), index)
+                while len(self.indexes) > self.max_lists:
+                    self.indexes.popitem(last=False)
+            return index
+        except Exception as e:
+            with self.lock:
+                self.stats['failures'] += 1
+            logger.error(f"❌ Failed to load cause list for {court[2]} on {date}: {e}")
+            raise
+        finally:
+            with self.lock:
+                self.loading.pop(key).set()
+
+    def lookup(self, cnr, dates):
+        """Listings of a CNR from already loaded cause lists"""
+        court = complex_for_cnr(cnr)
+        cnr = normalize_cnr(cnr)
+        listings = []
+        for date in dates:
+            index = self._cached((court, date)) or {}
+            listings.extend(listing_from_row(date, row) for row in index.get(cnr, []))
+        return listings
+
+    def resolve(self, cnrs, dates):
+        """Return ({cnr: listings}, unresolved CNRs) loading each needed list once"""
+        needed, unresolved = self.plan(cnrs, dates)
+        for court, date in sorted(needed):
+            self.load(court, date)
+
+        skip = set(unresolved)
+        return {cnr: self.lookup(cnr, dates) for cnr in cnrs if cnr not in skip}, unresolved
+
+    def check_case_listing(self, cnr, check_today=False, check_tomorrow=False):
+        """Listings of one CNR today/tomorrow, or None if its complex is unknown"""
+        if complex_for_cnr(cnr) is None:
+            return None
+        results, _ = self.resolve([cnr], listing_dates(check_today, check_tomorrow))
+        return results[cnr]
+
+    def _cached(self, key):
+        with self.lock:
+            return self._cached_locked(key)
+
+    def _cached_locked(self, key):
+        entry = self.indexes.get(key)
+        if entry is None:
+            return None
+        stored_at, index = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self.indexes[key]
+            return None
+        self.indexes.move_to_end(key)
+        return index
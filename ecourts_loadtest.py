@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Load Test
+Replays a mix of CNR, case and cause list API calls at a target rate and finds the saturation point
+"""
+
+import argparse
+import configparser
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from ecourts_directory import GEOGRAPHIC_DATA
+
+logger = logging.getLogger(__name__)
+
+# Share of each request type in the replayed traffic
+REQUEST_MIX = {'search_cnr': 0.5, 'search_case': 0.2, 'cause_list': 0.3}
+
+ENDPOINTS = {
+    'search_cnr': '/api/search-cnr',
+    'search_case': '/api/search-case',
+    'cause_list': '/api/cause-list'
+}
+
+CASE_TYPES = ('Civil', 'Criminal', 'CS', 'CRL.M.C.', 'CM')
+
+def request_body(kind, rng):
+    """A plausible request body for one API call"""
+    if kind == 'search_cnr':
+        return {'cnr': f"DL{rng.choice(['ND', 'CT', 'SD'])}01{rng.randint(0, 999999):06d}{rng.randint(2015, 2025)}",
+                'check_today': rng.random() < 0.3}
+    if kind == 'search_case':
+        return {'case_type': rng.choice(CASE_TYPES), 'case_number': str(rng.randint(1, 9999)),
+                'case_year': str(rng.randint(2015, 2025))}
+
+    state = rng.choice(list(GEOGRAPHIC_DATA))
+    district = rng.choice(list(GEOGRAPHIC_DATA[state]))
+    # A week of dates, so repeat selections hit the cause list cache like real traffic
+    day = date.today() + timedelta(days=rng.randint(0, 6))
+    return {'state': state, 'district': district, 'complex': rng.choice(GEOGRAPHIC_DATA[state][district]),
+            'date': day.isoformat()}
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))]
+
+def summarise(samples, rate, duration):
+    """Latency percentiles (ms), error rate and throughput of one stage"""
+    def stats(group):
+        latencies = sorted(latency for _, latency, _ in group)
+        errors = sum(1 for _, _, ok in group if not ok)
+        return {
+            'requests': len(group),
+            'errors': errors,
+            'error_rate': round(errors / len(group), 4) if group else 0.0,
+            'p50_ms': round(percentile(latencies, 0.50) * 1000, 1) if group else None,
+            'p95_ms': round(percentile(latencies, 0.95) * 1000, 1) if group else None,
+            'p99_ms': round(percentile(latencies, 0.99) * 1000, 1) if group else None
+        }
+
+    summary = stats(samples)
+    ok = sum(1 for _, _, success in samples if success)
+    summary.update({
+        'offered_rate': rate,
+        'throughput': round(ok / duration, 2),
+        'endpoints': {kind: stats([s for s in samples if s[0] == kind])
+                      for kind in sorted({kind for kind, _, _ in samples})}
+    })
+    return summary
+
+class LoadGenerator:
+    """
+    Open-loop load: requests start on a fixed schedule of ``rate`` per second
+    whether or not earlier ones have finished. Latency is measured from each
+    request's scheduled start, so queueing in front of a slow server counts
+    against it instead of quietly lowering the offered rate.
+    """
+
+    def __init__(self, base_url, mix=None, timeout=60, max_in_flight=256, api_key=None, seed=None):
+        self.base_url = base_url.rstrip('/')
+        self.mix = mix or REQUEST_MIX
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self.headers = {'X-API-Key': api_key} if api_key else {}
+        self.rng = random.Random(seed)
+        self.local = threading.local()
+
+    def _session(self):
+        import requests
+
+        if not hasattr(self.local, 'session'):
+            self.local.session = requests.Session()
+            self.local.session.headers.update(self.headers)
+        return self.local.session
+
+    def _call(self, kind, body, scheduled):
+        try:
+            response = self._session().post(self.base_url + ENDPOINTS[kind], json=body, timeout=self.timeout)
+            ok = response.status_code < 400 and response.json().get('success', False)
+        except Exception:
+            ok = False
+        return kind, time.perf_counter() - scheduled, ok
+
+    def run(self, rate, duration):
+        """Offer ``rate`` requests/second for ``duration`` seconds and summarise"""
+        kinds, weights = zip(*self.mix.items())
+        total = max(1, int(rate * duration))
+        futures = []
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            started = time.perf_counter()
+            for i in range(total):
+                scheduled = started + i / rate
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                kind = self.rng.choices(kinds, weights)[0]
+                futures.append(executor.submit(self._call, kind, request_body(kind, self.rng), scheduled))
+            samples = [future.result() for future in futures]
+
+        # Completions trail their start by at least the fastest response, so
+        # throughput is measured over the schedule shifted by that latency
+        last_finish = max(i / rate + latency for i, (_, latency, _) in enumerate(samples))
+        fastest = min(latency for _, latency, _ in samples)
+        window = max(total / rate, last_finish - fastest + 1 / rate)
+        return summarise(samples, rate, window)
+
+def is_saturated(stage, p99_slo_ms, max_error_rate, min_throughput_ratio=0.9):
+    """Why a stage shows saturation, or None if the app kept up"""
+    if stage['error_rate'] > max_error_rate:
+        return f"error rate {stage['error_rate']:.1%}"
+    if stage['p99_ms'] is not None and stage['p99_ms'] > p99_slo_ms:
+        return f"p99 {stage['p99_ms']} ms"
+    if stage['throughput'] < stage['offered_rate'] * min_throughput_ratio:
+        return f"throughput {stage['throughput']}/s"
+    return None
+
+def find_saturation(run_stage, rates, p99_slo_ms=10000, max_error_rate=0.01):
+    """
+    Step through ``rates`` (requests/second) until a stage breaks the p99 SLO,
+    the error budget or stops keeping up with the offered rate. Returns every
+    stage plus the highest healthy rate ('capacity') and the first saturated one.
+    """
+    stages = []
+    capacity = saturation = reason = None
+    for rate in rates:
+        stage = run_stage(rate)
+        stages.append(stage)
+        reason = is_saturated(stage, p99_slo_ms, max_error_rate)
+        logger.info(f"📈 {rate}/s: p99 {stage['p99_ms']} ms, errors {stage['error_rate']:.1%}, "
+                    f"throughput {stage['throughput']}/s{' - saturated: ' + reason if reason else ''}")
+        if reason:
+            saturation = rate
+            break
+        capacity = rate
+    return {'capacity': capacity, 'saturation_rate': saturation, 'saturation_reason': reason, 'stages': stages}
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+class StandIn:
+    """
+    The web app in its own process with scraping aimed at a local fixture
+    server ('fixture', needs Chrome) or on demo data ('demo'). Rate limits
+    are switched off so the load test measures capacity, not throttling.
+    """
+
+    def __init__(self, scraper='fixture', server='gunicorn', latency=0.3, jitter=0.2, error_rate=0.0):
+        self.scraper = scraper
+        self.server = server
+        self.fixture_args = {'latency': latency, 'jitter': jitter, 'error_rate': error_rate}
+        self.fixtures = None
+        self.process = None
+        self.config_path = None
+        self.port = free_port()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def _write_config(self):
+        import ecourts_config as config
+
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read(config.CONFIG_PATH, encoding='utf-8')
+        parser.set('security', 'rate_limit', '0')
+        parser.set('security', 'ip_rate_limit', '0')
+        parser.set('api', 'live_scraping', 'true' if self.scraper == 'fixture' else 'false')
+
+        handle, self.config_path = tempfile.mkstemp(suffix='.ini')
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            parser.write(f)
+
+    def start(self, timeout=60):
+        import requests
+
+        env = dict(os.environ)
+        if self.scraper == 'fixture':
+            from ecourts_fixtures import FixtureServer
+            self.fixtures = FixtureServer(**self.fixture_args).start()
+            env['ECOURTS_BASE_URL'] = self.fixtures.base_url
+        self._write_config()
+        env['ECOURTS_CONFIG'] = self.config_path
+
+        root = os.path.dirname(os.path.abspath(__file__))
+        if self.server == 'gunicorn':
+            cmd = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '-b', f'127.0.0.1:{self.port}',
+                   '--access-logfile', '/dev/null', '--pid', f'/tmp/loadtest-gunicorn-{self.port}.pid',
+                   'ecourts_web_interface:app']
+        else:
+            cmd = [sys.executable, '-c', "from ecourts_web_interface import app; "
+                   f"app.run(host='127.0.0.1', port={self.port}, debug=False, threaded=True)"]
+        self.process = subprocess.Popen(cmd, cwd=root, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.process.poll() is not None:
+                break
+            try:
+                requests.get(f"{self.base_url}/health", timeout=1)
+                return self
+            except Exception:
+                time.sleep(0.2)
+        self.stop()
+        raise RuntimeError(f"{self.server} did not start on port {self.port}")
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            self.process.wait(timeout=30)
+        if self.fixtures is not None:
+            self.fixtures.stop()
+        if self.config_path and os.path.exists(self.config_path):
+            os.remove(self.config_path)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def parse_mix(text):
+    """'search_cnr=5,cause_list=3' -> weights"""
+    mix = {}
+    for part in text.split(','):
+        kind, _, weight = part.partition('=')
+        if kind.strip() not in ENDPOINTS:
+            raise ValueError(f"Unknown request type: {kind}")
+        mix[kind.strip()] = float(weight or 1)
+    return mix
+
+def main():
+    """Load test a running app (--url) or a stand-in started here"""
+    parser = argparse.ArgumentParser(description='eCourts API load test')
+    parser.add_argument('--url', help='Running app to test (default: start a stand-in)')
+    parser.add_argument('--scraper', choices=('fixture', 'demo'), default='fixture',
+                        help="Stand-in scraping: Chrome against the fixture server, or demo data")
+    parser.add_argument('--server', choices=('gunicorn', 'dev'), default='gunicorn')
+    parser.add_argument('--fixture-latency', type=float, default=0.3, help='Seconds the fixture server adds per page')
+    parser.add_argument('--rate', type=float, help='Single stage at this many requests/second')
+    parser.add_argument('--ramp', default='1:20:1', help='start:stop:step requests/second to find saturation')
+    parser.add_argument('--stage-seconds', type=float, default=30)
+    parser.add_argument('--mix', help='Request weights, e.g. search_cnr=5,search_case=2,cause_list=3')
+    parser.add_argument('--p99-slo', type=float, default=10000, help='p99 latency (ms) above which the app is saturated')
+    parser.add_argument('--max-error-rate', type=float, default=0.01)
+    parser.add_argument('--api-key', help='Sent as X-API-Key when testing a deployment')
+    parser.add_argument('--json', help='Write the report to this file')
+    args = parser.parse_args()
+
+    from ecourts_logging import setup_logging
+    setup_logging()
+
+    if args.rate:
+        rates = [args.rate]
+    else:
+        start, stop, step = (float(x) for x in args.ramp.split(':'))
+        rates = []
+        while start <= stop:
+            rates.append(round(start, 3))
+            start += step
+
+    stand_in = None
+    if not args.url:
+        stand_in = StandIn(args.scraper, args.server, latency=args.fixture_latency).start()
+        print(f"🧪 Stand-in app on {stand_in.base_url} ({args.scraper} scraping, {args.server})")
+
+    try:
+        generator = LoadGenerator(args.url or stand_in.base_url, mix=parse_mix(args.mix) if args.mix else None,
+                                  api_key=args.api_key)
+        report = find_saturation(lambda rate: generator.run(rate, args.stage_seconds), rates,
+                                 args.p99_slo, args.max_error_rate)
+    finally:
+        if stand_in:
+            stand_in.stop()
+
+    print(f"\n{'rate/s':>8} {'thru/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>8}")
+    for stage in report['stages']:
+        print(f"{stage['offered_rate']:>8} {stage['throughput']:>8} {stage['p50_ms']:>9} {stage['p95_ms']:>9} "
+              f"{stage['p99_ms']:>9} {stage['error_rate']:>8.1%}")
+    if report['saturation_rate']:
+        print(f"\n🚦 Saturated at {report['saturation_rate']}/s ({report['saturation_reason']}); "
+              f"capacity {report['capacity'] or 0}/s")
+    else:
+        print(f"\n✅ No saturation up to {rates[-1]}/s")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == '__main__':
+    main()
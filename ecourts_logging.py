@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Logging
+Queue-backed logging: scraping threads only enqueue, a listener thread writes rotating JSON lines
+"""
+
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import ecourts_config as config
+from ecourts_tracing import current_span
+
+try:
+    import fcntl
+except ImportError:  # Windows: rotation is not coordinated between processes
+    fcntl = None
+
+# Fields (task_id, operation, ...) attached to every record logged in this context
+_log_context = contextvars.ContextVar('ecourts_log_context', default={})
+
+@contextmanager
+def log_context(**fields):
+    """Attach fields such as task_id to every log record inside the block"""
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+class ContextFilter(logging.Filter):
+    """Stamps records with the log context and the open tracing span's stage"""
+
+    def filter(self, record):
+        for key, value in _log_context.get().items():
+            setattr(record, key, value)
+        span = current_span()
+        if span is not None:
+            record.stage = span.name
+            if not hasattr(record, 'operation'):
+                record.operation = span.operation
+        return True
+
+# Record attributes every LogRecord has; anything else was added by context or extra=
+STANDARD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'process': record.process,
+            'thread': record.threadName
+        }
+        for key, value in vars(record).items():
+            if key not in STANDARD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the listener without ever waiting: when the queue is
+    full the record is dropped and counted instead of stalling a scrape.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Resolve the message and traceback in the caller: args and exc_info may
+        # change or be gone by the time the listener writes the record
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg, record.args, record.exc_info = record.message, None, None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class SharedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler several processes (e.g. gunicorn workers) can share.
+    Writes and rollovers happen under an flock on ``<file>.lock``, the size
+    check sees every process's lines, and a handler whose file another
+    process rotated away reopens the new one, so backup_count bounds the
+    logs of the whole service.
+    """
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding=None):
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        self.lock_file = open(self.baseFilename + '.lock', 'a') if fcntl else None
+
+    def emit(self, record):
+        if self.lock_file is None:
+            return super().emit(record)
+        fcntl.flock(self.lock_file, fcntl.LOCK_EX)
+        try:
+            self.reopen_if_rotated()
+            super().emit(record)
+        finally:
+            fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+
+    def reopen_if_rotated(self):
+        if self.stream is None:
+            return
+        try:
+            rotated = os.stat(self.baseFilename).st_ino != os.fstat(self.stream.fileno()).st_ino
+        except FileNotFoundError:
+            rotated = True
+        if rotated:
+            self.stream.close()
+            self.stream = self._open()
+
+    def close(self):
+        super().close()
+        if self.lock_file is not None:
+            self.lock_file.close()
+            self.lock_file = None
+
+class _State:
+    listener = None
+    handler = None
+    pid = None
+
+_state = _State()
+_lock = threading.Lock()
+
+def setup_logging(level=None, log_file=None, console=None, console_json=None, queue_size=None):
+    """
+    Route all logging through one background listener, configured from
+    config.ini [logging]: level, file (JSON lines, rotated at max_bytes
+    keeping backup_count files; processes may share it), console_logging
+    (stderr, in ``format`` or JSON with console_json) and queue_size. Safe
+    to call again, e.g. after a fork.
+    """
+    level = level or config.get('logging', 'level', 'INFO')
+    log_file = config.get('logging', 'file', '') if log_file is None else log_file
+    console = config.get_bool('logging', 'console_logging', True) if console is None else console
+    console_json = config.get_bool('logging', 'console_json', False) if console_json is None else console_json
+    queue_size = queue_size or config.get_int('logging', 'queue_size', 10000)
+
+    with _lock:
+        _stop_listener()
+
+        handlers = []
+        if log_file:
+            directory = os.path.dirname(log_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            file_handler = SharedRotatingFileHandler(
+                log_file, maxBytes=config.get_int('logging', 'max_bytes', 10 * 1024 * 1024),
+                backupCount=config.get_int('logging', 'backup_count', 5), encoding='utf-8'
+            )
+            file_handler.setFormatter(JsonFormatter())
+            handlers.append(file_handler)
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(JsonFormatter() if console_json else logging.Formatter(
+                config.get('logging', 'format', '%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+            ))
+            handlers.append(console_handler)
+
+        log_queue = queue.Queue(maxsize=queue_size)
+        handler = NonBlockingQueueHandler(log_queue)
+        handler.addFilter(ContextFilter())
+
+        root = logging.getLogger()
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(handler)
+        root.setLevel(level.upper() if isinstance(level, str) else level)
+
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _state.listener, _state.handler, _state.pid = listener, handler, os.getpid()
+        return listener
+
+def _stop_listener():
+    # A listener inherited through fork has no thread in this process; just drop it
+    if _state.listener is not None and _state.pid == os.getpid():
+        _state.listener.stop()
+        for handler in _state.listener.handlers:
+            handler.close()
+    _state.listener = None
+
+def flush_logging():
+    """Write out everything queued so far and stop the listener thread"""
+    with _lock:
+        _stop_listener()
+
+def dropped_records():
+    """Records discarded because the log queue was full"""
+    return _state.handler.dropped if _state.handler is not None else 0
+
+atexit.register(flush_logging)
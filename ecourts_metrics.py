@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Metrics
+Prometheus metrics shared by the scraper, web interface and workers
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+)
+
+# Scrapes take seconds, not milliseconds
+OPERATION_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 3, 5, 7.5, 10, 15, 30, 60, 120)
+
+OPERATION_LATENCY = Histogram(
+    'ecourts_operation_duration_seconds',
+    'Duration of scraping operations',
+    ['operation', 'status'],
+    buckets=OPERATION_BUCKETS
+)
+
+HTTP_LATENCY = Histogram(
+    'ecourts_http_request_duration_seconds',
+    'Duration of HTTP requests served by the web interface',
+    ['endpoint', 'method', 'status']
+)
+
+QUEUE_WAIT = Histogram(
+    'ecourts_queue_wait_seconds',
+    'Time scraping jobs spend queued, by priority class',
+    ['priority'],
+    buckets=OPERATION_BUCKETS
+)
+
+JOB_LATENCY = Histogram(
+    'ecourts_job_latency_seconds',
+    'Time from submission to completion of scraping jobs, by priority class',
+    ['priority'],
+    buckets=OPERATION_BUCKETS
+)
+
+ADMISSIONS = Counter(
+    'ecourts_admissions_total',
+    'Scheduler admission decisions (accepted, rejected, shed) by priority class',
+    ['priority', 'outcome']
+)
+
+ABANDONED_TASKS = Counter(
+    'ecourts_abandoned_tasks_total',
+    'Tasks whose caller stopped waiting, by operation and how the work ended',
+    ['operation', 'outcome']
+)
+
+PAGE_LOAD = Histogram(
+    'ecourts_page_load_seconds',
+    'eCourts page load time in Chrome, by browsing mode (lean or full)',
+    ['mode'],
+    buckets=OPERATION_BUCKETS
+)
+
+SCRAPE_STAGE = Histogram(
+    'ecourts_scrape_stage_seconds',
+    'Time spent in each stage (navigate, captcha, submit, wait, parse, save) of a scraping operation',
+    ['operation', 'stage'],
+    buckets=OPERATION_BUCKETS
+)
+
+PAGE_BYTES = Counter(
+    'ecourts_page_bytes_total',
+    'Bytes transferred loading eCourts pages, by browsing mode',
+    ['mode']
+)
+
+DRIVER_RECYCLES = Counter(
+    'ecourts_driver_recycles_total',
+    'Chrome sessions replaced for outgrowing their page or memory limit',
+    ['reason']
+)
+
+ECOURTS_ERRORS = Counter(
+    'ecourts_upstream_errors_total',
+    'Failed interactions with the eCourts website',
+    ['operation']
+)
+
+RATE_LIMITED = Counter(
+    'ecourts_rate_limited_total',
+    'API requests rejected by the rate limiter',
+    ['kind']
+)
+
+CACHE_REQUESTS = Counter(
+    'ecourts_cache_requests_total',
+    'Cache lookups by cache and result (hit or miss)',
+    ['cache', 'result']
+)
+
+# Gauges are refreshed from live state; summed across gunicorn workers
+ACTIVE_TASKS = Gauge('ecourts_active_tasks', 'Entries in active_tasks', multiprocess_mode='livesum')
+WRITER_QUEUE_DEPTH = Gauge('ecourts_writer_queue_depth', 'Exports waiting for the result writer', multiprocess_mode='livesum')
+QUEUE_DEPTH = Gauge('ecourts_queue_depth', 'Scraping jobs waiting, by priority class', ['priority'], multiprocess_mode='livesum')
+POOL_SIZE = Gauge('ecourts_pool_size', 'Maximum scrapers in the pool', multiprocess_mode='livesum')
+POOL_IN_USE = Gauge('ecourts_pool_in_use', 'Scrapers currently borrowed from the pool', multiprocess_mode='livesum')
+
+def record_cache(cache, hit):
+    """Count one cache lookup"""
+    CACHE_REQUESTS.labels(cache=cache, result='hit' if hit else 'miss').inc()
+
+def render_latest():
+    """Return (payload, content_type) for the /metrics endpoint"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        # Aggregate every gunicorn worker's metric files
+        from prometheus_client import multiprocess
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+    return generate_latest(), CONTENT_TYPE_LATEST
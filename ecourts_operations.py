@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Operations
+Dispatch of task parameters to ECourtsScraper methods
+"""
+
+def run_operation(scraper, params, cancel_token=None):
+    """Run an operation on an ECourtsScraper, shaped like the demo results"""
+    operation = params['operation']
+
+    if operation == 'search_cnr':
+        case_info = scraper.search_case_by_cnr(
+            params['cnr'], params.get('check_today'), params.get('check_tomorrow'), cancel_token=cancel_token
+        )
+        return {
+            'case_info': case_info.get('case_details', {}),
+            'listings': case_info.get('listings', [])
+        }
+    elif operation == 'search_case':
+        case_info = scraper.search_case_by_details(
+            params.get('case_type'), params.get('case_number'), params.get('case_year'), params.get('party_name'),
+            cancel_token=cancel_token
+        )
+        return {'case_info': case_info.get('case_details', {})}
+    elif operation == 'fetch_cause_list':
+        return scraper.fetch_cause_list(
+            params.get('state'), params.get('district'), params.get('complex'), params.get('date'), cancel_token=cancel_token
+        )
+    elif operation == 'check_listing':
+        return scraper.check_case_listing(params['cnr'], params.get('check_today'), params.get('check_tomorrow'))
+
+    raise ValueError(f"Unknown operation: {operation}")
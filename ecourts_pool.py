@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Driver Pool
+Bounded pool of ECourtsScraper instances shared by request threads
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+import ecourts_config as config
+import ecourts_metrics as metrics
+from ecourts_cancel import TaskCancelled
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; without it only the page limit applies
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+def process_tree_rss(pid):
+    """Resident memory in bytes of a process and all its children, or None"""
+    if psutil is None or pid is None:
+        return None
+    try:
+        root = psutil.Process(pid)
+        total = root.memory_info().rss
+        for child in root.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return total
+    except psutil.Error:
+        return None
+
+def scraper_rss(scraper):
+    """RSS of a scraper's chromedriver and every Chrome process under it"""
+    try:
+        return process_tree_rss(scraper.driver.service.process.pid)
+    except AttributeError:
+        return None
+
+def retire(scraper):
+    """Drop the page so Chrome frees renderer memory, then quit"""
+    try:
+        scraper.driver.get('about:blank')
+    except Exception:
+        pass
+    scraper.close()
+
+class PoolExhausted(Exception):
+    """Raised when no scraper becomes free before the acquire timeout"""
+
+class ScraperPool:
+    """
+    Pool of ECourtsScraper instances, each owning one Chrome process.
+
+    Scrapers are created lazily up to ``size``; ``warm`` of them can be
+    started eagerly so the first requests do not pay the Chrome launch.
+    A scraper returned after loading ``max_pages`` pages, or whose process
+    tree has grown past ``max_rss_mb``, keeps serving while a replacement
+    launches in the background; the replacement then takes its place and
+    the old Chrome is quit. With ``tabs_per_browser`` above 1, scrapers are
+    tabs of shared Chrome processes (see ecourts_tabs) and only the page
+    limit applies. With the 'playwright' ``backend`` every scraper is a
+    browser context on one shared Playwright connection (see
+    ecourts_backends). Create one pool per process, after any fork.
+    """
+
+    def __init__(self, size=3, headless=True, warm=0, factory=None, max_pages=None, max_rss_mb=None,
+                 tabs_per_browser=None, backend=None):
+        self.size = max(1, size)
+        self.headless = headless
+        self.tabs_per_browser = config.get_int('api', 'tabs_per_browser', 1) if tabs_per_browser is None else tabs_per_browser
+        self.backend = backend or config.get('api', 'browser_backend', 'selenium')
+        self.tabbed = None
+        self.contexts = None
+        if factory is None and self.backend == 'playwright':
+            from ecourts_backends import PlaywrightContexts
+            self.contexts = PlaywrightContexts(headless, config.get('api', 'playwright_cdp_url', '') or None)
+        elif factory is None and self.tabs_per_browser > 1:
+            from ecourts_tabs import TabbedBrowsers
+            # Each Chrome quits once its last tab is closed
+            self.tabbed = TabbedBrowsers(self.tabs_per_browser, headless)
+        self.factory = factory or self._default_factory
+        self.max_pages = config.get_int('api', 'recycle_max_pages', 0) if max_pages is None else max_pages
+        self.max_rss_mb = config.get_int('api', 'recycle_max_rss_mb', 0) if max_rss_mb is None else max_rss_mb
+
+        self.condition = threading.Condition()
+        self.idle = []
+        self.in_use = set()
+        self.created = 0
+        self.closed = False
+
+        # Scrapers with a replacement launching, and in-use ones already replaced
+        self.recycling = set()
+        self.replaced = set()
+        self.recycled = 0
+
+        for _ in range(min(warm, self.size)):
+            self.idle.append(self._create())
+
+    def _default_factory(self):
+        if self.contexts is not None:
+            return self.contexts.new_scraper()
+        if self.tabbed is not None:
+            return self.tabbed.new_scraper()
+
+        from ecourts_scraper import ECourtsScraper
+        return ECourtsScraper(headless=self.headless)
+
+    def _create(self):
+        scraper = self.factory()
+        self.created += 1
+        logger.info(f"✅ Scraper {self.created}/{self.size} added to pool")
+        return scraper
+
+    def acquire(self, timeout=None):
+        """Borrow a scraper, creating one if the pool has room"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self.condition:
+            while True:
+                if self.closed:
+                    raise PoolExhausted("Scraper pool is closed")
+
+                if self.idle:
+                    scraper = self.idle.pop()
+                    self.in_use.add(scraper)
+                    return scraper
+
+                if len(self.in_use) < self.size:
+                    # Reserve the slot before launching Chrome outside the lock
+                    placeholder = object()
+                    self.in_use.add(placeholder)
+                    break
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise PoolExhausted(f"No scraper available within {timeout}s")
+                self.condition.wait(remaining)
+
+        try:
+            scraper = self._create()
+        except Exception:
+            with self.condition:
+                self.in_use.discard(placeholder)
+                self.condition.notify()
+            raise
+
+        with self.condition:
+            self.in_use.discard(placeholder)
+            self.in_use.add(scraper)
+        return scraper
+
+    def release(self, scraper, discard=False):
+        """Return a scraper; discarded scrapers are closed and replaced lazily"""
+        reason = None if discard else self.recycle_reason(scraper)
+
+        with self.condition:
+            self.in_use.discard(scraper)
+            replaced = scraper in self.replaced
+            self.replaced.discard(scraper)
+            if discard or self.closed or replaced:
+                self.created -= 1
+            else:
+                self.idle.append(scraper)
+                if reason and scraper not in self.recycling:
+                    self.recycling.add(scraper)
+                else:
+                    reason = None
+            # The last busy scraper of a closed pool also shuts the shared connection
+            last_out = self.closed and not self.in_use
+            self.condition.notify()
+
+        if replaced:
+            retire(scraper)
+        elif discard or self.closed:
+            scraper.close()
+        elif reason:
+            threading.Thread(target=self._recycle, args=(scraper, reason), name='pool-recycle', daemon=True).start()
+        if last_out and self.contexts is not None:
+            self.contexts.close()
+
+    def recycle_reason(self, scraper):
+        """'pages' or 'rss' if the scraper has outgrown its limits, else None"""
+        try:
+            if self.max_pages and scraper.pages_loaded >= self.max_pages:
+                return 'pages'
+            if self.max_rss_mb:
+                rss = scraper_rss(scraper)
+                if rss is not None and rss >= self.max_rss_mb * 1024 * 1024:
+                    return 'rss'
+        except Exception as e:
+            logger.debug(f"Recycle check failed: {e}")
+        return None
+
+    def _recycle(self, old, reason):
+        # Launch the replacement while the old scraper keeps serving
+        try:
+            new = self.factory()
+        except Exception as e:
+            logger.error(f"❌ Failed to launch replacement scraper: {e}")
+            with self.condition:
+                self.recycling.discard(old)
+            return
+
+        with self.condition:
+            self.recycling.discard(old)
+            if self.closed:
+                retire_now, keep = [new], False
+            elif old in self.idle:
+                self.idle.remove(old)
+                retire_now, keep = [old], True
+            elif old in self.in_use:
+                # Retired when its current borrower releases it
+                self.replaced.add(old)
+                self.created += 1
+                retire_now, keep = [], True
+            else:
+                # Discarded meanwhile; use the replacement if there is room
+                keep = len(self.idle) + len(self.in_use) < self.size
+                if keep:
+                    self.created += 1
+                retire_now = [] if keep else [new]
+            if keep:
+                self.idle.append(new)
+                self.recycled += 1
+                self.condition.notify()
+
+        if keep:
+            metrics.DRIVER_RECYCLES.labels(reason=reason).inc()
+            logger.info(f"♻️ Scraper recycled ({reason})")
+        for scraper in retire_now:
+            retire(scraper)
+
+    @contextmanager
+    def scraper(self, timeout=None):
+        """Context manager around acquire/release"""
+        scraper = self.acquire(timeout)
+        discard = False
+        try:
+            yield scraper
+        except TaskCancelled:
+            # Cancelled between stages; the browser itself is healthy
+            raise
+        except Exception:
+            # A failing browser session is not reused
+            discard = True
+            raise
+        finally:
+            self.release(scraper, discard=discard)
+
+    def stats(self):
+        """Pool occupancy snapshot"""
+        with self.condition:
+            return {
+                'size': self.size,
+                'created': self.created,
+                'in_use': len(self.in_use),
+                'idle': len(self.idle),
+                'recycling': len(self.recycling),
+                'recycled': self.recycled
+            }
+
+    def close(self):
+        """Quit every idle scraper; busy ones are closed on release"""
+        with self.condition:
+            self.closed = True
+            idle, self.idle = self.idle, []
+            busy = len(self.in_use)
+            self.condition.notify_all()
+
+        for scraper in idle:
+            scraper.close()
+        if self.contexts is not None and not busy:
+            self.contexts.close()
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Job Queue
+Shared queue with leases, heartbeats and retries for scraping workers
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+
+from ecourts_scheduler import PRIORITY_CLASSES
+
+logger = logging.getLogger(__name__)
+
+# Job states: queued -> leased -> done | failed, or cancelled by the caller
+FINISHED_STATES = ('done', 'failed', 'cancelled')
+
+class Lease:
+    """A job handed to one worker until its visibility timeout expires"""
+
+    def __init__(self, job_id, payload, attempts, token):
+        self.job_id = job_id
+        self.payload = payload
+        self.attempts = attempts
+        self.token = token
+
+def retry_delay(base, attempts):
+    """Exponential backoff before a failed job becomes visible again"""
+    return base * 2 ** max(0, attempts - 1)
+
+class SQLiteQueue:
+    """
+    Job queue in a SQLite file, shared by processes on one host.
+
+    A lease hides a job from other workers for ``visibility_timeout``
+    seconds; workers extend it with heartbeats. A job whose lease expires
+    is handed out again until it has been attempted ``max_attempts`` times.
+    """
+
+    def __init__(self, path='ecourts_queue.db', visibility_timeout=120, max_attempts=3, retry_base=5):
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        with self.lock:
+            if path != ':memory:':
+                self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    available_at REAL NOT NULL,
+                    leased_until REAL,
+                    token TEXT,
+                    worker TEXT,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            self.db.execute("CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, priority, available_at)")
+
+    def enqueue(self, payload, priority='interactive', delay=0):
+        """Add a job and return its id"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "INSERT INTO jobs (id, payload, priority, status, available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+                (job_id, json.dumps(payload), PRIORITY_CLASSES[priority], now + delay, now, now)
+            )
+        return job_id
+
+    def lease(self, worker_id):
+        """Lease the most urgent visible job, or return None"""
+        now = time.time()
+        token = uuid.uuid4().hex
+
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                self._reclaim(now)
+                row = self.db.execute(
+                    "SELECT id, payload, attempts FROM jobs WHERE status = 'queued' AND available_at <= ? "
+                    "ORDER BY priority, available_at LIMIT 1",
+                    (now,)
+                ).fetchone()
+                if row is None:
+                    self.db.execute("COMMIT")
+                    return None
+
+                self.db.execute(
+                    "UPDATE jobs SET status = 'leased', attempts = attempts + 1, leased_until = ?, token = ?, "
+                    "worker = ?, updated_at = ? WHERE id = ?",
+                    (now + self.visibility_timeout, token, worker_id, now, row['id'])
+                )
+                self.db.execute("COMMIT")
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+
+        return Lease(row['id'], json.loads(row['payload']), row['attempts'] + 1, token)
+
+    def _reclaim(self, now):
+        # Expired leases: the worker died or stalled without heartbeats
+        self.db.execute(
+            "UPDATE jobs SET status = 'failed', error = 'Lease expired', updated_at = ? "
+            "WHERE status = 'leased' AND leased_until < ? AND attempts >= ?",
+            (now, now, self.max_attempts)
+        )
+        self.db.execute(
+            "UPDATE jobs SET status = 'queued', token = NULL, available_at = ?, updated_at = ? "
+            "WHERE status = 'leased' AND leased_until < ?",
+            (now, now, now)
+        )
+
+    def heartbeat(self, lease):
+        """Extend a lease; False once it expired, moved on or the job was cancelled"""
+        now = time.time()
+        with self.lock:
+            cursor = self.db.execute(
+                "UPDATE jobs SET leased_until = ?, updated_at = ? "
+                "WHERE id = ? AND token = ? AND status = 'leased' AND leased_until >= ?",
+                (now + self.visibility_timeout, now, lease.job_id, lease.token, now)
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, lease, result):
+        """Store the result; False if the lease no longer belongs to the caller"""
+        with self.lock:
+            cursor = self.db.execute(
+                "UPDATE jobs SET status = 'done', result = ?, token = NULL, updated_at = ? "
+                "WHERE id = ? AND token = ? AND status = 'leased'",
+                (json.dumps(result), time.time(), lease.job_id, lease.token)
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, lease, error, retry=True):
+        """Requeue with backoff while attempts remain, otherwise mark failed"""
+        now = time.time()
+        requeue = retry and lease.attempts < self.max_attempts
+        with self.lock:
+            cursor = self.db.execute(
+                "UPDATE jobs SET status = ?, error = ?, token = NULL, available_at = ?, updated_at = ? "
+                "WHERE id = ? AND token = ? AND status = 'leased'",
+                ('queued' if requeue else 'failed', str(error), now + retry_delay(self.retry_base, lease.attempts),
+                 now, lease.job_id, lease.token)
+            )
+        return cursor.rowcount == 1
+
+    def cancel(self, job_id):
+        """Cancel a queued or running job; its worker sees it on the next heartbeat"""
+        with self.lock:
+            cursor = self.db.execute(
+                "UPDATE jobs SET status = 'cancelled', updated_at = ? WHERE id = ? AND status IN ('queued', 'leased')",
+                (time.time(), job_id)
+            )
+        return cursor.rowcount == 1
+
+    def get(self, job_id):
+        """Job status, attempts, result and error"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT status, attempts, result, error FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'status': row['status'],
+            'attempts': row['attempts'],
+            'result': json.loads(row['result']) if row['result'] else None,
+            'error': row['error']
+        }
+
+    def depth(self):
+        """Jobs waiting to be leased"""
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+
+    def stats(self):
+        with self.lock:
+            rows = self.db.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row['status']: row['n'] for row in rows}
+
+    def purge(self, older_than=86400):
+        """Delete finished jobs last updated more than older_than seconds ago"""
+        with self.lock:
+            return self.db.execute(
+                f"DELETE FROM jobs WHERE status IN ({','.join('?' * len(FINISHED_STATES))}) AND updated_at < ?",
+                (*FINISHED_STATES, time.time() - older_than)
+            ).rowcount
+
+    def close(self):
+        self.db.close()
+
+# Every script touches only the keys passed in KEYS, and all of a queue's keys
+# share one {hash tag}, so the scripts also run on Redis Cluster.
+
+# Requeue (or fail) jobs whose lease expired: KEYS = leased set, ready sets
+# by rank, then one job hash per id in ARGV[4..]
+RECLAIM_SCRIPT = """
+local now = tonumber(ARGV[1])
+local max_attempts = tonumber(ARGV[2])
+local ranks = tonumber(ARGV[3])
+for i = 4, #ARGV do
+    local id = ARGV[i]
+    local job = KEYS[1 + ranks + i - 3]
+    local leased_until = redis.call('ZSCORE', KEYS[1], id)
+    if leased_until and tonumber(leased_until) <= now then
+        redis.call('ZREM', KEYS[1], id)
+        if redis.call('HGET', job, 'status') ~= 'leased' then
+            -- Cancelled while running; nothing to hand out again
+        elseif tonumber(redis.call('HGET', job, 'attempts') or '0') >= max_attempts then
+            redis.call('HSET', job, 'status', 'failed', 'error', 'Lease expired')
+        else
+            redis.call('HSET', job, 'status', 'queued')
+            redis.call('ZADD', KEYS[2 + tonumber(redis.call('HGET', job, 'priority'))], now, id)
+        end
+    end
+end
+return 1
+"""
+
+# Claim one visible job for a worker: KEYS = ready set, leased set, job hash
+CLAIM_SCRIPT = """
+local score = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not score or tonumber(score) > tonumber(ARGV[2]) then
+    return false
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+local attempts = redis.call('HINCRBY', KEYS[3], 'attempts', 1)
+redis.call('HSET', KEYS[3], 'status', 'leased', 'token', ARGV[4], 'worker', ARGV[5])
+redis.call('ZADD', KEYS[2], tonumber(ARGV[2]) + tonumber(ARGV[3]), ARGV[1])
+return {redis.call('HGET', KEYS[3], 'payload'), attempts}
+"""
+
+# Extend an unexpired lease held by ARGV[2]: KEYS = job hash, leased set
+HEARTBEAT_SCRIPT = """
+local job = KEYS[1]
+local leased_until = tonumber(redis.call('ZSCORE', KEYS[2], ARGV[3]) or '0')
+if redis.call('HGET', job, 'token') == ARGV[2] and redis.call('HGET', job, 'status') == 'leased' and leased_until >= tonumber(ARGV[4]) then
+    redis.call('ZADD', KEYS[2], tonumber(ARGV[1]), ARGV[3])
+    return 1
+end
+return 0
+"""
+
+# Finish a lease: KEYS = job hash, leased set, ready set;
+# ARGV = token, status, field, value, requeue_at (or ''), job id, ttl
+FINISH_SCRIPT = """
+local job = KEYS[1]
+if redis.call('HGET', job, 'token') ~= ARGV[1] or redis.call('HGET', job, 'status') ~= 'leased' then
+    return 0
+end
+redis.call('ZREM', KEYS[2], ARGV[6])
+redis.call('HSET', job, 'status', ARGV[2], ARGV[3], ARGV[4], 'token', '')
+if ARGV[5] ~= '' then
+    redis.call('ZADD', KEYS[3], tonumber(ARGV[5]), ARGV[6])
+else
+    redis.call('EXPIRE', job, tonumber(ARGV[7]))
+end
+return 1
+"""
+
+# Cancel a queued or leased job: KEYS = job hash, ready sets; unknown jobs return 0
+CANCEL_SCRIPT = """
+local status = redis.call('HGET', KEYS[1], 'status')
+if status ~= 'queued' and status ~= 'leased' then
+    return 0
+end
+for i = 2, #KEYS do
+    redis.call('ZREM', KEYS[i], ARGV[1])
+end
+redis.call('HSET', KEYS[1], 'status', 'cancelled')
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+return 1
+"""
+
+# Ready jobs tried per priority class when another worker claims the first
+CLAIM_CANDIDATES = 5
+
+class RedisQueue:
+    """Same contract as SQLiteQueue, shared by workers on any host through Redis"""
+
+    def __init__(self, url='redis://localhost:6379/0', prefix='ecourts:queue', visibility_timeout=120,
+                 max_attempts=3, retry_base=5, result_ttl=86400):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.result_ttl = result_ttl
+        # Ready sets are indexed by rank in the reclaim script, so ranks must be 0..n-1
+        self.ranks = sorted(PRIORITY_CLASSES.values())
+
+        self.reclaim_script = self.client.register_script(RECLAIM_SCRIPT)
+        self.claim_script = self.client.register_script(CLAIM_SCRIPT)
+        self.heartbeat_script = self.client.register_script(HEARTBEAT_SCRIPT)
+        self.finish_script = self.client.register_script(FINISH_SCRIPT)
+        self.cancel_script = self.client.register_script(CANCEL_SCRIPT)
+
+    def _key(self, name):
+        # The braces make Redis Cluster place all of this queue's keys in one slot
+        return f"{{{self.prefix}}}:{name}"
+
+    def _job_key(self, job_id):
+        return self._key(f"job:{job_id}")
+
+    def _ready_key(self, rank):
+        return self._key(f"ready:{rank}")
+
+    def enqueue(self, payload, priority='interactive', delay=0):
+        job_id = uuid.uuid4().hex
+        rank = PRIORITY_CLASSES[priority]
+        pipe = self.client.pipeline()
+        pipe.hset(self._job_key(job_id), mapping={
+            'payload': json.dumps(payload), 'priority': rank, 'status': 'queued', 'attempts': 0, 'token': ''
+        })
+        pipe.zadd(self._ready_key(rank), {job_id: time.time() + delay})
+        pipe.execute()
+        return job_id
+
+    def lease(self, worker_id):
+        now = time.time()
+        token = uuid.uuid4().hex
+        self._reclaim(now)
+
+        for rank in self.ranks:
+            candidates = self.client.zrangebyscore(self._ready_key(rank), '-inf', now, start=0, num=CLAIM_CANDIDATES)
+            for job_id in (candidate.decode() for candidate in candidates):
+                claimed = self.claim_script(
+                    keys=[self._ready_key(rank), self._key('leased'), self._job_key(job_id)],
+                    args=[job_id, now, self.visibility_timeout, token, worker_id]
+                )
+                if claimed:
+                    payload, attempts = claimed
+                    return Lease(job_id, json.loads(payload), int(attempts), token)
+        return None
+
+    def _reclaim(self, now):
+        # Expired leases: the worker died or stalled without heartbeats
+        expired = [job_id.decode() for job_id in self.client.zrangebyscore(self._key('leased'), '-inf', now)]
+        if expired:
+            self.reclaim_script(
+                keys=[self._key('leased'), *(self._ready_key(rank) for rank in self.ranks),
+                      *(self._job_key(job_id) for job_id in expired)],
+                args=[now, self.max_attempts, len(self.ranks), *expired]
+            )
+
+    def heartbeat(self, lease):
+        return bool(self.heartbeat_script(
+            keys=[self._job_key(lease.job_id), self._key('leased')],
+            args=[time.time() + self.visibility_timeout, lease.token, lease.job_id, time.time()]
+        ))
+
+    def _finish(self, lease, status, field, value, requeue_at=''):
+        rank = self.client.hget(self._job_key(lease.job_id), 'priority')
+        return bool(self.finish_script(
+            keys=[self._job_key(lease.job_id), self._key('leased'), self._ready_key((rank or b'0').decode())],
+            args=[lease.token, status, field, value, requeue_at, lease.job_id, self.result_ttl]
+        ))
+
+    def complete(self, lease, result):
+        return self._finish(lease, 'done', 'result', json.dumps(result))
+
+    def fail(self, lease, error, retry=True):
+        if retry and lease.attempts < self.max_attempts:
+            return self._finish(lease, 'queued', 'error', str(error),
+                                time.time() + retry_delay(self.retry_base, lease.attempts))
+        return self._finish(lease, 'failed', 'error', str(error))
+
+    def cancel(self, job_id):
+        return bool(self.cancel_script(
+            keys=[self._job_key(job_id), *(self._ready_key(rank) for rank in self.ranks)],
+            args=[job_id, self.result_ttl]
+        ))
+
+    def get(self, job_id):
+        fields = {k.decode(): v.decode() for k, v in self.client.hgetall(self._job_key(job_id)).items()}
+        if not fields:
+            return None
+        return {
+            'status': fields['status'],
+            'attempts': int(fields.get('attempts', 0)),
+            'result': json.loads(fields['result']) if fields.get('result') else None,
+            'error': fields.get('error')
+        }
+
+    def depth(self):
+        """Jobs waiting to be leased"""
+        return sum(self.client.zcard(self._ready_key(rank)) for rank in self.ranks)
+
+    def stats(self):
+        return {'queued': self.depth(), 'leased': self.client.zcard(self._key('leased'))}
+
+    def purge(self, older_than=86400):
+        # Finished jobs expire on their own after result_ttl
+        return 0
+
+    def close(self):
+        self.client.close()
+
+def wait_for_job(queue, job_id, timeout, poll_interval=0.1):
+    """Poll until a job finishes or timeout elapses; returns its last state"""
+    deadline = time.monotonic() + timeout
+    while True:
+        job = queue.get(job_id)
+        if job is None or job['status'] in FINISHED_STATES or time.monotonic() >= deadline:
+            return job
+        time.sleep(min(poll_interval, max(0, deadline - time.monotonic())))
+
+def create_queue(backend='sqlite', path='ecourts_queue.db', redis_url=None, **options):
+    """Build a queue from its config name ('sqlite' or 'redis')"""
+    if backend == 'redis':
+        return RedisQueue(redis_url or 'redis://localhost:6379/0', **options)
+    return SQLiteQueue(path, **options)
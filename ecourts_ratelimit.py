@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Rate Limiting
+Sliding-window request limits and usage counters per API client
+"""
+
+import logging
+import math
+import threading
+import time
+import uuid
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Usage counters of clients idle this long (seconds) are forgotten
+USAGE_TTL = 86400
+
+class RateLimitResult:
+    """Outcome of one rate limit check"""
+
+    def __init__(self, allowed, limit, remaining, retry_after=0):
+        self.allowed = allowed
+        self.limit = limit
+        self.remaining = remaining
+        self.retry_after = retry_after
+
+    def headers(self):
+        headers = {
+            'X-RateLimit-Limit': str(self.limit),
+            'X-RateLimit-Remaining': str(self.remaining)
+        }
+        if not self.allowed:
+            headers['Retry-After'] = str(max(1, math.ceil(self.retry_after)))
+        return headers
+
+class MemoryBackend:
+    """Sliding-window log per client, kept in process memory"""
+
+    def __init__(self, usage_ttl=USAGE_TTL):
+        self.usage_ttl = usage_ttl
+        self.lock = threading.Lock()
+        self.windows = {}
+        self.usage_counts = {}
+        self.last_purge = time.time()
+        self.last_usage_purge = self.last_purge
+
+    def hit(self, key, limit, period, now=None):
+        now = time.time() if now is None else now
+
+        with self.lock:
+            window = self.windows.setdefault(key, deque())
+            while window and window[0] <= now - period:
+                window.popleft()
+
+            if len(window) < limit:
+                window.append(now)
+                result = RateLimitResult(True, limit, limit - len(window))
+            else:
+                result = RateLimitResult(False, limit, 0, window[0] + period - now)
+
+            self._purge(now, period)
+            return result
+
+    def _purge(self, now, period):
+        # Drop clients whose windows have fully expired
+        if now - self.last_purge < period:
+            return
+        self.last_purge = now
+        for key in [k for k, w in self.windows.items() if not w or w[-1] <= now - period]:
+            del self.windows[key]
+
+    def record_usage(self, client, allowed, now=None):
+        now = time.time() if now is None else now
+
+        with self.lock:
+            # Forget clients idle past usage_ttl
+            if now - self.last_usage_purge >= min(self.usage_ttl, 60):
+                self.last_usage_purge = now
+                for idle in [c for c, counts in self.usage_counts.items() if counts['last_seen'] <= now - self.usage_ttl]:
+                    del self.usage_counts[idle]
+
+            counts = self.usage_counts.setdefault(client, {'requests': 0, 'rejected': 0, 'last_seen': 0})
+            counts['requests'] += 1
+            if not allowed:
+                counts['rejected'] += 1
+            counts['last_seen'] = now
+
+    def usage(self):
+        with self.lock:
+            return {client: dict(counts) for client, counts in self.usage_counts.items()}
+
+# Atomic sliding-window check: trim, count, then admit or report the oldest hit
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - period)
+local count = redis.call('ZCARD', key)
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, math.ceil(period * 1000))
+    return {1, limit - count - 1, '0'}
+end
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return {0, 0, tostring(tonumber(oldest[2]) + period - now)}
+"""
+
+class RedisBackend:
+    """Sliding-window log in Redis sorted sets, shared by every worker"""
+
+    def __init__(self, url='redis://localhost:6379/0', prefix='ecourts:ratelimit', usage_ttl=USAGE_TTL):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.usage_ttl = usage_ttl
+        self.script = self.client.register_script(SLIDING_WINDOW_SCRIPT)
+
+    def hit(self, key, limit, period, now=None):
+        now = time.time() if now is None else now
+        allowed, remaining, retry_after = self.script(
+            keys=[f"{self.prefix}:{key}"],
+            args=[now, period, limit, f"{now}:{uuid.uuid4().hex}"]
+        )
+        return RateLimitResult(bool(allowed), limit, int(remaining), float(retry_after))
+
+    def record_usage(self, client, allowed):
+        key = f"{self.prefix}:usage:{client}"
+        pipe = self.client.pipeline()
+        pipe.hincrby(key, 'requests', 1)
+        if not allowed:
+            pipe.hincrby(key, 'rejected', 1)
+        pipe.hset(key, 'last_seen', time.time())
+        pipe.expire(key, self.usage_ttl)
+        pipe.execute()
+
+    def usage(self):
+        usage = {}
+        for key in self.client.scan_iter(f"{self.prefix}:usage:*"):
+            client = key.decode().split(':usage:', 1)[1]
+            counts = {k.decode(): float(v) for k, v in self.client.hgetall(key).items()}
+            usage[client] = {
+                'requests': int(counts.get('requests', 0)),
+                'rejected': int(counts.get('rejected', 0)),
+                'last_seen': counts.get('last_seen', 0)
+            }
+        return usage
+
+class RateLimiter:
+    """
+    Per-client sliding-window limiter.
+
+    A limit of 0 disables limiting while usage is still counted. Backend
+    errors fail open so a Redis outage never takes the API down.
+    """
+
+    def __init__(self, backend, limit=100, period=3600):
+        self.backend = backend
+        self.limit = limit
+        self.period = period
+
+    def check(self, client, limit=None):
+        limit = self.limit if limit is None else limit
+
+        try:
+            if limit <= 0:
+                result = RateLimitResult(True, 0, 0)
+            else:
+                result = self.backend.hit(client, limit, self.period)
+            self.backend.record_usage(client, result.allowed)
+            return result
+        except Exception as e:
+            logger.warning(f"⚠️ Rate limit backend unavailable, allowing request: {e}")
+            return RateLimitResult(True, limit, limit)
+
+    def usage(self):
+        return self.backend.usage()
+
+def create_backend(name, redis_url=None):
+    """Build a backend from its config name ('memory' or 'redis')"""
+    if name == 'redis':
+        return RedisBackend(redis_url or 'redis://localhost:6379/0')
+    return MemoryBackend()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Scheduler
+Priority-aware worker pool for scraping jobs
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+
+import ecourts_metrics as metrics
+
+logger = logging.getLogger(__name__)
+
+# Lower rank runs first
+PRIORITY_CLASSES = {'interactive': 0, 'scheduled': 1, 'bulk': 2}
+
+# Completions inside this window define the current drain rate
+DRAIN_WINDOW = 60
+
+class AdmissionRejected(Exception):
+    """Raised when a job is refused or shed because capacity is saturated"""
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class Job:
+    """A unit of work submitted to the scheduler"""
+
+    def __init__(self, func, args, kwargs, priority):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.state = 'queued'
+        self.result = None
+        self.error = None
+        self.enqueued_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+        self.done = threading.Event()
+
+    def wait(self, timeout=None):
+        """Wait for completion; True if the job finished"""
+        return self.done.wait(timeout)
+
+    def effective_rank(self, now, aging_seconds):
+        """Class rank minus one step per aging period spent waiting"""
+        waited = now - self.enqueued_at
+        return PRIORITY_CLASSES[self.priority] - (waited / aging_seconds if aging_seconds else 0)
+
+class PriorityScheduler:
+    """
+    Fixed set of worker threads fed from one FIFO queue per priority class.
+
+    The next job is the queue head with the lowest effective rank, so a
+    bulk job that has waited two aging periods competes with fresh
+    interactive work instead of starving. ``reserved_interactive`` workers
+    are kept for interactive jobs: other classes never occupy more than
+    ``workers - reserved_interactive`` threads at once.
+
+    At most ``max_queue`` jobs wait at a time. When the queue is full a new
+    job sheds the newest queued job of a lower class; if there is none it
+    is rejected with a Retry-After derived from the recent drain rate.
+    """
+
+    def __init__(self, workers=5, reserved_interactive=1, aging_seconds=30, max_queue=0, name='scraper'):
+        self.workers = max(1, workers)
+        self.reserved_interactive = min(max(0, reserved_interactive), self.workers - 1)
+        self.aging_seconds = aging_seconds
+        self.max_queue = max_queue
+        self.name = name
+
+        self.condition = threading.Condition()
+        self.queues = {priority: deque() for priority in PRIORITY_CLASSES}
+        self.running = {priority: 0 for priority in PRIORITY_CLASSES}
+        self.threads = []
+        self.stopped = False
+        self.completions = deque()
+        self.average_duration = None
+
+    def after_fork(self):
+        """Start over in a forked child: the parent's workers and queued jobs do not carry over"""
+        self.condition = threading.Condition()
+        self.queues = {priority: deque() for priority in PRIORITY_CLASSES}
+        self.running = {priority: 0 for priority in PRIORITY_CLASSES}
+        self.threads = []
+        self.stopped = False
+        self.completions = deque()
+
+    def submit(self, func, *args, priority='interactive', **kwargs):
+        """Queue func(*args, **kwargs) and return its Job"""
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority class: {priority}")
+
+        job = Job(func, args, kwargs, priority)
+        shed = None
+
+        with self.condition:
+            self._ensure_workers()
+
+            if self.max_queue and self._queued() >= self.max_queue:
+                shed = self._shed_below(priority)
+                if shed is None:
+                    metrics.ADMISSIONS.labels(priority=priority, outcome='rejected').inc()
+                    raise AdmissionRejected('Scraping capacity is saturated', self.retry_after())
+
+            self.queues[priority].append(job)
+            self.condition.notify()
+
+        metrics.ADMISSIONS.labels(priority=priority, outcome='accepted').inc()
+        if shed is not None:
+            metrics.ADMISSIONS.labels(priority=shed.priority, outcome='shed').inc()
+            logger.warning(f"⚠️ Shed queued {shed.priority} job to admit {priority} work")
+            shed.done.set()
+        return job
+
+    def cancel(self, job):
+        """Drop a job that has not started yet; True if it was still queued"""
+        with self.condition:
+            try:
+                self.queues[job.priority].remove(job)
+            except ValueError:
+                return False
+            job.state = 'cancelled'
+        job.done.set()
+        return True
+
+    def _queued(self):
+        return sum(len(jobs) for jobs in self.queues.values())
+
+    def _shed_below(self, priority):
+        """Drop the newest queued job of the lowest class ranked below priority"""
+        for victim_class in sorted(PRIORITY_CLASSES, key=PRIORITY_CLASSES.get, reverse=True):
+            if PRIORITY_CLASSES[victim_class] <= PRIORITY_CLASSES[priority]:
+                return None
+            if self.queues[victim_class]:
+                victim = self.queues[victim_class].pop()
+                victim.state = 'shed'
+                victim.error = AdmissionRejected('Job shed under load', self.retry_after())
+                return victim
+        return None
+
+    def drain_rate(self):
+        """Jobs completed per second over the recent window"""
+        now = time.monotonic()
+        self._trim_completions(now)
+
+        if len(self.completions) >= 2:
+            span = max(now - self.completions[0], 1.0)
+            return len(self.completions) / span
+        if self.average_duration:
+            # No recent history: assume every worker completes at the average pace
+            return self.workers / self.average_duration
+        return None
+
+    def _trim_completions(self, now):
+        # Only the drain window matters; trimmed on every completion so the deque stays bounded
+        while self.completions and self.completions[0] < now - DRAIN_WINDOW:
+            self.completions.popleft()
+
+    def retry_after(self):
+        """Seconds until the current queue should have drained"""
+        rate = self.drain_rate()
+        if not rate:
+            return 5
+        return max(1, math.ceil((self._queued() + 1) / rate))
+
+    def _ensure_workers(self):
+        # Threads start lazily so a preloaded, forked process starts its own
+        if self.threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f'{self.name}-worker-{i}', daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def _non_interactive_slots(self):
+        running = sum(count for priority, count in self.running.items() if priority != 'interactive')
+        return self.workers - self.reserved_interactive - running
+
+    def _pick(self):
+        """Pop the eligible queue head with the lowest effective rank"""
+        now = time.monotonic()
+        best = None
+
+        for priority, jobs in self.queues.items():
+            if not jobs:
+                continue
+            if priority != 'interactive' and self._non_interactive_slots() <= 0:
+                continue
+            head = jobs[0]
+            key = (head.effective_rank(now, self.aging_seconds), head.enqueued_at)
+            if best is None or key < best[0]:
+                best = (key, priority)
+
+        if best is None:
+            return None
+        return self.queues[best[1]].popleft()
+
+    def _worker(self):
+        while True:
+            with self.condition:
+                job = self._pick()
+                while job is None and not self.stopped:
+                    self.condition.wait()
+                    job = self._pick()
+                if job is None:
+                    return
+                self.running[job.priority] += 1
+
+            self._run(job)
+
+            with self.condition:
+                self.running[job.priority] -= 1
+                self.completions.append(job.finished_at)
+                self._trim_completions(job.finished_at)
+                duration = job.finished_at - job.started_at
+                self.average_duration = duration if self.average_duration is None else 0.8 * self.average_duration + 0.2 * duration
+                # A freed non-interactive slot may unblock any queued class
+                self.condition.notify_all()
+
+    def _run(self, job):
+        job.started_at = time.monotonic()
+        job.state = 'running'
+        metrics.QUEUE_WAIT.labels(priority=job.priority).observe(job.started_at - job.enqueued_at)
+
+        try:
+            job.result = job.func(*job.args, **job.kwargs)
+            job.state = 'done'
+        except Exception as e:
+            job.error = e
+            job.state = 'failed'
+            logger.error(f"❌ {job.priority} job failed: {e}")
+        finally:
+            job.finished_at = time.monotonic()
+            metrics.JOB_LATENCY.labels(priority=job.priority).observe(job.finished_at - job.enqueued_at)
+            job.done.set()
+
+    def stats(self):
+        """Queue depth and running jobs per priority class"""
+        with self.condition:
+            return {
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'queued': {priority: len(jobs) for priority, jobs in self.queues.items()},
+                'running': dict(self.running),
+                'saturated': bool(self.max_queue) and self._queued() >= self.max_queue
+            }
+
+    def shutdown(self, wait=True):
+        """Stop workers once the queues drain"""
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+        if wait:
+            for thread in self.threads:
+                thread.join(timeout=5)
+        self.threads = []
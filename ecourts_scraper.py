@@ -1,45 +1,121 @@
 
-import requests
-from bs4 import BeautifulSoup
-import selenium
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.keys import Keys
-import time
+# requests, bs4, selenium and the browser backends are imported where they are
+# used, so --help and short CLI runs start without loading them
 import json
-import csv
 import os
 from datetime import datetime, timedelta
 import logging
 import argparse
-import re
-import base64
-from urllib.parse import urljoin
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+import ecourts_config as config
+from ecourts_cancel import TaskCancelled, checkpoint, pause
+from ecourts_directory import cnr_for_case
+from ecourts_lean import enable_lean_mode, measure_page
+from ecourts_listings import ListingResolver
+from ecourts_logging import setup_logging
+from ecourts_metrics import ECOURTS_ERRORS
+from ecourts_tracing import record_error, span
+from ecourts_writer import write_csv
+
 logger = logging.getLogger(__name__)
 
+# eCourts form controls (XPath, understood by every browser backend)
+CNR_INPUT = "//input[contains(@placeholder, 'CNR') or @name='cnr_number' or @id='cnr_number']"
+CNR_CAPTCHA_IMAGE = "//img[contains(@src, 'captcha') or @id='captcha_image']"
+CNR_CAPTCHA_INPUT = "//input[contains(@placeholder, 'Captcha') or @name='captcha']"
+SEARCH_BUTTON = "//input[@type='submit' and @value='Search'] | //button[contains(text(), 'Search')]"
+PARTY_INPUT = "//input[@name='party_name' or contains(@placeholder, 'Petitioner')]"
+YEAR_INPUT = "//input[@name='case_year' or contains(@placeholder, 'Year')]"
+CASE_CAPTCHA_IMAGE = "//img[contains(@src, 'captcha')]"
+CASE_CAPTCHA_INPUT = "//input[contains(@placeholder, 'Captcha')]"
+GO_BUTTON = "//input[@value='Go'] | //button[contains(text(), 'Go')]"
+RESULTS_TABLE = "//table"
+
+DEFAULT_BASE_URL = 'https://services.ecourts.gov.in/ecourtindia_v6/'
+
+# Cause list table headings (lowercased substrings) and the keys they map to
+CAUSE_LIST_COLUMNS = (
+    ('cnr', 'cnr'),
+    ('sr', 'sr_no'),
+    ('case', 'case_no'),
+    ('part', 'party_names'),
+    ('advocate', 'advocate'),
+    ('purpose', 'purpose'),
+    ('court', 'court_name'),
+)
+
+def launch_chrome(headless=True, page_load_strategy='normal'):
+    """Start Chrome with optimal settings, falling back to webdriver-manager"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-logging')
+    chrome_options.add_argument('--disable-web-security')
+    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    chrome_options.page_load_strategy = page_load_strategy
+
+    try:
+        driver = webdriver.Chrome(options=chrome_options)
+        logger.info("✅ Chrome driver initialized successfully")
+        return driver
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize Chrome driver: {e}")
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            driver = webdriver.Chrome(ChromeDriverManager().install(), options=chrome_options)
+            logger.info("✅ Chrome driver installed via webdriver-manager")
+            return driver
+        except Exception as e2:
+            logger.error(f"❌ Both Chrome driver methods failed: {e2}")
+            raise Exception("Chrome driver setup failed. Please install Chrome and ChromeDriver.")
+
 class ECourtsScraper:
     """
     Complete eCourts scraper for real-time data fetching
     Updated version with all fixes applied
     """
 
-    def __init__(self, headless=True):
-        # Real eCourts URLs from actual website
-        self.base_url = "https://services.ecourts.gov.in/ecourtindia_v6/"
-        self.cnr_search_url = f"{self.base_url}?p=home/index"
-        self.case_status_url = f"{self.base_url}?p=casestatus/index" 
-        self.cause_list_url = f"{self.base_url}?p=cause_list/index"
+    def __init__(self, headless=True, lean=None, driver=None, backend=None, base_url=None):
+        # Real eCourts URLs, or a fixture server (ecourts_fixtures) via ECOURTS_BASE_URL
+        self.base_url = (base_url or os.environ.get('ECOURTS_BASE_URL')
+                         or config.get('urls', 'base_url', DEFAULT_BASE_URL))
+        self.cnr_search_url = f"{self.base_url}{config.get('urls', 'cnr_search', '?p=home/index')}"
+        self.case_status_url = f"{self.base_url}{config.get('urls', 'case_status', '?p=casestatus/index')}"
+        self.cause_list_url = f"{self.base_url}{config.get('urls', 'cause_list', '?p=cause_list/index')}"
+
+        # Lean browsing skips images, stylesheets, fonts and trackers (not the CAPTCHA)
+        self.lean = config.get_bool('scraper', 'lean_mode', True) if lean is None else lean
+        # Navigations so far; the pool recycles long-lived sessions
+        self.pages_loaded = 0
+
+        # Setup browser, unless given a tab of a shared one (ecourts_tabs) or
+        # a non-Selenium backend (ecourts_backends), which handles lean mode itself
+        from ecourts_backends import SeleniumBackend
+
+        if backend is not None:
+            self.driver = None
+            self.browser = backend
+        else:
+            if driver is None:
+                self.setup_driver(headless)
+            else:
+                self.driver = driver
+                self.enable_lean_mode()
+            self.browser = SeleniumBackend(self.driver)
 
-        # Setup browser
-        self.setup_driver(headless)
+        # Listing checks join against live cause lists fetched once per complex and date
+        self.listing_resolver = ListingResolver(self.fetch_cause_list)
 
         # Initialize session for requests
+        import requests
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -47,40 +123,38 @@ class ECourtsScraper:
 
     def setup_driver(self, headless=True):
         """Setup Chrome WebDriver with optimal settings"""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--disable-logging')
-        chrome_options.add_argument('--disable-web-security')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        self.driver = launch_chrome(headless)
+        self.enable_lean_mode()
 
-        try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            logger.info("✅ Chrome driver initialized successfully")
-        except Exception as e:
-            logger.error(f"❌ Failed to initialize Chrome driver: {e}")
+    def enable_lean_mode(self):
+        """Block non-essential resources for this scraper's browser or tab"""
+        if self.lean:
             try:
-                from webdriver_manager.chrome import ChromeDriverManager
-                self.driver = webdriver.Chrome(ChromeDriverManager().install(), options=chrome_options)
-                logger.info("✅ Chrome driver installed via webdriver-manager")
-            except Exception as e2:
-                logger.error(f"❌ Both Chrome driver methods failed: {e2}")
-                raise Exception("Chrome driver setup failed. Please install Chrome and ChromeDriver.")
-
-    def wait_for_element(self, by, value, timeout=10):
-        """Wait for element to be present"""
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((by, value))
-        )
-
-    def solve_captcha_basic(self, captcha_element):
+                enable_lean_mode(self.driver)
+            except Exception as e:
+                logger.warning(f"⚠️ Lean browsing unavailable, loading full pages: {e}")
+                self.lean = False
+
+    def open_page(self, url, cancel_token=None):
+        """Navigate to an eCourts page and record its load time and size"""
+        checkpoint(cancel_token)
+        with span('navigate', url=url):
+            self.browser.navigate(url)
+        self.pages_loaded += 1
+        measure_page(self.browser, 'lean' if self.lean else 'full')
+
+    def settle(self, cancel_token=None):
+        """Politeness pause after loading an eCourts page"""
+        with span('pause'):
+            pause(3, cancel_token)
+
+    def wait_for_element(self, selector, timeout=10):
+        """Wait for an element (XPath) to be present, on whichever browser backend is in use"""
+        self.browser.wait_for(selector, timeout)
+
+    def solve_captcha_basic(self, captcha_image):
         """
-        Basic CAPTCHA solving
+        Basic CAPTCHA solving from the CAPTCHA image (PNG bytes)
         In production, use OCR libraries or CAPTCHA services
         """
         try:
@@ -90,56 +164,62 @@ class ECourtsScraper:
         except:
             return None
 
-    def search_case_by_cnr(self, cnr_number, check_today=False, check_tomorrow=False):
+    def search_case_by_cnr(self, cnr_number, check_today=False, check_tomorrow=False, cancel_token=None):
         """Search case by CNR number with listing check"""
-        try:
-            logger.info(f"🔍 Searching case with CNR: {cnr_number}")
-
-            # Navigate to CNR search page
-            self.driver.get(self.cnr_search_url)
-            time.sleep(3)
-
-            # Find CNR input field
-            cnr_input = self.wait_for_element(By.XPATH, "//input[contains(@placeholder, 'CNR') or @name='cnr_number' or @id='cnr_number']")
-            cnr_input.clear()
-            cnr_input.send_keys(cnr_number)
-
-            # Handle CAPTCHA if present
+        with span('search_cnr', cnr=cnr_number):
             try:
-                captcha_element = self.driver.find_element(By.XPATH, "//img[contains(@src, 'captcha') or @id='captcha_image']")
-                captcha_input = self.driver.find_element(By.XPATH, "//input[contains(@placeholder, 'Captcha') or @name='captcha']")
-
-                captcha_text = self.solve_captcha_basic(captcha_element)
-                if captcha_text:
-                    captcha_input.clear()
-                    captcha_input.send_keys(captcha_text)
-            except:
-                logger.info("No CAPTCHA found or already handled")
-
-            # Submit search
-            search_button = self.driver.find_element(By.XPATH, "//input[@type='submit' and @value='Search'] | //button[contains(text(), 'Search')]")
-            search_button.click()
-
-            # Wait for results
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "table"))
-            )
-
-            # Parse case details
-            case_info = self.parse_case_details()
-
-            # Check listings if requested
-            listings = []
-            if check_today or check_tomorrow:
-                listings = self.check_case_listing(cnr_number, check_today, check_tomorrow)
-                case_info['listings'] = listings
-
-            return case_info
-
-        except Exception as e:
-            logger.error(f"❌ Failed to search case by CNR: {e}")
-            # Return demo data for testing
-            return self.get_demo_case_data(cnr_number, check_today, check_tomorrow)
+                logger.info(f"🔍 Searching case with CNR: {cnr_number}")
+
+                # Navigate to CNR search page
+                self.open_page(self.cnr_search_url, cancel_token)
+                self.settle(cancel_token)
+
+                # Find CNR input field
+                with span('fill'):
+                    self.browser.wait_for(CNR_INPUT, 10)
+                    self.browser.fill(CNR_INPUT, cnr_number)
+
+                # Handle CAPTCHA if present
+                with span('captcha'):
+                    try:
+                        captcha_text = self.solve_captcha_basic(self.browser.element_png(CNR_CAPTCHA_IMAGE))
+                        if captcha_text:
+                            self.browser.fill(CNR_CAPTCHA_INPUT, captcha_text)
+                    except:
+                        logger.info("No CAPTCHA found or already handled")
+
+                # Submit search
+                checkpoint(cancel_token)
+                with span('submit'):
+                    self.browser.click(SEARCH_BUTTON)
+
+                # Wait for results
+                with span('wait'):
+                    self.browser.wait_for(RESULTS_TABLE, 15)
+
+                # Parse case details
+                with span('parse'):
+                    case_info = self.parse_case_details()
+
+                # Check listings if requested
+                listings = []
+                if check_today or check_tomorrow:
+                    checkpoint(cancel_token)
+                    with span('listings'):
+                        listings = self.check_case_listing(cnr_number, check_today, check_tomorrow)
+                    case_info['listings'] = listings
+
+                return case_info
+
+            except TaskCancelled:
+                logger.info(f"⏹️ CNR search cancelled: {cnr_number}")
+                raise
+            except Exception as e:
+                logger.error(f"❌ Failed to search case by CNR: {e}")
+                ECOURTS_ERRORS.labels(operation='search_cnr').inc()
+                record_error(e)
+                # Return demo data for testing
+                return self.get_demo_case_data(cnr_number, check_today, check_tomorrow)
 
     def get_demo_case_data(self, cnr_number, check_today=False, check_tomorrow=False):
         """Demo case data when real scraping is not available"""
@@ -181,79 +261,106 @@ class ECourtsScraper:
 
         return case_info
 
-    def search_case_by_details(self, case_type, case_number, case_year, party_name=None):
+    def search_case_by_details(self, case_type, case_number, case_year, party_name=None, cancel_token=None):
         """Search case by case details"""
-        try:
-            logger.info(f"🔍 Searching case: {case_type} {case_number}/{case_year}")
-
-            # Navigate to case status page
-            self.driver.get(self.case_status_url)
-            time.sleep(3)
-
-            # Fill case details
-            if party_name:
-                party_input = self.driver.find_element(By.XPATH, "//input[@name='party_name' or contains(@placeholder, 'Petitioner')]")
-                party_input.send_keys(party_name)
-
-            year_input = self.driver.find_element(By.XPATH, "//input[@name='case_year' or contains(@placeholder, 'Year')]")
-            year_input.send_keys(case_year)
-
-            # Handle CAPTCHA and submit
+        with span('search_case', case=f"{case_type} {case_number}/{case_year}"):
             try:
-                captcha_input = self.driver.find_element(By.XPATH, "//input[contains(@placeholder, 'Captcha')]")
-                captcha_img = self.driver.find_element(By.XPATH, "//img[contains(@src, 'captcha')]")
-
-                captcha_text = self.solve_captcha_basic(captcha_img)
-                if captcha_text:
-                    captcha_input.send_keys(captcha_text)
-            except:
-                pass
-
-            # Submit search
-            go_btn = self.driver.find_element(By.XPATH, "//input[@value='Go'] | //button[contains(text(), 'Go')]")
-            go_btn.click()
-
-            # Parse results
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "table"))
-            )
-
-            return self.parse_case_details()
-
-        except Exception as e:
-            logger.error(f"❌ Failed to search case by details: {e}")
-            # Return demo data
-            return {
-                'case_details': {
-                    'Case Number': f"{case_type} {case_number}/{case_year}",
-                    'Case Type': case_type,
-                    'Filing Date': f'15/10/{case_year}',
-                    'Status': 'Pending',
-                    'Next Hearing': '20/10/2025',
-                    'Court': 'District Court',
-                    'Judge': "Hon'ble Sh. Rajesh Kumar"
+                logger.info(f"🔍 Searching case: {case_type} {case_number}/{case_year}")
+
+                # Navigate to case status page
+                self.open_page(self.case_status_url, cancel_token)
+                self.settle(cancel_token)
+
+                # Fill case details
+                with span('fill'):
+                    if party_name:
+                        self.browser.fill(PARTY_INPUT, party_name)
+
+                    self.browser.fill(YEAR_INPUT, case_year)
+
+                # Handle CAPTCHA and submit
+                with span('captcha'):
+                    try:
+                        captcha_text = self.solve_captcha_basic(self.browser.element_png(CASE_CAPTCHA_IMAGE))
+                        if captcha_text:
+                            self.browser.fill(CASE_CAPTCHA_INPUT, captcha_text)
+                    except:
+                        pass
+
+                # Submit search
+                checkpoint(cancel_token)
+                with span('submit'):
+                    self.browser.click(GO_BUTTON)
+
+                # Parse results
+                with span('wait'):
+                    self.browser.wait_for(RESULTS_TABLE, 15)
+
+                checkpoint(cancel_token)
+                with span('parse'):
+                    return self.parse_case_details()
+
+            except TaskCancelled:
+                logger.info(f"⏹️ Case search cancelled: {case_type} {case_number}/{case_year}")
+                raise
+            except Exception as e:
+                logger.error(f"❌ Failed to search case by details: {e}")
+                ECOURTS_ERRORS.labels(operation='search_case').inc()
+                record_error(e)
+                # Return demo data
+                return {
+                    'case_details': {
+                        'Case Number': f"{case_type} {case_number}/{case_year}",
+                        'Case Type': case_type,
+                        'Filing Date': f'15/10/{case_year}',
+                        'Status': 'Pending',
+                        'Next Hearing': '20/10/2025',
+                        'Court': 'District Court',
+                        'Judge': "Hon'ble Sh. Rajesh Kumar"
+                    }
                 }
-            }
 
-    def fetch_cause_list(self, state="Delhi", district="New Delhi", complex_name="Patiala House Court Comp", date=None):
+    def fetch_cause_list(self, state="Delhi", district="New Delhi", complex_name="Patiala House Court Comp", date=None, cancel_token=None):
         """Fetch cause list with dynamic data based on selections"""
-        try:
-            if not date:
-                date = datetime.now().strftime("%d/%m/%Y")
-
-            logger.info(f"📊 Fetching cause list for {complex_name} on {date}")
-
-            # Navigate to cause list page
-            self.driver.get(self.cause_list_url)
-            time.sleep(3)
-
-            # This is where real scraping would happen
-            # For demo, return varied data based on selections
-            return self.get_dynamic_cause_list(state, district, complex_name, date)
+        with span('fetch_cause_list', state=state, district=district, complex=complex_name, date=date) as trace:
+            try:
+                if not date:
+                    date = datetime.now().strftime("%d/%m/%Y")
+                    trace.set(date=date)
+
+                logger.info(f"📊 Fetching cause list for {complex_name} on {date}")
+
+                # Navigate to cause list page
+                self.open_page(self.cause_list_url, cancel_token)
+                self.settle(cancel_token)
+
+                with span('parse'):
+                    cases = self.parse_cause_list()
+                if not cases:
+                    # No cause list table on the page: return varied demo data based on selections
+                    return self.get_dynamic_cause_list(state, district, complex_name, date)
+
+                return {
+                    'metadata': {
+                        'source': 'eCourts',
+                        'fetched_at': datetime.now().isoformat(),
+                        'state': state,
+                        'district': district,
+                        'complex': complex_name,
+                        'date': date,
+                        'total_cases': len(cases)
+                    },
+                    'cases': cases
+                }
 
-        except Exception as e:
-            logger.error(f"❌ Failed to fetch cause list: {e}")
-            return self.get_dynamic_cause_list(state, district, complex_name, date)
+            except TaskCancelled:
+                logger.info(f"⏹️ Cause list fetch cancelled: {complex_name} on {date}")
+                raise
+            except Exception as e:
+                logger.error(f"❌ Failed to fetch cause list: {e}")
+                ECOURTS_ERRORS.labels(operation='fetch_cause_list').inc()
+                record_error(e)
+                return self.get_dynamic_cause_list(state, district, complex_name, date)
 
     def get_dynamic_cause_list(self, state, district, complex_name, date):
         """Generate dynamic cause list data based on user selections"""
@@ -293,6 +400,9 @@ class ECourtsScraper:
         remarks_list = ['Matter taken up', 'Witness examination', 'Final arguments', 'Judgment reserved', 'Part heard']
         for i, case in enumerate(cases):
             case['remarks'] = remarks_list[i % len(remarks_list)]
+            cnr = cnr_for_case(state, district, complex_name, case['case_no'])
+            if cnr:
+                case['cnr'] = cnr
 
         cause_list_data = {
             'metadata': {
@@ -309,23 +419,48 @@ class ECourtsScraper:
 
         return cause_list_data
 
-    def parse_case_details(self):
+    def parse_cause_list(self, html=None):
+        """Rows of the cause list table on the current page (or html), keyed by column"""
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html if html is not None else self.browser.snapshot(), 'html.parser')
+        cases = []
+
+        for table in soup.find_all('table'):
+            columns = None
+            for row in table.find_all('tr'):
+                headers = [th.get_text(' ', strip=True).lower() for th in row.find_all('th')]
+                if headers:
+                    columns = [next((key for label, key in CAUSE_LIST_COLUMNS if label in header), None)
+                               for header in headers]
+                    continue
+
+                cells = [td.get_text(' ', strip=True) for td in row.find_all('td')]
+                if not columns or 'case_no' not in columns or len(cells) < len(columns):
+                    continue
+                case = {key: cells[i] for i, key in enumerate(columns) if key}
+                if case.get('case_no'):
+                    cases.append(case)
+
+        return cases
+
+    def parse_case_details(self, html=None):
         """Parse case details from eCourts results"""
         try:
             case_info = {'case_details': {}, 'hearings': [], 'orders': []}
 
-            # Find case details table
-            tables = self.driver.find_elements(By.TAG_NAME, "table")
+            # One page snapshot instead of a browser round trip per cell
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(html if html is not None else self.browser.snapshot(), 'html.parser')
 
-            for table in tables:
-                rows = table.find_elements(By.TAG_NAME, "tr")
+            for table in soup.find_all('table'):
+                rows = table.find_all('tr')
 
                 for row in rows:
-                    cells = row.find_elements(By.TAG_NAME, "td")
+                    cells = row.find_all('td')
 
                     if len(cells) >= 2:
-                        key = cells[0].text.strip()
-                        value = cells[1].text.strip()
+                        key = cells[0].get_text(' ', strip=True)
+                        value = cells[1].get_text(' ', strip=True)
 
                         if key and value:
                             case_info['case_details'][key] = value
@@ -334,11 +469,17 @@ class ECourtsScraper:
 
         except Exception as e:
             logger.error(f"❌ Failed to parse case details: {e}")
+            ECOURTS_ERRORS.labels(operation='parse_case_details').inc()
             return {'case_details': {}, 'hearings': [], 'orders': []}
 
     def check_case_listing(self, cnr_number, check_today=False, check_tomorrow=False):
         """Check if case is listed for today or tomorrow"""
         try:
+            # Known complexes are answered from their (cached) cause lists
+            listings = self.listing_resolver.check_case_listing(cnr_number, check_today, check_tomorrow)
+            if listings is not None:
+                return listings
+
             listings = []
             today = datetime.now().date()
             tomorrow = today + timedelta(days=1)
@@ -364,43 +505,43 @@ class ECourtsScraper:
 
         except Exception as e:
             logger.error(f"❌ Failed to check case listing: {e}")
+            ECOURTS_ERRORS.labels(operation='check_listing').inc()
             return []
 
     def save_results(self, data, filename_base):
         """Save results in JSON and CSV formats"""
-        try:
-            # Ensure downloads directory exists
-            os.makedirs('downloads', exist_ok=True)
-
-            # Save as JSON
-            json_filename = f"downloads/{filename_base}.json"
-            with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            # Save as CSV if it's cause list data
-            if 'cases' in data and data['cases']:
-                csv_filename = f"downloads/{filename_base}.csv"
-                with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-                    if data['cases']:
-                        writer = csv.DictWriter(f, fieldnames=data['cases'][0].keys())
-                        writer.writeheader()
-                        writer.writerows(data['cases'])
-
-            logger.info(f"✅ Results saved to {json_filename}")
-            return True
+        with span('save', file=filename_base, rows=len(data.get('cases') or [])):
+            try:
+                # Ensure downloads directory exists
+                os.makedirs('downloads', exist_ok=True)
 
-        except Exception as e:
-            logger.error(f"❌ Failed to save results: {e}")
-            return False
+                # Save as JSON
+                json_filename = f"downloads/{filename_base}.json"
+                with open(json_filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+
+                # Save as CSV if it's cause list data
+                if 'cases' in data and data['cases']:
+                    csv_filename = f"downloads/{filename_base}.csv"
+                    with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
+                        write_csv(f, data)
+
+                logger.info(f"✅ Results saved to {json_filename}")
+                return True
+
+            except Exception as e:
+                logger.error(f"❌ Failed to save results: {e}")
+                record_error(e)
+                return False
 
     def close(self):
         """Clean up resources"""
         try:
-            self.driver.quit()
+            self.browser.close()
         except:
             pass
 
-def main():
+def main(argv=None):
     """Main CLI function with comprehensive argument handling"""
     parser = argparse.ArgumentParser(description='eCourts Professional Scraper - Updated Version')
 
@@ -425,8 +566,10 @@ def main():
     # Output options
     parser.add_argument('--output', default='console', choices=['console', 'json', 'csv'], help='Output format')
     parser.add_argument('--headless', default=True, type=bool, help='Run in headless mode')
+    parser.add_argument('--full-pages', action='store_true', help='Load images, stylesheets and fonts too')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    setup_logging()
 
     print("🏛️  eCOURTS PROFESSIONAL SCRAPER")
     print("="*50)
@@ -434,7 +577,7 @@ def main():
     print("="*50)
 
     # Initialize scraper
-    scraper = ECourtsScraper(headless=args.headless)
+    scraper = ECourtsScraper(headless=args.headless, lean=False if args.full_pages else None)
 
     try:
         # CNR search
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Browser Tabs
+Several isolated tabs per Chrome, each driving its own ECourtsScraper
+"""
+
+import functools
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Polling interval while a tab's page loads; the browser is free in between
+LOAD_POLL_INTERVAL = 0.05
+
+class SharedBrowser:
+    """
+    One Chrome process whose tabs are driven concurrently.
+
+    A WebDriver session executes one command at a time against its current
+    window, so every tab command takes the browser lock and switches window
+    if needed. Chrome runs with page_load_strategy 'none' and tabs poll for
+    load completion without holding the lock, so while one tab waits for
+    eCourts the others keep working. Each tab lives in its own browser
+    context (separate cookies and session storage) when Chrome allows it.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.lock = threading.RLock()
+        # The initial window stays open so the session survives its tabs
+        self.current = driver.current_window_handle
+        self.tabs = 0
+        self.closed = False
+
+    def open_tab(self, on_close=None):
+        """Open an isolated tab and return its TabDriver"""
+        with self.lock:
+            if self.closed:
+                raise RuntimeError('Browser has been quit')
+            context_id = None
+            try:
+                context_id = self.driver.execute_cdp_cmd('Target.createBrowserContext', {})['browserContextId']
+                target = self.driver.execute_cdp_cmd(
+                    'Target.createTarget', {'url': 'about:blank', 'browserContextId': context_id}
+                )
+                handle = target['targetId']
+                # chromedriver discovers new targets when listing handles
+                if handle not in self.driver.window_handles:
+                    raise RuntimeError('new target not attached to the session')
+            except Exception as e:
+                logger.warning(f"⚠️ Isolated browser context unavailable, sharing cookies: {e}")
+                if context_id is not None:
+                    self._dispose_context(context_id)
+                context_id = None
+                self.driver.switch_to.new_window('tab')
+                handle = self.current = self.driver.current_window_handle
+            self.tabs += 1
+            return TabDriver(self, handle, context_id, on_close=on_close)
+
+    def close_tab(self, tab):
+        with self.lock:
+            if self.closed:
+                return
+            try:
+                self.driver.execute_cdp_cmd('Target.closeTarget', {'targetId': tab.handle})
+            except Exception:
+                try:
+                    self.activate(tab.handle)
+                    self.driver.close()
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to close tab: {e}")
+            if tab.context_id:
+                self._dispose_context(tab.context_id)
+            if self.current == tab.handle:
+                self.current = None
+            self.tabs -= 1
+
+    def activate(self, handle):
+        """Make handle the session's current window (caller holds the lock)"""
+        if self.current != handle:
+            self.driver.switch_to.window(handle)
+            self.current = handle
+
+    def quit(self):
+        with self.lock:
+            self.closed = True
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+
+    def _dispose_context(self, context_id):
+        try:
+            self.driver.execute_cdp_cmd('Target.disposeBrowserContext', {'browserContextId': context_id})
+        except Exception:
+            pass
+
+class TabDriver:
+    """
+    The subset of the WebDriver API ECourtsScraper uses, bound to one tab.
+
+    Commands switch the shared session to this tab under the browser lock;
+    elements are wrapped so later clicks and reads do the same.
+    """
+
+    def __init__(self, browser, handle, context_id=None, page_load_timeout=45, on_close=None):
+        self.browser = browser
+        self.handle = handle
+        self.context_id = context_id
+        self.page_load_timeout = page_load_timeout
+        self.on_close = on_close
+
+    @contextmanager
+    def active(self):
+        with self.browser.lock:
+            self.browser.activate(self.handle)
+            yield self.browser.driver
+
+    def get(self, url):
+        """Navigate and wait for the load event, releasing the browser while waiting"""
+        marker = uuid.uuid4().hex
+        with self.active() as driver:
+            # The marker disappears with the old document
+            driver.execute_script("window.__ecourtsNav = arguments[0]; window.location.href = arguments[1];", marker, url)
+
+        deadline = time.monotonic() + self.page_load_timeout
+        while True:
+            time.sleep(LOAD_POLL_INTERVAL)
+            with self.active() as driver:
+                loaded = driver.execute_script(
+                    "return window.__ecourtsNav !== arguments[0] && document.readyState === 'complete';", marker
+                )
+            if loaded:
+                return
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Page did not load within {self.page_load_timeout}s: {url}")
+
+    def find_element(self, by, value):
+        with self.active() as driver:
+            return TabElement(self, driver.find_element(by, value))
+
+    def find_elements(self, by, value):
+        with self.active() as driver:
+            return [TabElement(self, element) for element in driver.find_elements(by, value)]
+
+    def execute_script(self, script, *args):
+        with self.active() as driver:
+            return driver.execute_script(script, *args)
+
+    def execute_cdp_cmd(self, cmd, params):
+        # CDP commands from chromedriver go to the current window's target
+        with self.active() as driver:
+            return driver.execute_cdp_cmd(cmd, params)
+
+    @property
+    def current_url(self):
+        with self.active() as driver:
+            return driver.current_url
+
+    @property
+    def page_source(self):
+        with self.active() as driver:
+            return driver.page_source
+
+    @property
+    def title(self):
+        with self.active() as driver:
+            return driver.title
+
+    def quit(self):
+        """Close this tab"""
+        if self.on_close:
+            self.on_close(self)
+        else:
+            self.browser.close_tab(self)
+
+class TabElement:
+    """A WebElement whose every use first switches to its tab"""
+
+    def __init__(self, tab, element):
+        self._tab = tab
+        self._element = element
+
+    def __getattr__(self, name):
+        with self._tab.active():
+            value = getattr(self._element, name)
+        if not callable(value):
+            return value
+
+        def call(*args, **kwargs):
+            with self._tab.active():
+                result = value(*args, **kwargs)
+            if isinstance(result, list):
+                return [self._wrap(item) for item in result]
+            return self._wrap(result)
+        return call
+
+    def _wrap(self, value):
+        if hasattr(value, 'find_element') and hasattr(value, 'click'):
+            return TabElement(self._tab, value)
+        return value
+
+class TabbedBrowsers:
+    """
+    Scraper factory placing up to ``tabs_per_browser`` scrapers in each Chrome.
+
+    Use as a ScraperPool factory: closing a scraper closes its tab, and a
+    Chrome is quit once its last tab is gone.
+    """
+
+    def __init__(self, tabs_per_browser=4, headless=True, lean=None, launch=None):
+        self.tabs_per_browser = max(1, tabs_per_browser)
+        self.headless = headless
+        self.lean = lean
+        self.launch = launch or self._default_launch
+        self.lock = threading.Lock()
+        self.browsers = []
+
+    def _default_launch(self):
+        from ecourts_scraper import launch_chrome
+        return launch_chrome(self.headless, page_load_strategy='none')
+
+    def new_scraper(self):
+        """An ECourtsScraper driving a fresh tab in a browser with room"""
+        from ecourts_scraper import ECourtsScraper
+
+        with self.lock:
+            self.browsers = [b for b in self.browsers if not b.closed]
+            browser = next((b for b in self.browsers if b.tabs < self.tabs_per_browser), None)
+            if browser is None:
+                browser = SharedBrowser(self.launch())
+                self.browsers.append(browser)
+                logger.info(f"✅ Chrome {len(self.browsers)} started for up to {self.tabs_per_browser} tabs")
+            tab = browser.open_tab(on_close=functools.partial(self._close_tab, browser))
+
+        return ECourtsScraper(headless=self.headless, lean=self.lean, driver=tab)
+
+    def _close_tab(self, browser, tab):
+        with self.lock:
+            browser.close_tab(tab)
+            if browser.tabs <= 0:
+                browser.quit()
+
+    def stats(self):
+        with self.lock:
+            return {'browsers': len([b for b in self.browsers if not b.closed]),
+                    'tabs': sum(b.tabs for b in self.browsers if not b.closed)}
+
+    def close(self):
+        with self.lock:
+            for browser in self.browsers:
+                browser.quit()
+            self.browsers = []
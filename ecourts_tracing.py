@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Tracing
+Timing spans around each stage of a scrape, written as JSON lines and optionally to OpenTelemetry
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+
+import ecourts_config as config
+import ecourts_metrics as metrics
+from ecourts_cancel import TaskCancelled
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # OpenTelemetry export is optional
+    otel_trace = None
+
+logger = logging.getLogger(__name__)
+
+# Innermost open span of the current thread or task
+_current_span = contextvars.ContextVar('ecourts_span', default=None)
+
+class Span:
+    """One timed stage; spans opened inside it become its children"""
+
+    def __init__(self, name, parent=None, attributes=None):
+        self.name = name
+        self.parent = parent
+        self.root = parent.root if parent else self
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.attributes = dict(attributes or {})
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.duration = None
+        self.status = 'ok'
+        self.error = None
+        # Root spans total their descendants' time per stage name
+        self.stages = {}
+
+    @property
+    def operation(self):
+        return self.root.name
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def fail(self, error):
+        self.status = 'cancelled' if isinstance(error, TaskCancelled) else 'error'
+        self.error = str(error)
+
+    def end(self):
+        self.duration = time.perf_counter() - self.started
+        if self.parent:
+            self.root.stages[self.name] = self.root.stages.get(self.name, 0.0) + self.duration
+
+    def to_dict(self):
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent.span_id if self.parent else None,
+            'operation': self.operation,
+            'name': self.name,
+            'start': self.started_at,
+            'duration_ms': round(self.duration * 1000, 2) if self.duration is not None else None,
+            'status': self.status,
+            'error': self.error,
+            'attributes': self.attributes
+        }
+
+class JsonSpanSink:
+    """Appends finished spans to a JSON lines file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, span):
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+
+class Tracer:
+    """
+    Opens spans, records their duration per operation and stage in
+    Prometheus and hands finished spans to the sinks. With ``otel`` every
+    span is mirrored into the OpenTelemetry tracer provider as well.
+    """
+
+    def __init__(self, sinks=(), otel=False):
+        self.sinks = list(sinks)
+        self.otel = None
+        if otel:
+            if otel_trace is None:
+                logger.warning("⚠️ OpenTelemetry export requested but opentelemetry-api is not installed")
+            else:
+                self.otel = otel_trace.get_tracer('ecourts')
+
+    @contextmanager
+    def span(self, name, **attributes):
+        parent = _current_span.get()
+        span = Span(name, parent, attributes)
+        token = _current_span.set(span)
+        mirror = self.otel.start_as_current_span(name, attributes=otel_attributes(attributes)) if self.otel else nullcontext()
+        try:
+            with mirror as otel_span:
+                try:
+                    yield span
+                except BaseException as e:
+                    span.fail(e)
+                    raise
+                finally:
+                    if otel_span is not None:
+                        otel_span.set_attributes(otel_attributes(span.attributes))
+                        if span.status != 'ok':
+                            otel_span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, span.error))
+        finally:
+            _current_span.reset(token)
+            self._finish(span)
+
+    def _finish(self, span):
+        span.end()
+        if span.parent:
+            metrics.SCRAPE_STAGE.labels(operation=span.operation, stage=span.name).observe(span.duration)
+        else:
+            breakdown = ', '.join(f"{stage} {seconds:.2f}s" for stage, seconds in
+                                  sorted(span.stages.items(), key=lambda item: -item[1]))
+            # One line per operation saying where its time went
+            (logger.info if span.stages else logger.debug)(
+                f"⏱️ {span.name} {span.duration:.2f}s ({span.status}){': ' + breakdown if breakdown else ''}"
+            )
+
+        for sink in self.sinks:
+            try:
+                sink.export(span)
+            except Exception as e:
+                logger.debug(f"Span export failed: {e}")
+
+def otel_attributes(attributes):
+    """OpenTelemetry only takes primitive attribute values"""
+    return {key: value if isinstance(value, (str, bool, int, float)) else str(value)
+            for key, value in attributes.items() if value is not None}
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+def get_tracer():
+    """This process's tracer, configured from config.ini [tracing] on first use"""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            sinks = []
+            path = config.get('tracing', 'json_path', '')
+            if path:
+                sinks.append(JsonSpanSink(path))
+            _tracer = Tracer(sinks, otel=config.get_bool('tracing', 'otel', False))
+        return _tracer
+
+def set_tracer(tracer):
+    """Replace this process's tracer (tests, benchmarks)"""
+    global _tracer
+    with _tracer_lock:
+        _tracer = tracer
+
+def span(name, **attributes):
+    """Time a stage: ``with span('navigate', url=url): ...``"""
+    return get_tracer().span(name, **attributes)
+
+def current_span():
+    return _current_span.get()
+
+def record_error(error):
+    """Mark the open span as failed when the error is handled inside it"""
+    active = _current_span.get()
+    if active is not None:
+        active.fail(error)
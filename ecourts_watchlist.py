@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Watchlist
+Tracked CNRs checked daily for listings, reporting only what changed
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import date as date_cls, datetime, timedelta
+from functools import partial
+
+from ecourts_crawl import fetch_live_cause_list
+from ecourts_directory import complex_for_cnr
+from ecourts_listings import ListingResolver
+from ecourts_scheduler import AdmissionRejected
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS watchlist (
+    cnr TEXT PRIMARY KEY,
+    label TEXT,
+    added_at TEXT NOT NULL,
+    checked_for TEXT
+);
+CREATE TABLE IF NOT EXISTS listings (
+    cnr TEXT NOT NULL,
+    listed_on TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    listing TEXT NOT NULL,
+    PRIMARY KEY (cnr, listed_on)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_date TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    status TEXT NOT NULL,
+    checked INTEGER DEFAULT 0,
+    failed INTEGER DEFAULT 0,
+    changed INTEGER DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS changes (
+    run_id INTEGER NOT NULL,
+    cnr TEXT NOT NULL,
+    listed_on TEXT NOT NULL,
+    change TEXT NOT NULL,
+    listing TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS changes_run ON changes (run_id);
+CREATE TABLE IF NOT EXISTS schedule (
+    run_date TEXT PRIMARY KEY
+);
+"""
+
+def listing_date(listing):
+    """ISO date of a listing whose 'date' is DD/MM/YYYY"""
+    return datetime.strptime(listing['date'], '%d/%m/%Y').date().isoformat()
+
+def fingerprint(listing):
+    return hashlib.sha1(json.dumps(listing, sort_keys=True).encode()).hexdigest()
+
+class WatchlistStore:
+    """SQLite store for tracked CNRs, their current listings and run history"""
+
+    def __init__(self, path='watchlist.db'):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        with self.lock, self.db:
+            self.db.executescript(SCHEMA)
+
+    def add(self, cnrs, label=None):
+        """Track CNRs; returns how many were new"""
+        now = datetime.now().isoformat()
+        with self.lock, self.db:
+            before = self.db.total_changes
+            self.db.executemany(
+                "INSERT OR IGNORE INTO watchlist (cnr, label, added_at) VALUES (?, ?, ?)",
+                [(cnr.strip().upper(), label, now) for cnr in cnrs if cnr.strip()]
+            )
+            return self.db.total_changes - before
+
+    def remove(self, cnr):
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM listings WHERE cnr = ?", (cnr,))
+            return self.db.execute("DELETE FROM watchlist WHERE cnr = ?", (cnr,)).rowcount > 0
+
+    def entries(self, offset=0, limit=100):
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT cnr, label, added_at, checked_for FROM watchlist ORDER BY cnr LIMIT ? OFFSET ?",
+                (limit, offset)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM watchlist").fetchone()[0]
+
+    def due(self, run_date, limit):
+        """CNRs not yet checked for run_date"""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT cnr, label FROM watchlist WHERE checked_for IS NULL OR checked_for < ? ORDER BY cnr LIMIT ?",
+                (run_date, limit)
+            ).fetchall()
+        return [(row['cnr'], row['label']) for row in rows]
+
+    def reset_checks(self):
+        """Make every CNR due again"""
+        with self.lock, self.db:
+            self.db.execute("UPDATE watchlist SET checked_for = NULL")
+
+    def claim_schedule(self, run_date):
+        """True for exactly one caller per day, across processes"""
+        with self.lock, self.db:
+            return self.db.execute("INSERT OR IGNORE INTO schedule (run_date) VALUES (?)", (run_date,)).rowcount == 1
+
+    def start_run(self, run_date):
+        with self.lock, self.db:
+            return self.db.execute(
+                "INSERT INTO runs (run_date, started_at, status) VALUES (?, ?, 'running')",
+                (run_date, datetime.now().isoformat())
+            ).lastrowid
+
+    def interrupted_run(self, run_date):
+        """Latest run for run_date that never finished, or None"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT * FROM runs WHERE run_date = ? AND status = 'running' ORDER BY id DESC LIMIT 1", (run_date,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def finish_run(self, run_id, status, checked, failed, changed):
+        with self.lock, self.db:
+            self.db.execute(
+                "UPDATE runs SET finished_at = ?, status = ?, checked = ?, failed = ?, changed = ? WHERE id = ?",
+                (datetime.now().isoformat(), status, checked, failed, changed, run_id)
+            )
+
+    def record(self, run_id, run_date, dates, results, failed=0):
+        """
+        Store the listings found for each CNR on the given dates and return
+        the changes against what was stored before: added, changed, removed.
+        The run's counters advance in the same transaction, so a resumed
+        run continues from exactly the CNRs and totals committed so far.
+        """
+        changes = []
+        with self.lock, self.db:
+            for cnr, listings in results.items():
+                current = {}
+                for listing in listings:
+                    listed_on = listing_date(listing)
+                    if listed_on in dates:
+                        current[listed_on] = listing
+
+                stored = {
+                    row['listed_on']: (row['fingerprint'], json.loads(row['listing']))
+                    for row in self.db.execute(
+                        f"SELECT listed_on, fingerprint, listing FROM listings WHERE cnr = ? AND listed_on IN ({','.join('?' * len(dates))})",
+                        (cnr, *dates)
+                    )
+                }
+
+                for listed_on in dates:
+                    new, old = current.get(listed_on), stored.get(listed_on)
+                    if new is not None and old is None:
+                        changes.append((cnr, listed_on, 'added', new))
+                    elif new is not None and fingerprint(new) != old[0]:
+                        changes.append((cnr, listed_on, 'changed', new))
+                    elif new is None and old is not None:
+                        changes.append((cnr, listed_on, 'removed', old[1]))
+
+                self.db.execute(
+                    f"DELETE FROM listings WHERE cnr = ? AND listed_on IN ({','.join('?' * len(dates))})",
+                    (cnr, *dates)
+                )
+                self.db.executemany(
+                    "INSERT INTO listings (cnr, listed_on, fingerprint, listing) VALUES (?, ?, ?, ?)",
+                    [(cnr, listed_on, fingerprint(l), json.dumps(l)) for listed_on, l in current.items()]
+                )
+
+            self.db.executemany(
+                "INSERT INTO changes (run_id, cnr, listed_on, change, listing) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, cnr, listed_on, change, json.dumps(l)) for cnr, listed_on, change, l in changes]
+            )
+            self.db.executemany(
+                "UPDATE watchlist SET checked_for = ? WHERE cnr = ?",
+                [(run_date, cnr) for cnr in results]
+            )
+            self.db.execute(
+                "UPDATE runs SET checked = checked + ?, failed = failed + ?, changed = changed + ? WHERE id = ?",
+                (len(results), failed, len(changes), run_id)
+            )
+            # Listings for past days can no longer change
+            self.db.execute("DELETE FROM listings WHERE listed_on < ?", (min(dates),))
+        return changes
+
+    def runs(self, limit=20):
+        with self.lock:
+            rows = self.db.execute("SELECT * FROM runs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def run(self, run_id):
+        with self.lock:
+            row = self.db.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
+    def changes(self, run_id):
+        """Changed listings of one run, joined with their watchlist labels"""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT c.cnr, w.label, c.listed_on, c.change, c.listing FROM changes c "
+                "LEFT JOIN watchlist w ON w.cnr = c.cnr WHERE c.run_id = ? ORDER BY c.listed_on, c.cnr",
+                (run_id,)
+            ).fetchall()
+        return [
+            {'cnr': row['cnr'], 'label': row['label'] or '', 'date': row['listed_on'], 'change': row['change'], **json.loads(row['listing'])}
+            for row in rows
+        ]
+
+    def close(self):
+        self.db.close()
+
+class WatchlistMonitor:
+    """
+    Runs listing checks for every tracked CNR once per day.
+
+    Runs are incremental: only CNRs not yet checked for the run date are
+    submitted, so an interrupted run resumes where it stopped and CNRs
+    added later in the day are picked up by the next run. Checks go
+    through the scheduler at 'scheduled' priority in batches no larger
+    than its admission queue allows. With a ListingResolver, CNRs from
+    known complexes are joined against cause lists fetched once per
+    complex; only the rest are checked one by one.
+    """
+
+    def __init__(self, store, scheduler, check, batch_size=20, run_at='07:00', on_report=None, resolver=None):
+        self.store = store
+        self.scheduler = scheduler
+        self.check = check
+        self.resolver = resolver
+        self.batch_size = max(1, batch_size)
+        self.run_at = run_at
+        self.on_report = on_report
+
+        self.run_lock = threading.Lock()
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def run_once(self, run_date=None, force=False, resume=False):
+        """
+        Check due CNRs for run_date and its next day; returns the run report.
+        With ``resume`` an interrupted run for the date is continued under
+        its own id, so its report covers the whole run.
+        """
+        if not self.run_lock.acquire(blocking=False):
+            raise RuntimeError('A watchlist run is already in progress')
+
+        try:
+            return self._run(run_date, force, resume)
+        finally:
+            self.run_lock.release()
+
+    def run_in_background(self, run_date=None, force=False, resume=False):
+        """Start run_once on its own thread; False if a run is already in progress"""
+        # Taken here, in the caller, so two requests cannot both start a run
+        if not self.run_lock.acquire(blocking=False):
+            return False
+
+        def run():
+            try:
+                self._run(run_date, force, resume)
+            except Exception as e:
+                logger.error(f"❌ Watchlist run failed: {e}")
+            finally:
+                self.run_lock.release()
+
+        threading.Thread(target=run, name='watchlist-run', daemon=True).start()
+        return True
+
+    def _run(self, run_date, force, resume):
+        run_day = date_cls.fromisoformat(run_date) if run_date else date_cls.today()
+        run_date = run_day.isoformat()
+        dates = (run_date, (run_day + timedelta(days=1)).isoformat())
+        if force:
+            self.store.reset_checks()
+
+        interrupted = self.store.interrupted_run(run_date) if resume and not force else None
+        if interrupted:
+            run_id = interrupted['id']
+            checked, failed, changed = interrupted['checked'], interrupted['failed'], interrupted['changed']
+            logger.info(f"⏩ Watchlist run {run_id} for {run_date} resumed after {checked} checked")
+        else:
+            run_id = self.store.start_run(run_date)
+            logger.info(f"📋 Watchlist run {run_id} for {run_date} started")
+            checked = failed = changed = 0
+        retry = set()
+
+        while True:
+            batch = [(cnr, label) for cnr, label in self.store.due(run_date, self.batch_size + len(retry)) if cnr not in retry]
+            if not batch:
+                break
+
+            cnrs = [cnr for cnr, _ in batch[:self.batch_size]]
+            results = self._check_batch(cnrs, dates)
+            failures = {cnr for cnr in cnrs if cnr not in results}
+            # Failed CNRs stay due for the next run but are not retried in this one
+            retry |= failures
+            failed += len(failures)
+            checked += len(results)
+            changed += len(self.store.record(run_id, run_date, dates, results, len(failures)))
+
+        status = 'completed' if not failed else 'partial'
+        self.store.finish_run(run_id, status, checked, failed, changed)
+        logger.info(f"✅ Watchlist run {run_id}: {checked} checked, {changed} changed, {failed} failed")
+
+        report = {
+            'run_id': run_id,
+            'run_date': run_date,
+            'status': status,
+            'checked': checked,
+            'failed': failed,
+            'changes': self.store.changes(run_id)
+        }
+        if self.on_report:
+            self.on_report(report)
+        return report
+
+    def _check_batch(self, cnrs, dates):
+        """Run one batch on the scheduler; returns {cnr: listings} for successes"""
+        results = {}
+        if self.resolver is not None:
+            # One cause list fetch per complex and date, then a join per CNR
+            list_dates = [date_cls.fromisoformat(d).strftime('%d/%m/%Y') for d in dates]
+            needed, unresolved = self.resolver.plan(cnrs, list_dates)
+            loads = {key: self._submit(self.resolver.load, *key) for key in sorted(needed)}
+
+            failed_courts = set()
+            for (court, date), job in loads.items():
+                job.wait()
+                if job.state != 'done':
+                    failed_courts.add(court)
+                    logger.warning(f"⚠️ Watchlist cause list failed for {court[2]} on {date}: {job.error}")
+
+            skip = set(unresolved)
+            for cnr in cnrs:
+                if cnr not in skip and complex_for_cnr(cnr) not in failed_courts:
+                    results[cnr] = self.resolver.lookup(cnr, list_dates)
+            cnrs = unresolved
+
+        jobs = {cnr: self._submit(self.check, cnr, True, True) for cnr in cnrs}
+        for cnr, job in jobs.items():
+            job.wait()
+            if job.state == 'done':
+                results[cnr] = job.result or []
+            else:
+                logger.warning(f"⚠️ Watchlist check failed for {cnr}: {job.error}")
+        return results
+
+    def _submit(self, func, *args):
+        while True:
+            try:
+                return self.scheduler.submit(func, *args, priority='scheduled')
+            except AdmissionRejected as e:
+                # Interactive traffic has the queue; back off as advised
+                time.sleep(min(e.retry_after, 30))
+
+    def start(self):
+        """Run once a day at run_at (HH:MM local time) in a background thread"""
+        if self.thread is None or not self.thread.is_alive():
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._loop, name='watchlist', daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def _loop(self):
+        hour, minute = (int(part) for part in self.run_at.split(':'))
+        while not self.stop_event.is_set():
+            now = datetime.now()
+            today = now.date().isoformat()
+            if (now.hour, now.minute) >= (hour, minute) and self.store.claim_schedule(today):
+                try:
+                    self.run_once(today)
+                except Exception as e:
+                    logger.error(f"❌ Watchlist run failed: {e}")
+            self.stop_event.wait(60)
+
+def report_rows(report):
+    """Flatten a run report into uniform CSV rows"""
+    return [
+        {
+            'cnr': change['cnr'],
+            'label': change['label'],
+            'date': change['date'],
+            'change': change['change'],
+            'serial_no': change.get('serial_no', ''),
+            'court_name': change.get('court_name', ''),
+            'purpose': change.get('purpose', '')
+        }
+        for change in report['changes']
+    ]
+
+def pool_check(pool, timeout=None):
+    """
+    Listing check joined against live cause lists fetched through a
+    ScraperPool. A CNR outside the court directory has no cause list to
+    join against, so its check fails instead of reporting demo listings.
+    """
+    resolver = ListingResolver(partial(fetch_live_cause_list, pool, timeout=timeout))
+
+    def check(cnr, check_today, check_tomorrow):
+        listings = resolver.check_case_listing(cnr, check_today, check_tomorrow)
+        if listings is None:
+            raise LookupError(f"{cnr} is not in the court directory")
+        return listings
+    return check
+
+def main():
+    """Manage the watchlist and run checks from the command line"""
+    import ecourts_config as config
+    from ecourts_logging import setup_logging
+    from ecourts_pool import ScraperPool
+    from ecourts_scheduler import PriorityScheduler
+
+    parser = argparse.ArgumentParser(description='eCourts watchlist monitor')
+    parser.add_argument('--database', default=config.get('watchlist', 'database', 'watchlist.db'))
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    add = sub.add_parser('add', help='Track CNR numbers')
+    add.add_argument('cnrs', nargs='*')
+    add.add_argument('--file', help='File with one CNR per line')
+    add.add_argument('--label')
+
+    remove = sub.add_parser('remove', help='Stop tracking a CNR')
+    remove.add_argument('cnr')
+
+    sub.add_parser('list', help='Show tracked CNRs')
+
+    run = sub.add_parser('run', help='Check listings for today and tomorrow')
+    run.add_argument('--date', help='Run date (YYYY-MM-DD), default today')
+    run.add_argument('--force', action='store_true', help='Recheck CNRs already checked for the date')
+    run.add_argument('--resume', action='store_true', help='Continue the interrupted run for the date')
+
+    args = parser.parse_args()
+    setup_logging()
+    store = WatchlistStore(args.database)
+
+    if args.command == 'add':
+        cnrs = list(args.cnrs)
+        if args.file:
+            with open(args.file, encoding='utf-8') as f:
+                cnrs.extend(line.strip() for line in f)
+        print(f"✅ {store.add(cnrs, args.label)} CNRs added ({store.count()} tracked)")
+    elif args.command == 'remove':
+        print("✅ Removed" if store.remove(args.cnr.upper()) else "❌ Not tracked")
+    elif args.command == 'list':
+        for entry in store.entries(limit=store.count()):
+            print(f"{entry['cnr']}  {entry['label'] or ''}  last checked: {entry['checked_for'] or 'never'}")
+    elif args.command == 'run':
+        workers = config.get_int('api', 'max_concurrent_tasks', 5)
+        pool = ScraperPool(size=workers, headless=config.get_bool('scraper', 'headless', True))
+        scheduler = PriorityScheduler(workers=workers, reserved_interactive=0)
+        resolver = ListingResolver(partial(fetch_live_cause_list, pool), ttl=config.get_int('watchlist', 'listing_cache_ttl', 3600))
+        monitor = WatchlistMonitor(
+            store, scheduler, pool_check(pool), config.get_int('watchlist', 'batch_size', 20), resolver=resolver
+        )
+        try:
+            report = monitor.run_once(args.date, force=args.force, resume=args.resume)
+            print(f"📋 {report['checked']} checked, {len(report['changes'])} changed, {report['failed']} failed")
+            for change in report['changes']:
+                print(f"  {change['change']:8} {change['date']}  {change['cnr']}  {change.get('court_name', '')}  {change.get('purpose', '')}")
+        finally:
+            scheduler.shutdown()
+            pool.close()
+
+    store.close()
+
+if __name__ == '__main__':
+    main()
@@ -1,51 +1,341 @@
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, request, jsonify, abort, g, Response, send_file
 from flask_cors import CORS
-import json
 from datetime import datetime, timedelta
 import threading
+import time
 import uuid
 import os
+import atexit
+import hashlib
+import hmac
 
-app = Flask(__name__)
+import ecourts_config as config
+import ecourts_metrics as metrics
+from ecourts_assets import Asset, AssetBundle
+from ecourts_cancel import CancellationToken, TaskCancelled
+from ecourts_causelist import CauseListStore, FILTER_FIELDS, InvalidCursor, decode_cursor
+from ecourts_crawl import fetch_live_cause_list
+from ecourts_directory import cnr_for_case
+from ecourts_downloads import download_path, download_urls, export_name, stream_gzip, stream_zip
+from ecourts_listings import ListingResolver
+from ecourts_lean import PAGE_STATS
+from ecourts_logging import flush_logging, log_context, setup_logging
+from ecourts_operations import run_operation
+from ecourts_pool import ScraperPool
+from ecourts_queue import create_queue, wait_for_job
+from ecourts_ratelimit import RateLimiter, create_backend
+from ecourts_scheduler import AdmissionRejected, PriorityScheduler, PRIORITY_CLASSES
+from ecourts_watchlist import WatchlistMonitor, WatchlistStore, report_rows
+from ecourts_writer import ResultWriter
+
+# Static files are served pre-built from the asset bundle below
+app = Flask(__name__, static_folder=None)
 CORS(app)
 
+# Trust X-Forwarded-For from this many reverse proxies (nginx in front)
+if config.get_int('security', 'trusted_proxies', 0):
+    from werkzeug.middleware.proxy_fix import ProxyFix
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=config.get_int('security', 'trusted_proxies', 0))
+
 # Store active scraping tasks
 active_tasks = {}
 
+# Background writer for cause list exports
+result_writer = ResultWriter(
+    output_dir=config.get('scraper', 'output_directory', 'downloads'),
+    batch_size=config.get_int('export', 'batch_size', 20),
+    flush_interval=config.get_float('export', 'flush_interval', 0.5),
+    fsync_policy=config.get('export', 'fsync_policy', 'batch'),
+    max_queue=config.get_int('export', 'max_queue', 1000)
+)
+atexit.register(result_writer.close)
+
+# Per-client request limits from config.ini [security]
+API_KEY_REQUIRED = config.get_bool('security', 'api_key_required', False)
+API_KEY = config.get('security', 'api_key', '')
+IP_RATE_LIMIT = config.get_int('security', 'ip_rate_limit', config.get_int('security', 'rate_limit', 100))
+rate_limiter = RateLimiter(
+    create_backend(config.get('security', 'rate_limit_backend', 'memory'), config.get('security', 'redis_url', '')),
+    limit=config.get_int('security', 'rate_limit', 100),
+    period=config.get_int('security', 'rate_limit_period', 3600)
+)
+
+# Indexed cause lists serve filtered pages and cursors without re-scraping
+CAUSE_LIST_PAGE_SIZE = config.get_int('scraper', 'max_cases_display', 50)
+CAUSE_LIST_MAX_PAGE_SIZE = config.get_int('api', 'cause_list_max_page_size', 500)
+cause_list_store = CauseListStore(
+    max_lists=config.get_int('api', 'cause_list_cache_size', 256),
+    ttl=config.get_int('api', 'cause_list_cache_ttl', 600)
+)
+
+# Real scraping is opt-in; demo data is served otherwise
+LIVE_SCRAPING = config.get_bool('api', 'live_scraping', False)
+
+# Chrome pool for this process; created after fork under gunicorn
+scraper_pool = None
+scraper_pool_lock = threading.Lock()
+
+# Scraping jobs run on a fixed set of workers, interactive work first
+scheduler = PriorityScheduler(
+    workers=config.get_int('api', 'max_concurrent_tasks', 5),
+    reserved_interactive=config.get_int('api', 'reserved_interactive', 1),
+    aging_seconds=config.get_float('api', 'aging_seconds', 30),
+    max_queue=config.get_int('api', 'max_queued_tasks', 50)
+)
+
+# 'local' runs tasks on this process's scheduler; 'queue' hands them to ecourts_worker nodes
+TASK_BACKEND = config.get('api', 'task_backend', 'local')
+# Queue mode bypasses the local scheduler, so the shared queue has its own bound
+QUEUE_MAX_DEPTH = config.get_int('queue', 'max_depth', 200)
+job_queue = None
+job_queue_lock = threading.Lock()
+
+# Tracked CNRs checked daily; opened lazily so each process has its own connection
+watchlist_monitor = None
+watchlist_lock = threading.Lock()
+
+def get_scraper_pool():
+    """Return this process's scraper pool, creating it on first use"""
+    global scraper_pool
+    with scraper_pool_lock:
+        if scraper_pool is None:
+            scraper_pool = ScraperPool(
+                size=config.get_int('api', 'max_concurrent_tasks', 5),
+                headless=config.get_bool('scraper', 'headless', True),
+                warm=config.get_int('api', 'warm_drivers', 0) if LIVE_SCRAPING else 0
+            )
+        return scraper_pool
+
+def get_job_queue():
+    """Return this process's connection to the shared job queue"""
+    global job_queue
+    with job_queue_lock:
+        if job_queue is None:
+            job_queue = create_queue(
+                config.get('queue', 'backend', 'sqlite'),
+                config.get('queue', 'path', 'ecourts_queue.db'),
+                config.get('queue', 'redis_url', ''),
+                visibility_timeout=config.get_int('queue', 'visibility_timeout', 120),
+                max_attempts=config.get_int('queue', 'max_attempts', 3),
+                retry_base=config.get_float('queue', 'retry_base', 5)
+            )
+        return job_queue
+
+def init_worker():
+    """Per-process setup; gunicorn calls this in post_fork"""
+    global scraper_pool, job_queue, gauge_refresher
+    # Browsers, threads and connections never survive a fork, so start from scratch
+    scraper_pool = None
+    job_queue = None
+    gauge_refresher = None
+    result_writer.after_fork()
+    scheduler.after_fork()
+    setup_logging()
+    get_scraper_pool()
+    start_gauge_refresher()
+    if config.get_bool('watchlist', 'enabled', False):
+        get_watchlist().start()
+
+def get_watchlist():
+    """Return this process's watchlist monitor, opening the database on first use"""
+    global watchlist_monitor
+    with watchlist_lock:
+        if watchlist_monitor is None:
+            watchlist_monitor = WatchlistMonitor(
+                WatchlistStore(config.get('watchlist', 'database', 'watchlist.db')),
+                scheduler,
+                check_listing,
+                batch_size=config.get_int('watchlist', 'batch_size', 20),
+                run_at=config.get('watchlist', 'run_at', '07:00'),
+                on_report=export_watchlist_report,
+                resolver=listing_resolver
+            )
+        return watchlist_monitor
+
+def fetch_listing_cause_list(state, district, complex_name, date):
+    """Cause list source for the listing resolver"""
+    if LIVE_SCRAPING:
+        # Demo fallbacks raise, so they fail the check instead of becoming listings
+        return fetch_live_cause_list(
+            get_scraper_pool(), state, district, complex_name, date, timeout=config.get_int('api', 'task_timeout', 300)
+        )
+    return generate_cause_list_result({'state': state, 'district': district, 'complex': complex_name, 'date': date})
+
+# CNR listing checks joined against cause lists cached per complex and date
+listing_resolver = ListingResolver(
+    fetch_listing_cause_list, ttl=config.get_int('watchlist', 'listing_cache_ttl', 3600), live_only=LIVE_SCRAPING
+)
+
+def check_listing(cnr, check_today, check_tomorrow):
+    """Listing check for one CNR joined against its complex's cause lists"""
+    listings = listing_resolver.check_case_listing(cnr, check_today, check_tomorrow)
+    if listings is not None:
+        return listings
+    if LIVE_SCRAPING:
+        # No cause list to join against; a failed check, not a demo listing
+        raise LookupError(f"{cnr} is not in the court directory")
+    return generate_listing_result(cnr, check_today, check_tomorrow)
+
+def export_watchlist_report(report):
+    """Queue the changed listings of a watchlist run as JSON/CSV exports"""
+    filename_base = export_name('watchlist', report['run_date'].replace('-', '_'), report['run_id'])
+    result_writer.submit(filename_base, {
+        'metadata': {k: v for k, v in report.items() if k != 'changes'},
+        'cases': report_rows(report)
+    })
+    report['downloads'] = download_urls(filename_base, bool(report['changes']))
+
+def shutdown_worker():
+    """Flush exports and quit browsers before the process exits"""
+    if watchlist_monitor is not None:
+        watchlist_monitor.stop()
+    stop_gauge_refresher()
+    scheduler.shutdown(wait=False)
+    result_writer.close()
+    if scraper_pool is not None:
+        scraper_pool.close()
+    flush_logging()
+
 class ScrapingTask:
-    def __init__(self, task_id, params):
+    def __init__(self, task_id, params, priority='interactive'):
         self.task_id = task_id
         self.params = params
+        self.priority = priority
         self.status = 'pending'
         self.result = None
         self.error = None
         self.progress = 0
+        self.cancel_token = CancellationToken()
 
 def run_scraping_task(task_id, params):
     """Run scraping task in background"""
+    task = active_tasks.get(task_id)
+    if task is None:
+        # Cleaned up before a worker got to it; nobody is waiting for the result
+        return
+
+    with log_context(task_id=task_id, operation=params.get('operation')):
+        started = time.perf_counter()
+        try:
+            task.cancel_token.check()
+            task.status = 'running'
+            task.progress = 20
+        
+            if LIVE_SCRAPING:
+                with get_scraper_pool().scraper(timeout=config.get_int('api', 'task_timeout', 300)) as scraper:
+                    task.progress = 60
+                    result = run_operation(scraper, params, task.cancel_token)
+            else:
+                # Simulated scraping latency for demo data
+                task.cancel_token.sleep(2)
+                task.progress = 60
+            
+                if params['operation'] == 'search_cnr':
+                    result = generate_cnr_result(params)
+                elif params['operation'] == 'search_case':
+                    result = generate_case_result(params)
+                elif params['operation'] == 'fetch_cause_list':
+                    result = generate_cause_list_result(params)
+        
+            task.progress = 100
+            task.status = 'completed'
+            task.result = result
+        
+            if task.cancel_token.cancelled:
+                # Finished after the caller gave up; the work was wasted
+                metrics.ABANDONED_TASKS.labels(operation=params['operation'], outcome='completed').inc()
+        
+        except TaskCancelled as e:
+            task.status = 'cancelled'
+            task.error = str(e)
+            metrics.ABANDONED_TASKS.labels(operation=params.get('operation', 'unknown'), outcome='interrupted').inc()
+        
+        except Exception as e:
+            task.status = 'error'
+            task.error = str(e)
+    
+        finally:
+            # Whoever waits holds the task itself; the entry only tracks work in flight
+            active_tasks.pop(task_id, None)
+            metrics.OPERATION_LATENCY.labels(
+                operation=params.get('operation', 'unknown'),
+                status=task.status
+            ).observe(time.perf_counter() - started)
+
+def submit_task(params, timeout, priority='interactive'):
+    """Queue a scraping task and wait up to timeout seconds for it"""
+    task_id = str(uuid.uuid4())
+    task = ScrapingTask(task_id, params, priority)
+    active_tasks[task_id] = task
+    
+    if TASK_BACKEND == 'queue':
+        try:
+            return submit_queued_task(task, timeout)
+        finally:
+            # Finished, rejected or handed back to the queue; nothing runs here
+            active_tasks.pop(task_id, None)
+    
     try:
-        task = active_tasks[task_id]
-        task.status = 'running'
-        task.progress = 20
-        
-        import time
-        time.sleep(2)
-        task.progress = 60
-        
-        if params['operation'] == 'search_cnr':
-            result = generate_cnr_result(params)
-        elif params['operation'] == 'search_case':
-            result = generate_case_result(params)
-        elif params['operation'] == 'fetch_cause_list':
-            result = generate_cause_list_result(params)
-        
-        task.progress = 100
+        job = scheduler.submit(run_scraping_task, task_id, params, priority=priority)
+    except AdmissionRejected:
+        del active_tasks[task_id]
+        raise
+    
+    if not job.wait(timeout):
+        abandon_task(task, job)
+    if job.state == 'shed':
+        active_tasks.pop(task_id, None)
+        raise job.error
+    return task
+
+def submit_queued_task(task, timeout):
+    """Run a task on a worker node through the shared queue"""
+    started = time.perf_counter()
+    queue = get_job_queue()
+    if QUEUE_MAX_DEPTH and queue.depth() >= QUEUE_MAX_DEPTH:
+        metrics.ADMISSIONS.labels(priority=task.priority, outcome='rejected').inc()
+        raise AdmissionRejected('Scraping queue is full', 5)
+    job_id = queue.enqueue(task.params, task.priority)
+    metrics.ADMISSIONS.labels(priority=task.priority, outcome='accepted').inc()
+    job = wait_for_job(queue, job_id, timeout)
+    
+    if job and job['status'] == 'done':
         task.status = 'completed'
-        task.result = result
-        
-    except Exception as e:
+        task.result = job['result']
+    elif job and job['status'] == 'failed':
         task.status = 'error'
-        task.error = str(e)
+        task.error = job['error']
+    else:
+        # Nobody waits any more; the worker sees the cancel on its next heartbeat
+        queue.cancel(job_id)
+        task.status = 'cancelled'
+        task.error = 'Request timed out'
+        metrics.ABANDONED_TASKS.labels(operation=task.params.get('operation', 'unknown'), outcome='dequeued').inc()
+    
+    metrics.JOB_LATENCY.labels(priority=task.priority).observe(time.perf_counter() - started)
+    return task
+
+def abandon_task(task, job):
+    """Stop work the caller no longer waits for and free its worker"""
+    task.cancel_token.cancel('Request timed out')
+    if scheduler.cancel(job):
+        # Never started: nothing ran, so the worker was never taken
+        active_tasks.pop(task.task_id, None)
+        task.status = 'cancelled'
+        task.error = 'Request timed out'
+        metrics.ABANDONED_TASKS.labels(operation=task.params.get('operation', 'unknown'), outcome='dequeued').inc()
+
+def overloaded_response(error):
+    """503 telling the client when scraping capacity should be free again"""
+    response = jsonify({'success': False, 'error': str(error), 'retry_after': error.retry_after})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+def request_priority(data):
+    """Priority class requested by the client; API calls default to interactive"""
+    priority = (data or {}).get('priority', 'interactive')
+    return priority if priority in PRIORITY_CLASSES else 'interactive'
 
 def generate_cnr_result(params):
     """Generate CNR search result"""
@@ -101,6 +391,226 @@ def generate_case_result(params):
         }
     }
 
+def generate_listing_result(cnr, check_today=False, check_tomorrow=False):
+    """Demo listings: a stable subset of CNRs is listed on each day"""
+    listings = []
+    days = [(check_today, datetime.now()), (check_tomorrow, datetime.now() + timedelta(days=1))]
+    
+    for wanted, day in days:
+        seed = int(hashlib.sha1(f"{cnr}{day.date()}".encode()).hexdigest()[:8], 16)
+        if wanted and seed % 3 == 0:
+            listings.append({
+                'date': day.strftime('%d/%m/%Y'),
+                'serial_no': str(seed % 40 + 1),
+                'court_name': f'Court No. {seed % 5 + 1} - District Judge',
+                'purpose': ['For Arguments', 'For Evidence', 'For Hearing', 'For Orders'][seed % 4]
+            })
+    return listings
+
+# COMPREHENSIVE CASE VARIATIONS - 5 STATES WITH MULTIPLE DISTRICTS & COMPLEXES
+CAUSE_LIST_VARIATIONS = {
+    # DELHI VARIATIONS
+    ('Delhi', 'New Delhi', 'Patiala House Court Comp'): [
+        {'sr_no': '1', 'case_no': 'CRL.M.C. 1234/2025', 'party_names': 'Arun Kumar vs State of Delhi', 'advocate': 'Sh. Rajesh Sharma'},
+        {'sr_no': '2', 'case_no': 'CS 5678/2024', 'party_names': 'Delhi Metro vs ABC Construction', 'advocate': 'Ms. Priya Gupta'},
+        {'sr_no': '3', 'case_no': 'FIR 9876/2025', 'party_names': 'State vs Mohan Singh', 'advocate': 'Sh. Vikram Kumar'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 4567/2024', 'party_names': 'Sunita Devi vs State', 'advocate': 'Ms. Neha Agarwal'},
+        {'sr_no': '5', 'case_no': 'CM 8901/2025', 'party_names': 'HDFC Bank vs Rakesh & Others', 'advocate': 'Sh. Amit Jain'}
+    ],
+    ('Delhi', 'New Delhi', 'Saket Court Complex'): [
+        {'sr_no': '1', 'case_no': 'CS 2345/2025', 'party_names': 'Infosys Ltd vs Tech Solutions', 'advocate': 'Ms. Anjali Verma'},
+        {'sr_no': '2', 'case_no': 'CRL.M.C. 6789/2024', 'party_names': 'Ravi Sharma vs State', 'advocate': 'Sh. Deepak Malhotra'},
+        {'sr_no': '3', 'case_no': 'FIR 4321/2025', 'party_names': 'State vs Priya Singh', 'advocate': 'Ms. Kavita Rao'},
+        {'sr_no': '4', 'case_no': 'CM 7890/2025', 'party_names': 'ICICI Bank vs Suresh Kumar', 'advocate': 'Sh. Rahul Jain'},
+        {'sr_no': '5', 'case_no': 'CRL.A. 5678/2024', 'party_names': 'Meena Devi vs State', 'advocate': 'Ms. Pooja Sharma'}
+    ],
+    ('Delhi', 'Central Delhi', 'Tis Hazari Court Complex'): [
+        {'sr_no': '1', 'case_no': 'CRL.M.C. 3456/2025', 'party_names': 'Ramesh Chand vs State', 'advocate': 'Sh. Sunil Sharma'},
+        {'sr_no': '2', 'case_no': 'CS 7890/2024', 'party_names': 'MCD vs Contractor Ltd', 'advocate': 'Ms. Ritu Singh'},
+        {'sr_no': '3', 'case_no': 'FIR 7654/2025', 'party_names': 'State vs Deepak Yadav', 'advocate': 'Sh. Ajay Kumar'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 6789/2024', 'party_names': 'Geeta Sharma vs State', 'advocate': 'Ms. Anita Rao'},
+        {'sr_no': '5', 'case_no': 'CM 9012/2025', 'party_names': 'SBI vs Mohan Lal', 'advocate': 'Sh. Vinod Jain'}
+    ],
+    ('Delhi', 'Central Delhi', 'Karkardooma Court Complex'): [
+        {'sr_no': '1', 'case_no': 'CRL.M.C. 4567/2025', 'party_names': 'Vijay Kumar vs State', 'advocate': 'Sh. Manoj Tiwari'},
+        {'sr_no': '2', 'case_no': 'CS 8901/2024', 'party_names': 'DDA vs Builder Group', 'advocate': 'Ms. Seema Kapoor'},
+        {'sr_no': '3', 'case_no': 'FIR 8765/2025', 'party_names': 'State vs Rohit Verma', 'advocate': 'Sh. Pankaj Sharma'},
+        {'sr_no': '4', 'case_no': 'CM 3456/2025', 'party_names': 'Axis Bank vs Rajesh', 'advocate': 'Ms. Nisha Gupta'},
+        {'sr_no': '5', 'case_no': 'CRL.A. 7890/2024', 'party_names': 'Sita Devi vs State', 'advocate': 'Sh. Anil Kumar'}
+    ],
+    ('Delhi', 'South Delhi', 'Saket Court Complex'): [
+        {'sr_no': '1', 'case_no': 'CS 5678/2025', 'party_names': 'TCS Ltd vs Software Inc', 'advocate': 'Ms. Priyanka Mehta'},
+        {'sr_no': '2', 'case_no': 'CRL.M.C. 9012/2024', 'party_names': 'Amit Sharma vs State', 'advocate': 'Sh. Rakesh Gupta'},
+        {'sr_no': '3', 'case_no': 'FIR 6543/2025', 'party_names': 'State vs Neha Kapoor', 'advocate': 'Ms. Divya Singh'},
+        {'sr_no': '4', 'case_no': 'CM 4567/2025', 'party_names': 'PNB vs Vikas & Others', 'advocate': 'Sh. Sanjay Jain'},
+        {'sr_no': '5', 'case_no': 'CRL.A. 8901/2024', 'party_names': 'Radha Devi vs State', 'advocate': 'Ms. Meera Sharma'}
+    ],
+
+    # MAHARASHTRA VARIATIONS
+    ('Maharashtra', 'Mumbai City', 'Mumbai City Civil Court'): [
+        {'sr_no': '1', 'case_no': 'CS 1111/2025', 'party_names': 'Reliance vs Tata Group', 'advocate': 'Mr. Adv. Mehta'},
+        {'sr_no': '2', 'case_no': 'CRL 2222/2024', 'party_names': 'State vs Shivaji Patil', 'advocate': 'Ms. Adv. Desai'},
+        {'sr_no': '3', 'case_no': 'CC 3333/2025', 'party_names': 'BMC vs Builder Corp', 'advocate': 'Mr. Adv. Joshi'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 4444/2024', 'party_names': 'Prakash Rao vs State', 'advocate': 'Ms. Adv. Kulkarni'},
+        {'sr_no': '5', 'case_no': 'CM 5555/2025', 'party_names': 'Bank of Maharashtra vs Ramesh', 'advocate': 'Mr. Adv. Pawar'}
+    ],
+    ('Maharashtra', 'Mumbai City', 'Bombay High Court'): [
+        {'sr_no': '1', 'case_no': 'PIL 7777/2025', 'party_names': 'Citizen vs State of Maharashtra', 'advocate': 'Mr. Sr. Adv. Shah'},
+        {'sr_no': '2', 'case_no': 'WP 8888/2024', 'party_names': 'Wipro vs Govt of Maharashtra', 'advocate': 'Ms. Sr. Adv. Patel'},
+        {'sr_no': '3', 'case_no': 'CRL 9999/2025', 'party_names': 'State vs Dawood Khan', 'advocate': 'Mr. Adv. Fernandes'},
+        {'sr_no': '4', 'case_no': 'CA 1010/2024', 'party_names': 'Aditya Birla vs Competition', 'advocate': 'Ms. Adv. Iyer'},
+        {'sr_no': '5', 'case_no': 'CM 2020/2025', 'party_names': 'HDFC vs Borrowers', 'advocate': 'Mr. Adv. Nair'}
+    ],
+    ('Maharashtra', 'Pune', 'Pune District Court'): [
+        {'sr_no': '1', 'case_no': 'CS 3030/2025', 'party_names': 'Infosys Pune vs Tech Ltd', 'advocate': 'Mr. Adv. Kolhe'},
+        {'sr_no': '2', 'case_no': 'CRL 4040/2024', 'party_names': 'State vs Santosh More', 'advocate': 'Ms. Adv. Deshpande'},
+        {'sr_no': '3', 'case_no': 'CC 5050/2025', 'party_names': 'PMC vs Real Estate', 'advocate': 'Mr. Adv. Bhosale'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 6060/2024', 'party_names': 'Mangesh Patil vs State', 'advocate': 'Ms. Adv. Apte'},
+        {'sr_no': '5', 'case_no': 'CM 7070/2025', 'party_names': 'SBI Pune vs Defaulters', 'advocate': 'Mr. Adv. Raut'}
+    ],
+    ('Maharashtra', 'Nagpur', 'Nagpur District Court'): [
+        {'sr_no': '1', 'case_no': 'CS 8080/2025', 'party_names': 'Coal India vs Mining Corp', 'advocate': 'Mr. Adv. Wagh'},
+        {'sr_no': '2', 'case_no': 'CRL 9090/2024', 'party_names': 'State vs Ramesh Deshmukh', 'advocate': 'Ms. Adv. Thakur'},
+        {'sr_no': '3', 'case_no': 'CC 1212/2025', 'party_names': 'NMC vs Contractor', 'advocate': 'Mr. Adv. Meshram'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 3434/2024', 'party_names': 'Suresh Kale vs State', 'advocate': 'Ms. Adv. Gaikwad'},
+        {'sr_no': '5', 'case_no': 'CM 5656/2025', 'party_names': 'Bank of India vs Borrower', 'advocate': 'Mr. Adv. Dongre'}
+    ],
+    ('Maharashtra', 'Thane', 'Thane District Court'): [
+        {'sr_no': '1', 'case_no': 'CS 7878/2025', 'party_names': 'Lodha Group vs Buyer', 'advocate': 'Mr. Adv. Shetty'},
+        {'sr_no': '2', 'case_no': 'CRL 9090/2024', 'party_names': 'State vs Vijay Salvi', 'advocate': 'Ms. Adv. Kadam'},
+        {'sr_no': '3', 'case_no': 'CC 1313/2025', 'party_names': 'TMC vs Developer', 'advocate': 'Mr. Adv. Chavan'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 4545/2024', 'party_names': 'Prakash Naik vs State', 'advocate': 'Ms. Adv. Sawant'},
+        {'sr_no': '5', 'case_no': 'CM 6767/2025', 'party_names': 'ICICI Bank vs Defaulter', 'advocate': 'Mr. Adv. Rane'}
+    ],
+
+    # UTTAR PRADESH VARIATIONS
+    ('Uttar Pradesh', 'Lucknow', 'Lucknow District Court'): [
+        {'sr_no': '1', 'case_no': 'CS 1234/2025', 'party_names': 'UP Govt vs Contractor', 'advocate': 'Mr. Adv. Tiwari'},
+        {'sr_no': '2', 'case_no': 'CRL 2345/2024', 'party_names': 'State vs Ramesh Yadav', 'advocate': 'Ms. Adv. Mishra'},
+        {'sr_no': '3', 'case_no': 'CC 3456/2025', 'party_names': 'LDA vs Builder', 'advocate': 'Mr. Adv. Pandey'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 4567/2024', 'party_names': 'Suresh Verma vs State', 'advocate': 'Ms. Adv. Gupta'},
+        {'sr_no': '5', 'case_no': 'CM 5678/2025', 'party_names': 'Canara Bank vs Debtor', 'advocate': 'Mr. Adv. Sharma'}
+    ],
+    ('Uttar Pradesh', 'Kanpur', 'Kanpur District Court'): [
+        {'sr_no': '1', 'case_no': 'CS 6789/2025', 'party_names': 'Leather Company vs Supplier', 'advocate': 'Mr. Adv. Singh'},
+        {'sr_no': '2', 'case_no': 'CRL 7890/2024', 'party_names': 'State vs Dinesh Kumar', 'advocate': 'Ms. Adv. Yadav'},
+        {'sr_no': '3', 'case_no': 'CC 8901/2025', 'party_names': 'KDA vs Developer', 'advocate': 'Mr. Adv. Dubey'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 9012/2024', 'party_names': 'Rakesh Agarwal vs State', 'advocate': 'Ms. Adv. Srivastava'},
+        {'sr_no': '5', 'case_no': 'CM 1234/2025', 'party_names': 'PNB vs Borrower', 'advocate': 'Mr. Adv. Tripathi'}
+    ],
+    ('Uttar Pradesh', 'Allahabad', 'Allahabad High Court'): [
+        {'sr_no': '1', 'case_no': 'PIL 2345/2025', 'party_names': 'Society vs UP Govt', 'advocate': 'Mr. Sr. Adv. Chaturvedi'},
+        {'sr_no': '2', 'case_no': 'WP 3456/2024', 'party_names': 'Citizen vs State', 'advocate': 'Ms. Sr. Adv. Saxena'},
+        {'sr_no': '3', 'case_no': 'CRL 4567/2025', 'party_names': 'State vs Mafia Don', 'advocate': 'Mr. Adv. Pathak'},
+        {'sr_no': '4', 'case_no': 'CA 5678/2024', 'party_names': 'Corporation vs Competitor', 'advocate': 'Ms. Adv. Joshi'},
+        {'sr_no': '5', 'case_no': 'CM 6789/2025', 'party_names': 'Union Bank vs Defaulter', 'advocate': 'Mr. Adv. Gupta'}
+    ],
+    ('Uttar Pradesh', 'Varanasi', 'Varanasi District Court'): [
+        {'sr_no': '1', 'case_no': 'CS 7890/2025', 'party_names': 'Temple Trust vs Occupant', 'advocate': 'Mr. Adv. Pandey'},
+        {'sr_no': '2', 'case_no': 'CRL 8901/2024', 'party_names': 'State vs Ravi Shankar', 'advocate': 'Ms. Adv. Upadhyay'},
+        {'sr_no': '3', 'case_no': 'CC 9012/2025', 'party_names': 'VDA vs Encroacher', 'advocate': 'Mr. Adv. Dwivedi'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 1234/2024', 'party_names': 'Mohan Tiwari vs State', 'advocate': 'Ms. Adv. Mishra'},
+        {'sr_no': '5', 'case_no': 'CM 2345/2025', 'party_names': 'BOB vs Debtor', 'advocate': 'Mr. Adv. Shukla'}
+    ],
+    ('Uttar Pradesh', 'Noida', 'Gautam Buddha Nagar Court'): [
+        {'sr_no': '1', 'case_no': 'CS 3456/2025', 'party_names': 'HCL vs Vendor', 'advocate': 'Mr. Adv. Agarwal'},
+        {'sr_no': '2', 'case_no': 'CRL 4567/2024', 'party_names': 'State vs Cyber Criminal', 'advocate': 'Ms. Adv. Kapoor'},
+        {'sr_no': '3', 'case_no': 'CC 5678/2025', 'party_names': 'Noida Authority vs Builder', 'advocate': 'Mr. Adv. Bansal'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 6789/2024', 'party_names': 'Ajay Kumar vs State', 'advocate': 'Ms. Adv. Malhotra'},
+        {'sr_no': '5', 'case_no': 'CM 7890/2025', 'party_names': 'HDFC Bank vs Borrower', 'advocate': 'Mr. Adv. Khanna'}
+    ],
+
+    # KARNATAKA VARIATIONS
+    ('Karnataka', 'Bangalore Urban', 'Bangalore City Civil Court'): [
+        {'sr_no': '1', 'case_no': 'CS 1111/2025', 'party_names': 'Wipro vs Tech Startup', 'advocate': 'Mr. Adv. Rao'},
+        {'sr_no': '2', 'case_no': 'CRL 2222/2024', 'party_names': 'State vs Rajesh Gowda', 'advocate': 'Ms. Adv. Hegde'},
+        {'sr_no': '3', 'case_no': 'CC 3333/2025', 'party_names': 'BBMP vs Developer', 'advocate': 'Mr. Adv. Nair'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 4444/2024', 'party_names': 'Kumar Swamy vs State', 'advocate': 'Ms. Adv. Shetty'},
+        {'sr_no': '5', 'case_no': 'CM 5555/2025', 'party_names': 'Canara Bank vs Borrower', 'advocate': 'Mr. Adv. Bhat'}
+    ],
+    ('Karnataka', 'Bangalore Urban', 'Karnataka High Court'): [
+        {'sr_no': '1', 'case_no': 'PIL 6666/2025', 'party_names': 'NGO vs Karnataka Govt', 'advocate': 'Mr. Sr. Adv. Krishna'},
+        {'sr_no': '2', 'case_no': 'WP 7777/2024', 'party_names': 'Infosys vs State', 'advocate': 'Ms. Sr. Adv. Reddy'},
+        {'sr_no': '3', 'case_no': 'CRL 8888/2025', 'party_names': 'State vs Gangster', 'advocate': 'Mr. Adv. Murthy'},
+        {'sr_no': '4', 'case_no': 'CA 9999/2024', 'party_names': 'Tech Company vs Rival', 'advocate': 'Ms. Adv. Iyengar'},
+        {'sr_no': '5', 'case_no': 'CM 1010/2025', 'party_names': 'SBI vs Defaulter', 'advocate': 'Mr. Adv. Rao'}
+    ],
+    ('Karnataka', 'Mysore', 'Mysore District Court'): [
+        {'sr_no': '1', 'case_no': 'CS 2020/2025', 'party_names': 'Palace Trust vs Occupant', 'advocate': 'Mr. Adv. Gowda'},
+        {'sr_no': '2', 'case_no': 'CRL 3030/2024', 'party_names': 'State vs Raju Urs', 'advocate': 'Ms. Adv. Kumari'},
+        {'sr_no': '3', 'case_no': 'CC 4040/2025', 'party_names': 'MCC vs Builder', 'advocate': 'Mr. Adv. Prasad'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 5050/2024', 'party_names': 'Suresh Reddy vs State', 'advocate': 'Ms. Adv. Lakshmi'},
+        {'sr_no': '5', 'case_no': 'CM 6060/2025', 'party_names': 'Bank of Baroda vs Debtor', 'advocate': 'Mr. Adv. Achar'}
+    ],
+    ('Karnataka', 'Hubli', 'Hubli-Dharwad Court'): [
+        {'sr_no': '1', 'case_no': 'CS 7070/2025', 'party_names': 'Textile Company vs Supplier', 'advocate': 'Mr. Adv. Patil'},
+        {'sr_no': '2', 'case_no': 'CRL 8080/2024', 'party_names': 'State vs Basavaraj', 'advocate': 'Ms. Adv. Kulkarni'},
+        {'sr_no': '3', 'case_no': 'CC 9090/2025', 'party_names': 'HDMC vs Encroacher', 'advocate': 'Mr. Adv. Desai'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 1212/2024', 'party_names': 'Ramesh Naik vs State', 'advocate': 'Ms. Adv. Angadi'},
+        {'sr_no': '5', 'case_no': 'CM 3434/2025', 'party_names': 'Karnataka Bank vs Borrower', 'advocate': 'Mr. Adv. Joshi'}
+    ],
+    ('Karnataka', 'Mangalore', 'Mangalore District Court'): [
+        {'sr_no': '1', 'case_no': 'CS 5656/2025', 'party_names': 'Port Authority vs Company', 'advocate': 'Mr. Adv. Shetty'},
+        {'sr_no': '2', 'case_no': 'CRL 7878/2024', 'party_names': 'State vs Sunil Kumar', 'advocate': 'Ms. Adv. D\'Souza'},
+        {'sr_no': '3', 'case_no': 'CC 9090/2025', 'party_names': 'MCC vs Real Estate', 'advocate': 'Mr. Adv. Lobo'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 1313/2024', 'party_names': 'Prakash Rai vs State', 'advocate': 'Ms. Adv. Pai'},
+        {'sr_no': '5', 'case_no': 'CM 4545/2025', 'party_names': 'Syndicate Bank vs Debtor', 'advocate': 'Mr. Adv. Alva'}
+    ],
+
+    # TAMIL NADU VARIATIONS
+    ('Tamil Nadu', 'Chennai', 'Chennai City Civil Court'): [
+        {'sr_no': '1', 'case_no': 'CS 1212/2025', 'party_names': 'TCS Chennai vs Vendor', 'advocate': 'Mr. Adv. Ramesh'},
+        {'sr_no': '2', 'case_no': 'CRL 3434/2024', 'party_names': 'State vs Murugan', 'advocate': 'Ms. Adv. Lakshmi'},
+        {'sr_no': '3', 'case_no': 'CC 5656/2025', 'party_names': 'Corporation vs Builder', 'advocate': 'Mr. Adv. Kumar'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 7878/2024', 'party_names': 'Selvam vs State', 'advocate': 'Ms. Adv. Priya'},
+        {'sr_no': '5', 'case_no': 'CM 9090/2025', 'party_names': 'Indian Bank vs Borrower', 'advocate': 'Mr. Adv. Rajan'}
+    ],
+    ('Tamil Nadu', 'Chennai', 'Madras High Court'): [
+        {'sr_no': '1', 'case_no': 'PIL 1313/2025', 'party_names': 'Citizens vs TN Govt', 'advocate': 'Mr. Sr. Adv. Subramaniam'},
+        {'sr_no': '2', 'case_no': 'WP 4545/2024', 'party_names': 'Cognizant vs State', 'advocate': 'Ms. Sr. Adv. Janaki'},
+        {'sr_no': '3', 'case_no': 'CRL 6767/2025', 'party_names': 'State vs Criminal', 'advocate': 'Mr. Adv. Venkat'},
+        {'sr_no': '4', 'case_no': 'CA 8989/2024', 'party_names': 'TVS vs Competitor', 'advocate': 'Ms. Adv. Meena'},
+        {'sr_no': '5', 'case_no': 'CM 1111/2025', 'party_names': 'IOB vs Defaulter', 'advocate': 'Mr. Adv. Saravanan'}
+    ],
+    ('Tamil Nadu', 'Coimbatore', 'Coimbatore District Court'): [
+        {'sr_no': '1', 'case_no': 'CS 2323/2025', 'party_names': 'Textile Mill vs Supplier', 'advocate': 'Mr. Adv. Govindan'},
+        {'sr_no': '2', 'case_no': 'CRL 4545/2024', 'party_names': 'State vs Ravi', 'advocate': 'Ms. Adv. Bhavani'},
+        {'sr_no': '3', 'case_no': 'CC 6767/2025', 'party_names': 'CMC vs Contractor', 'advocate': 'Mr. Adv. Natarajan'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 8989/2024', 'party_names': 'Kumar vs State', 'advocate': 'Ms. Adv. Radha'},
+        {'sr_no': '5', 'case_no': 'CM 1212/2025', 'party_names': 'City Union Bank vs Debtor', 'advocate': 'Mr. Adv. Pandian'}
+    ],
+    ('Tamil Nadu', 'Madurai', 'Madurai District Court'): [
+        {'sr_no': '1', 'case_no': 'CS 3535/2025', 'party_names': 'Temple vs Encroacher', 'advocate': 'Mr. Adv. Shankar'},
+        {'sr_no': '2', 'case_no': 'CRL 5757/2024', 'party_names': 'State vs Karthik', 'advocate': 'Ms. Adv. Valli'},
+        {'sr_no': '3', 'case_no': 'CC 7979/2025', 'party_names': 'Corporation vs Developer', 'advocate': 'Mr. Adv. Muthu'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 9191/2024', 'party_names': 'Senthil vs State', 'advocate': 'Ms. Adv. Selvi'},
+        {'sr_no': '5', 'case_no': 'CM 1414/2025', 'party_names': 'TMB vs Borrower', 'advocate': 'Mr. Adv. Raja'}
+    ],
+    ('Tamil Nadu', 'Salem', 'Salem District Court'): [
+        {'sr_no': '1', 'case_no': 'CS 4646/2025', 'party_names': 'Steel Plant vs Vendor', 'advocate': 'Mr. Adv. Vel'},
+        {'sr_no': '2', 'case_no': 'CRL 6868/2024', 'party_names': 'State vs Arumugam', 'advocate': 'Ms. Adv. Kamala'},
+        {'sr_no': '3', 'case_no': 'CC 8080/2025', 'party_names': 'SMC vs Builder', 'advocate': 'Mr. Adv. Balu'},
+        {'sr_no': '4', 'case_no': 'CRL.A. 2424/2024', 'party_names': 'Mani vs State', 'advocate': 'Ms. Adv. Devi'},
+        {'sr_no': '5', 'case_no': 'CM 4646/2025', 'party_names': 'Canara Bank vs Debtor', 'advocate': 'Mr. Adv. Ganesan'}
+    ]
+}
+
+# Add additional fields once at import so requests only copy prepared rows
+CAUSE_LIST_PURPOSES = ['For Arguments', 'For Evidence', 'For Hearing', 'For Orders', 'For Final Arguments']
+CAUSE_LIST_REMARKS = ['Matter taken up', 'Witness examination', 'Final arguments', 'Judgment reserved', 'Part heard']
+CAUSE_LIST_COURTS = ['Court No. 1 - District Judge', 'Court No. 2 - Civil Judge', 'Court No. 3 - Sessions Judge', 'Court No. 4 - Additional Sessions Judge', 'Court No. 5 - Magistrate']
+
+for _key, _cases in CAUSE_LIST_VARIATIONS.items():
+    for i, case in enumerate(_cases):
+        _cnr = cnr_for_case(*_key, case['case_no'])
+        if _cnr:
+            case.setdefault('cnr', _cnr)
+        case.setdefault('purpose', CAUSE_LIST_PURPOSES[i % len(CAUSE_LIST_PURPOSES)])
+        case.setdefault('court_name', CAUSE_LIST_COURTS[i % len(CAUSE_LIST_COURTS)])
+        case.setdefault('remarks', CAUSE_LIST_REMARKS[i % len(CAUSE_LIST_REMARKS)])
+
+DEFAULT_CAUSE_LIST_KEY = ('Delhi', 'New Delhi', 'Patiala House Court Comp')
+
 def generate_cause_list_result(params):
     """Generate dynamic cause list based on selections with 5 states"""
     state = params.get('state', 'Delhi')
@@ -108,210 +618,9 @@ def generate_cause_list_result(params):
     complex_name = params.get('complex', 'Patiala House Court Comp')
     date = params.get('date', datetime.now().strftime('%Y-%m-%d'))
     
-    # COMPREHENSIVE CASE VARIATIONS - 5 STATES WITH MULTIPLE DISTRICTS & COMPLEXES
-    case_variations = {
-        # DELHI VARIATIONS
-        ('Delhi', 'New Delhi', 'Patiala House Court Comp'): [
-            {'sr_no': '1', 'case_no': 'CRL.M.C. 1234/2025', 'party_names': 'Arun Kumar vs State of Delhi', 'advocate': 'Sh. Rajesh Sharma'},
-            {'sr_no': '2', 'case_no': 'CS 5678/2024', 'party_names': 'Delhi Metro vs ABC Construction', 'advocate': 'Ms. Priya Gupta'},
-            {'sr_no': '3', 'case_no': 'FIR 9876/2025', 'party_names': 'State vs Mohan Singh', 'advocate': 'Sh. Vikram Kumar'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 4567/2024', 'party_names': 'Sunita Devi vs State', 'advocate': 'Ms. Neha Agarwal'},
-            {'sr_no': '5', 'case_no': 'CM 8901/2025', 'party_names': 'HDFC Bank vs Rakesh & Others', 'advocate': 'Sh. Amit Jain'}
-        ],
-        ('Delhi', 'New Delhi', 'Saket Court Complex'): [
-            {'sr_no': '1', 'case_no': 'CS 2345/2025', 'party_names': 'Infosys Ltd vs Tech Solutions', 'advocate': 'Ms. Anjali Verma'},
-            {'sr_no': '2', 'case_no': 'CRL.M.C. 6789/2024', 'party_names': 'Ravi Sharma vs State', 'advocate': 'Sh. Deepak Malhotra'},
-            {'sr_no': '3', 'case_no': 'FIR 4321/2025', 'party_names': 'State vs Priya Singh', 'advocate': 'Ms. Kavita Rao'},
-            {'sr_no': '4', 'case_no': 'CM 7890/2025', 'party_names': 'ICICI Bank vs Suresh Kumar', 'advocate': 'Sh. Rahul Jain'},
-            {'sr_no': '5', 'case_no': 'CRL.A. 5678/2024', 'party_names': 'Meena Devi vs State', 'advocate': 'Ms. Pooja Sharma'}
-        ],
-        ('Delhi', 'Central Delhi', 'Tis Hazari Court Complex'): [
-            {'sr_no': '1', 'case_no': 'CRL.M.C. 3456/2025', 'party_names': 'Ramesh Chand vs State', 'advocate': 'Sh. Sunil Sharma'},
-            {'sr_no': '2', 'case_no': 'CS 7890/2024', 'party_names': 'MCD vs Contractor Ltd', 'advocate': 'Ms. Ritu Singh'},
-            {'sr_no': '3', 'case_no': 'FIR 7654/2025', 'party_names': 'State vs Deepak Yadav', 'advocate': 'Sh. Ajay Kumar'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 6789/2024', 'party_names': 'Geeta Sharma vs State', 'advocate': 'Ms. Anita Rao'},
-            {'sr_no': '5', 'case_no': 'CM 9012/2025', 'party_names': 'SBI vs Mohan Lal', 'advocate': 'Sh. Vinod Jain'}
-        ],
-        ('Delhi', 'Central Delhi', 'Karkardooma Court Complex'): [
-            {'sr_no': '1', 'case_no': 'CRL.M.C. 4567/2025', 'party_names': 'Vijay Kumar vs State', 'advocate': 'Sh. Manoj Tiwari'},
-            {'sr_no': '2', 'case_no': 'CS 8901/2024', 'party_names': 'DDA vs Builder Group', 'advocate': 'Ms. Seema Kapoor'},
-            {'sr_no': '3', 'case_no': 'FIR 8765/2025', 'party_names': 'State vs Rohit Verma', 'advocate': 'Sh. Pankaj Sharma'},
-            {'sr_no': '4', 'case_no': 'CM 3456/2025', 'party_names': 'Axis Bank vs Rajesh', 'advocate': 'Ms. Nisha Gupta'},
-            {'sr_no': '5', 'case_no': 'CRL.A. 7890/2024', 'party_names': 'Sita Devi vs State', 'advocate': 'Sh. Anil Kumar'}
-        ],
-        ('Delhi', 'South Delhi', 'Saket Court Complex'): [
-            {'sr_no': '1', 'case_no': 'CS 5678/2025', 'party_names': 'TCS Ltd vs Software Inc', 'advocate': 'Ms. Priyanka Mehta'},
-            {'sr_no': '2', 'case_no': 'CRL.M.C. 9012/2024', 'party_names': 'Amit Sharma vs State', 'advocate': 'Sh. Rakesh Gupta'},
-            {'sr_no': '3', 'case_no': 'FIR 6543/2025', 'party_names': 'State vs Neha Kapoor', 'advocate': 'Ms. Divya Singh'},
-            {'sr_no': '4', 'case_no': 'CM 4567/2025', 'party_names': 'PNB vs Vikas & Others', 'advocate': 'Sh. Sanjay Jain'},
-            {'sr_no': '5', 'case_no': 'CRL.A. 8901/2024', 'party_names': 'Radha Devi vs State', 'advocate': 'Ms. Meera Sharma'}
-        ],
-        
-        # MAHARASHTRA VARIATIONS
-        ('Maharashtra', 'Mumbai City', 'Mumbai City Civil Court'): [
-            {'sr_no': '1', 'case_no': 'CS 1111/2025', 'party_names': 'Reliance vs Tata Group', 'advocate': 'Mr. Adv. Mehta'},
-            {'sr_no': '2', 'case_no': 'CRL 2222/2024', 'party_names': 'State vs Shivaji Patil', 'advocate': 'Ms. Adv. Desai'},
-            {'sr_no': '3', 'case_no': 'CC 3333/2025', 'party_names': 'BMC vs Builder Corp', 'advocate': 'Mr. Adv. Joshi'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 4444/2024', 'party_names': 'Prakash Rao vs State', 'advocate': 'Ms. Adv. Kulkarni'},
-            {'sr_no': '5', 'case_no': 'CM 5555/2025', 'party_names': 'Bank of Maharashtra vs Ramesh', 'advocate': 'Mr. Adv. Pawar'}
-        ],
-        ('Maharashtra', 'Mumbai City', 'Bombay High Court'): [
-            {'sr_no': '1', 'case_no': 'PIL 7777/2025', 'party_names': 'Citizen vs State of Maharashtra', 'advocate': 'Mr. Sr. Adv. Shah'},
-            {'sr_no': '2', 'case_no': 'WP 8888/2024', 'party_names': 'Wipro vs Govt of Maharashtra', 'advocate': 'Ms. Sr. Adv. Patel'},
-            {'sr_no': '3', 'case_no': 'CRL 9999/2025', 'party_names': 'State vs Dawood Khan', 'advocate': 'Mr. Adv. Fernandes'},
-            {'sr_no': '4', 'case_no': 'CA 1010/2024', 'party_names': 'Aditya Birla vs Competition', 'advocate': 'Ms. Adv. Iyer'},
-            {'sr_no': '5', 'case_no': 'CM 2020/2025', 'party_names': 'HDFC vs Borrowers', 'advocate': 'Mr. Adv. Nair'}
-        ],
-        ('Maharashtra', 'Pune', 'Pune District Court'): [
-            {'sr_no': '1', 'case_no': 'CS 3030/2025', 'party_names': 'Infosys Pune vs Tech Ltd', 'advocate': 'Mr. Adv. Kolhe'},
-            {'sr_no': '2', 'case_no': 'CRL 4040/2024', 'party_names': 'State vs Santosh More', 'advocate': 'Ms. Adv. Deshpande'},
-            {'sr_no': '3', 'case_no': 'CC 5050/2025', 'party_names': 'PMC vs Real Estate', 'advocate': 'Mr. Adv. Bhosale'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 6060/2024', 'party_names': 'Mangesh Patil vs State', 'advocate': 'Ms. Adv. Apte'},
-            {'sr_no': '5', 'case_no': 'CM 7070/2025', 'party_names': 'SBI Pune vs Defaulters', 'advocate': 'Mr. Adv. Raut'}
-        ],
-        ('Maharashtra', 'Nagpur', 'Nagpur District Court'): [
-            {'sr_no': '1', 'case_no': 'CS 8080/2025', 'party_names': 'Coal India vs Mining Corp', 'advocate': 'Mr. Adv. Wagh'},
-            {'sr_no': '2', 'case_no': 'CRL 9090/2024', 'party_names': 'State vs Ramesh Deshmukh', 'advocate': 'Ms. Adv. Thakur'},
-            {'sr_no': '3', 'case_no': 'CC 1212/2025', 'party_names': 'NMC vs Contractor', 'advocate': 'Mr. Adv. Meshram'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 3434/2024', 'party_names': 'Suresh Kale vs State', 'advocate': 'Ms. Adv. Gaikwad'},
-            {'sr_no': '5', 'case_no': 'CM 5656/2025', 'party_names': 'Bank of India vs Borrower', 'advocate': 'Mr. Adv. Dongre'}
-        ],
-        ('Maharashtra', 'Thane', 'Thane District Court'): [
-            {'sr_no': '1', 'case_no': 'CS 7878/2025', 'party_names': 'Lodha Group vs Buyer', 'advocate': 'Mr. Adv. Shetty'},
-            {'sr_no': '2', 'case_no': 'CRL 9090/2024', 'party_names': 'State vs Vijay Salvi', 'advocate': 'Ms. Adv. Kadam'},
-            {'sr_no': '3', 'case_no': 'CC 1313/2025', 'party_names': 'TMC vs Developer', 'advocate': 'Mr. Adv. Chavan'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 4545/2024', 'party_names': 'Prakash Naik vs State', 'advocate': 'Ms. Adv. Sawant'},
-            {'sr_no': '5', 'case_no': 'CM 6767/2025', 'party_names': 'ICICI Bank vs Defaulter', 'advocate': 'Mr. Adv. Rane'}
-        ],
-        
-        # UTTAR PRADESH VARIATIONS
-        ('Uttar Pradesh', 'Lucknow', 'Lucknow District Court'): [
-            {'sr_no': '1', 'case_no': 'CS 1234/2025', 'party_names': 'UP Govt vs Contractor', 'advocate': 'Mr. Adv. Tiwari'},
-            {'sr_no': '2', 'case_no': 'CRL 2345/2024', 'party_names': 'State vs Ramesh Yadav', 'advocate': 'Ms. Adv. Mishra'},
-            {'sr_no': '3', 'case_no': 'CC 3456/2025', 'party_names': 'LDA vs Builder', 'advocate': 'Mr. Adv. Pandey'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 4567/2024', 'party_names': 'Suresh Verma vs State', 'advocate': 'Ms. Adv. Gupta'},
-            {'sr_no': '5', 'case_no': 'CM 5678/2025', 'party_names': 'Canara Bank vs Debtor', 'advocate': 'Mr. Adv. Sharma'}
-        ],
-        ('Uttar Pradesh', 'Kanpur', 'Kanpur District Court'): [
-            {'sr_no': '1', 'case_no': 'CS 6789/2025', 'party_names': 'Leather Company vs Supplier', 'advocate': 'Mr. Adv. Singh'},
-            {'sr_no': '2', 'case_no': 'CRL 7890/2024', 'party_names': 'State vs Dinesh Kumar', 'advocate': 'Ms. Adv. Yadav'},
-            {'sr_no': '3', 'case_no': 'CC 8901/2025', 'party_names': 'KDA vs Developer', 'advocate': 'Mr. Adv. Dubey'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 9012/2024', 'party_names': 'Rakesh Agarwal vs State', 'advocate': 'Ms. Adv. Srivastava'},
-            {'sr_no': '5', 'case_no': 'CM 1234/2025', 'party_names': 'PNB vs Borrower', 'advocate': 'Mr. Adv. Tripathi'}
-        ],
-        ('Uttar Pradesh', 'Allahabad', 'Allahabad High Court'): [
-            {'sr_no': '1', 'case_no': 'PIL 2345/2025', 'party_names': 'Society vs UP Govt', 'advocate': 'Mr. Sr. Adv. Chaturvedi'},
-            {'sr_no': '2', 'case_no': 'WP 3456/2024', 'party_names': 'Citizen vs State', 'advocate': 'Ms. Sr. Adv. Saxena'},
-            {'sr_no': '3', 'case_no': 'CRL 4567/2025', 'party_names': 'State vs Mafia Don', 'advocate': 'Mr. Adv. Pathak'},
-            {'sr_no': '4', 'case_no': 'CA 5678/2024', 'party_names': 'Corporation vs Competitor', 'advocate': 'Ms. Adv. Joshi'},
-            {'sr_no': '5', 'case_no': 'CM 6789/2025', 'party_names': 'Union Bank vs Defaulter', 'advocate': 'Mr. Adv. Gupta'}
-        ],
-        ('Uttar Pradesh', 'Varanasi', 'Varanasi District Court'): [
-            {'sr_no': '1', 'case_no': 'CS 7890/2025', 'party_names': 'Temple Trust vs Occupant', 'advocate': 'Mr. Adv. Pandey'},
-            {'sr_no': '2', 'case_no': 'CRL 8901/2024', 'party_names': 'State vs Ravi Shankar', 'advocate': 'Ms. Adv. Upadhyay'},
-            {'sr_no': '3', 'case_no': 'CC 9012/2025', 'party_names': 'VDA vs Encroacher', 'advocate': 'Mr. Adv. Dwivedi'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 1234/2024', 'party_names': 'Mohan Tiwari vs State', 'advocate': 'Ms. Adv. Mishra'},
-            {'sr_no': '5', 'case_no': 'CM 2345/2025', 'party_names': 'BOB vs Debtor', 'advocate': 'Mr. Adv. Shukla'}
-        ],
-        ('Uttar Pradesh', 'Noida', 'Gautam Buddha Nagar Court'): [
-            {'sr_no': '1', 'case_no': 'CS 3456/2025', 'party_names': 'HCL vs Vendor', 'advocate': 'Mr. Adv. Agarwal'},
-            {'sr_no': '2', 'case_no': 'CRL 4567/2024', 'party_names': 'State vs Cyber Criminal', 'advocate': 'Ms. Adv. Kapoor'},
-            {'sr_no': '3', 'case_no': 'CC 5678/2025', 'party_names': 'Noida Authority vs Builder', 'advocate': 'Mr. Adv. Bansal'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 6789/2024', 'party_names': 'Ajay Kumar vs State', 'advocate': 'Ms. Adv. Malhotra'},
-            {'sr_no': '5', 'case_no': 'CM 7890/2025', 'party_names': 'HDFC Bank vs Borrower', 'advocate': 'Mr. Adv. Khanna'}
-        ],
-        
-        # KARNATAKA VARIATIONS
-        ('Karnataka', 'Bangalore Urban', 'Bangalore City Civil Court'): [
-            {'sr_no': '1', 'case_no': 'CS 1111/2025', 'party_names': 'Wipro vs Tech Startup', 'advocate': 'Mr. Adv. Rao'},
-            {'sr_no': '2', 'case_no': 'CRL 2222/2024', 'party_names': 'State vs Rajesh Gowda', 'advocate': 'Ms. Adv. Hegde'},
-            {'sr_no': '3', 'case_no': 'CC 3333/2025', 'party_names': 'BBMP vs Developer', 'advocate': 'Mr. Adv. Nair'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 4444/2024', 'party_names': 'Kumar Swamy vs State', 'advocate': 'Ms. Adv. Shetty'},
-            {'sr_no': '5', 'case_no': 'CM 5555/2025', 'party_names': 'Canara Bank vs Borrower', 'advocate': 'Mr. Adv. Bhat'}
-        ],
-        ('Karnataka', 'Bangalore Urban', 'Karnataka High Court'): [
-            {'sr_no': '1', 'case_no': 'PIL 6666/2025', 'party_names': 'NGO vs Karnataka Govt', 'advocate': 'Mr. Sr. Adv. Krishna'},
-            {'sr_no': '2', 'case_no': 'WP 7777/2024', 'party_names': 'Infosys vs State', 'advocate': 'Ms. Sr. Adv. Reddy'},
-            {'sr_no': '3', 'case_no': 'CRL 8888/2025', 'party_names': 'State vs Gangster', 'advocate': 'Mr. Adv. Murthy'},
-            {'sr_no': '4', 'case_no': 'CA 9999/2024', 'party_names': 'Tech Company vs Rival', 'advocate': 'Ms. Adv. Iyengar'},
-            {'sr_no': '5', 'case_no': 'CM 1010/2025', 'party_names': 'SBI vs Defaulter', 'advocate': 'Mr. Adv. Rao'}
-        ],
-        ('Karnataka', 'Mysore', 'Mysore District Court'): [
-            {'sr_no': '1', 'case_no': 'CS 2020/2025', 'party_names': 'Palace Trust vs Occupant', 'advocate': 'Mr. Adv. Gowda'},
-            {'sr_no': '2', 'case_no': 'CRL 3030/2024', 'party_names': 'State vs Raju Urs', 'advocate': 'Ms. Adv. Kumari'},
-            {'sr_no': '3', 'case_no': 'CC 4040/2025', 'party_names': 'MCC vs Builder', 'advocate': 'Mr. Adv. Prasad'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 5050/2024', 'party_names': 'Suresh Reddy vs State', 'advocate': 'Ms. Adv. Lakshmi'},
-            {'sr_no': '5', 'case_no': 'CM 6060/2025', 'party_names': 'Bank of Baroda vs Debtor', 'advocate': 'Mr. Adv. Achar'}
-        ],
-        ('Karnataka', 'Hubli', 'Hubli-Dharwad Court'): [
-            {'sr_no': '1', 'case_no': 'CS 7070/2025', 'party_names': 'Textile Company vs Supplier', 'advocate': 'Mr. Adv. Patil'},
-            {'sr_no': '2', 'case_no': 'CRL 8080/2024', 'party_names': 'State vs Basavaraj', 'advocate': 'Ms. Adv. Kulkarni'},
-            {'sr_no': '3', 'case_no': 'CC 9090/2025', 'party_names': 'HDMC vs Encroacher', 'advocate': 'Mr. Adv. Desai'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 1212/2024', 'party_names': 'Ramesh Naik vs State', 'advocate': 'Ms. Adv. Angadi'},
-            {'sr_no': '5', 'case_no': 'CM 3434/2025', 'party_names': 'Karnataka Bank vs Borrower', 'advocate': 'Mr. Adv. Joshi'}
-        ],
-        ('Karnataka', 'Mangalore', 'Mangalore District Court'): [
-            {'sr_no': '1', 'case_no': 'CS 5656/2025', 'party_names': 'Port Authority vs Company', 'advocate': 'Mr. Adv. Shetty'},
-            {'sr_no': '2', 'case_no': 'CRL 7878/2024', 'party_names': 'State vs Sunil Kumar', 'advocate': 'Ms. Adv. D\'Souza'},
-            {'sr_no': '3', 'case_no': 'CC 9090/2025', 'party_names': 'MCC vs Real Estate', 'advocate': 'Mr. Adv. Lobo'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 1313/2024', 'party_names': 'Prakash Rai vs State', 'advocate': 'Ms. Adv. Pai'},
-            {'sr_no': '5', 'case_no': 'CM 4545/2025', 'party_names': 'Syndicate Bank vs Debtor', 'advocate': 'Mr. Adv. Alva'}
-        ],
-        
-        # TAMIL NADU VARIATIONS
-        ('Tamil Nadu', 'Chennai', 'Chennai City Civil Court'): [
-            {'sr_no': '1', 'case_no': 'CS 1212/2025', 'party_names': 'TCS Chennai vs Vendor', 'advocate': 'Mr. Adv. Ramesh'},
-            {'sr_no': '2', 'case_no': 'CRL 3434/2024', 'party_names': 'State vs Murugan', 'advocate': 'Ms. Adv. Lakshmi'},
-            {'sr_no': '3', 'case_no': 'CC 5656/2025', 'party_names': 'Corporation vs Builder', 'advocate': 'Mr. Adv. Kumar'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 7878/2024', 'party_names': 'Selvam vs State', 'advocate': 'Ms. Adv. Priya'},
-            {'sr_no': '5', 'case_no': 'CM 9090/2025', 'party_names': 'Indian Bank vs Borrower', 'advocate': 'Mr. Adv. Rajan'}
-        ],
-        ('Tamil Nadu', 'Chennai', 'Madras High Court'): [
-            {'sr_no': '1', 'case_no': 'PIL 1313/2025', 'party_names': 'Citizens vs TN Govt', 'advocate': 'Mr. Sr. Adv. Subramaniam'},
-            {'sr_no': '2', 'case_no': 'WP 4545/2024', 'party_names': 'Cognizant vs State', 'advocate': 'Ms. Sr. Adv. Janaki'},
-            {'sr_no': '3', 'case_no': 'CRL 6767/2025', 'party_names': 'State vs Criminal', 'advocate': 'Mr. Adv. Venkat'},
-            {'sr_no': '4', 'case_no': 'CA 8989/2024', 'party_names': 'TVS vs Competitor', 'advocate': 'Ms. Adv. Meena'},
-            {'sr_no': '5', 'case_no': 'CM 1111/2025', 'party_names': 'IOB vs Defaulter', 'advocate': 'Mr. Adv. Saravanan'}
-        ],
-        ('Tamil Nadu', 'Coimbatore', 'Coimbatore District Court'): [
-            {'sr_no': '1', 'case_no': 'CS 2323/2025', 'party_names': 'Textile Mill vs Supplier', 'advocate': 'Mr. Adv. Govindan'},
-            {'sr_no': '2', 'case_no': 'CRL 4545/2024', 'party_names': 'State vs Ravi', 'advocate': 'Ms. Adv. Bhavani'},
-            {'sr_no': '3', 'case_no': 'CC 6767/2025', 'party_names': 'CMC vs Contractor', 'advocate': 'Mr. Adv. Natarajan'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 8989/2024', 'party_names': 'Kumar vs State', 'advocate': 'Ms. Adv. Radha'},
-            {'sr_no': '5', 'case_no': 'CM 1212/2025', 'party_names': 'City Union Bank vs Debtor', 'advocate': 'Mr. Adv. Pandian'}
-        ],
-        ('Tamil Nadu', 'Madurai', 'Madurai District Court'): [
-            {'sr_no': '1', 'case_no': 'CS 3535/2025', 'party_names': 'Temple vs Encroacher', 'advocate': 'Mr. Adv. Shankar'},
-            {'sr_no': '2', 'case_no': 'CRL 5757/2024', 'party_names': 'State vs Karthik', 'advocate': 'Ms. Adv. Valli'},
-            {'sr_no': '3', 'case_no': 'CC 7979/2025', 'party_names': 'Corporation vs Developer', 'advocate': 'Mr. Adv. Muthu'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 9191/2024', 'party_names': 'Senthil vs State', 'advocate': 'Ms. Adv. Selvi'},
-            {'sr_no': '5', 'case_no': 'CM 1414/2025', 'party_names': 'TMB vs Borrower', 'advocate': 'Mr. Adv. Raja'}
-        ],
-        ('Tamil Nadu', 'Salem', 'Salem District Court'): [
-            {'sr_no': '1', 'case_no': 'CS 4646/2025', 'party_names': 'Steel Plant vs Vendor', 'advocate': 'Mr. Adv. Vel'},
-            {'sr_no': '2', 'case_no': 'CRL 6868/2024', 'party_names': 'State vs Arumugam', 'advocate': 'Ms. Adv. Kamala'},
-            {'sr_no': '3', 'case_no': 'CC 8080/2025', 'party_names': 'SMC vs Builder', 'advocate': 'Mr. Adv. Balu'},
-            {'sr_no': '4', 'case_no': 'CRL.A. 2424/2024', 'party_names': 'Mani vs State', 'advocate': 'Ms. Adv. Devi'},
-            {'sr_no': '5', 'case_no': 'CM 4646/2025', 'party_names': 'Canara Bank vs Debtor', 'advocate': 'Mr. Adv. Ganesan'}
-        ]
-    }
-    
     # Get cases based on selection
     key = (state, district, complex_name)
-    cases = case_variations.get(key, case_variations[('Delhi', 'New Delhi', 'Patiala House Court Comp')])
-    
-    # Add additional fields
-    purposes = ['For Arguments', 'For Evidence', 'For Hearing', 'For Orders', 'For Final Arguments']
-    remarks = ['Matter taken up', 'Witness examination', 'Final arguments', 'Judgment reserved', 'Part heard']
-    courts = ['Court No. 1 - District Judge', 'Court No. 2 - Civil Judge', 'Court No. 3 - Sessions Judge', 'Court No. 4 - Additional Sessions Judge', 'Court No. 5 - Magistrate']
-    
-    for i, case in enumerate(cases):
-        if 'purpose' not in case:
-            case['purpose'] = purposes[i % len(purposes)]
-        if 'court_name' not in case:
-            case['court_name'] = courts[i % len(courts)]
-        if 'remarks' not in case:
-            case['remarks'] = remarks[i % len(remarks)]
+    cases = [dict(case) for case in CAUSE_LIST_VARIATIONS.get(key, CAUSE_LIST_VARIATIONS[DEFAULT_CAUSE_LIST_KEY])]
     
     return {
         'metadata': {
@@ -334,329 +643,7 @@ HTML_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>eCourts Professional Scraper - Complete Version</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.15);
-            overflow: hidden;
-        }
-        
-        .header {
-            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }
-        
-        .header h1 {
-            font-size: 2.5rem;
-            margin-bottom: 10px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        
-        .header p {
-            font-size: 1.1rem;
-            opacity: 0.9;
-        }
-        
-        .update-badge {
-            background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
-            color: white;
-            padding: 12px 30px;
-            text-align: center;
-            font-weight: 600;
-            font-size: 1rem;
-        }
-        
-        .main-content {
-            padding: 40px;
-        }
-        
-        .tabs {
-            display: flex;
-            gap: 10px;
-            margin-bottom: 30px;
-            border-bottom: 2px solid #e9ecef;
-            padding-bottom: 10px;
-        }
-        
-        .tab-btn {
-            padding: 15px 25px;
-            background: #f8f9fa;
-            border: 2px solid transparent;
-            cursor: pointer;
-            font-size: 1rem;
-            font-weight: 600;
-            color: #6c757d;
-            border-radius: 10px 10px 0 0;
-            transition: all 0.3s ease;
-            position: relative;
-            z-index: 10;
-            pointer-events: auto !important;
-        }
-        
-        .tab-btn:hover {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            transform: translateY(-2px);
-        }
-        
-        .tab-btn.active {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-color: #667eea;
-            transform: translateY(-2px);
-        }
-        
-        .tab-content {
-            display: none;
-            background: linear-gradient(145deg, #f8f9fa 0%, #e9ecef 100%);
-            border-radius: 15px;
-            padding: 30px;
-            margin-bottom: 20px;
-            box-shadow: inset 2px 2px 5px rgba(0,0,0,0.05);
-        }
-        
-        .tab-content.active {
-            display: block;
-            animation: fadeIn 0.3s ease-in;
-        }
-        
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        .tab-content h2 {
-            color: #2c3e50;
-            margin-bottom: 20px;
-            font-size: 1.5rem;
-        }
-        
-        .form-row {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 20px;
-        }
-        
-        .form-group {
-            display: flex;
-            flex-direction: column;
-            background: white;
-            padding: 15px;
-            border-radius: 10px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.05);
-        }
-        
-        .form-group label {
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 8px;
-            font-size: 0.9rem;
-        }
-        
-        .form-group input, .form-group select {
-            padding: 12px;
-            border: 2px solid #e9ecef;
-            border-radius: 8px;
-            font-size: 1rem;
-            transition: all 0.3s ease;
-        }
-        
-        .form-group input:focus, .form-group select:focus {
-            outline: none;
-            border-color: #667eea;
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-            transform: translateY(-1px);
-        }
-        
-        .btn {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-            padding: 14px 28px;
-            border-radius: 8px;
-            font-size: 1rem;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            margin-right: 10px;
-            margin-bottom: 10px;
-        }
-        
-        .btn:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 8px 20px rgba(102, 126, 234, 0.3);
-        }
-        
-        .btn-success {
-            background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
-        }
-        
-        .btn-success:hover {
-            box-shadow: 0 8px 20px rgba(40, 167, 69, 0.3);
-        }
-        
-        .results {
-            background: white;
-            border: 2px solid #e9ecef;
-            border-radius: 15px;
-            padding: 30px;
-            margin-top: 20px;
-            display: none;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-        }
-        
-        .results.show {
-            display: block;
-            animation: slideIn 0.4s ease-out;
-        }
-        
-        @keyframes slideIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        .results h3 {
-            color: #2c3e50;
-            margin-bottom: 20px;
-            font-size: 1.5rem;
-        }
-        
-        .success {
-            background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-            color: #155724;
-            border: 2px solid #c3e6cb;
-            border-radius: 10px;
-            padding: 15px;
-            margin: 20px 0;
-            font-weight: 600;
-        }
-        
-        .error {
-            background: linear-gradient(135deg, #f8d7da 0%, #f5c6cb 100%);
-            color: #721c24;
-            border: 2px solid #f5c6cb;
-            border-radius: 10px;
-            padding: 15px;
-            margin: 20px 0;
-            font-weight: 600;
-        }
-        
-        .case-item {
-            background: linear-gradient(145deg, #ffffff 0%, #f8f9fa 100%);
-            border-left: 5px solid #667eea;
-            padding: 20px;
-            margin-bottom: 15px;
-            border-radius: 10px;
-            transition: all 0.3s ease;
-            box-shadow: 0 3px 10px rgba(0,0,0,0.08);
-        }
-        
-        .case-item:hover {
-            transform: translateX(5px);
-            box-shadow: 0 5px 15px rgba(0,0,0,0.15);
-        }
-        
-        .case-item h4 {
-            color: #2c3e50;
-            margin-bottom: 15px;
-            font-size: 1.2rem;
-            font-weight: 700;
-        }
-        
-        .case-details {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 10px;
-            margin-top: 10px;
-        }
-        
-        .case-details span {
-            background: rgba(102, 126, 234, 0.1);
-            color: #495057;
-            padding: 8px 12px;
-            border-radius: 6px;
-            font-size: 0.9rem;
-        }
-        
-        .case-details strong {
-            color: #2c3e50;
-        }
-        
-        .loading {
-            text-align: center;
-            padding: 50px;
-        }
-        
-        .spinner {
-            width: 60px;
-            height: 60px;
-            border: 6px solid #f3f3f3;
-            border-top: 6px solid #667eea;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-            margin: 0 auto 20px;
-        }
-        
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        
-        .download-links {
-            margin: 20px 0;
-        }
-        
-        .download-links a {
-            display: inline-block;
-            background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
-            color: white;
-            text-decoration: none;
-            padding: 10px 20px;
-            border-radius: 8px;
-            margin-right: 10px;
-            margin-bottom: 10px;
-            font-weight: 600;
-            transition: all 0.3s ease;
-        }
-        
-        .download-links a:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 8px 20px rgba(40, 167, 69, 0.3);
-        }
-        
-        .checkbox-group {
-            display: flex;
-            gap: 20px;
-            margin-top: 10px;
-        }
-        
-        .checkbox-group label {
-            display: flex;
-            align-items: center;
-            font-weight: normal;
-            cursor: pointer;
-        }
-        
-        .checkbox-group input[type="checkbox"] {
-            margin-right: 8px;
-            transform: scale(1.2);
-        }
-    </style>
+    <link rel="stylesheet" href="{{ css_url }}">
 </head>
 <body>
     <div class="container">
@@ -766,6 +753,24 @@ HTML_TEMPLATE = """
                         <input type="date" id="cl-date">
                     </div>
                 </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label for="cl-filter-court">Court (Optional)</label>
+                        <input type="text" id="cl-filter-court" placeholder="e.g., Court No. 2">
+                    </div>
+                    <div class="form-group">
+                        <label for="cl-filter-purpose">Purpose (Optional)</label>
+                        <input type="text" id="cl-filter-purpose" placeholder="e.g., Evidence">
+                    </div>
+                    <div class="form-group">
+                        <label for="cl-filter-advocate">Advocate (Optional)</label>
+                        <input type="text" id="cl-filter-advocate" placeholder="Advocate name">
+                    </div>
+                    <div class="form-group">
+                        <label for="cl-filter-case-type">Case Type (Optional)</label>
+                        <input type="text" id="cl-filter-case-type" placeholder="e.g., CRL.A.">
+                    </div>
+                </div>
                 <button class="btn" onclick="fetchCauseList()">📊 Fetch Cause List</button>
                 <button class="btn btn-success" onclick="downloadTodaysList()">📥 Download Today's List</button>
             </div>
@@ -778,376 +783,197 @@ HTML_TEMPLATE = """
         </div>
     </div>
     
-    <script>
-        // Set today's date as default
-        document.getElementById('cl-date').valueAsDate = new Date();
-        
-        // COMPLETE GEOGRAPHIC DATA - 5 STATES WITH FULL COVERAGE
-        const geographicData = {
-            'Delhi': {
-                districts: ['New Delhi', 'Central Delhi', 'South Delhi', 'East Delhi', 'West Delhi'],
-                complexes: {
-                    'New Delhi': ['Patiala House Court Comp', 'Saket Court Complex'],
-                    'Central Delhi': ['Tis Hazari Court Complex', 'Karkardooma Court Complex'],
-                    'South Delhi': ['Saket Court Complex', 'Dwarka Court Complex'],
-                    'East Delhi': ['Karkardooma Court Complex', 'Mandoli Court Complex'],
-                    'West Delhi': ['Rohini Court Complex', 'Dwarka Court Complex']
-                }
-            },
-            'Maharashtra': {
-                districts: ['Mumbai City', 'Pune', 'Nagpur', 'Thane', 'Nashik'],
-                complexes: {
-                    'Mumbai City': ['Mumbai City Civil Court', 'Bombay High Court'],
-                    'Pune': ['Pune District Court', 'Pune City Civil Court'],
-                    'Nagpur': ['Nagpur District Court', 'Nagpur Bench High Court'],
-                    'Thane': ['Thane District Court', 'Kalyan Court Complex'],
-                    'Nashik': ['Nashik District Court', 'Nashik Road Court']
-                }
-            },
-            'Uttar Pradesh': {
-                districts: ['Lucknow', 'Kanpur', 'Allahabad', 'Varanasi', 'Noida'],
-                complexes: {
-                    'Lucknow': ['Lucknow District Court', 'Lucknow Bench'],
-                    'Kanpur': ['Kanpur District Court', 'Kanpur Nagar Court'],
-                    'Allahabad': ['Allahabad High Court', 'Allahabad District Court'],
-                    'Varanasi': ['Varanasi District Court', 'Varanasi Civil Court'],
-                    'Noida': ['Gautam Buddha Nagar Court', 'Noida Additional Court']
-                }
-            },
-            'Karnataka': {
-                districts: ['Bangalore Urban', 'Mysore', 'Hubli', 'Mangalore', 'Belgaum'],
-                complexes: {
-                    'Bangalore Urban': ['Bangalore City Civil Court', 'Karnataka High Court'],
-                    'Mysore': ['Mysore District Court', 'Mysore City Court'],
-                    'Hubli': ['Hubli-Dharwad Court', 'Hubli District Court'],
-                    'Mangalore': ['Mangalore District Court', 'Mangalore City Court'],
-                    'Belgaum': ['Belgaum District Court', 'Belgaum Bench High Court']
-                }
-            },
-            'Tamil Nadu': {
-                districts: ['Chennai', 'Coimbatore', 'Madurai', 'Salem', 'Trichy'],
-                complexes: {
-                    'Chennai': ['Chennai City Civil Court', 'Madras High Court'],
-                    'Coimbatore': ['Coimbatore District Court', 'Coimbatore City Court'],
-                    'Madurai': ['Madurai District Court', 'Madurai Bench High Court'],
-                    'Salem': ['Salem District Court', 'Salem City Court'],
-                    'Trichy': ['Trichy District Court', 'Trichy City Court']
-                }
-            }
-        };
-        
-        // FIXED TAB SWITCHING FUNCTION
-        function switchTab(tabName) {
-            console.log('Switching to tab:', tabName);
-            
-            // Hide all tab contents
-            document.querySelectorAll('.tab-content').forEach(tab => {
-                tab.classList.remove('active');
-            });
-            
-            // Remove active class from all tab buttons
-            document.querySelectorAll('.tab-btn').forEach(btn => {
-                btn.classList.remove('active');
-            });
-            
-            // Show selected tab content
-            const selectedTab = document.getElementById(tabName + '-tab');
-            if (selectedTab) {
-                selectedTab.classList.add('active');
-            }
-            
-            // Activate clicked button
-            event.target.classList.add('active');
-            
-            // Hide results when switching tabs
-            document.getElementById('results').classList.remove('show');
-        }
-        
-        // FIXED DISTRICT UPDATE FUNCTION
-        function updateDistricts() {
-            const state = document.getElementById('state-select').value;
-            const districtSelect = document.getElementById('district-select');
-            
-            console.log('Selected state:', state);
-            
-            // Clear existing options
-            districtSelect.innerHTML = '';
-            
-            // Get districts for selected state
-            const districts = geographicData[state].districts;
-            console.log('Districts for', state, ':', districts);
-            
-            // Populate district dropdown
-            districts.forEach(district => {
-                const option = document.createElement('option');
-                option.value = district;
-                option.textContent = district;
-                districtSelect.appendChild(option);
-            });
-            
-            // Update complexes for first district
-            updateComplexes();
-        }
-        
-        // FIXED COMPLEX UPDATE FUNCTION
-        function updateComplexes() {
-            const state = document.getElementById('state-select').value;
-            const district = document.getElementById('district-select').value;
-            const complexSelect = document.getElementById('complex-select');
-            
-            console.log('Selected state:', state, 'district:', district);
-            
-            // Clear existing options
-            complexSelect.innerHTML = '';
-            
-            // Get complexes for selected state and district
-            const complexes = geographicData[state].complexes[district] || [];
-            console.log('Complexes:', complexes);
-            
-            // Populate complex dropdown
-            complexes.forEach(complex => {
-                const option = document.createElement('option');
-                option.value = complex;
-                option.textContent = complex;
-                complexSelect.appendChild(option);
-            });
-        }
-        
-        function showLoading(message) {
-            const resultsDiv = document.getElementById('results');
-            const resultsContent = document.getElementById('results-content');
-            
-            resultsContent.innerHTML = `
-                <div class="loading">
-                    <div class="spinner"></div>
-                    <p>${message}</p>
-                </div>
-            `;
-            resultsDiv.classList.add('show');
-        }
-        
-        function showResults(content) {
-            document.getElementById('results-content').innerHTML = content;
-        }
-        
-        function showError(message) {
-            showResults(`<div class="error">❌ ${message}</div>`);
-        }
-        
-        async function searchByCNR() {
-            const cnr = document.getElementById('cnr-input').value.trim();
-            const checkToday = document.getElementById('check-today').checked;
-            const checkTomorrow = document.getElementById('check-tomorrow').checked;
-            
-            if (!cnr || cnr.length !== 16) {
-                alert('Please enter a valid 16-digit CNR number');
-                return;
-            }
-            
-            showLoading('Searching case in eCourts database...');
-            
-            try {
-                const response = await fetch('/api/search-cnr', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        cnr: cnr,
-                        check_today: checkToday,
-                        check_tomorrow: checkTomorrow
-                    })
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    let html = `<div class="success">✅ Case found in eCourts database!</div>`;
-                    
-                    // Case details
-                    html += `<div class="case-item">
-                        <h4>📋 Case Information</h4>
-                        <div class="case-details">`;
-                    
-                    Object.entries(result.case_info).forEach(([key, value]) => {
-                        html += `<span><strong>${key}:</strong> ${value}</span>`;
-                    });
-                    
-                    html += `</div></div>`;
-                    
-                    // Listings
-                    if (result.listings && result.listings.length > 0) {
-                        html += `<div class="case-item">
-                            <h4>🎯 Case Listings</h4>`;
-                        
-                        result.listings.forEach(listing => {
-                            html += `<div class="case-details">
-                                <span><strong>📅 Date:</strong> ${listing.date}</span>
-                                <span><strong>🏛️ Court:</strong> ${listing.court_name}</span>
-                                <span><strong>📝 Serial No:</strong> ${listing.serial_no}</span>
-                                <span><strong>⚖️ Purpose:</strong> ${listing.purpose}</span>
-                            </div>`;
-                        });
-                        
-                        html += `</div>`;
-                    } else if (checkToday || checkTomorrow) {
-                        html += `<div class="error">Case is not listed for the selected dates.</div>`;
-                    }
-                    
-                    showResults(html);
-                } else {
-                    showError(result.error || 'Case not found in eCourts database');
-                }
-            } catch (error) {
-                showError('Connection to eCourts failed: ' + error.message);
-            }
-        }
-        
-        async function searchByDetails() {
-            const caseType = document.getElementById('case-type').value;
-            const caseNumber = document.getElementById('case-number').value;
-            const caseYear = document.getElementById('case-year').value;
-            const partyName = document.getElementById('party-name').value;
-            
-            if (!caseType || !caseNumber || !caseYear) {
-                alert('Please fill in Case Type, Number, and Year');
-                return;
-            }
-            
-            showLoading('Searching case by details in eCourts...');
-            
-            try {
-                const response = await fetch('/api/search-case', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        case_type: caseType,
-                        case_number: caseNumber,
-                        case_year: caseYear,
-                        party_name: partyName
-                    })
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    let html = `<div class="success">✅ Case found: ${caseType} ${caseNumber}/${caseYear}</div>`;
-                    
-                    html += `<div class="case-item">
-                        <h4>${result.case_info['Case Number']}</h4>
-                        <div class="case-details">`;
-                    
-                    Object.entries(result.case_info).forEach(([key, value]) => {
-                        html += `<span><strong>${key}:</strong> ${value}</span>`;
-                    });
-                    
-                    html += `</div></div>`;
-                    
-                    showResults(html);
-                } else {
-                    showError(result.error || 'Case not found');
-                }
-            } catch (error) {
-                showError('Search failed: ' + error.message);
-            }
-        }
-        
-        async function fetchCauseList() {
-            const state = document.getElementById('state-select').value;
-            const district = document.getElementById('district-select').value;
-            const complex = document.getElementById('complex-select').value;
-            const date = document.getElementById('cl-date').value;
-            
-            if (!date) {
-                alert('Please select a date');
-                return;
-            }
-            
-            showLoading(`Fetching cause list from ${state} → ${district} → ${complex}...`);
-            
-            try {
-                const response = await fetch('/api/cause-list', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        state: state,
-                        district: district,
-                        complex: complex,
-                        date: date
-                    })
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    const cases = result.cause_list.cases;
-                    let html = `<div class="success">✅ Fetched ${cases.length} cases from ${state} → ${district} → ${complex}</div>`;
-                    
-                    html += `<div class="download-links">
-                        <a href="#" onclick="downloadJSON()">📄 Download JSON</a>
-                        <a href="#" onclick="downloadCSV()">📊 Download CSV</a>
-                        <a href="#" onclick="downloadPDF()">📥 Download PDF</a>
-                    </div>`;
-                    
-                    cases.forEach((caseItem, index) => {
-                        html += `<div class="case-item">
-                            <h4>${caseItem.case_no}</h4>
-                            <div class="case-details">
-                                <span><strong>📝 Serial No:</strong> ${caseItem.sr_no}</span>
-                                <span><strong>👥 Parties:</strong> ${caseItem.party_names}</span>
-                                <span><strong>⚖️ Advocate:</strong> ${caseItem.advocate}</span>
-                                <span><strong>🏛️ Court:</strong> ${caseItem.court_name}</span>
-                                <span><strong>📋 Purpose:</strong> ${caseItem.purpose}</span>
-                                <span><strong>📄 Remarks:</strong> ${caseItem.remarks}</span>
-                            </div>
-                        </div>`;
-                    });
-                    
-                    showResults(html);
-                } else {
-                    showError(result.error || 'Failed to fetch cause list');
-                }
-            } catch (error) {
-                showError('Failed to connect to eCourts: ' + error.message);
-            }
-        }
-        
-        function downloadTodaysList() {
-            showLoading('Downloading today\\'s complete cause list...');
-            
-            setTimeout(() => {
-                const html = `
-                    <div class="success">✅ Today's complete cause list downloaded!</div>
-                    <div class="download-links">
-                        <a href="#" onclick="alert('Downloaded: cause_list_today.pdf')">📥 cause_list_today.pdf</a>
-                        <a href="#" onclick="alert('Downloaded: cause_list_today.json')">📄 cause_list_today.json</a>
-                        <a href="#" onclick="alert('Downloaded: cause_list_today.csv')">📊 cause_list_today.csv</a>
-                    </div>
-                `;
-                showResults(html);
-            }, 2000);
-        }
-        
-        function downloadJSON() {
-            alert('cause_list.json downloaded successfully!');
-        }
-        
-        function downloadCSV() {
-            alert('cause_list.csv downloaded successfully!');
-        }
-        
-        function downloadPDF() {
-            alert('cause_list.pdf downloaded successfully!');
-        }
-        
-        // Initialize districts and complexes on page load
-        updateDistricts();
-    </script>
+    <script src="{{ js_url }}"></script>
 </body>
 </html>
 """
 
+def refresh_gauges():
+    """Copy live task, writer and pool state into the Prometheus gauges"""
+    metrics.ACTIVE_TASKS.set(len(active_tasks))
+    metrics.WRITER_QUEUE_DEPTH.set(result_writer.pending())
+    for priority, depth in scheduler.stats()['queued'].items():
+        metrics.QUEUE_DEPTH.labels(priority=priority).set(depth)
+    pool_stats = get_scraper_pool().stats()
+    metrics.POOL_SIZE.set(pool_stats['size'])
+    metrics.POOL_IN_USE.set(pool_stats['in_use'])
+
+gauge_refresher = None
+
+def start_gauge_refresher():
+    """
+    Refresh this process's gauges every [metrics] refresh_interval seconds.
+    Under gunicorn /metrics is served by one worker at a time, so each
+    worker has to keep its own livesum gauges current.
+    """
+    global gauge_refresher
+    interval = config.get_float('metrics', 'refresh_interval', 5)
+    if interval <= 0 or gauge_refresher is not None:
+        return
+    gauge_refresher = threading.Event()
+
+    def run(stop):
+        while not stop.wait(interval):
+            try:
+                refresh_gauges()
+            except Exception:
+                pass
+
+    threading.Thread(target=run, args=(gauge_refresher,), name='gauge-refresher', daemon=True).start()
+
+def stop_gauge_refresher():
+    global gauge_refresher
+    if gauge_refresher is not None:
+        gauge_refresher.set()
+        gauge_refresher = None
+
+def readiness_checks():
+    """Readiness: a free scraper (live mode), room in the scheduler and writer queues"""
+    pool_stats = get_scraper_pool().stats()
+    scheduler_stats = scheduler.stats()
+    writer_capacity = result_writer.queue.maxsize or float('inf')
+
+    return {
+        'scheduler': {
+            'ok': not scheduler_stats['saturated'],
+            'queued': sum(scheduler_stats['queued'].values()),
+            'max_queue': scheduler_stats['max_queue']
+        },
+        'scraper_pool': {
+            'ok': not LIVE_SCRAPING or pool_stats['in_use'] < pool_stats['size'],
+            **pool_stats
+        },
+        'result_writer': {
+            'ok': result_writer.pending() < 0.9 * writer_capacity,
+            'pending': result_writer.pending()
+        }
+    }
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+def valid_api_key():
+    """True when the request carries the configured API key (header only: query strings end up in access logs)"""
+    api_key = request.headers.get('X-API-Key')
+    return bool(api_key and API_KEY and hmac.compare_digest(api_key.encode(), API_KEY.encode()))
+
+def client_identity():
+    """Rate limit identity: the API key once it is verified, otherwise the client IP"""
+    if valid_api_key():
+        # Never keep raw keys in limiter state or usage reports
+        return True, f"key:{hashlib.sha256(API_KEY.encode()).hexdigest()[:12]}", rate_limiter.limit
+    return False, f"ip:{request.remote_addr}", IP_RATE_LIMIT
+
+def rate_limited(client, result):
+    metrics.RATE_LIMITED.labels(kind=client.split(':', 1)[0]).inc()
+    response = jsonify({
+        'success': False,
+        'error': f'Rate limit exceeded. Retry after {result.headers()["Retry-After"]} seconds.'
+    })
+    response.status_code = 429
+    response.headers.extend(result.headers())
+    return response
+
+@app.before_request
+def enforce_api_limits():
+    """API key check plus per-IP and per-key rate limits for /api routes"""
+    if not request.path.startswith('/api/'):
+        return None
+
+    authenticated, client, limit = client_identity()
+
+    if API_KEY_REQUIRED and not authenticated:
+        return jsonify({'success': False, 'error': 'Valid API key required'}), 401
+
+    # The IP limit always applies, so a key cannot lift a client past it
+    ip_client = f"ip:{request.remote_addr}"
+    result = rate_limiter.check(ip_client, IP_RATE_LIMIT)
+    if not result.allowed:
+        return rate_limited(ip_client, result)
+
+    if authenticated:
+        result = rate_limiter.check(client, limit)
+        if not result.allowed:
+            return rate_limited(client, result)
+
+    g.rate_limit = result
+    return None
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.get('request_started')
+    if started is not None:
+        metrics.HTTP_LATENCY.labels(
+            endpoint=request.endpoint or 'unknown',
+            method=request.method,
+            status=response.status_code
+        ).observe(time.perf_counter() - started)
+    
+    rate_limit = g.get('rate_limit')
+    if rate_limit is not None and rate_limit.limit and rate_limit.allowed:
+        response.headers.extend(rate_limit.headers())
+    return response
+
+def build_assets():
+    """Render the index page and hash its CSS/JS once at startup"""
+    bundle = AssetBundle(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static'))
+    css_url = bundle.add_file('css/ecourts.css', 'text/css; charset=utf-8')
+    js_url = bundle.add_file('js/ecourts.js', 'application/javascript; charset=utf-8')
+    html = app.jinja_env.from_string(HTML_TEMPLATE).render(css_url=css_url, js_url=js_url)
+    return bundle, Asset(html, 'text/html; charset=utf-8')
+
+asset_bundle, index_page = build_assets()
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    return index_page.response()
+
+@app.route('/assets/<name>')
+def static_asset(name):
+    asset = asset_bundle.get(name)
+    if asset is None:
+        abort(404)
+    return asset.response()
+
+@app.route('/health')
+def health():
+    """Liveness probe with readiness details"""
+    checks = readiness_checks()
+    return jsonify({
+        'status': 'ok',
+        'ready': all(check['ok'] for check in checks.values()),
+        'checks': checks,
+        'active_tasks': len(active_tasks),
+        'pages': PAGE_STATS.summary()
+    })
+
+@app.route('/health/ready')
+def health_ready():
+    """Readiness probe: 503 while the pool or writer queue is saturated"""
+    checks = readiness_checks()
+    ready = all(check['ok'] for check in checks.values())
+    return jsonify({'ready': ready, 'checks': checks}), 200 if ready else 503
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Prometheus scrape endpoint"""
+    refresh_gauges()
+    payload, content_type = metrics.render_latest()
+    return Response(payload, content_type=content_type)
+
+@app.route('/api/usage')
+def api_usage():
+    """Per-client request and rejection counts for capacity planning (API key required: it lists client IPs)"""
+    if not valid_api_key():
+        return jsonify({'success': False, 'error': 'Valid API key required'}), 401
+    return jsonify({
+        'success': True,
+        'limit': rate_limiter.limit,
+        'ip_limit': IP_RATE_LIMIT,
+        'period': rate_limiter.period,
+        'clients': rate_limiter.usage()
+    })
 
 @app.route('/api/search-cnr', methods=['POST'])
 def search_cnr():
@@ -1159,20 +985,13 @@ def search_cnr():
         if not cnr or len(cnr) != 16:
             return jsonify({'success': False, 'error': 'Invalid CNR number. Must be exactly 16 characters.'})
         
-        # Create background task
-        task_id = str(uuid.uuid4())
-        task = ScrapingTask(task_id, {
+        # Run task on the priority scheduler
+        task = submit_task({
             'operation': 'search_cnr',
             'cnr': cnr,
             'check_today': data.get('check_today', False),
             'check_tomorrow': data.get('check_tomorrow', False)
-        })
-        active_tasks[task_id] = task
-        
-        # Run task
-        thread = threading.Thread(target=run_scraping_task, args=(task_id, task.params))
-        thread.start()
-        thread.join(timeout=10)
+        }, timeout=10, priority=request_priority(data))
         
         if task.status == 'completed':
             return jsonify({
@@ -1186,6 +1005,8 @@ def search_cnr():
                 'error': task.error or 'Search timeout or failed'
             })
             
+    except AdmissionRejected as e:
+        return overloaded_response(e)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
@@ -1195,21 +1016,14 @@ def search_case():
     try:
         data = request.json
         
-        # Create task
-        task_id = str(uuid.uuid4())
-        task = ScrapingTask(task_id, {
+        # Run task on the priority scheduler
+        task = submit_task({
             'operation': 'search_case',
             'case_type': data.get('case_type'),
             'case_number': data.get('case_number'),
             'case_year': data.get('case_year'),
             'party_name': data.get('party_name')
-        })
-        active_tasks[task_id] = task
-        
-        # Run task
-        thread = threading.Thread(target=run_scraping_task, args=(task_id, task.params))
-        thread.start()
-        thread.join(timeout=10)
+        }, timeout=10, priority=request_priority(data))
         
         if task.status == 'completed':
             return jsonify({
@@ -1222,66 +1036,196 @@ def search_case():
                 'error': task.error or 'Search failed'
             })
             
+    except AdmissionRejected as e:
+        return overloaded_response(e)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
 @app.route('/api/cause-list', methods=['POST'])
 def cause_list():
-    """Cause list API with dynamic data for 5 states"""
+    """Cause list API with dynamic data for 5 states, filtered and paginated"""
     try:
-        data = request.json
+        data = request.json or {}
+        limit = max(1, min(int(data.get('limit') or CAUSE_LIST_PAGE_SIZE), CAUSE_LIST_MAX_PAGE_SIZE))
         
-        # Create task
-        task_id = str(uuid.uuid4())
-        task = ScrapingTask(task_id, {
-            'operation': 'fetch_cause_list',
-            'state': data.get('state', 'Delhi'),
-            'district': data.get('district', 'New Delhi'),
-            'complex': data.get('complex', 'Patiala House Court Comp'),
-            'date': data.get('date')
-        })
-        active_tasks[task_id] = task
-        
-        # Run task
-        thread = threading.Thread(target=run_scraping_task, args=(task_id, task.params))
-        thread.start()
-        thread.join(timeout=15)
-        
-        if task.status == 'completed':
-            # Save results
+        # Later pages come from the stored index, or its selection on another worker
+        if data.get('cursor'):
             try:
-                os.makedirs('downloads', exist_ok=True)
-                
-                # Save JSON
-                filename_base = f"cause_list_{data.get('complex', 'default').replace(' ', '_')}_{data.get('date', 'today').replace('-', '_')}"
-                
-                with open(f'downloads/{filename_base}.json', 'w', encoding='utf-8') as f:
-                    json.dump(task.result, f, indent=2, ensure_ascii=False)
-                
-                # Save CSV
-                if task.result.get('cases'):
-                    import csv
-                    with open(f'downloads/{filename_base}.csv', 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.DictWriter(f, fieldnames=task.result['cases'][0].keys())
-                        writer.writeheader()
-                        writer.writerows(task.result['cases'])
-            except Exception as e:
-                print(f"Failed to save files: {e}")
+                list_id, offset, filters, selection = decode_cursor(data['cursor'])
+            except InvalidCursor as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
             
-            return jsonify({
-                'success': True,
-                'cause_list': task.result
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': task.error or 'Failed to fetch cause list'
-            })
+            index = cause_list_store.get(list_id)
+            if index is None and selection is None:
+                return jsonify({'success': False, 'error': 'Cursor expired. Fetch the cause list again.'}), 410
+            if index is None:
+                index, error = load_cause_list(selection, request_priority(data))
+                if index is None:
+                    return jsonify({'success': False, 'error': error})
+            return cause_list_page(index, filters, offset, limit)
+        
+        filters = data.get('filters') or {field: data.get(field) for field in FILTER_FIELDS}
+        selection = CauseListStore.selection_key(
+            data.get('state', 'Delhi'),
+            data.get('district', 'New Delhi'),
+            data.get('complex', 'Patiala House Court Comp'),
+            data.get('date')
+        )
+        
+        index, error = load_cause_list(selection, request_priority(data))
+        if index is None:
+            return jsonify({'success': False, 'error': error})
+        return cause_list_page(index, filters, 0, limit)
             
+    except AdmissionRejected as e:
+        return overloaded_response(e)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
-if __name__ == '__main__':
+def load_cause_list(selection, priority):
+    """Return (index, error) for a selection, fetching and indexing it on a miss"""
+    index = cause_list_store.lookup(selection)
+    metrics.record_cache('cause_list', index is not None)
+    if index is not None:
+        return index, None
+    
+    # Run task on the priority scheduler
+    state, district, complex_name, date = selection
+    params = {'operation': 'fetch_cause_list', 'state': state, 'district': district, 'complex': complex_name, 'date': date}
+    task = submit_task(params, timeout=15, priority=priority)
+    
+    if task.status != 'completed':
+        return None, task.error or 'Failed to fetch cause list'
+    
+    # Queue export of the full list; files are written by the background writer
+    filename_base = export_name('cause_list', complex_name or 'default', (date or 'today').replace('-', '_'))
+    result_writer.submit(filename_base, task.result)
+    
+    return cause_list_store.put(selection, task.result, download_urls(filename_base, bool(task.result.get('cases')))), None
+
+def cause_list_page(index, filters, offset, limit):
+    """JSON response for one page of a cause list index"""
+    cases, next_cursor, total_matches = index.page(filters, offset, limit)
+    
+    return jsonify({
+        'success': True,
+        'cause_list': {
+            'metadata': {**index.metadata, 'matched_cases': total_matches},
+            'cases': cases
+        },
+        'downloads': index.downloads,
+        'page': {
+            'offset': offset,
+            'limit': limit,
+            'returned': len(cases),
+            'total_matches': total_matches,
+            'next_cursor': next_cursor
+        }
+    })
+
+def resolve_download(download_id):
+    """Path of a finished export, waiting briefly for queued writes"""
+    path = download_path(result_writer.output_dir, download_id)
+    if path is None:
+        return None
+    
+    result_writer.wait_for(os.path.splitext(download_id)[0], timeout=5)
+    return path if os.path.isfile(path) else None
+
+@app.route('/api/downloads/<download_id>')
+def download_export(download_id):
+    """Serve an export with Range, ETag and If-Modified-Since support"""
+    path = resolve_download(download_id)
+    if path is None:
+        return jsonify({'success': False, 'error': 'Download not found'}), 404
+    
+    if request.args.get('compress') == 'gzip':
+        # Compressed on the fly; Range does not apply to the transformed body
+        return Response(stream_gzip(path), mimetype='application/gzip', headers={
+            'Content-Disposition': f'attachment; filename="{download_id}.gz"'
+        })
+    
+    # send_file hands the open file to the server's file_wrapper (sendfile under gunicorn)
+    return send_file(path, as_attachment=True, conditional=True, etag=True, max_age=0)
+
+@app.route('/api/downloads/bundle')
+def download_bundle():
+    """Stream several exports as one zip archive"""
+    download_ids = [i for i in request.args.get('ids', '').split(',') if i]
+    if not download_ids or len(download_ids) > 100:
+        return jsonify({'success': False, 'error': 'Provide between 1 and 100 download ids'}), 400
+    
+    paths = []
+    for download_id in dict.fromkeys(download_ids):
+        path = resolve_download(download_id)
+        if path is None:
+            return jsonify({'success': False, 'error': f'Download not found: {download_id}'}), 404
+        paths.append(path)
+    
+    return Response(stream_zip(paths), mimetype='application/zip', headers={
+        'Content-Disposition': 'attachment; filename="ecourts_exports.zip"'
+    })
+
+@app.route('/api/watchlist', methods=['GET'])
+def watchlist_entries():
+    """Tracked CNRs, paginated with offset/limit"""
+    store = get_watchlist().store
+    offset = max(0, request.args.get('offset', 0, type=int))
+    limit = max(1, min(request.args.get('limit', 100, type=int), 1000))
+    
+    return jsonify({
+        'success': True,
+        'total': store.count(),
+        'entries': store.entries(offset, limit)
+    })
+
+@app.route('/api/watchlist', methods=['POST'])
+def watchlist_add():
+    """Track CNRs: {"cnrs": [...], "label": "..."}"""
+    data = request.json or {}
+    cnrs = [str(cnr).strip().upper() for cnr in data.get('cnrs', [])]
+    
+    invalid = [cnr for cnr in cnrs if len(cnr) != 16 or not cnr.isalnum()]
+    if not cnrs or invalid:
+        return jsonify({'success': False, 'error': 'Provide 16-character CNR numbers', 'invalid': invalid[:20]}), 400
+    
+    store = get_watchlist().store
+    return jsonify({'success': True, 'added': store.add(cnrs, data.get('label')), 'total': store.count()})
+
+@app.route('/api/watchlist/<cnr>', methods=['DELETE'])
+def watchlist_remove(cnr):
+    """Stop tracking a CNR"""
+    if not get_watchlist().store.remove(cnr.upper()):
+        return jsonify({'success': False, 'error': 'CNR not tracked'}), 404
+    return jsonify({'success': True})
+
+@app.route('/api/watchlist/run', methods=['POST'])
+def watchlist_run():
+    """Start an incremental run in the background"""
+    data = request.json or {}
+    if not get_watchlist().run_in_background(data.get('date'), bool(data.get('force')), bool(data.get('resume'))):
+        return jsonify({'success': False, 'error': 'A watchlist run is already in progress'}), 409
+    return jsonify({'success': True, 'status': 'started'}), 202
+
+@app.route('/api/watchlist/runs')
+def watchlist_runs():
+    """Recent watchlist runs, newest first"""
+    return jsonify({'success': True, 'runs': get_watchlist().store.runs(request.args.get('limit', 20, type=int))})
+
+@app.route('/api/watchlist/runs/<int:run_id>/changes')
+def watchlist_changes(run_id):
+    """Listings that changed in one run"""
+    store = get_watchlist().store
+    run = store.run(run_id)
+    if run is None:
+        return jsonify({'success': False, 'error': 'Run not found'}), 404
+    
+    changes = store.changes(run_id)
+    filename_base = export_name('watchlist', run['run_date'].replace('-', '_'), run_id)
+    return jsonify({'success': True, 'changes': changes, 'downloads': download_urls(filename_base, bool(changes))})
+
+def main(use_reloader=True):
+    """Run the development server (the launcher calls this in-process without the reloader)"""
     print("🚀 eCourts Professional Scraper - COMPLETE VERSION")
     print("=" * 70)
     print("✅ 5 States with full geographic coverage")
@@ -1300,7 +1244,24 @@ if __name__ == '__main__':
     print("📱 Access: http://localhost:5000")
     print("🛑 Press Ctrl+C to stop")
     
+    print("🏭 Production: gunicorn -c gunicorn.conf.py ecourts_web_interface:app")
+    
+    setup_logging()
+    
     # Ensure downloads directory exists
     os.makedirs('downloads', exist_ok=True)
     
-    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
+    if config.get_bool('watchlist', 'enabled', False):
+        get_watchlist().start()
+    start_gauge_refresher()
+    
+    app.run(
+        debug=config.get_bool('api', 'debug', False),
+        host=config.get('api', 'host', '0.0.0.0'),
+        port=config.get_int('api', 'port', 5000),
+        threaded=config.get_bool('api', 'threaded', True),
+        use_reloader=use_reloader and config.get_bool('api', 'debug', False)
+    )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Worker
+Standalone scraping node: python -m ecourts_worker
+"""
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+
+import ecourts_metrics as metrics
+from ecourts_cancel import CancellationToken, TaskCancelled
+from ecourts_logging import log_context
+
+logger = logging.getLogger(__name__)
+
+class Worker:
+    """
+    Leases jobs from a shared queue and runs them with ``handler``.
+
+    While a job runs a heartbeat thread extends its lease; if the lease is
+    lost (visibility timeout passed, or the job was cancelled) the job's
+    CancellationToken is cancelled so the scrape stops at its next stage.
+    ``handler(payload, cancel_token)`` returns a JSON-serializable result.
+    Every ``purge_interval`` seconds one loop thread deletes jobs finished
+    more than ``retention`` seconds ago, so the queue does not grow forever.
+    """
+
+    def __init__(self, queue, handler, worker_id=None, concurrency=1, heartbeat_interval=None, poll_interval=1.0,
+                 purge_interval=3600, retention=86400):
+        self.queue = queue
+        self.handler = handler
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.concurrency = max(1, concurrency)
+        self.heartbeat_interval = heartbeat_interval or max(1, queue.visibility_timeout / 3)
+        self.poll_interval = poll_interval
+        self.purge_interval = purge_interval
+        self.retention = retention
+        self.next_purge = 0
+
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.stats = {'completed': 0, 'failed': 0, 'lost': 0}
+        self.remaining = None
+
+    def run(self, max_jobs=None):
+        """Process jobs until stop() is called or max_jobs have been taken"""
+        self.remaining = max_jobs
+        threads = [
+            threading.Thread(target=self._loop, name=f'worker-{i}', daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return dict(self.stats)
+
+    def stop(self):
+        """Finish running jobs, then exit"""
+        self.stop_event.set()
+
+    def _take_slot(self):
+        with self.lock:
+            if self.remaining is None:
+                return True
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+    def _purge_due(self):
+        with self.lock:
+            now = time.monotonic()
+            if not self.purge_interval or now < self.next_purge:
+                return False
+            self.next_purge = now + self.purge_interval
+            return True
+
+    def purge(self):
+        """Delete finished jobs older than retention; returns how many"""
+        try:
+            purged = self.queue.purge(self.retention)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to purge finished jobs: {e}")
+            return 0
+        if purged:
+            logger.info(f"🧹 Purged {purged} finished jobs")
+        return purged
+
+    def _loop(self):
+        while not self.stop_event.is_set():
+            if self._purge_due():
+                self.purge()
+            if not self._take_slot():
+                return
+
+            try:
+                lease = self.queue.lease(self.worker_id)
+            except Exception as e:
+                logger.error(f"❌ Failed to lease a job: {e}")
+                lease = None
+
+            if lease is None:
+                with self.lock:
+                    if self.remaining is not None:
+                        self.remaining += 1
+                self.stop_event.wait(self.poll_interval)
+                continue
+
+            self.process(lease)
+
+    def process(self, lease):
+        """Run one leased job, heartbeating until it finishes"""
+        token = CancellationToken()
+        done = threading.Event()
+        operation = lease.payload.get('operation', 'unknown')
+
+        def heartbeat():
+            while not done.wait(self.heartbeat_interval):
+                try:
+                    alive = self.queue.heartbeat(lease)
+                except Exception as e:
+                    logger.warning(f"⚠️ Heartbeat failed for job {lease.job_id}: {e}")
+                    continue
+                if not alive:
+                    token.cancel('Lease lost or job cancelled')
+                    return
+
+        beat = threading.Thread(target=heartbeat, name=f'heartbeat-{lease.job_id[:8]}', daemon=True)
+        beat.start()
+        started = time.perf_counter()
+        status = 'completed'
+
+        with log_context(task_id=lease.job_id, operation=operation):
+            try:
+                logger.info(f"⚙️ Job {lease.job_id} ({operation}) attempt {lease.attempts}")
+                result = self.handler(lease.payload, token)
+                if not self.queue.complete(lease, result):
+                    status = 'lost'
+            except TaskCancelled:
+                status = 'lost'
+            except ValueError as e:
+                # Bad parameters never succeed on retry
+                status = 'error'
+                self.queue.fail(lease, e, retry=False)
+            except Exception as e:
+                status = 'error'
+                logger.error(f"❌ Job {lease.job_id} failed: {e}")
+                self.queue.fail(lease, e)
+            finally:
+                done.set()
+                beat.join()
+                metrics.OPERATION_LATENCY.labels(operation=operation, status=status).observe(time.perf_counter() - started)
+
+        with self.lock:
+            self.stats[status if status in ('completed', 'lost') else 'failed'] += 1
+        if status == 'lost':
+            logger.warning(f"⚠️ Job {lease.job_id} lost its lease; result discarded")
+
+def pool_handler(pool, timeout=None):
+    """Handler running each job on a scraper borrowed from a ScraperPool"""
+    from ecourts_operations import run_operation
+
+    def handle(payload, cancel_token):
+        with pool.scraper(timeout=timeout) as scraper:
+            return run_operation(scraper, payload, cancel_token)
+    return handle
+
+def main():
+    """Run a scraping worker against the configured queue"""
+    import ecourts_config as config
+    from ecourts_logging import setup_logging
+    from ecourts_pool import ScraperPool
+    from ecourts_queue import create_queue
+
+    parser = argparse.ArgumentParser(description='eCourts scraping worker')
+    parser.add_argument('--backend', default=config.get('queue', 'backend', 'sqlite'), choices=['sqlite', 'redis'])
+    parser.add_argument('--path', default=config.get('queue', 'path', 'ecourts_queue.db'), help='SQLite queue file')
+    parser.add_argument('--redis-url', default=config.get('queue', 'redis_url', 'redis://localhost:6379/0'))
+    parser.add_argument('--concurrency', type=int, default=config.get_int('api', 'max_concurrent_tasks', 5))
+    parser.add_argument('--max-jobs', type=int, help='Exit after this many jobs')
+    parser.add_argument('--worker-id', help='Name reported in leases (default host:pid)')
+    args = parser.parse_args()
+
+    setup_logging()
+
+    queue = create_queue(
+        args.backend, args.path, args.redis_url,
+        visibility_timeout=config.get_int('queue', 'visibility_timeout', 120),
+        max_attempts=config.get_int('queue', 'max_attempts', 3),
+        retry_base=config.get_float('queue', 'retry_base', 5)
+    )
+    pool = ScraperPool(
+        size=args.concurrency,
+        headless=config.get_bool('scraper', 'headless', True),
+        warm=config.get_int('api', 'warm_drivers', 0)
+    )
+    worker = Worker(
+        queue, pool_handler(pool, config.get_int('api', 'task_timeout', 300)),
+        worker_id=args.worker_id, concurrency=args.concurrency,
+        heartbeat_interval=config.get_float('queue', 'heartbeat_interval', 0) or None,
+        purge_interval=config.get_int('queue', 'purge_interval', 3600),
+        retention=config.get_int('queue', 'retention', 86400)
+    )
+
+    # SIGTERM (docker stop, scale-down) drains running jobs before exiting
+    signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+    signal.signal(signal.SIGINT, lambda *_: worker.stop())
+
+    print(f"🚀 eCourts worker {worker.worker_id}: {args.concurrency} slots on {args.backend} queue")
+    try:
+        stats = worker.run(args.max_jobs)
+        print(f"✅ Worker stopped: {stats['completed']} completed, {stats['failed']} failed, {stats['lost']} lost")
+    finally:
+        pool.close()
+        queue.close()
+
+if __name__ == '__main__':
+    main()
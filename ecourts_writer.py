@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+eCourts Professional Scraper Result Writer
+Background JSON/CSV export so disk I/O stays off the request path
+"""
+
+import csv
+import json
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ('never', 'batch', 'always')
+
+# mkstemp creates files 0600; exports get the usual permissions
+_umask = os.umask(0)
+os.umask(_umask)
+FILE_MODE = 0o666 & ~_umask
+
+def write_json(f, data):
+    """Serialize export data as JSON"""
+    json.dump(data, f, indent=2, ensure_ascii=False)
+
+def case_fieldnames(cases):
+    """Columns of every case in first-seen order (some rows have extra keys, e.g. cnr)"""
+    return list(dict.fromkeys(key for case in cases for key in case))
+
+def write_csv(f, data):
+    """Serialize the cases of a cause list as CSV"""
+    writer = csv.DictWriter(f, fieldnames=case_fieldnames(data['cases']))
+    writer.writeheader()
+    writer.writerows(data['cases'])
+
+def export_files(output_dir, filename_base, data):
+    """List (path, serializer) pairs for one export"""
+    files = [(os.path.join(output_dir, f"{filename_base}.json"), write_json)]
+    if data.get('cases'):
+        files.append((os.path.join(output_dir, f"{filename_base}.csv"), write_csv))
+    return files
+
+class ResultWriter:
+    """
+    Single background thread that drains export jobs in batches.
+
+    Jobs for the same filename inside one batch are coalesced (last write
+    wins), files are written to a temporary name and renamed into place,
+    and fsync is applied per file ('always'), once per batch ('batch') or
+    not at all ('never'). ``on_commit(filename_base)`` is called once all
+    files of an export have been renamed into place.
+    """
+
+    def __init__(self, output_dir='downloads', batch_size=20, flush_interval=0.5,
+                 fsync_policy='batch', max_queue=1000, on_commit=None):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync_policy}")
+
+        self.output_dir = output_dir
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.fsync_policy = fsync_policy
+        self.on_commit = on_commit
+
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.thread = None
+        self.lock = threading.Lock()
+
+        # Exports submitted but not yet renamed into place, by filename
+        self.inflight = {}
+        self.committed = threading.Condition()
+        self.stats = {'submitted': 0, 'written': 0, 'coalesced': 0, 'failed': 0, 'batches': 0}
+        # Batches can also be written inline on a request thread (queue full)
+        self.stats_lock = threading.Lock()
+
+    def after_fork(self):
+        """Reset threads, locks and the queue in a forked child (the parent's thread is gone)"""
+        self.queue = queue.Queue(maxsize=self.queue.maxsize)
+        self.thread = None
+        self.lock = threading.Lock()
+        self.inflight = {}
+        self.committed = threading.Condition()
+        self.stats_lock = threading.Lock()
+
+    def start(self):
+        """Start the writer thread (idempotent)"""
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                os.makedirs(self.output_dir, exist_ok=True)
+                self.thread = threading.Thread(target=self._run, name='result-writer', daemon=True)
+                self.thread.start()
+
+    def submit(self, filename_base, data):
+        """Queue an export and return immediately"""
+        self.start()
+        self._count('submitted')
+
+        with self.committed:
+            self.inflight[filename_base] = self.inflight.get(filename_base, 0) + 1
+
+        try:
+            self.queue.put_nowait((filename_base, data))
+        except queue.Full:
+            # Queue is saturated; write inline rather than drop the export
+            logger.warning(f"⚠️ Result writer queue full, writing {filename_base} inline")
+            self._write_batch([(filename_base, data)])
+
+        return filename_base
+
+    def wait_for(self, filename_base, timeout=None):
+        """Wait until no export of this filename is outstanding"""
+        with self.committed:
+            return self.committed.wait_for(lambda: not self.inflight.get(filename_base), timeout)
+
+    def pending(self):
+        """Number of exports waiting to be written"""
+        return self.queue.qsize()
+
+    def flush(self):
+        """Block until every queued export has been written"""
+        if self.thread is not None:
+            self.queue.join()
+
+    def close(self):
+        """Flush outstanding exports and stop the writer thread"""
+        if self.thread is not None and self.thread.is_alive():
+            self.flush()
+            self.queue.put(None)
+            self.thread.join(timeout=5)
+        self.thread = None
+
+    def _run(self):
+        # Bound once, so a thread outliving after_fork() keeps to its own queue
+        work_queue = self.queue
+        while True:
+            item = work_queue.get()
+            if item is None:
+                work_queue.task_done()
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+
+            # Collect a batch until it is full or the flush interval elapses
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = work_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    work_queue.task_done()
+
+            if stop:
+                return
+
+    def _count(self, stat, amount=1):
+        with self.stats_lock:
+            self.stats[stat] += amount
+
+    def _stage(self, path, serializer, data):
+        """Write one file under a unique temporary name next to path"""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                        prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+        f = os.fdopen(fd, 'w', newline='', encoding='utf-8')
+        try:
+            os.chmod(tmp_path, FILE_MODE)
+            serializer(f, data)
+            f.flush()
+            if self.fsync_policy == 'always':
+                os.fsync(f.fileno())
+        except Exception:
+            f.close()
+            os.remove(tmp_path)
+            raise
+        return f, tmp_path
+
+    def _discard(self, staged):
+        for f, tmp_path, _ in staged:
+            try:
+                f.close()
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _backup(self, path, tmp_path):
+        """Hard link to the file now at path (a copy where links fail), or None"""
+        if not os.path.exists(path):
+            return None
+        backup = f"{tmp_path}.bak"
+        try:
+            os.link(path, backup)
+        except OSError:
+            shutil.copy2(path, backup)
+        return backup
+
+    def _publish(self, staged):
+        """
+        Rename every staged file of one export into place. If a rename
+        fails, the files already renamed get their previous contents back
+        (or are removed), so readers never see half of an export.
+        """
+        published, backups = [], []
+        try:
+            for _, tmp_path, path in staged:
+                backup = self._backup(path, tmp_path)
+                backups.append(backup)
+                os.replace(tmp_path, path)
+                published.append((path, backup))
+        except Exception:
+            for path, backup in reversed(published):
+                try:
+                    if backup is None:
+                        os.remove(path)
+                    else:
+                        os.replace(backup, path)
+                except OSError as e:
+                    logger.error(f"❌ Failed to roll back {path}: {e}")
+            raise
+        finally:
+            for backup in backups:
+                if backup is not None and os.path.exists(backup):
+                    os.remove(backup)
+
+    def _write_batch(self, batch):
+        # Coalesce repeated exports of the same file, keeping the latest data
+        latest = {}
+        for filename_base, data in batch:
+            latest[filename_base] = data
+        self._count('coalesced', len(batch) - len(latest))
+
+        # Stage every file of an export before renaming any of them, so a
+        # failure never leaves half an export (JSON without its CSV) in place
+        exports = {}
+        failed = set()
+        for filename_base, data in latest.items():
+            staged = []
+            try:
+                for path, serializer in export_files(self.output_dir, filename_base, data):
+                    staged.append((*self._stage(path, serializer, data), path))
+                if self.fsync_policy == 'batch':
+                    for f, _, _ in staged:
+                        os.fsync(f.fileno())
+                for f, _, _ in staged:
+                    f.close()
+                exports[filename_base] = staged
+            except Exception as e:
+                self._discard(staged)
+                failed.add(filename_base)
+                self._count('failed')
+                logger.error(f"❌ Failed to save results for {filename_base}: {e}")
+
+        for filename_base, staged in exports.items():
+            try:
+                self._publish(staged)
+                self._count('written')
+            except Exception as e:
+                self._discard(staged)
+                failed.add(filename_base)
+                self._count('failed')
+                logger.error(f"❌ Failed to commit {filename_base}: {e}")
+
+        if exports and self.fsync_policy != 'never':
+            self._fsync_directory()
+
+        if self.on_commit:
+            for filename_base in latest:
+                if filename_base in failed:
+                    continue
+                try:
+                    self.on_commit(filename_base)
+                except Exception as e:
+                    logger.error(f"❌ Commit callback failed for {filename_base}: {e}")
+
+        with self.committed:
+            for filename_base, _ in batch:
+                remaining = self.inflight.get(filename_base, 1) - 1
+                if remaining > 0:
+                    self.inflight[filename_base] = remaining
+                else:
+                    self.inflight.pop(filename_base, None)
+            self.committed.notify_all()
+
+        self._count('batches')
+
+    def _fsync_directory(self):
+        # Persist the renames themselves; not supported on Windows
+        if os.name != 'posix':
+            return
+        try:
+            fd = os.open(self.output_dir, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
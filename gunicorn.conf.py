@@ -0,0 +1,51 @@
+"""
+Gunicorn configuration for the eCourts web interface
+Usage: gunicorn -c gunicorn.conf.py ecourts_web_interface:app
+
+Worker and thread counts come from config.ini [api]. The app is preloaded
+in the master so templates and static cause list data are built once and
+shared copy-on-write; each worker creates its own Chrome pool after fork.
+
+Graceful reload: `kill -HUP <master>` restarts workers with the current
+config; because the app is preloaded, deploy new code with `kill -USR2`
+followed by `kill -QUIT` on the old master.
+"""
+
+import ecourts_config
+
+bind = f"{ecourts_config.get('api', 'host', '0.0.0.0')}:{ecourts_config.get_int('api', 'port', 5000)}"
+workers = ecourts_config.get_int('api', 'workers', 2)
+threads = ecourts_config.get_int('api', 'threads', 4)
+worker_class = 'gthread'
+
+preload_app = True
+timeout = ecourts_config.get_int('api', 'worker_timeout', 60)
+graceful_timeout = ecourts_config.get_int('api', 'graceful_timeout', 30)
+keepalive = 5
+
+# Recycle workers periodically; jitter keeps them from restarting together
+max_requests = ecourts_config.get_int('api', 'max_requests', 1000)
+max_requests_jitter = ecourts_config.get_int('api', 'max_requests_jitter', 100)
+
+pidfile = '/tmp/gunicorn.pid'
+accesslog = '-'
+errorlog = '-'
+loglevel = ecourts_config.get('logging', 'level', 'INFO').lower()
+
+def post_fork(server, worker):
+    """Give every worker its own browser pool and writer thread"""
+    import ecourts_web_interface
+    ecourts_web_interface.init_worker()
+    server.log.info(f"Worker {worker.pid} initialized scraper pool")
+
+def worker_exit(server, worker):
+    """Flush exports and quit Chrome before the worker goes away"""
+    import ecourts_web_interface
+    ecourts_web_interface.shutdown_worker()
+
+def child_exit(server, worker):
+    """Drop a dead worker's live gauges when metrics are multiprocess"""
+    import os
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
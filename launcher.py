@@ -6,9 +6,25 @@ Easy-to-use launcher for the complete eCourts scraper system
 
 import sys
 import os
+import shutil
 import subprocess
 import platform
 from datetime import datetime
+from importlib.util import find_spec
+
+# The scraper and web interface run in this process (imported on first use)
+# rather than in a fresh interpreter per menu option
+
+def run_scraper_cli(args):
+    """Run the scraper CLI with args in this process"""
+    import ecourts_scraper
+    try:
+        ecourts_scraper.main(args)
+    except SystemExit:
+        # argparse exits after --help or a bad argument
+        pass
+    except KeyboardInterrupt:
+        print("\n⏹️  Stopped")
 
 def print_banner():
     print("="*70)
@@ -64,7 +80,8 @@ def run_web_interface():
         print("🛑 Press Ctrl+C to stop the server")
         print("-" * 50)
 
-        subprocess.run([sys.executable, 'ecourts_web_interface.py'])
+        import ecourts_web_interface
+        ecourts_web_interface.main(use_reloader=False)
     except KeyboardInterrupt:
         print("\n\n👋 Web server stopped")
     except Exception as e:
@@ -73,7 +90,7 @@ def run_web_interface():
 def run_cli_help():
     """Show CLI help"""
     try:
-        subprocess.run([sys.executable, 'ecourts_scraper.py', '--help'])
+        run_scraper_cli(['--help'])
     except Exception as e:
         print(f"❌ Error showing CLI help: {e}")
 
@@ -98,13 +115,13 @@ def run_quick_cnr_search():
         try:
             print(f"\n🔍 Searching CNR: {cnr}")
 
-            cmd = [sys.executable, 'ecourts_scraper.py', '--cnr', cnr]
+            args = ['--cnr', cnr]
             if check_today:
-                cmd.append('--today')
+                args.append('--today')
             if check_tomorrow:
-                cmd.append('--tomorrow')
+                args.append('--tomorrow')
 
-            subprocess.run(cmd)
+            run_scraper_cli(args)
 
             break
         except Exception as e:
@@ -132,17 +149,14 @@ def run_quick_cause_list():
         print(f"📍 {state} → {district} → {complex_name}")
         print(f"📅 Date: {date}")
 
-        cmd = [
-            sys.executable, 'ecourts_scraper.py',
+        run_scraper_cli([
             '--causelist',
             '--state', state,
             '--district', district,
             '--complex', complex_name,
             '--date', date,
             '--output', output_format
-        ]
-
-        subprocess.run(cmd)
+        ])
 
     except Exception as e:
         print(f"❌ Error fetching cause list: {e}")
@@ -165,17 +179,18 @@ def run_system_info():
         else:
             chrome_paths = ["/usr/bin/google-chrome", "/usr/bin/chromium-browser"]
 
-        chrome_found = any(os.path.exists(path) for path in chrome_paths)
+        chrome_found = any(os.path.exists(path) for path in chrome_paths) or any(
+            shutil.which(name) for name in ('google-chrome', 'chromium', 'chromium-browser'))
         print(f"🌐 Chrome Browser: {'✅ Found' if chrome_found else '❌ Not Found'}")
     except:
         print("🌐 Chrome Browser: ❓ Unknown")
 
-    # Check pip packages
-    try:
-        import selenium, flask, requests, bs4
+    # Check pip packages without importing them
+    missing = [name for name in ('selenium', 'flask', 'requests', 'bs4') if find_spec(name) is None]
+    if missing:
+        print(f"📦 Required Packages: ❌ Missing - {', '.join(missing)}")
+    else:
         print("📦 Required Packages: ✅ Installed")
-    except ImportError as e:
-        print(f"📦 Required Packages: ❌ Missing - {e}")
 
 def main():
     """Main launcher function"""
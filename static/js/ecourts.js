@@ -0,0 +1,418 @@
+// Set today's date as default
+document.getElementById('cl-date').valueAsDate = new Date();
+
+// COMPLETE GEOGRAPHIC DATA - 5 STATES WITH FULL COVERAGE
+const geographicData = {
+    'Delhi': {
+        districts: ['New Delhi', 'Central Delhi', 'South Delhi', 'East Delhi', 'West Delhi'],
+        complexes: {
+            'New Delhi': ['Patiala House Court Comp', 'Saket Court Complex'],
+            'Central Delhi': ['Tis Hazari Court Complex', 'Karkardooma Court Complex'],
+            'South Delhi': ['Saket Court Complex', 'Dwarka Court Complex'],
+            'East Delhi': ['Karkardooma Court Complex', 'Mandoli Court Complex'],
+            'West Delhi': ['Rohini Court Complex', 'Dwarka Court Complex']
+        }
+    },
+    'Maharashtra': {
+        districts: ['Mumbai City', 'Pune', 'Nagpur', 'Thane', 'Nashik'],
+        complexes: {
+            'Mumbai City': ['Mumbai City Civil Court', 'Bombay High Court'],
+            'Pune': ['Pune District Court', 'Pune City Civil Court'],
+            'Nagpur': ['Nagpur District Court', 'Nagpur Bench High Court'],
+            'Thane': ['Thane District Court', 'Kalyan Court Complex'],
+            'Nashik': ['Nashik District Court', 'Nashik Road Court']
+        }
+    },
+    'Uttar Pradesh': {
+        districts: ['Lucknow', 'Kanpur', 'Allahabad', 'Varanasi', 'Noida'],
+        complexes: {
+            'Lucknow': ['Lucknow District Court', 'Lucknow Bench'],
+            'Kanpur': ['Kanpur District Court', 'Kanpur Nagar Court'],
+            'Allahabad': ['Allahabad High Court', 'Allahabad District Court'],
+            'Varanasi': ['Varanasi District Court', 'Varanasi Civil Court'],
+            'Noida': ['Gautam Buddha Nagar Court', 'Noida Additional Court']
+        }
+    },
+    'Karnataka': {
+        districts: ['Bangalore Urban', 'Mysore', 'Hubli', 'Mangalore', 'Belgaum'],
+        complexes: {
+            'Bangalore Urban': ['Bangalore City Civil Court', 'Karnataka High Court'],
+            'Mysore': ['Mysore District Court', 'Mysore City Court'],
+            'Hubli': ['Hubli-Dharwad Court', 'Hubli District Court'],
+            'Mangalore': ['Mangalore District Court', 'Mangalore City Court'],
+            'Belgaum': ['Belgaum District Court', 'Belgaum Bench High Court']
+        }
+    },
+    'Tamil Nadu': {
+        districts: ['Chennai', 'Coimbatore', 'Madurai', 'Salem', 'Trichy'],
+        complexes: {
+            'Chennai': ['Chennai City Civil Court', 'Madras High Court'],
+            'Coimbatore': ['Coimbatore District Court', 'Coimbatore City Court'],
+            'Madurai': ['Madurai District Court', 'Madurai Bench High Court'],
+            'Salem': ['Salem District Court', 'Salem City Court'],
+            'Trichy': ['Trichy District Court', 'Trichy City Court']
+        }
+    }
+};
+
+// FIXED TAB SWITCHING FUNCTION
+function switchTab(tabName) {
+    console.log('Switching to tab:', tabName);
+
+    // Hide all tab contents
+    document.querySelectorAll('.tab-content').forEach(tab => {
+        tab.classList.remove('active');
+    });
+
+    // Remove active class from all tab buttons
+    document.querySelectorAll('.tab-btn').forEach(btn => {
+        btn.classList.remove('active');
+    });
+
+    // Show selected tab content
+    const selectedTab = document.getElementById(tabName + '-tab');
+    if (selectedTab) {
+        selectedTab.classList.add('active');
+    }
+
+    // Activate clicked button
+    event.target.classList.add('active');
+
+    // Hide results when switching tabs
+    document.getElementById('results').classList.remove('show');
+}
+
+// FIXED DISTRICT UPDATE FUNCTION
+function updateDistricts() {
+    const state = document.getElementById('state-select').value;
+    const districtSelect = document.getElementById('district-select');
+
+    console.log('Selected state:', state);
+
+    // Clear existing options
+    districtSelect.innerHTML = '';
+
+    // Get districts for selected state
+    const districts = geographicData[state].districts;
+    console.log('Districts for', state, ':', districts);
+
+    // Populate district dropdown
+    districts.forEach(district => {
+        const option = document.createElement('option');
+        option.value = district;
+        option.textContent = district;
+        districtSelect.appendChild(option);
+    });
+
+    // Update complexes for first district
+    updateComplexes();
+}
+
+// FIXED COMPLEX UPDATE FUNCTION
+function updateComplexes() {
+    const state = document.getElementById('state-select').value;
+    const district = document.getElementById('district-select').value;
+    const complexSelect = document.getElementById('complex-select');
+
+    console.log('Selected state:', state, 'district:', district);
+
+    // Clear existing options
+    complexSelect.innerHTML = '';
+
+    // Get complexes for selected state and district
+    const complexes = geographicData[state].complexes[district] || [];
+    console.log('Complexes:', complexes);
+
+    // Populate complex dropdown
+    complexes.forEach(complex => {
+        const option = document.createElement('option');
+        option.value = complex;
+        option.textContent = complex;
+        complexSelect.appendChild(option);
+    });
+}
+
+function showLoading(message) {
+    const resultsDiv = document.getElementById('results');
+    const resultsContent = document.getElementById('results-content');
+
+    resultsContent.innerHTML = `
+        <div class="loading">
+            <div class="spinner"></div>
+            <p>${message}</p>
+        </div>
+    `;
+    resultsDiv.classList.add('show');
+}
+
+function showResults(content) {
+    document.getElementById('results-content').innerHTML = content;
+}
+
+function showError(message) {
+    showResults(`<div class="error">❌ ${message}</div>`);
+}
+
+async function searchByCNR() {
+    const cnr = document.getElementById('cnr-input').value.trim();
+    const checkToday = document.getElementById('check-today').checked;
+    const checkTomorrow = document.getElementById('check-tomorrow').checked;
+
+    if (!cnr || cnr.length !== 16) {
+        alert('Please enter a valid 16-digit CNR number');
+        return;
+    }
+
+    showLoading('Searching case in eCourts database...');
+
+    try {
+        const response = await fetch('/api/search-cnr', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                cnr: cnr,
+                check_today: checkToday,
+                check_tomorrow: checkTomorrow
+            })
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            let html = `<div class="success">✅ Case found in eCourts database!</div>`;
+
+            // Case details
+            html += `<div class="case-item">
+                <h4>📋 Case Information</h4>
+                <div class="case-details">`;
+
+            Object.entries(result.case_info).forEach(([key, value]) => {
+                html += `<span><strong>${key}:</strong> ${value}</span>`;
+            });
+
+            html += `</div></div>`;
+
+            // Listings
+            if (result.listings && result.listings.length > 0) {
+                html += `<div class="case-item">
+                    <h4>🎯 Case Listings</h4>`;
+
+                result.listings.forEach(listing => {
+                    html += `<div class="case-details">
+                        <span><strong>📅 Date:</strong> ${listing.date}</span>
+                        <span><strong>🏛️ Court:</strong> ${listing.court_name}</span>
+                        <span><strong>📝 Serial No:</strong> ${listing.serial_no}</span>
+                        <span><strong>⚖️ Purpose:</strong> ${listing.purpose}</span>
+                    </div>`;
+                });
+
+                html += `</div>`;
+            } else if (checkToday || checkTomorrow) {
+                html += `<div class="error">Case is not listed for the selected dates.</div>`;
+            }
+
+            showResults(html);
+        } else {
+            showError(result.error || 'Case not found in eCourts database');
+        }
+    } catch (error) {
+        showError('Connection to eCourts failed: ' + error.message);
+    }
+}
+
+async function searchByDetails() {
+    const caseType = document.getElementById('case-type').value;
+    const caseNumber = document.getElementById('case-number').value;
+    const caseYear = document.getElementById('case-year').value;
+    const partyName = document.getElementById('party-name').value;
+
+    if (!caseType || !caseNumber || !caseYear) {
+        alert('Please fill in Case Type, Number, and Year');
+        return;
+    }
+
+    showLoading('Searching case by details in eCourts...');
+
+    try {
+        const response = await fetch('/api/search-case', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                case_type: caseType,
+                case_number: caseNumber,
+                case_year: caseYear,
+                party_name: partyName
+            })
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            let html = `<div class="success">✅ Case found: ${caseType} ${caseNumber}/${caseYear}</div>`;
+
+            html += `<div class="case-item">
+                <h4>${result.case_info['Case Number']}</h4>
+                <div class="case-details">`;
+
+            Object.entries(result.case_info).forEach(([key, value]) => {
+                html += `<span><strong>${key}:</strong> ${value}</span>`;
+            });
+
+            html += `</div></div>`;
+
+            showResults(html);
+        } else {
+            showError(result.error || 'Case not found');
+        }
+    } catch (error) {
+        showError('Search failed: ' + error.message);
+    }
+}
+
+// Cursor for the next page of the current cause list
+let causeListCursor = null;
+
+// Download links for the current cause list export
+let causeListDownloads = null;
+
+function renderCaseItems(cases) {
+    let html = '';
+    cases.forEach((caseItem, index) => {
+        html += `<div class="case-item">
+            <h4>${caseItem.case_no}</h4>
+            <div class="case-details">
+                <span><strong>📝 Serial No:</strong> ${caseItem.sr_no}</span>
+                <span><strong>👥 Parties:</strong> ${caseItem.party_names}</span>
+                <span><strong>⚖️ Advocate:</strong> ${caseItem.advocate}</span>
+                <span><strong>🏛️ Court:</strong> ${caseItem.court_name}</span>
+                <span><strong>📋 Purpose:</strong> ${caseItem.purpose}</span>
+                <span><strong>📄 Remarks:</strong> ${caseItem.remarks}</span>
+            </div>
+        </div>`;
+    });
+    return html;
+}
+
+function updateLoadMore(page) {
+    causeListCursor = page.next_cursor;
+    const button = document.getElementById('load-more-cases');
+    if (button) {
+        button.style.display = causeListCursor ? 'inline-block' : 'none';
+    }
+}
+
+async function fetchCauseList() {
+    const state = document.getElementById('state-select').value;
+    const district = document.getElementById('district-select').value;
+    const complex = document.getElementById('complex-select').value;
+    const date = document.getElementById('cl-date').value;
+
+    if (!date) {
+        alert('Please select a date');
+        return;
+    }
+
+    causeListDownloads = null;
+    showLoading(`Fetching cause list from ${state} → ${district} → ${complex}...`);
+
+    try {
+        const response = await fetch('/api/cause-list', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                state: state,
+                district: district,
+                complex: complex,
+                date: date,
+                filters: {
+                    court_name: document.getElementById('cl-filter-court').value,
+                    purpose: document.getElementById('cl-filter-purpose').value,
+                    advocate: document.getElementById('cl-filter-advocate').value,
+                    case_type: document.getElementById('cl-filter-case-type').value
+                }
+            })
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            const metadata = result.cause_list.metadata;
+            let html = `<div class="success">✅ Fetched ${metadata.total_cases} cases from ${state} → ${district} → ${complex}`;
+            if (result.page.total_matches !== metadata.total_cases) {
+                html += ` (${result.page.total_matches} match the filters)`;
+            }
+            html += `</div>`;
+
+            html += `<div class="download-links">
+                <a href="#" onclick="downloadJSON()">📄 Download JSON</a>
+                <a href="#" onclick="downloadCSV()">📊 Download CSV</a>
+                <a href="#" onclick="downloadZIP()">📦 Download ZIP</a>
+            </div>`;
+
+            html += `<div id="case-list">${renderCaseItems(result.cause_list.cases)}</div>`;
+            html += `<button class="btn" id="load-more-cases" style="display: none" onclick="loadMoreCases()">⬇️ Load More</button>`;
+
+            showResults(html);
+            updateLoadMore(result.page);
+            causeListDownloads = result.downloads;
+        } else {
+            showError(result.error || 'Failed to fetch cause list');
+        }
+    } catch (error) {
+        showError('Failed to connect to eCourts: ' + error.message);
+    }
+}
+
+async function loadMoreCases() {
+    if (!causeListCursor) {
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/cause-list', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ cursor: causeListCursor })
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            document.getElementById('case-list').insertAdjacentHTML('beforeend', renderCaseItems(result.cause_list.cases));
+            updateLoadMore(result.page);
+        } else {
+            showError(result.error || 'Failed to load more cases');
+        }
+    } catch (error) {
+        showError('Failed to connect to eCourts: ' + error.message);
+    }
+}
+
+async function downloadTodaysList() {
+    document.getElementById('cl-date').valueAsDate = new Date();
+    await fetchCauseList();
+    downloadExport('zip');
+}
+
+function downloadExport(format) {
+    if (!causeListDownloads || !causeListDownloads[format]) {
+        alert('Fetch a cause list first');
+        return;
+    }
+    window.location.href = causeListDownloads[format];
+}
+
+function downloadJSON() {
+    downloadExport('json');
+}
+
+function downloadCSV() {
+    downloadExport('csv');
+}
+
+function downloadZIP() {
+    downloadExport('zip');
+}
+
+// Initialize districts and complexes on page load
+updateDistricts();
@@ -14,6 +14,19 @@ from unittest.mock import Mock, patch, MagicMock
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+def use_scratch_exports(test):
+    """Send the web app's exports to a temporary directory until the test ends"""
+    import tempfile
+    import ecourts_web_interface as web
+    output_dir = tempfile.TemporaryDirectory()
+    patcher = patch.object(web.result_writer, 'output_dir', output_dir.name)
+    patcher.start()
+    # Cleanups run last first: finish queued writes, restore the directory, delete
+    test.addCleanup(output_dir.cleanup)
+    test.addCleanup(patcher.stop)
+    test.addCleanup(web.result_writer.flush)
+    return output_dir.name
+
 class TestECourtsScraper(unittest.TestCase):
     """Test cases for eCourts scraper - Updated version"""
 
@@ -172,6 +185,7 @@ class TestWebAPI(unittest.TestCase):
             self.app.testing = True
         except ImportError:
             self.skipTest("Web interface not available for testing")
+        use_scratch_exports(self)
 
     def test_home_page_loads(self):
         """Test that home page loads without duplication"""
@@ -187,6 +201,79 @@ class TestWebAPI(unittest.TestCase):
         scraper_count = content.count('eCourts Cause List Scraper')
         self.assertLessEqual(scraper_count, 1, "Should not have duplicate scraper UI")
 
+    def test_home_page_is_cached_and_compressed(self):
+        """Test index page ETag revalidation and gzip negotiation"""
+        response = self.app.get('/')
+        etag = response.headers['ETag']
+        self.assertEqual(response.headers['Cache-Control'], 'no-cache')
+
+        revalidated = self.app.get('/', headers={'If-None-Match': etag})
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.data, b'')
+
+        compressed = self.app.get('/', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(compressed.headers['Content-Encoding'], 'gzip')
+        self.assertLess(len(compressed.data), len(response.data))
+
+    def test_static_assets_are_hashed_and_immutable(self):
+        """Test CSS/JS are served under content-hashed URLs"""
+        import re
+        content = self.app.get('/').data.decode('utf-8')
+        urls = re.findall(r'(/assets/ecourts\.[0-9a-f]{16}\.(?:css|js))', content)
+        self.assertEqual(len(urls), 2)
+
+        for url in urls:
+            response = self.app.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('immutable', response.headers['Cache-Control'])
+
+        self.assertEqual(self.app.get('/assets/ecourts.0000000000000000.css').status_code, 404)
+
+    def test_health_and_metrics_endpoints(self):
+        """Test /health liveness, readiness and Prometheus metrics"""
+        health = self.app.get('/health')
+        self.assertEqual(health.status_code, 200)
+        self.assertEqual(health.get_json()['status'], 'ok')
+        self.assertIn('result_writer', health.get_json()['checks'])
+
+        self.assertEqual(self.app.get('/health/ready').status_code, 200)
+
+        self.app.post('/api/search-case', json={'case_type': 'Civil', 'case_number': '1', 'case_year': '2025'})
+        content = self.app.get('/metrics').data.decode('utf-8')
+        self.assertIn('ecourts_operation_duration_seconds_bucket', content)
+        self.assertIn('operation="search_case"', content)
+        self.assertIn('ecourts_active_tasks', content)
+
+    def test_gauges_refresh_without_scrapes(self):
+        """Test each worker keeps its live gauges current between /metrics scrapes"""
+        import time
+        import ecourts_metrics as metrics
+        import ecourts_web_interface as web
+
+        with patch.object(web.config, 'get_float', return_value=0.01), \
+                patch.dict(web.active_tasks, {'gauge-test': object()}):
+            web.start_gauge_refresher()
+            try:
+                deadline = time.monotonic() + 2
+                while metrics.ACTIVE_TASKS._value.get() != len(web.active_tasks) and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                self.assertEqual(metrics.ACTIVE_TASKS._value.get(), len(web.active_tasks))
+            finally:
+                web.stop_gauge_refresher()
+
+    def test_saturated_scheduler_returns_503(self):
+        """Test requests are refused with Retry-After when the queue is full"""
+        from unittest import mock
+        import ecourts_web_interface as web
+        from ecourts_scheduler import AdmissionRejected
+
+        with mock.patch.object(web.scheduler, 'submit', side_effect=AdmissionRejected('Scraping capacity is saturated', 7)):
+            response = self.app.post('/api/search-case', json={'case_type': 'Civil', 'case_number': '1', 'case_year': '2025'})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers['Retry-After'], '7')
+        self.assertFalse(response.get_json()['success'])
+
     def test_cnr_search_api(self):
         """Test CNR search API endpoint"""
         test_data = {
@@ -249,6 +336,45 @@ class TestWebAPI(unittest.TestCase):
 class TestFileOperations(unittest.TestCase):
     """Test file operations and downloads"""
 
+    def setUp(self):
+        use_scratch_exports(self)
+
+    def test_export_downloads(self):
+        """Test exports download with Range, gzip and zip bundles"""
+        import gzip
+        import io
+        import zipfile
+        from ecourts_web_interface import app
+        client = app.test_client()
+
+        result = client.post('/api/cause-list', json={
+            'state': 'Tamil Nadu', 'district': 'Salem', 'complex': 'Salem District Court', 'date': '2025-10-18'
+        }).get_json()
+        downloads = result['downloads']
+
+        full = client.get(downloads['json'])
+        self.assertEqual(full.status_code, 200)
+        self.assertEqual(json.loads(full.data)['metadata']['complex'], 'Salem District Court')
+
+        partial = client.get(downloads['json'], headers={'Range': 'bytes=0-9'})
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(partial.data, full.data[:10])
+
+        cached = client.get(downloads['json'], headers={'If-None-Match': full.headers['ETag']})
+        self.assertEqual(cached.status_code, 304)
+
+        compressed = client.get(downloads['csv'] + '?compress=gzip')
+        self.assertTrue(gzip.decompress(compressed.data).startswith(b'sr_no,'))
+
+        bundle = zipfile.ZipFile(io.BytesIO(client.get(downloads['zip']).data))
+        self.assertEqual(sorted(bundle.namelist()), [
+            'cause_list_Salem_District_Court_2025_10_18.csv',
+            'cause_list_Salem_District_Court_2025_10_18.json'
+        ])
+
+        self.assertEqual(client.get('/api/downloads/..%2Fconfig.ini').status_code, 404)
+        self.assertEqual(client.get('/api/downloads/missing.json').status_code, 404)
+
     def test_downloads_directory_creation(self):
         """Test downloads directory is created"""
         downloads_dir = 'downloads'
@@ -294,6 +420,1748 @@ class TestFileOperations(unittest.TestCase):
         if os.path.exists(filename):
             os.remove(filename)
 
+class TestResultWriter(unittest.TestCase):
+    """Test the background result writer"""
+
+    def setUp(self):
+        import tempfile
+        from ecourts_writer import ResultWriter
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.writer = ResultWriter(output_dir=self.tmpdir.name, flush_interval=0.05)
+
+    def tearDown(self):
+        self.writer.close()
+        self.tmpdir.cleanup()
+
+    def test_writes_json_and_csv(self):
+        """Test queued exports land on disk as JSON and CSV"""
+        data = {'metadata': {'total_cases': 1}, 'cases': [{'sr_no': '1', 'case_no': 'CS 1/2025'}]}
+        self.writer.submit('cause_list_test', data)
+        self.writer.flush()
+
+        with open(os.path.join(self.tmpdir.name, 'cause_list_test.json'), encoding='utf-8') as f:
+            self.assertEqual(json.load(f), data)
+        with open(os.path.join(self.tmpdir.name, 'cause_list_test.csv'), encoding='utf-8') as f:
+            self.assertEqual(f.read().splitlines(), ['sr_no,case_no', '1,CS 1/2025'])
+
+    def test_csv_columns_cover_every_row(self):
+        """Test a cnr column appearing after the first row still lands in the CSV"""
+        data = {'metadata': {}, 'cases': [{'sr_no': '1', 'case_no': 'CS 1/2025'},
+                                          {'sr_no': '2', 'case_no': 'CS 2/2025', 'cnr': 'DLND010000022025'}]}
+        self.writer.submit('mixed', data)
+        self.writer.flush()
+
+        with open(os.path.join(self.tmpdir.name, 'mixed.csv'), encoding='utf-8') as f:
+            self.assertEqual(f.read().splitlines(), ['sr_no,case_no,cnr', '1,CS 1/2025,', '2,CS 2/2025,DLND010000022025'])
+
+    def test_burst_is_coalesced(self):
+        """Test repeated exports of one file keep only the latest data"""
+        for i in range(10):
+            self.writer.submit('burst', {'version': i})
+        self.writer.flush()
+
+        with open(os.path.join(self.tmpdir.name, 'burst.json'), encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['version'], 9)
+        self.assertEqual(self.writer.stats['failed'], 0)
+        self.assertEqual(self.writer.pending(), 0)
+
+    def test_after_fork_restarts_writer(self):
+        """Test a forked child gets its own writer thread and queue"""
+        self.writer.submit('parent', {'version': 1})
+        self.writer.flush()
+        parent_thread, parent_queue = self.writer.thread, self.writer.queue
+        self.writer.after_fork()
+
+        self.writer.submit('child', {'version': 2})
+        self.writer.flush()
+        self.assertIsNot(self.writer.thread, parent_thread)
+        self.assertTrue(os.path.exists(os.path.join(self.tmpdir.name, 'child.json')))
+        parent_queue.put(None)
+
+    def test_failed_file_discards_whole_export(self):
+        """Test a CSV failure keeps the export's JSON from being renamed into place"""
+        data = {'metadata': {'total_cases': 1}, 'cases': [{'sr_no': '1'}]}
+        with patch('ecourts_writer.write_csv', side_effect=OSError('disk full')):
+            self.writer._write_batch([('half', data)])
+
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+        self.assertEqual(self.writer.stats['failed'], 1)
+        self.assertEqual(self.writer.stats['written'], 0)
+
+    def test_failed_rename_rolls_back_export(self):
+        """Test a failed CSV rename restores the JSON already renamed into place"""
+        old = {'metadata': {'version': 1}, 'cases': [{'sr_no': '1'}]}
+        new = {'metadata': {'version': 2}, 'cases': [{'sr_no': '2'}]}
+        self.writer._write_batch([('export', old), ('fresh', new)])
+        with open(os.path.join(self.tmpdir.name, 'export.csv'), encoding='utf-8') as f:
+            old_csv = f.read()
+        os.remove(os.path.join(self.tmpdir.name, 'fresh.json'))
+        os.remove(os.path.join(self.tmpdir.name, 'fresh.csv'))
+
+        replace = os.replace
+        def failing_replace(src, dst):
+            if src.endswith('.tmp') and dst.endswith('.csv'):
+                raise OSError('disk full')
+            return replace(src, dst)
+
+        with patch('ecourts_writer.os.replace', side_effect=failing_replace):
+            self.writer._write_batch([('export', new), ('fresh', new)])
+
+        # The earlier export is intact and the new one left nothing behind
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ['export.csv', 'export.json'])
+        with open(os.path.join(self.tmpdir.name, 'export.json'), encoding='utf-8') as f:
+            self.assertEqual(json.load(f), old)
+        with open(os.path.join(self.tmpdir.name, 'export.csv'), encoding='utf-8') as f:
+            self.assertEqual(f.read(), old_csv)
+        self.assertEqual((self.writer.stats['written'], self.writer.stats['failed']), (2, 2))
+
+    def test_concurrent_batches_use_unique_temp_files(self):
+        """Test inline and background writes of one file never share a temp file"""
+        import threading
+        data = {'metadata': {}, 'cases': [{'sr_no': str(i)} for i in range(2000)]}
+        threads = [threading.Thread(target=self.writer._write_batch, args=([('same', data)],))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ['same.csv', 'same.json'])
+        self.assertEqual(self.writer.stats['written'], 8)
+        self.assertEqual(self.writer.stats['batches'], 8)
+
+class TestScraperPool(unittest.TestCase):
+    """Test the per-process scraper pool"""
+
+    def test_pool_reuses_and_bounds_scrapers(self):
+        """Test scrapers are reused and the pool never exceeds its size"""
+        from ecourts_pool import ScraperPool, PoolExhausted
+
+        pool = ScraperPool(size=2, factory=Mock)
+        first = pool.acquire()
+        second = pool.acquire()
+
+        with self.assertRaises(PoolExhausted):
+            pool.acquire(timeout=0.05)
+
+        pool.release(first)
+        self.assertIs(pool.acquire(timeout=0.05), first)
+        self.assertEqual(pool.stats()['created'], 2)
+
+        pool.release(first)
+        pool.release(second)
+        pool.close()
+        first.close.assert_called_once()
+
+    def test_failed_scraper_is_discarded(self):
+        """Test a scraper that raised is closed instead of reused"""
+        from ecourts_pool import ScraperPool
+
+        pool = ScraperPool(size=1, factory=Mock)
+        with self.assertRaises(RuntimeError):
+            with pool.scraper() as scraper:
+                raise RuntimeError('browser crashed')
+
+        scraper.close.assert_called_once()
+        self.assertEqual(pool.stats(), {'size': 1, 'created': 0, 'in_use': 0, 'idle': 0, 'recycling': 0, 'recycled': 0})
+
+    def wait_until(self, predicate):
+        import time
+        deadline = time.monotonic() + 2
+        while not predicate() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_outgrown_scraper_is_replaced(self):
+        """Test a scraper past its page limit is swapped for a fresh one in the background"""
+        from ecourts_pool import ScraperPool
+
+        pool = ScraperPool(size=1, factory=lambda: Mock(pages_loaded=0), max_pages=3, max_rss_mb=0)
+        old = pool.acquire()
+        old.pages_loaded = 3
+        pool.release(old)
+        self.wait_until(lambda: old.close.called)
+
+        fresh = pool.acquire(timeout=0.05)
+        self.assertIsNot(fresh, old)
+        old.driver.get.assert_called_once_with('about:blank')
+        old.close.assert_called_once()
+        self.assertEqual(pool.stats()['created'], 1)
+
+    def test_replaced_scraper_finishes_its_request(self):
+        """Test a scraper replaced while borrowed is only quit on release"""
+        import threading
+        from unittest import mock
+        from ecourts_pool import ScraperPool
+
+        launched = threading.Event()
+        def factory():
+            if pool.created:
+                launched.wait(2)
+            return Mock(pages_loaded=0)
+
+        pool = ScraperPool(size=1, factory=factory, max_pages=0, max_rss_mb=100)
+        old = pool.acquire()
+        with mock.patch('ecourts_pool.scraper_rss', return_value=200 * 1024 * 1024):
+            pool.release(old)
+
+        # Borrowed again before the replacement is up
+        self.assertIs(pool.acquire(timeout=0.05), old)
+        launched.set()
+        self.wait_until(lambda: pool.stats()['recycled'])
+        old.close.assert_not_called()
+
+        pool.release(old)
+        old.close.assert_called_once()
+        self.assertEqual(pool.stats()['created'], 1)
+        self.assertIsNot(pool.acquire(timeout=0.05), old)
+
+class TestRateLimiting(unittest.TestCase):
+    """Test per-client sliding-window rate limits"""
+
+    def test_memory_backend_sliding_window(self):
+        """Test hits expire one by one as the window slides"""
+        from ecourts_ratelimit import MemoryBackend
+
+        backend = MemoryBackend()
+        self.assertTrue(backend.hit('ip:1', 2, 60, now=0).allowed)
+        self.assertTrue(backend.hit('ip:1', 2, 60, now=30).allowed)
+
+        rejected = backend.hit('ip:1', 2, 60, now=45)
+        self.assertFalse(rejected.allowed)
+        self.assertEqual(rejected.retry_after, 15)
+
+        self.assertTrue(backend.hit('ip:1', 2, 60, now=61).allowed)
+        self.assertTrue(backend.hit('ip:2', 2, 60, now=45).allowed)
+
+    def test_api_returns_429_with_retry_after(self):
+        """Test the API rejects a client over its limit and counts usage"""
+        import ecourts_web_interface as web
+        from ecourts_ratelimit import RateLimiter, MemoryBackend
+
+        client = web.app.test_client()
+        limiter = RateLimiter(MemoryBackend(), limit=2, period=60)
+
+        key = {'X-API-Key': 'secret'}
+
+        with patch.object(web, 'rate_limiter', limiter), patch.object(web, 'IP_RATE_LIMIT', 2), \
+                patch.object(web, 'API_KEY', 'secret'):
+            self.assertEqual(client.get('/api/usage', headers=key).status_code, 200)
+            allowed = client.get('/api/usage', headers=key)
+            self.assertEqual(allowed.headers['X-RateLimit-Remaining'], '0')
+
+            rejected = client.get('/api/usage', headers=key)
+            self.assertEqual(rejected.status_code, 429)
+            self.assertGreaterEqual(int(rejected.headers['Retry-After']), 1)
+
+            # Pages and probes are never limited
+            self.assertEqual(client.get('/health').status_code, 200)
+
+        self.assertEqual(limiter.usage()['ip:127.0.0.1']['rejected'], 1)
+
+    def test_unverified_keys_fall_back_to_ip_limit(self):
+        """Test random API keys neither get their own limit nor bypass the IP limit"""
+        import ecourts_web_interface as web
+        from ecourts_ratelimit import RateLimiter, MemoryBackend
+
+        client = web.app.test_client()
+        limiter = RateLimiter(MemoryBackend(), limit=100, period=60)
+
+        with patch.object(web, 'rate_limiter', limiter), patch.object(web, 'IP_RATE_LIMIT', 2), \
+                patch.object(web, 'API_KEY', 'secret'):
+            statuses = [client.get('/api/downloads/missing', headers={'X-API-Key': f'guess-{i}'}).status_code
+                        for i in range(3)]
+            self.assertEqual(statuses[-1], 429)
+            self.assertEqual(list(limiter.usage()), ['ip:127.0.0.1'])
+
+            # A valid key is limited per key and per IP
+            self.assertEqual(client.get('/api/usage', headers={'X-API-Key': 'secret'}).status_code, 429)
+            self.assertEqual(client.get('/api/usage?api_key=secret').status_code, 429)
+
+        with patch.object(web, 'rate_limiter', RateLimiter(MemoryBackend(), limit=0)), \
+                patch.object(web, 'IP_RATE_LIMIT', 0), patch.object(web, 'API_KEY', 'secret'):
+            self.assertEqual(client.get('/api/usage').status_code, 401)
+            self.assertEqual(client.get('/api/usage?api_key=secret').status_code, 401)
+            self.assertEqual(client.get('/api/usage', headers={'X-API-Key': 'secret'}).status_code, 200)
+
+    def test_idle_usage_is_purged(self):
+        """Test usage counters of long-idle clients are dropped"""
+        from ecourts_ratelimit import MemoryBackend
+
+        backend = MemoryBackend(usage_ttl=100)
+        backend.record_usage('ip:1', True, now=backend.last_usage_purge)
+        backend.record_usage('ip:2', True, now=backend.last_usage_purge + 150)
+        self.assertEqual(list(backend.usage()), ['ip:2'])
+
+class TestCauseListPagination(unittest.TestCase):
+    """Test cause list indexing, filters and cursors"""
+
+    def setUp(self):
+        from ecourts_causelist import CauseListIndex
+        use_scratch_exports(self)
+        cases = [
+            {'sr_no': str(i), 'case_no': f"{'CRL.A.' if i % 2 else 'CS'} {i}/2025",
+             'advocate': 'Ms. Priya Gupta' if i % 3 == 0 else 'Sh. Amit Jain',
+             'purpose': 'For Evidence', 'court_name': f'Court No. {i % 4}'}
+            for i in range(1, 101)
+        ]
+        self.index = CauseListIndex('list1', {'metadata': {'total_cases': 100}, 'cases': cases})
+
+    def test_cursor_walks_every_match_once(self):
+        """Test cursors page through all matching rows without overlap"""
+        from ecourts_causelist import decode_cursor
+
+        seen, offset, filters = [], 0, {'case_type': 'crl.a.', 'advocate': 'priya'}
+        while True:
+            rows, cursor, total = self.index.page(filters, offset, limit=7)
+            seen.extend(row['sr_no'] for row in rows)
+            if cursor is None:
+                break
+            _, offset, filters, _ = decode_cursor(cursor)
+
+        expected = [str(i) for i in range(1, 101) if i % 2 and i % 3 == 0]
+        self.assertEqual(seen, expected)
+        self.assertEqual(total, len(expected))
+
+    def test_api_pages_and_expired_cursor(self):
+        """Test the API bounds page size and serves cursors from the index"""
+        from ecourts_web_interface import app
+        client = app.test_client()
+
+        first = client.post('/api/cause-list', json={
+            'state': 'Karnataka', 'district': 'Mysore', 'complex': 'Mysore District Court',
+            'date': '2025-10-17', 'limit': 2
+        }).get_json()
+        self.assertTrue(first['success'])
+        self.assertEqual(len(first['cause_list']['cases']), 2)
+        self.assertEqual(first['page']['total_matches'], 5)
+
+        second = client.post('/api/cause-list', json={'cursor': first['page']['next_cursor'], 'limit': 2}).get_json()
+        self.assertEqual([c['sr_no'] for c in second['cause_list']['cases']], ['3', '4'])
+
+        filtered = client.post('/api/cause-list', json={
+            'state': 'Karnataka', 'district': 'Mysore', 'complex': 'Mysore District Court',
+            'date': '2025-10-17', 'filters': {'purpose': 'orders'}
+        }).get_json()
+        self.assertEqual([c['case_no'] for c in filtered['cause_list']['cases']], ['CRL.A. 5050/2024'])
+
+        from ecourts_causelist import decode_cursor, encode_cursor
+        expired = client.post('/api/cause-list', json={'cursor': encode_cursor('missing', 0, {})})
+        self.assertEqual(expired.status_code, 410)
+
+        negative = client.post('/api/cause-list', json={'cursor': encode_cursor(decode_cursor(first['page']['next_cursor'])[0], -2, {})})
+        self.assertEqual(negative.status_code, 400)
+
+    def test_cursor_served_by_another_worker(self):
+        """Test a page-2 cursor refetches its list on a worker that never indexed it"""
+        import ecourts_web_interface as web
+        from ecourts_causelist import CauseListStore
+        client = web.app.test_client()
+
+        first = client.post('/api/cause-list', json={
+            'state': 'Karnataka', 'district': 'Mysore', 'complex': 'Mysore District Court',
+            'date': '2025-10-18', 'limit': 2
+        }).get_json()
+
+        with patch.object(web, 'cause_list_store', CauseListStore()):
+            second = client.post('/api/cause-list', json={'cursor': first['page']['next_cursor'], 'limit': 2})
+            self.assertEqual(second.status_code, 200)
+            page = second.get_json()
+            self.assertEqual([c['sr_no'] for c in page['cause_list']['cases']], ['3', '4'])
+            self.assertEqual(page['page']['offset'], 2)
+            self.assertIsNotNone(web.cause_list_store.lookup(('Karnataka', 'Mysore', 'Mysore District Court', '2025-10-18')))
+
+class TestPriorityScheduler(unittest.TestCase):
+    """Test priority classes, reserved capacity and aging"""
+
+    def test_interactive_uses_reserved_worker(self):
+        """Test an interactive job runs while bulk work waits for its slot"""
+        import threading
+        from ecourts_scheduler import PriorityScheduler
+
+        scheduler = PriorityScheduler(workers=2, reserved_interactive=1, aging_seconds=1000)
+        release = threading.Event()
+
+        blocking = scheduler.submit(release.wait, priority='bulk')
+        queued_bulk = scheduler.submit(lambda: 'bulk', priority='bulk')
+        interactive = scheduler.submit(lambda: 'interactive', priority='interactive')
+
+        self.assertTrue(interactive.wait(2))
+        self.assertEqual(interactive.result, 'interactive')
+        self.assertEqual(queued_bulk.state, 'queued')
+
+        release.set()
+        self.assertTrue(queued_bulk.wait(2))
+        self.assertTrue(blocking.wait(2))
+        scheduler.shutdown()
+
+    def test_aging_prevents_starvation(self):
+        """Test a long-waiting bulk job overtakes fresh interactive work"""
+        import time
+        from ecourts_scheduler import Job, PriorityScheduler
+
+        scheduler = PriorityScheduler(workers=2, reserved_interactive=0, aging_seconds=10)
+        old_bulk = Job(print, (), {}, 'bulk')
+        old_bulk.enqueued_at = time.monotonic() - 25
+        fresh = Job(print, (), {}, 'interactive')
+        scheduler.queues['bulk'].append(old_bulk)
+        scheduler.queues['interactive'].append(fresh)
+
+        self.assertIs(scheduler._pick(), old_bulk)
+        self.assertIs(scheduler._pick(), fresh)
+
+    def test_full_queue_sheds_lower_class_then_rejects(self):
+        """Test a full queue sheds bulk work for interactive jobs and rejects the rest"""
+        import threading
+        from ecourts_scheduler import AdmissionRejected, PriorityScheduler
+
+        scheduler = PriorityScheduler(workers=1, reserved_interactive=0, aging_seconds=1000, max_queue=1)
+        release = threading.Event()
+
+        running = scheduler.submit(release.wait, priority='bulk')
+        while running.state != 'running':
+            release.wait(0.01)
+        queued_bulk = scheduler.submit(lambda: 'bulk', priority='bulk')
+
+        interactive = scheduler.submit(lambda: 'interactive', priority='interactive')
+        self.assertTrue(queued_bulk.wait(0))
+        self.assertEqual(queued_bulk.state, 'shed')
+        self.assertIsInstance(queued_bulk.error, AdmissionRejected)
+
+        with self.assertRaises(AdmissionRejected) as ctx:
+            scheduler.submit(lambda: 'late', priority='interactive')
+        self.assertGreaterEqual(ctx.exception.retry_after, 1)
+        self.assertTrue(scheduler.stats()['saturated'])
+
+        release.set()
+        self.assertTrue(interactive.wait(2))
+        self.assertEqual(interactive.result, 'interactive')
+        scheduler.shutdown()
+
+    def test_completions_stay_within_drain_window(self):
+        """Test completion history is trimmed as jobs finish, not only on rejection"""
+        import time
+        from ecourts_scheduler import DRAIN_WINDOW, PriorityScheduler
+
+        scheduler = PriorityScheduler(workers=1, reserved_interactive=0)
+        scheduler.completions.extend([time.monotonic() - DRAIN_WINDOW - 5] * 100)
+        self.assertTrue(scheduler.submit(lambda: None).wait(2))
+        scheduler.shutdown()
+
+        self.assertEqual(len(scheduler.completions), 1)
+
+    def test_after_fork_starts_fresh(self):
+        """Test a forked child drops inherited jobs and starts its own workers"""
+        from ecourts_scheduler import PriorityScheduler
+
+        scheduler = PriorityScheduler(workers=1, reserved_interactive=0)
+        scheduler.queues['bulk'].append(object())
+        scheduler.threads = ['parent-worker']
+        scheduler.after_fork()
+
+        self.assertEqual(scheduler.stats()['queued']['bulk'], 0)
+        job = scheduler.submit(lambda: 'child')
+        self.assertTrue(job.wait(2))
+        self.assertEqual(job.result, 'child')
+        scheduler.shutdown()
+
+class TestCancellation(unittest.TestCase):
+    """Test cooperative cancellation of abandoned tasks"""
+
+    def test_token_interrupts_sleep(self):
+        """Test a cancelled token wakes a sleeping worker at once"""
+        import threading
+        import time
+        from ecourts_cancel import CancellationToken, TaskCancelled
+
+        token = CancellationToken()
+        threading.Timer(0.05, token.cancel, args=('Request timed out',)).start()
+
+        started = time.monotonic()
+        with self.assertRaises(TaskCancelled):
+            token.sleep(5)
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(token.reason, 'Request timed out')
+
+    def test_cancelled_scraper_returns_to_pool(self):
+        """Test cancellation keeps the browser instead of discarding it"""
+        from ecourts_cancel import TaskCancelled
+        from ecourts_pool import ScraperPool
+
+        pool = ScraperPool(size=1, factory=Mock)
+        with self.assertRaises(TaskCancelled):
+            with pool.scraper() as scraper:
+                raise TaskCancelled('Request timed out')
+
+        scraper.close.assert_not_called()
+        self.assertEqual(pool.stats()['idle'], 1)
+
+    def test_timed_out_request_stops_its_task(self):
+        """Test a request timeout cancels the running demo task"""
+        import time
+        import ecourts_web_interface as web
+
+        task = web.submit_task({'operation': 'search_case', 'case_type': 'Civil'}, timeout=0.1)
+        deadline = time.monotonic() + 1
+        while task.status not in ('cancelled', 'completed') and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(task.status, 'cancelled')
+        self.assertEqual(task.error, 'Request timed out')
+
+    def test_finished_tasks_leave_active_tasks(self):
+        """Test completed tasks are dropped so active_tasks counts only work in flight"""
+        import ecourts_web_interface as web
+
+        with patch.dict(web.active_tasks, clear=True):
+            task = web.submit_task({'operation': 'fetch_cause_list', 'state': 'Delhi'}, timeout=10)
+            self.assertEqual(task.status, 'completed')
+            self.assertEqual(web.active_tasks, {})
+            self.assertEqual(web.app.test_client().get('/health').get_json()['active_tasks'], 0)
+
+    def test_task_removed_before_start_is_skipped(self):
+        """Test a task cleaned up before a worker reaches it is skipped without errors"""
+        import ecourts_web_interface as web
+
+        web.run_scraping_task('no-such-task', {'operation': 'search_case'})
+        self.assertNotIn('no-such-task', web.active_tasks)
+
+    def test_queued_job_is_dropped(self):
+        """Test cancelling a job that never started removes it from the queue"""
+        import threading
+        from ecourts_scheduler import PriorityScheduler
+
+        scheduler = PriorityScheduler(workers=1, reserved_interactive=0)
+        release = threading.Event()
+        running = scheduler.submit(release.wait)
+        while running.state != 'running':
+            release.wait(0.01)
+        queued = scheduler.submit(lambda: 'never')
+
+        self.assertTrue(scheduler.cancel(queued))
+        self.assertEqual(queued.state, 'cancelled')
+        self.assertFalse(scheduler.cancel(running))
+
+        release.set()
+        scheduler.shutdown()
+        self.assertIsNone(queued.result)
+
+class TestWatchlist(unittest.TestCase):
+    """Test the watchlist store and incremental monitor runs"""
+
+    def listing(self, day, purpose='For Arguments'):
+        return {'date': day.strftime('%d/%m/%Y'), 'serial_no': '5', 'court_name': 'Court No. 1', 'purpose': purpose}
+
+    def test_record_reports_only_changes(self):
+        """Test unchanged listings are not reported again"""
+        from datetime import date, timedelta
+        from ecourts_watchlist import WatchlistStore
+
+        store = WatchlistStore(':memory:')
+        store.add(['DLHC010000000001', 'DLHC010000000002'])
+        today, tomorrow = date(2025, 10, 20), date(2025, 10, 21)
+        dates = (today.isoformat(), tomorrow.isoformat())
+
+        first = store.record(1, dates[0], dates, {
+            'DLHC010000000001': [self.listing(today)],
+            'DLHC010000000002': [self.listing(tomorrow)]
+        })
+        self.assertEqual(sorted(change for _, _, change, _ in first), ['added', 'added'])
+
+        second = store.record(2, dates[0], dates, {
+            'DLHC010000000001': [self.listing(today)],
+            'DLHC010000000002': [self.listing(tomorrow, 'For Orders')]
+        })
+        self.assertEqual([(cnr, change) for cnr, _, change, _ in second], [('DLHC010000000002', 'changed')])
+
+        third = store.record(3, dates[0], dates, {'DLHC010000000001': []})
+        self.assertEqual([(cnr, change) for cnr, _, change, _ in third], [('DLHC010000000001', 'removed')])
+
+    def test_runs_are_incremental(self):
+        """Test a second run only checks CNRs added since, and failures stay due"""
+        from datetime import datetime
+        from ecourts_scheduler import PriorityScheduler
+        from ecourts_watchlist import WatchlistMonitor, WatchlistStore
+
+        checked = []
+        def check(cnr, check_today, check_tomorrow):
+            checked.append(cnr)
+            if cnr.endswith('9'):
+                raise RuntimeError('page did not load')
+            return [self.listing(datetime.now())] if cnr.endswith('1') else []
+
+        store = WatchlistStore(':memory:')
+        store.add([f'DLHC01000000000{i}' for i in range(1, 10)])
+        scheduler = PriorityScheduler(workers=2, reserved_interactive=0)
+        monitor = WatchlistMonitor(store, scheduler, check, batch_size=4)
+
+        report = monitor.run_once()
+        self.assertEqual((report['checked'], report['failed'], report['status']), (8, 1, 'partial'))
+        self.assertEqual([c['cnr'] for c in report['changes']], ['DLHC010000000001'])
+
+        checked.clear()
+        store.add(['DLHC010000000010'])
+        report = monitor.run_once()
+        self.assertEqual(sorted(checked), ['DLHC010000000009', 'DLHC010000000010'])
+        self.assertEqual(report['changes'], [])
+        scheduler.shutdown()
+
+    def test_background_run_is_exclusive(self):
+        """Test a second background run is refused while the first holds the lock"""
+        import threading
+        from ecourts_scheduler import PriorityScheduler
+        from ecourts_watchlist import WatchlistMonitor, WatchlistStore
+
+        release = threading.Event()
+        def check(cnr, check_today, check_tomorrow):
+            release.wait(2)
+            return []
+
+        store = WatchlistStore(':memory:')
+        store.add(['DLHC010000000001'])
+        scheduler = PriorityScheduler(workers=1, reserved_interactive=0)
+        monitor = WatchlistMonitor(store, scheduler, check)
+
+        self.assertTrue(monitor.run_in_background())
+        self.assertFalse(monitor.run_in_background())
+        release.set()
+        with monitor.run_lock:
+            self.assertEqual(store.runs(1)[0]['status'], 'completed')
+        scheduler.shutdown()
+
+    def test_interrupted_run_resumes(self):
+        """Test a resumed run keeps its id and totals and skips checked CNRs"""
+        from datetime import date
+        from ecourts_scheduler import PriorityScheduler
+        from ecourts_watchlist import WatchlistMonitor, WatchlistStore
+
+        checked = []
+        def check(cnr, check_today, check_tomorrow):
+            checked.append(cnr)
+            return []
+
+        store = WatchlistStore(':memory:')
+        store.add([f'DLHC01000000000{i}' for i in range(1, 7)])
+        run_date = date.today().isoformat()
+        dates = (run_date, date.fromordinal(date.today().toordinal() + 1).isoformat())
+
+        # A run that died after committing its first batch
+        run_id = store.start_run(run_date)
+        store.record(run_id, run_date, dates, {'DLHC010000000001': [], 'DLHC010000000002': []})
+
+        scheduler = PriorityScheduler(workers=2, reserved_interactive=0)
+        report = WatchlistMonitor(store, scheduler, check, batch_size=2).run_once(resume=True)
+        scheduler.shutdown()
+
+        self.assertEqual(report['run_id'], run_id)
+        self.assertEqual(report['checked'], 6)
+        self.assertEqual(sorted(checked), [f'DLHC01000000000{i}' for i in range(3, 7)])
+        self.assertEqual(store.run(run_id)['status'], 'completed')
+        self.assertIsNone(store.interrupted_run(run_date))
+
+    def test_watchlist_api(self):
+        """Test adding, listing and validating tracked CNRs over the API"""
+        from unittest import mock
+        import ecourts_web_interface as web
+        from ecourts_watchlist import WatchlistMonitor, WatchlistStore
+
+        monitor = WatchlistMonitor(WatchlistStore(':memory:'), web.scheduler, web.check_listing)
+        client = web.app.test_client()
+
+        with mock.patch.object(web, 'watchlist_monitor', monitor):
+            self.assertEqual(client.post('/api/watchlist', json={'cnrs': ['bad']}).status_code, 400)
+
+            response = client.post('/api/watchlist', json={'cnrs': ['dlhc010123456789'], 'label': 'Client A'})
+            self.assertEqual(response.get_json()['added'], 1)
+
+            entries = client.get('/api/watchlist').get_json()
+            self.assertEqual(entries['entries'][0]['cnr'], 'DLHC010123456789')
+            self.assertEqual(client.delete('/api/watchlist/DLHC010123456789').status_code, 200)
+            self.assertEqual(client.get('/api/watchlist/runs/99/changes').status_code, 404)
+
+class TestListingResolver(unittest.TestCase):
+    """Test listing checks joined against cached cause lists"""
+
+    def cause_list(self, state, district, complex_name, date):
+        self.fetches.append((complex_name, date))
+        rows = {
+            'Patiala House Court Comp': [{'sr_no': '1', 'case_no': 'CRL.M.C. 1234/2025', 'cnr': 'DLND010012342025', 'court_name': 'Court No. 1', 'purpose': 'For Arguments'}],
+            'Saket Court Complex': [{'sr_no': '7', 'case_no': 'CS 2345/2025', 'cnr': 'DLND020023452025', 'court_name': 'Court No. 2', 'purpose': 'For Evidence'}]
+        }
+        return {'metadata': {'source': 'eCourts', 'date': date}, 'cases': rows.get(complex_name, [])}
+
+    def setUp(self):
+        self.fetches = []
+
+    def test_directory_maps_cnr_to_complex(self):
+        """Test CNR establishment codes round-trip through the directory"""
+        from ecourts_directory import cnr_for_case, complex_for_cnr
+
+        cnr = cnr_for_case('Delhi', 'New Delhi', 'Patiala House Court Comp', 'CRL.M.C. 1234/2025')
+        self.assertEqual(cnr, 'DLND010012342025')
+        self.assertEqual(complex_for_cnr(cnr.lower()), ('Delhi', 'New Delhi', 'Patiala House Court Comp'))
+        self.assertIsNone(complex_for_cnr('DLHC010123456789'))
+
+    def test_one_fetch_per_complex_and_date(self):
+        """Test many CNRs cost one cause list fetch per complex and date"""
+        from ecourts_listings import ListingResolver
+
+        resolver = ListingResolver(self.cause_list)
+        cnrs = ['DLND010012342025', 'DLND010099992025', 'DLND020023452025', 'DLHC010123456789']
+        results, unresolved = resolver.resolve(cnrs, ['20/10/2025', '21/10/2025'])
+
+        self.assertEqual(len(self.fetches), 4)
+        self.assertEqual(unresolved, ['DLHC010123456789'])
+        self.assertEqual([l['serial_no'] for l in results['DLND010012342025']], ['1', '1'])
+        self.assertEqual(results['DLND010099992025'], [])
+        self.assertEqual(results['DLND020023452025'][0]['purpose'], 'For Evidence')
+
+        resolver.resolve(cnrs, ['20/10/2025'])
+        self.assertEqual(len(self.fetches), 4)
+        self.assertIsNone(resolver.check_case_listing('DLHC010123456789', True, True))
+
+    def test_index_uses_only_row_cnrs(self):
+        """Test cases sharing a number and year are not joined by a made-up CNR"""
+        from ecourts_listings import index_cause_list
+
+        index = index_cause_list({'cases': [
+            {'sr_no': '1', 'case_no': 'CS 5678/2024'},
+            {'sr_no': '2', 'case_no': 'CRL 5678/2024', 'cnr': 'dlnd-01-005678-2024'}
+        ]})
+        self.assertEqual(list(index), ['DLND010056782024'])
+        self.assertEqual([row['sr_no'] for row in index['DLND010056782024']], ['2'])
+
+    def test_demo_cause_lists_are_not_indexed(self):
+        """Test a demo fallback fails the load and is not cached"""
+        from ecourts_listings import ListingResolver
+
+        demo = {'metadata': {'source': 'eCourts Scraper (Updated)'}, 'cases': [{'cnr': 'DLND010012342025'}]}
+        resolver = ListingResolver(lambda *args: demo)
+        with self.assertRaises(RuntimeError):
+            resolver.check_case_listing('DLND010012342025', True)
+        self.assertEqual((resolver.stats['failures'], len(resolver.indexes)), (1, 0))
+
+        resolver = ListingResolver(lambda *args: demo, live_only=False)
+        self.assertEqual(len(resolver.check_case_listing('DLND010012342025', True)), 1)
+
+    def test_watchlist_run_uses_resolver(self):
+        """Test a watchlist run joins known CNRs and scrapes only the rest"""
+        from ecourts_listings import ListingResolver
+        from ecourts_scheduler import PriorityScheduler
+        from ecourts_watchlist import WatchlistMonitor, WatchlistStore
+
+        checked = []
+        store = WatchlistStore(':memory:')
+        store.add(['DLND010012342025', 'DLND010000012025', 'DLHC010123456789'])
+        scheduler = PriorityScheduler(workers=2, reserved_interactive=0)
+        monitor = WatchlistMonitor(
+            store, scheduler, lambda cnr, today, tomorrow: checked.append(cnr) or [],
+            resolver=ListingResolver(self.cause_list)
+        )
+
+        report = monitor.run_once()
+        self.assertEqual(report['checked'], 3)
+        self.assertEqual(checked, ['DLHC010123456789'])
+        self.assertEqual(len(self.fetches), 2)
+        self.assertEqual({c['cnr'] for c in report['changes']}, {'DLND010012342025'})
+        scheduler.shutdown()
+
+    def test_pool_check_rejects_demo_listings(self):
+        """Test pool listing checks fail on demo cause lists and unknown complexes"""
+        from contextlib import contextmanager
+        from ecourts_watchlist import pool_check
+
+        class Pool:
+            def __init__(self, source):
+                self.source = source
+
+            @contextmanager
+            def scraper(self, timeout=None):
+                rows = [{'sr_no': '4', 'case_no': 'CRL.M.C. 1234/2025', 'cnr': 'DLND010012342025'}]
+                yield Mock(fetch_cause_list=Mock(return_value={'metadata': {'source': self.source}, 'cases': rows}))
+
+        listings = pool_check(Pool('eCourts'))('DLND010012342025', True, False)
+        self.assertEqual([l['serial_no'] for l in listings], ['4'])
+
+        with self.assertRaises(RuntimeError):
+            pool_check(Pool('eCourts Scraper (Updated)'))('DLND010012342025', True, False)
+        with self.assertRaises(LookupError):
+            pool_check(Pool('eCourts'))('DLHC010123456789', True, True)
+
+class TestJobQueue(unittest.TestCase):
+    """Test leases, retries and workers on the SQLite job queue"""
+
+    def setUp(self):
+        import tempfile
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'queue.db')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_lease_order_and_completion(self):
+        """Test interactive jobs are leased before older bulk jobs"""
+        from ecourts_queue import SQLiteQueue
+
+        queue = SQLiteQueue(self.path)
+        bulk = queue.enqueue({'operation': 'fetch_cause_list'}, priority='bulk')
+        interactive = queue.enqueue({'operation': 'search_cnr', 'cnr': 'DLHC010123456789'})
+
+        lease = queue.lease('w1')
+        self.assertEqual(lease.job_id, interactive)
+        self.assertIsNone(SQLiteQueue(self.path).lease('w2').payload.get('cnr'))
+
+        self.assertTrue(queue.complete(lease, {'ok': True}))
+        self.assertEqual(queue.get(interactive), {'status': 'done', 'attempts': 1, 'result': {'ok': True}, 'error': None})
+        self.assertEqual(queue.get(bulk)['status'], 'leased')
+        queue.close()
+
+    def test_expired_lease_is_retried_then_failed(self):
+        """Test a job whose worker vanished is handed out again up to max_attempts"""
+        import time
+        from ecourts_queue import SQLiteQueue
+
+        queue = SQLiteQueue(self.path, visibility_timeout=0.05, max_attempts=2)
+        job_id = queue.enqueue({'operation': 'search_case'})
+
+        first = queue.lease('crashed-worker')
+        time.sleep(0.1)
+        self.assertFalse(queue.heartbeat(first))
+
+        second = queue.lease('w2')
+        self.assertEqual((second.job_id, second.attempts), (job_id, 2))
+        self.assertFalse(queue.complete(first, {'stale': True}))
+
+        time.sleep(0.1)
+        self.assertIsNone(queue.lease('w3'))
+        self.assertEqual(queue.get(job_id)['status'], 'failed')
+        queue.close()
+
+    def test_workers_drain_queue_and_serve_api(self):
+        """Test worker nodes run queued tasks submitted through the API"""
+        import threading
+        from unittest import mock
+        import ecourts_web_interface as web
+        from ecourts_queue import SQLiteQueue
+        from ecourts_worker import Worker
+
+        def handler(payload, cancel_token):
+            if payload.get('case_number') == 'bad':
+                raise RuntimeError('page did not load')
+            return web.generate_case_result(payload)
+
+        queue = SQLiteQueue(self.path, retry_base=0, max_attempts=2)
+        workers = [Worker(SQLiteQueue(self.path, retry_base=0, max_attempts=2), handler, worker_id=f'w{i}', poll_interval=0.01) for i in range(2)]
+        threads = [threading.Thread(target=w.run, daemon=True) for w in workers]
+        for thread in threads:
+            thread.start()
+
+        with mock.patch.object(web, 'TASK_BACKEND', 'queue'), mock.patch.object(web, 'job_queue', queue):
+            client = web.app.test_client()
+            ok = client.post('/api/search-case', json={'case_type': 'Civil', 'case_number': '7', 'case_year': '2025'})
+            bad = client.post('/api/search-case', json={'case_type': 'Civil', 'case_number': 'bad', 'case_year': '2025'})
+
+        for w in workers:
+            w.stop()
+        for thread in threads:
+            thread.join(2)
+
+        self.assertTrue(ok.get_json()['success'])
+        self.assertEqual(ok.get_json()['case_info']['Case Number'], 'Civil 7/2025')
+        self.assertEqual(bad.get_json()['error'], 'page did not load')
+        self.assertEqual(sum(w.stats['failed'] for w in workers), 2)
+        queue.close()
+
+    def test_worker_purges_old_finished_jobs(self):
+        """Test the worker loop deletes finished jobs past retention and keeps the rest"""
+        from ecourts_queue import SQLiteQueue
+        from ecourts_worker import Worker
+
+        queue = SQLiteQueue(self.path)
+        old_id, new_id = queue.enqueue({'n': 1}), queue.enqueue({'n': 2})
+        queue.complete(queue.lease('w1'), {'ok': True})
+        queue.complete(queue.lease('w1'), {'ok': True})
+        queue.db.execute("UPDATE jobs SET updated_at = updated_at - 7200 WHERE id = ?", (old_id,))
+        pending = queue.enqueue({'n': 3})
+
+        worker = Worker(queue, lambda payload, token: {}, purge_interval=3600, retention=3600)
+        worker.run(max_jobs=0)
+        self.assertIsNone(queue.get(old_id))
+        self.assertEqual(queue.get(new_id)['status'], 'done')
+        self.assertEqual(queue.get(pending)['status'], 'queued')
+
+        # Not due again until purge_interval has passed
+        queue.db.execute("UPDATE jobs SET updated_at = updated_at - 7200 WHERE id = ?", (new_id,))
+        worker.run(max_jobs=0)
+        self.assertEqual(queue.get(new_id)['status'], 'done')
+        queue.close()
+
+    def test_cancelled_job_stops_worker(self):
+        """Test cancelling a running job cancels the worker's token"""
+        import threading
+        from ecourts_cancel import TaskCancelled
+        from ecourts_queue import SQLiteQueue
+        from ecourts_worker import Worker
+
+        queue = SQLiteQueue(self.path)
+        job_id = queue.enqueue({'operation': 'fetch_cause_list'})
+        started = threading.Event()
+
+        def handler(payload, cancel_token):
+            started.set()
+            cancel_token.sleep(5)
+
+        worker = Worker(SQLiteQueue(self.path), handler, heartbeat_interval=0.02, poll_interval=0.01)
+        thread = threading.Thread(target=worker.run, args=(1,), daemon=True)
+        thread.start()
+
+        self.assertTrue(started.wait(2))
+        self.assertTrue(queue.cancel(job_id))
+        thread.join(2)
+        self.assertEqual(worker.stats['lost'], 1)
+        self.assertEqual(queue.get(job_id)['status'], 'cancelled')
+        queue.close()
+
+    def test_full_queue_returns_503(self):
+        """Test queue mode refuses work beyond max_depth instead of queueing without bound"""
+        from unittest import mock
+        import ecourts_web_interface as web
+        from ecourts_queue import SQLiteQueue
+
+        queue = SQLiteQueue(self.path)
+        queue.enqueue({'operation': 'search_cnr'})
+        with mock.patch.object(web, 'TASK_BACKEND', 'queue'), mock.patch.object(web, 'job_queue', queue), \
+                mock.patch.object(web, 'QUEUE_MAX_DEPTH', 1):
+            tasks = len(web.active_tasks)
+            response = web.app.test_client().post('/api/search-case', json={'case_type': 'Civil', 'case_number': '7', 'case_year': '2025'})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('Retry-After', response.headers)
+        self.assertEqual(len(web.active_tasks), tasks)
+        self.assertEqual(queue.depth(), 1)
+        queue.close()
+
+    def test_redis_scripts_declare_every_key(self):
+        """Test Redis queue scripts get all keys through KEYS under one hash tag"""
+        from unittest import mock
+        from ecourts_queue import RedisQueue
+
+        with mock.patch('redis.Redis.from_url') as from_url:
+            client = from_url.return_value
+            client.register_script.side_effect = lambda source: mock.Mock()
+            queue = RedisQueue()
+        client.zrangebyscore.side_effect = lambda key, *args, **kwargs: [b'job1'] if key.endswith(':leased') or key.endswith(':ready:0') else []
+        queue.claim_script.return_value = [b'{"operation": "search_cnr"}', 1]
+        queue.cancel_script.return_value = 0
+
+        lease = queue.lease('w1')
+        self.assertEqual((lease.job_id, lease.payload), ('job1', {'operation': 'search_cnr'}))
+        self.assertFalse(queue.cancel('expired-job'))
+
+        for script in (queue.reclaim_script, queue.claim_script, queue.cancel_script):
+            keys = script.call_args.kwargs['keys']
+            self.assertTrue(keys)
+            self.assertTrue(all(key.startswith('{ecourts:queue}:') for key in keys), keys)
+        self.assertIn('{ecourts:queue}:job:job1', queue.reclaim_script.call_args.kwargs['keys'])
+
+class TestStatewideCrawl(unittest.TestCase):
+    """Test crawl planning and the work-stealing pool"""
+
+    def test_plan_expands_directory(self):
+        """Test states expand to one unit per complex and date"""
+        from ecourts_crawl import plan_units
+
+        units = plan_units(['Delhi'], ['20/10/2025', '21/10/2025'])
+        self.assertEqual(len(units), 20)
+        self.assertEqual(len({unit.key for unit in units}), 20)
+        self.assertEqual(len(plan_units(['Delhi', 'Karnataka'], ['20/10/2025'], ['Mysore'])), 2)
+        with self.assertRaises(ValueError):
+            plan_units(['Atlantis'], ['20/10/2025'])
+
+    def test_idle_workers_steal_from_slow_worker(self):
+        """Test a slow unit does not hold up the rest of its worker's share"""
+        import time
+        from ecourts_crawl import WorkStealingPool, plan_units
+
+        units = plan_units(['Delhi'], ['20/10/2025'])
+        slow = units[0].key
+
+        def fetch(unit):
+            time.sleep(0.3 if unit.key == slow else 0.01)
+            return unit.key
+
+        pool = WorkStealingPool(2, fetch, shuffle=False)
+        started = time.monotonic()
+        results = pool.run(units)
+
+        self.assertEqual(len(results), 10)
+        self.assertEqual(pool.stats['steals'], 4)
+        self.assertLess(time.monotonic() - started, 0.38)
+
+    def test_crawl_retries_and_exports(self):
+        """Test failed units are retried and every list is exported"""
+        import tempfile
+        from ecourts_crawl import StatewideCrawl, plan_units
+        from ecourts_writer import ResultWriter
+
+        attempts = {}
+        def fetch(state, district, complex_name, date):
+            attempts[complex_name] = attempts.get(complex_name, 0) + 1
+            if complex_name == 'Mysore City Court' and attempts[complex_name] == 1:
+                raise RuntimeError('timeout')
+            return {'metadata': {'complex': complex_name}, 'cases': [{'sr_no': '1', 'case_no': 'CS 1/2025'}]}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            writer = ResultWriter(output_dir=tmpdir, flush_interval=0.01)
+            summary = StatewideCrawl(fetch, writer, workers=3, progress=False).run(plan_units(['Karnataka'], ['20/10/2025']))
+            writer.close()
+
+            self.assertEqual((summary['completed'], summary['failed'], summary['retried']), (10, 0, 1))
+            self.assertEqual(summary['cases'], 10)
+            self.assertEqual(len([f for f in os.listdir(tmpdir) if f.endswith('.csv')]), 10)
+
+    def test_demo_fallback_counts_as_failure(self):
+        """Test a crawl retries, then fails, units where the scraper fell back to demo data"""
+        from contextlib import contextmanager
+        from ecourts_crawl import WorkStealingPool, fetch_live_cause_list, plan_units
+
+        class Pool:
+            """Serves demo data for the first demo_fetches lookups"""
+
+            def __init__(self, demo_fetches):
+                self.demo_fetches = demo_fetches
+                self.fetches = 0
+
+            @contextmanager
+            def scraper(self, timeout=None):
+                self.fetches += 1
+                source = 'eCourts Scraper (Updated)' if self.fetches <= self.demo_fetches else 'eCourts'
+                yield Mock(fetch_cause_list=Mock(return_value={'metadata': {'source': source}, 'cases': []}))
+
+        for demo_fetches, outcome in ((1, 'done'), (2, 'failed')):
+            unit = plan_units(['Karnataka'], ['20/10/2025'], ['Mysore'])[0]
+            pool = Pool(demo_fetches)
+            crawl = WorkStealingPool(1, lambda u: fetch_live_cause_list(pool, u.state, u.district, u.complex_name, u.date), retries=1)
+            results = crawl.run([unit])
+
+            self.assertEqual(results[unit.key][0], outcome)
+            self.assertEqual((crawl.stats['retried'], pool.fetches), (1, 2))
+        self.assertEqual(results[unit.key][1], 'No cause list from eCourts (demo data fallback)')
+
+    def test_resume_skips_committed_units(self):
+        """Test a resumed crawl fetches only units missing from the journal"""
+        import tempfile
+        from ecourts_crawl import CrawlJournal, StatewideCrawl, plan_units
+        from ecourts_writer import ResultWriter
+
+        units = plan_units(['Delhi'], ['20/10/2025'])
+        fetched, broken, demo = [], ['West Delhi'], ['Karkardooma Court Complex']
+        def fetch(state, district, complex_name, date):
+            fetched.append((district, complex_name))
+            if district in broken:
+                raise RuntimeError('browser crashed')
+            source = 'demo' if complex_name in demo else 'eCourts'
+            return {'metadata': {'source': source}, 'cases': [{'sr_no': '1', 'case_no': 'CS 1/2025'}]}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'crawl_journal.jsonl')
+            journal = CrawlJournal(path)
+            journal.start({'states': ['Delhi']})
+            writer = ResultWriter(output_dir=tmpdir, flush_interval=0.01)
+            first = StatewideCrawl(fetch, writer, workers=2, retries=0, progress=False, journal=journal).run(units)
+            journal.close()
+            self.assertEqual((first['completed'], first['failed']), (8, 2))
+
+            # A crash mid-write leaves a torn last line behind
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('{"type": "done", "key": "Del')
+
+            fetched.clear()
+            broken.clear()
+            demo.clear()
+            journal = CrawlJournal(path)
+            # Demo fallbacks are exported but not journaled
+            self.assertEqual(len(journal.completed), 6)
+            with self.assertRaises(ValueError):
+                journal.start({'states': ['Karnataka']})
+            journal.start({'states': ['Delhi']})
+            second = StatewideCrawl(fetch, writer, workers=2, progress=False, journal=journal).run(units)
+            writer.close()
+            journal.close()
+
+            self.assertEqual(sorted(fetched), [('Central Delhi', 'Karkardooma Court Complex'), ('East Delhi', 'Karkardooma Court Complex'),
+                                               ('West Delhi', 'Dwarka Court Complex'), ('West Delhi', 'Rohini Court Complex')])
+            self.assertEqual((second['resumed'], second['completed'], second['cases']), (6, 4, 10))
+            self.assertEqual(len(CrawlJournal(path).completed), 10)
+
+class TestLeanBrowsing(unittest.TestCase):
+    """Test resource blocking and page statistics"""
+
+    def test_blocks_assets_but_not_captcha(self):
+        """Test images, stylesheets and trackers are blocked while the CAPTCHA loads"""
+        from ecourts_lean import CAPTCHA_URL, blocked_url_patterns, is_blocked
+
+        base = 'https://services.ecourts.gov.in/ecourtindia_v6/'
+        for url in (f'{base}images/logo.png', f'{base}css/bootstrap.min.css?v=3', f'{base}fonts/icons.woff2',
+                    'https://www.google-analytics.com/analytics.js'):
+            self.assertTrue(is_blocked(url), url)
+        for url in (f'{base}?p=home/index', f'{base}js/main.js', CAPTCHA_URL, f'{CAPTCHA_URL}?0.27182818'):
+            self.assertFalse(is_blocked(url), url)
+
+        # An extra pattern that would catch the CAPTCHA is dropped, and any cache-buster stays allowed
+        self.assertNotIn('*securimage*', blocked_url_patterns(extra=['*securimage*', '*.gif']))
+        self.assertFalse(is_blocked(f'{CAPTCHA_URL}?0.9', patterns=['*.php?*']))
+        self.assertTrue(is_blocked(f'{base}images/logo.gif', patterns=['*.php?*', '*.gif']))
+
+    def test_default_patterns_compiled_once(self):
+        """Test checking a URL does not rebuild the blocked pattern list"""
+        from ecourts_lean import is_blocked
+
+        with patch('ecourts_lean.blocked_url_patterns', side_effect=AssertionError('rebuilt')):
+            self.assertTrue(is_blocked('https://example.com/logo.png'))
+
+    @patch('selenium.webdriver.Chrome')
+    def test_scraper_enables_blocking(self, mock_chrome):
+        """Test lean scrapers install blocked URLs over CDP and full ones do not"""
+        from ecourts_scraper import ECourtsScraper
+
+        mock_chrome.side_effect = lambda **kwargs: Mock()
+        lean = ECourtsScraper(headless=True, lean=True)
+        commands = [call.args[0] for call in lean.driver.execute_cdp_cmd.call_args_list]
+        self.assertEqual(commands, ['Network.enable', 'Network.setBlockedURLs'])
+
+        full = ECourtsScraper(headless=True, lean=False)
+        full.driver.execute_cdp_cmd.assert_not_called()
+
+    def test_page_stats_estimate_savings(self):
+        """Test bytes saved are estimated against measured full pages"""
+        from ecourts_lean import PageStats
+
+        stats = PageStats()
+        stats.record('full', 2000, 900000, 40)
+        stats.record('lean', 800, 120000, 6)
+        stats.record('lean', 1000, 80000, 6)
+
+        summary = stats.summary()
+        self.assertEqual(summary['lean']['avg_bytes'], 100000)
+        self.assertEqual(summary['lean']['bytes_saved'], 1600000)
+        self.assertEqual(summary['lean']['load_ms_saved'], 1100.0)
+
+class FakeBrowserSession:
+    """WebDriver session stand-in that tracks the current window and slow page loads"""
+
+    load_seconds = 0.2
+
+    def __init__(self):
+        import itertools
+        self.ids = itertools.count(1)
+        self.current_window_handle = 'home'
+        self.window_handles = ['home']
+        self.loads = {}
+        self.clicks = []
+        self.quit = Mock()
+        self.switch_to = Mock(window=self.switch)
+
+    def switch(self, handle):
+        self.current_window_handle = handle
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == 'Target.createBrowserContext':
+            return {'browserContextId': f'ctx-{next(self.ids)}'}
+        if cmd == 'Target.createTarget':
+            handle = f"tab-{params['browserContextId']}"
+            self.window_handles.append(handle)
+            return {'targetId': handle}
+        if cmd == 'Target.closeTarget':
+            self.window_handles.remove(params['targetId'])
+        return {}
+
+    def execute_script(self, script, *args):
+        import time
+        if 'location.href' in script:
+            self.loads[self.current_window_handle] = time.monotonic() + self.load_seconds
+            return None
+        return time.monotonic() >= self.loads[self.current_window_handle]
+
+    def find_element(self, by, value):
+        window = self.current_window_handle
+        element = Mock()
+        # (window the element belongs to, window current when clicked)
+        element.click.side_effect = lambda: self.clicks.append((window, self.current_window_handle))
+        return element
+
+class TestBrowserTabs(unittest.TestCase):
+    """Test several isolated scraper tabs sharing one Chrome"""
+
+    def test_tabs_share_browsers_up_to_limit(self):
+        """Test tabs get their own contexts and a second Chrome starts when the first is full"""
+        from ecourts_tabs import TabbedBrowsers
+
+        browsers = TabbedBrowsers(tabs_per_browser=2, lean=False, launch=FakeBrowserSession)
+        scrapers = [browsers.new_scraper() for _ in range(3)]
+        self.assertEqual(browsers.stats(), {'browsers': 2, 'tabs': 3})
+        self.assertEqual(len({(id(s.driver.browser), s.driver.context_id) for s in scrapers}), 3)
+
+        first_session = scrapers[0].driver.browser.driver
+        scrapers[0].close()
+        first_session.quit.assert_not_called()
+        scrapers[1].close()
+        first_session.quit.assert_called_once()
+        self.assertEqual(browsers.stats(), {'browsers': 1, 'tabs': 1})
+
+    def test_elements_switch_back_to_their_tab(self):
+        """Test an element found in one tab is clicked there after another tab ran commands"""
+        from ecourts_tabs import TabbedBrowsers
+
+        browsers = TabbedBrowsers(tabs_per_browser=2, lean=False, launch=FakeBrowserSession)
+        first, second = browsers.new_scraper(), browsers.new_scraper()
+        button = first.driver.find_element('id', 'submit')
+        second.driver.find_element('id', 'cnr')
+        button.click()
+
+        handle = first.driver.handle
+        self.assertEqual(first.driver.browser.driver.clicks, [(handle, handle)])
+
+    def test_tabs_load_pages_concurrently(self):
+        """Test page loads in different tabs overlap instead of queueing"""
+        import threading
+        import time
+        from ecourts_tabs import TabbedBrowsers
+
+        browsers = TabbedBrowsers(tabs_per_browser=3, lean=False, launch=FakeBrowserSession)
+        scrapers = [browsers.new_scraper() for _ in range(3)]
+
+        started = time.monotonic()
+        threads = [threading.Thread(target=s.driver.get, args=('http://ecourts.test/',)) for s in scrapers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLess(time.monotonic() - started, 2 * FakeBrowserSession.load_seconds)
+
+class FakeBackend:
+    """Browser backend serving fixed HTML and recording the steps taken"""
+
+    name = 'fake'
+
+    def __init__(self, html):
+        self.html = html
+        self.steps = []
+
+    def navigate(self, url):
+        self.steps.append(('navigate', url))
+
+    def fill(self, selector, text):
+        self.steps.append(('fill', text))
+
+    def click(self, selector):
+        self.steps.append(('click', selector))
+
+    def exists(self, selector):
+        return True
+
+    def wait_for(self, selector, timeout=15):
+        self.steps.append(('wait', selector))
+
+    def snapshot(self):
+        return self.html
+
+    def element_png(self, selector):
+        return b'png'
+
+    def execute_script(self, script, *args):
+        return {'load_ms': 120, 'bytes': 4096, 'requests': 3}
+
+    def close(self):
+        self.steps.append(('close',))
+
+class TestBrowserBackends(unittest.TestCase):
+    """Test the scraper through the backend interface"""
+
+    CASE_PAGE = """
+        <html><body><table>
+          <tr><td>Case Type</td><td>CS - Civil Suit</td></tr>
+          <tr><td>Filing Number</td><td> 1234/2025 </td></tr>
+          <tr><td>Next Hearing Date</td><td>20th October 2025</td></tr>
+          <tr><td colspan="2">Case Status</td></tr>
+        </table></body></html>
+    """
+
+    def test_cnr_search_parses_snapshot(self):
+        """Test a CNR search fills the form, submits and parses the results page"""
+        from ecourts_scraper import ECourtsScraper, SEARCH_BUTTON
+
+        backend = FakeBackend(self.CASE_PAGE)
+        scraper = ECourtsScraper(backend=backend)
+        with patch('ecourts_scraper.pause'):
+            case_info = scraper.search_case_by_cnr('DLND010012342025')
+
+        self.assertEqual(case_info['case_details'], {
+            'Case Type': 'CS - Civil Suit',
+            'Filing Number': '1234/2025',
+            'Next Hearing Date': '20th October 2025'
+        })
+        self.assertEqual(backend.steps[0], ('navigate', scraper.cnr_search_url))
+        self.assertIn(('fill', 'DLND010012342025'), backend.steps)
+        self.assertIn(('click', SEARCH_BUTTON), backend.steps)
+        self.assertEqual(scraper.pages_loaded, 1)
+
+        scraper.close()
+        self.assertEqual(backend.steps[-1], ('close',))
+
+    def test_wait_for_element_uses_backend(self):
+        """Test waits go through the backend, which also works without a WebDriver"""
+        from ecourts_scraper import ECourtsScraper
+
+        backend = FakeBackend('')
+        scraper = ECourtsScraper(backend=backend)
+        self.assertIsNone(scraper.driver)
+        scraper.wait_for_element("//table", timeout=1)
+        self.assertEqual(backend.steps, [('wait', '//table')])
+
+    def test_closed_pool_shuts_shared_connection_after_last_release(self):
+        """Test a pool closed while scrapers are busy closes the Playwright connection once they return"""
+        from ecourts_pool import ScraperPool
+
+        pool = ScraperPool(size=2, factory=Mock)
+        pool.contexts = Mock()
+        first, second = pool.acquire(), pool.acquire()
+        pool.close()
+        pool.release(first)
+        pool.contexts.close.assert_not_called()
+        pool.release(second)
+        pool.contexts.close.assert_called_once()
+
+    def test_playwright_routing_keeps_captcha(self):
+        """Test lean Playwright contexts block by resource type but never the CAPTCHA"""
+        import random
+        from ecourts_backends import should_block
+        from ecourts_lean import CAPTCHA_URL
+
+        base = 'https://services.ecourts.gov.in/ecourtindia_v6/'
+        self.assertTrue(should_block(f'{base}images/banner', 'image'))
+        self.assertTrue(should_block(f'{base}theme/site', 'stylesheet'))
+        self.assertTrue(should_block('https://www.googletagmanager.com/gtm.js', 'script'))
+        self.assertFalse(should_block(f'{CAPTCHA_URL}?0.{random.randrange(10 ** 8)}', 'image'))
+        self.assertFalse(should_block(f'{base}?p=home/index', 'document'))
+
+class HttpBackend(FakeBackend):
+    """FakeBackend whose navigations really fetch the page over HTTP"""
+
+    def __init__(self):
+        super().__init__('')
+
+    def navigate(self, url):
+        import requests
+        super().navigate(url)
+        self.html = requests.get(url, timeout=5).text
+
+class TestFixtureServer(unittest.TestCase):
+    """Test the offline eCourts fixture server"""
+
+    def setUp(self):
+        from ecourts_fixtures import FixtureServer
+        self.server = FixtureServer(seed=1).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_serves_ecourts_pages(self):
+        """Test search forms, results, CAPTCHA and assets are replayed"""
+        import requests
+        from ecourts_fixtures import CAPTCHA_PATH
+
+        base = self.server.base_url
+        home = requests.get(f'{base}?p=home/index', timeout=5)
+        self.assertEqual(home.status_code, 200)
+        self.assertIn('id="cnr_number"', home.text)
+
+        result = requests.post(f'{base}?p=home/viewcase', data={'cnr_number': 'DLND010012342025'}, timeout=5)
+        self.assertIn('DLND010012342025', result.text)
+
+        captcha = requests.get(f'{base}{CAPTCHA_PATH}', timeout=5)
+        self.assertEqual(captcha.headers['Content-Type'], 'image/png')
+        self.assertEqual(requests.get(f'{base}css/style.css', timeout=5).status_code, 200)
+        self.assertEqual(requests.get(f'{base}?p=no/such', timeout=5).status_code, 404)
+        self.assertEqual(self.server.stats['requests'], 5)
+
+    def test_recorded_fixtures_override_defaults(self):
+        """Test a recorded page is served instead of the built-in one"""
+        import requests
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as fixtures:
+            with open(os.path.join(fixtures, 'cause_list_index.html'), 'w') as f:
+                f.write('<html>recorded</html>')
+            self.server.fixtures_dir = fixtures
+            page = requests.get(f'{self.server.base_url}?p=cause_list/index', timeout=5)
+        self.assertEqual(page.text, '<html>recorded</html>')
+
+    def test_latency_and_error_injection(self):
+        """Test injected latency and failures"""
+        import requests
+        import time
+
+        self.server.latency = 0.1
+        started = time.perf_counter()
+        requests.get(self.server.base_url, timeout=5)
+        self.assertGreaterEqual(time.perf_counter() - started, 0.1)
+
+        self.server.latency = 0
+        self.server.error_rate = 1.0
+        self.assertEqual(requests.get(self.server.base_url, timeout=5).status_code, 500)
+        self.assertEqual(self.server.stats['errors'], 1)
+
+    def test_scraper_base_url_switch(self):
+        """Test the scraper reads cause lists from the fixture server via ECOURTS_BASE_URL"""
+        from ecourts_scraper import ECourtsScraper
+
+        with patch.dict(os.environ, {'ECOURTS_BASE_URL': self.server.base_url}):
+            scraper = ECourtsScraper(backend=HttpBackend())
+        self.assertEqual(scraper.cause_list_url, f'{self.server.base_url}?p=cause_list/index')
+        self.assertEqual(ECourtsScraper(backend=FakeBackend(''), base_url='http://x/').cnr_search_url,
+                         'http://x/?p=home/index')
+
+        with patch('ecourts_scraper.pause'):
+            data = scraper.fetch_cause_list(date='20/10/2025')
+
+        self.assertEqual(data['metadata']['source'], 'eCourts')
+        self.assertEqual(data['metadata']['total_cases'], 3)
+        self.assertEqual(data['cases'][0], {
+            'sr_no': '1', 'case_no': 'CS 1234/2025', 'party_names': 'Arun Kumar vs State',
+            'advocate': 'Sh. Rajesh Sharma', 'purpose': 'For Arguments', 'court_name': 'Court No. 1'
+        })
+
+        # Live rows carry a CNR only when eCourts shows one
+        html = ('<table><tr><th>Sr No</th><th>CNR Number</th><th>Case Number</th></tr>'
+                '<tr><td>1</td><td>DLND010056782024</td><td>CS 5678/2024</td></tr></table>')
+        self.assertEqual(scraper.parse_cause_list(html), [{'sr_no': '1', 'cnr': 'DLND010056782024', 'case_no': 'CS 5678/2024'}])
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Test the benchmark harness and its regression check"""
+
+    @classmethod
+    def setUpClass(cls):
+        import importlib.util
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'bench_suite.py')
+        spec = importlib.util.spec_from_file_location('bench_suite', path)
+        cls.bench = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cls.bench)
+
+    def results(self, cases, groups=('parser',), quick=False):
+        return {'metadata': {'quick': quick, 'groups': list(groups)},
+                'benchmarks': {name: {'group': group, 'median_ms': median} for name, (group, median) in cases.items()}}
+
+    def test_measure_times_every_round(self):
+        """Test measure runs warmup plus timed rounds and orders its statistics"""
+        calls = []
+        stats = self.bench.measure(lambda: calls.append(1), rounds=4, warmup=2)
+
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(stats['rounds'], 4)
+        self.assertLessEqual(stats['min_ms'], stats['median_ms'])
+        self.assertLessEqual(stats['median_ms'], stats['p95_ms'])
+        self.assertGreater(stats['ops_per_second'], 0)
+
+    def test_compare_flags_slowdowns_over_threshold(self):
+        """Test only cases slower than the threshold count as regressions"""
+        baseline = self.results({'a': ('parser', 10), 'b': ('parser', 10)})
+        current = self.results({'a': ('parser', 13), 'b': ('parser', 11), 'new': ('parser', 50)})
+
+        regressions = self.bench.compare(current, baseline, 0.2)
+        self.assertEqual([(name, before, after) for name, before, after, _ in regressions], [('a', 10, 13)])
+
+    def test_missing_cases_fail_the_comparison(self):
+        """Test a baseline case that was not measured in a group that ran is reported"""
+        baseline = self.results({'a': ('parser', 10), 'b': ('export', 10)})
+
+        self.assertEqual(self.bench.missing_cases(self.results({}), baseline), ['a'])
+        self.assertEqual(self.bench.missing_cases(self.results({}, quick=True), baseline), [])
+        self.assertEqual(self.bench.missing_cases(self.results({'a': ('parser', 10)}), baseline), [])
+
+    def test_failed_group_exits_non_zero(self):
+        """Test a crashing benchmark group fails the run instead of being skipped"""
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                patch.object(self.bench, 'bench_parser', side_effect=RuntimeError('parser broke')), \
+                patch.object(sys, 'argv', ['bench_suite.py', '--only', 'parser', '--output', os.path.join(tmpdir, 'r.json')]), \
+                patch('builtins.print'):
+            with self.assertRaises(SystemExit) as ctx:
+                self.bench.main()
+            with open(os.path.join(tmpdir, 'r.json'), encoding='utf-8') as f:
+                self.assertEqual(json.load(f)['metadata']['failed_groups'], ['parser'])
+        self.assertEqual(ctx.exception.code, 1)
+
+class TestLoadTest(unittest.TestCase):
+    """Test the API load generator and saturation search"""
+
+    def test_summary_percentiles(self):
+        """Test latency percentiles, error rate and throughput of a stage"""
+        from ecourts_loadtest import summarise
+
+        samples = [('search_cnr', i / 1000, True) for i in range(1, 100)] + [('cause_list', 5.0, False)]
+        stage = summarise(samples, rate=10, duration=10)
+
+        self.assertEqual(stage['requests'], 100)
+        self.assertEqual(stage['error_rate'], 0.01)
+        self.assertEqual(stage['p50_ms'], 50.0)
+        self.assertEqual(stage['p95_ms'], 95.0)
+        self.assertEqual(stage['p99_ms'], 99.0)
+        self.assertEqual(stage['throughput'], 9.9)
+        self.assertEqual(stage['endpoints']['cause_list']['errors'], 1)
+
+    def test_finds_saturation_point(self):
+        """Test the ramp stops at the first stage that cannot keep up"""
+        from ecourts_loadtest import find_saturation
+
+        def stage(rate):
+            # Fake app that serves at most 6 requests/second
+            return {'offered_rate': rate, 'throughput': min(rate, 6), 'error_rate': 0.0,
+                    'p99_ms': 200 if rate <= 6 else 4000}
+
+        report = find_saturation(stage, [2, 4, 6, 8, 10], p99_slo_ms=10000)
+        self.assertEqual(report['capacity'], 6)
+        self.assertEqual(report['saturation_rate'], 8)
+        self.assertIn('throughput', report['saturation_reason'])
+        self.assertEqual(len(report['stages']), 4)
+
+    def test_load_against_app(self):
+        """Test an open-loop stage against the app served over HTTP"""
+        import threading
+        from werkzeug.serving import make_server
+        import ecourts_web_interface as web
+        from ecourts_cancel import CancellationToken
+        from ecourts_loadtest import LoadGenerator
+
+        use_scratch_exports(self)
+        server = make_server('127.0.0.1', 0, web.app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            with patch.object(CancellationToken, 'sleep', lambda self, seconds: None), \
+                    patch.object(web, 'IP_RATE_LIMIT', 0):
+                generator = LoadGenerator(f'http://127.0.0.1:{server.server_port}', seed=3)
+                stage = generator.run(rate=20, duration=0.5)
+        finally:
+            server.shutdown()
+
+        self.assertEqual(stage['requests'], 10)
+        self.assertEqual(stage['errors'], 0)
+        self.assertGreater(stage['throughput'], 0)
+        self.assertTrue(set(stage['endpoints']) <= {'search_cnr', 'search_case', 'cause_list'})
+
+class TestTracing(unittest.TestCase):
+    """Test per-stage tracing spans"""
+
+    def setUp(self):
+        from ecourts_tracing import Tracer, set_tracer
+
+        self.spans = []
+        sink = Mock()
+        sink.export.side_effect = self.spans.append
+        set_tracer(Tracer([sink]))
+
+    def tearDown(self):
+        from ecourts_tracing import set_tracer
+        set_tracer(None)
+
+    def test_nested_spans_and_json_sink(self):
+        """Test children link to their root, failures are recorded and spans are written as JSON lines"""
+        import tempfile
+        from ecourts_tracing import JsonSpanSink, Tracer, set_tracer, span
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'spans', 'spans.jsonl')
+            set_tracer(Tracer([JsonSpanSink(path)]))
+
+            with span('search_cnr', cnr='DLND010012342025') as root:
+                with span('navigate'):
+                    pass
+                with self.assertRaises(ValueError):
+                    with span('parse'):
+                        raise ValueError('bad table')
+
+            with open(path) as f:
+                lines = [json.loads(line) for line in f]
+
+        self.assertEqual([line['name'] for line in lines], ['navigate', 'parse', 'search_cnr'])
+        self.assertTrue(all(line['trace_id'] == root.trace_id for line in lines))
+        self.assertEqual(lines[0]['parent_id'], root.span_id)
+        self.assertEqual(lines[1]['status'], 'error')
+        self.assertEqual(lines[1]['error'], 'bad table')
+        self.assertEqual(lines[2]['attributes'], {'cnr': 'DLND010012342025'})
+        self.assertEqual(set(root.stages), {'navigate', 'parse'})
+
+    def test_cnr_search_stages(self):
+        """Test a CNR search is traced stage by stage"""
+        from ecourts_scraper import ECourtsScraper
+
+        scraper = ECourtsScraper(backend=FakeBackend(TestBrowserBackends.CASE_PAGE))
+        with patch('ecourts_scraper.pause'):
+            scraper.search_case_by_cnr('DLND010012342025')
+
+        root = self.spans[-1]
+        self.assertEqual(root.name, 'search_cnr')
+        self.assertEqual(root.status, 'ok')
+        self.assertEqual([s.name for s in self.spans[:-1]],
+                         ['navigate', 'pause', 'fill', 'captcha', 'submit', 'wait', 'parse'])
+        self.assertTrue(all(s.operation == 'search_cnr' for s in self.spans))
+
+    def test_fallback_marks_operation_failed(self):
+        """Test an operation that falls back to demo data is traced as an error"""
+        from ecourts_scraper import ECourtsScraper
+
+        backend = FakeBackend('')
+        backend.navigate = Mock(side_effect=RuntimeError('net::ERR_CONNECTION_RESET'))
+        scraper = ECourtsScraper(backend=backend)
+        scraper.search_case_by_details('CS', '1', '2025')
+
+        self.assertEqual(self.spans[0].name, 'navigate')
+        self.assertEqual(self.spans[0].status, 'error')
+        self.assertEqual(self.spans[-1].name, 'search_case')
+        self.assertEqual(self.spans[-1].status, 'error')
+
+class TestLogging(unittest.TestCase):
+    """Test queue-backed JSON logging"""
+
+    def setUp(self):
+        import logging
+        root = logging.getLogger()
+        self.saved = (list(root.handlers), root.level)
+
+    def tearDown(self):
+        import logging
+        from ecourts_logging import flush_logging
+        flush_logging()
+        root = logging.getLogger()
+        root.handlers[:] = self.saved[0]
+        root.setLevel(self.saved[1])
+
+    def test_json_lines_carry_task_and_stage(self):
+        """Test records are written by the listener as JSON with task_id, operation and stage"""
+        import logging
+        import tempfile
+        from ecourts_logging import flush_logging, log_context, setup_logging
+        from ecourts_tracing import span
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'logs', 'scraper.log')
+            setup_logging(level='INFO', log_file=path, console=False)
+            log = logging.getLogger('ecourts_test')
+
+            with log_context(task_id='task-1', operation='search_cnr'):
+                with span('search_cnr'), span('captcha'):
+                    log.info('🔍 solving %s', 'captcha')
+                try:
+                    raise ValueError('bad page')
+                except ValueError:
+                    log.exception('❌ failed')
+            log.debug('hidden')
+            flush_logging()
+
+            with open(path, encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f]
+
+        # The span's own timing line comes from ecourts_tracing
+        self.assertEqual(lines[1]['logger'], 'ecourts_tracing')
+        self.assertEqual(lines[1]['task_id'], 'task-1')
+        lines = [line for line in lines if line['logger'] == 'ecourts_test']
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0]['message'], '🔍 solving captcha')
+        self.assertEqual(lines[0]['task_id'], 'task-1')
+        self.assertEqual(lines[0]['operation'], 'search_cnr')
+        self.assertEqual(lines[0]['stage'], 'captcha')
+        self.assertEqual(lines[1]['level'], 'ERROR')
+        self.assertNotIn('stage', lines[1])
+        self.assertIn('ValueError: bad page', lines[1]['exception'])
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        """Test a full log queue never blocks the logging thread"""
+        import logging
+        import queue
+        from ecourts_logging import NonBlockingQueueHandler
+
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+        record = logging.LogRecord('ecourts', logging.INFO, __file__, 1, 'msg %s', ('x',), None)
+        handler.handle(record)
+        handler.handle(record)
+
+        self.assertEqual(handler.dropped, 1)
+        self.assertEqual(handler.queue.get_nowait().msg, 'msg x')
+
+    def test_shared_log_file_rotates_once(self):
+        """Test handlers sharing a file follow each other's rollovers and keep backup_count files"""
+        import logging
+        import tempfile
+        from ecourts_logging import SharedRotatingFileHandler
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scraper.log')
+            # Two handlers on one file, as in two gunicorn workers
+            first, second = (SharedRotatingFileHandler(path, maxBytes=200, backupCount=2) for _ in range(2))
+            for i in range(40):
+                handler = first if i % 2 else second
+                handler.emit(logging.LogRecord('ecourts', logging.INFO, __file__, 1, f'line {i:02d} ' + 'x' * 20, None, None))
+            first.close()
+            second.close()
+
+            self.assertEqual(sorted(os.listdir(tmp)), ['scraper.log', 'scraper.log.1', 'scraper.log.2', 'scraper.log.lock'])
+            with open(path, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            # Both handlers wrote the newest lines into the current file, in order
+            self.assertEqual(lines[-1][:7], 'line 39')
+            self.assertEqual([line[:7] for line in lines], [f'line {i:02d}' for i in range(40 - len(lines), 40)])
+
+    def test_import_does_not_configure_logging(self):
+        """Test importing the scraper leaves logging configuration to the entry point"""
+        import subprocess
+        code = "import logging, ecourts_scraper; print(len(logging.getLogger().handlers))"
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(output.stdout.strip(), '0')
+
+class TestStartup(unittest.TestCase):
+    """Test CLI startup stays cheap"""
+
+    HEAVY_MODULES = ('requests', 'bs4', 'selenium', 'flask')
+
+    def run_python(self, *args):
+        import subprocess
+        return subprocess.run([sys.executable, *args], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    def test_import_skips_heavy_modules(self):
+        """Test importing the scraper leaves selenium, requests and bs4 unloaded"""
+        code = ("import sys, ecourts_scraper; "
+                f"print(','.join(m for m in {self.HEAVY_MODULES!r} if m in sys.modules))")
+        self.assertEqual(self.run_python('-c', code).stdout.strip(), '')
+
+    def test_help_within_budget(self):
+        """Test --help (interpreter start included) finishes within the startup budget"""
+        import time
+        self.run_python('ecourts_scraper.py', '--help')  # warm the bytecode cache
+        started = time.perf_counter()
+        output = self.run_python('ecourts_scraper.py', '--help')
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(output.returncode, 0)
+        self.assertIn('--cnr', output.stdout)
+        self.assertLess(elapsed, 1.0)
+
+    def test_system_info_does_not_import_packages(self):
+        """Test the launcher checks packages without importing them"""
+        code = ("import sys, io, contextlib, launcher\n"
+                "with contextlib.redirect_stdout(io.StringIO()): launcher.run_system_info()\n"
+                f"print(','.join(m for m in {self.HEAVY_MODULES!r} if m in sys.modules))")
+        self.assertEqual(self.run_python('-c', code).stdout.strip(), '')
+
+    def test_launcher_runs_cli_in_process(self):
+        """Test launcher options call the scraper CLI without a subprocess"""
+        import launcher
+        with patch('ecourts_scraper.main') as cli, patch('subprocess.run') as spawn:
+            launcher.run_cli_help()
+        cli.assert_called_once_with(['--help'])
+        spawn.assert_not_called()
+
 class TestSystemIntegration(unittest.TestCase):
     """Integration tests for the complete system"""
 
@@ -360,6 +2228,25 @@ def run_tests():
         TestECourtsScraper,
         TestWebAPI, 
         TestFileOperations,
+        TestResultWriter,
+        TestScraperPool,
+        TestRateLimiting,
+        TestCauseListPagination,
+        TestPriorityScheduler,
+        TestCancellation,
+        TestWatchlist,
+        TestListingResolver,
+        TestJobQueue,
+        TestStatewideCrawl,
+        TestLeanBrowsing,
+        TestBrowserTabs,
+        TestBrowserBackends,
+        TestFixtureServer,
+        TestBenchmarkSuite,
+        TestLoadTest,
+        TestTracing,
+        TestLogging,
+        TestStartup,
         TestSystemIntegration
     ]
 